@@ -1,11 +1,24 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
 import pRigging.src.bindchain as pbc
 import pRigging.src.ikchain as pic
 import pRigging.src.fkchain as pfc
 import pRigging.src.control as pctrl
 import pRigging.src.riggingbase as prb
+import pRigging.src.buildsession as pbs
+import pRigging.src.buildplan as pbp
+import pRigging.src.planexecutor as ppe
+import pRigging.src.nodelist as pnl
+
+pm = psb.pm
+
+#the parts of the rig that are compared when it is regenerated, see regenArmRig
+
+ARM_PARTS = ["ik", "fk", "bind", "top"]
+
+PART_NAMES = {"ik" : "IK chain", "fk" : "FK chain", "bind" : "bind chain", "top" : "rig group"}
+ACTION_NAMES = {"add" : "added", "remove" : "removed", "rebuild" : "rebuilt"}
 
 #----------ArmRig-Class----------#
 
@@ -21,22 +34,35 @@ class ArmRig(prb.RiggingBase):
         File: pRigging/src/armrig.py
         
         Contains:
-            self.m_templateJoints:  A list of template joints
+            self.m_templateJoints:  A NodeList of template joints
             self.m_fkChain:         An optional FKChain.
             self.m_ikChain:         An optional IkChain.
             self.m_bindChain:       An optional BindChain.
             self.m_FKIKControl:     The FKIK switching control, generated if both chain 
                                     sets are made with a bind chain.
-            self.m_reverseNode:     The plus minus average node used to reverse the output 
-                                    of the FK/IK switch value 
+            self.m_reverseNode:     A NodeList of the plus minus average node used to
+                                    reverse the output of the FK/IK switch value 
+            self.m_topGroup:        A NodeList of the group the chains are parented under,
+                                    empty until the rig is made
+            self.m_plan:            The BuildPlan of the rig if it was planned
+            self.m_planExisting:    A dictionary of the names of the nodes the plan
+                                    started from to their scene nodes
+            self.m_buildParams:     A dictionary of the settings the rig was built with,
+                                    see getBuildParams, None before it is built
+            self.m_ledger:          A NodeList of every scene node made by the object, so
+                                    they can all be deleted at once when it is cleared
         
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
             pRigging.src.bindchain as pbc
             pRigging.src.ikchain as pic
             pRigging.src.fkchain as pfc
             pRigging.src.control as pctrl
             pRigging.src.riggingbase as prb
+            pRigging.src.buildsession as pbs
+            pRigging.src.buildplan as pbp
+            pRigging.src.planexecutor as ppe
+            pRigging.src.nodelist as pnl
 
     """
     
@@ -54,13 +80,23 @@ class ArmRig(prb.RiggingBase):
         
         #set the variables up
         
-        self.m_templateJoints = []
+        self.m_templateJoints = pnl.NodeList()
         self.m_fkChain = 0
         self.m_ikChain = 0
         self.m_bindChain = 0
         self.m_FKIKControl = 0
-        self.m_reverseNode = ""
-        self.m_topGroup = ""
+        self.m_reverseNode = pnl.NodeList()
+        self.m_topGroup = pnl.NodeList()
+        self.m_ledger = pnl.NodeList()
+        
+        #the plan of the rig, if it was planned, and the scene nodes it started from
+        
+        self.m_plan = None
+        self.m_planExisting = {}
+        
+        #the settings the rig was built with
+        
+        self.m_buildParams = None
         
         #the root name of the rig
         
@@ -80,7 +116,10 @@ class ArmRig(prb.RiggingBase):
                     _ctrlExt = "",
                     _doTwist = True, 
                     _twistStartIds = [-2],
-                    _numTwistJnts = 3
+                    _numTwistJnts = 3,
+                    _usePlan = False,
+                    _fastBuild = False,
+                    _cache = None
                     ):
 
         
@@ -99,8 +138,19 @@ class ArmRig(prb.RiggingBase):
                                         defaults to True
                 _twistStartId:          Defaults to -2, the joint above the last, amounting to
                                         a default of forearm twist
+                _usePlan:               Defaults to False, whether or not to plan the whole rig
+                                        first, see planArmRig, and then make it in one pass
+                _fastBuild:             Defaults to False, whether or not to stop recording undo
+                                        while the rig is built, otherwise the whole build is a
+                                        single undo chunk. A fast build is removed with clear
+                                        rather than undo
+                _cache:                 Defaults to None, a BuildCache to look the build up in,
+                                        a build already in it is made from its stored plan
+                                        and a new one is planned and stored, see buildFromCache
                                         
-            On Exit:                The arm has been generated.
+            On Exit:                The arm has been generated, if the build fails part way
+                                    through everything it made is rolled back and the error
+                                    is raised again
         """
         
         #if no joints are passed in
@@ -113,284 +163,1282 @@ class ArmRig(prb.RiggingBase):
             
             return ["ERROR","NOT ENOUGH JOINTS","ERROR: You need to select at least 2 joints"]
 
+        #build the rig inside a build session, so every chain shares its state,
+        #e.g. the name index
         
-        #set the template joints
-        
-        self.m_templateJoints = _templateJoints[:]
-
-        #get the number of joints inputted
-        
-        numJoints = len(self.m_templateJoints)
-        
-        #make a list of names based on the number of joints
-        
-        names = []
+        pbs.startSession()
         
-        groupName = self.addExtToNames([self.m_rootName],"GRP")[0]
+        undoState = self.startUndo("pRigging " + str(self.m_rootName), _fastBuild)
         
-        if numJoints >= 1:
+        try:
             
-            #if there is at least 1 joint
+            #if caching, make the stored plan or plan and store it
             
-            names.append(self.addExtToNames([self.m_rootName], "Shoulder")[0])
+            if _cache is not None:
+                
+                return self.buildFromCache(
+                                        _cache,
+                                        _templateJoints,
+                                        self.getBuildParams(
+                                                        _doIK,
+                                                        _ikExt,
+                                                        _doFK,
+                                                        _fkExt,
+                                                        _jntExt,
+                                                        _ctrlExt,
+                                                        _doTwist,
+                                                        _twistStartIds,
+                                                        _numTwistJnts
+                                                        )
+                                        )
+                                        
+            #if planning, plan the rig and then make the plan
             
-        if numJoints >= 2:
+            if _usePlan:
+                
+                status = self.planArmRig(
+                                        _templateJoints,
+                                        _doIK,
+                                        _ikExt,
+                                        _doFK,
+                                        _fkExt,
+                                        _jntExt,
+                                        _ctrlExt,
+                                        _doTwist,
+                                        _twistStartIds,
+                                        _numTwistJnts
+                                        )
+                                        
+                if status[0] == "SUCCESS":
+                    
+                    self.executePlan()
+                    
+                return status
+                
+            return self.buildArmRig(
+                                    _templateJoints,
+                                    _doIK,
+                                    _ikExt,
+                                    _doFK,
+                                    _fkExt,
+                                    _jntExt,
+                                    _ctrlExt,
+                                    _doTwist,
+                                    _twistStartIds,
+                                    _numTwistJnts
+                                    )
+                                    
+        #the build is all or nothing, so a failure doesn't leave half a rig
+        
+        except:
             
-            #if there are at least 2 joints
+            self.rollback()
             
-            names.append(self.addExtToNames([self.m_rootName], "Wrist")[0])
+            raise
             
-        if numJoints == 3:
+        finally:
             
-            #if there are exactly three joints
+            self.endUndo(undoState, _fastBuild)
             
-            names.insert(-1, self.addExtToNames([self.m_rootName], "Elbow")[0])
+            pbs.endSession()
             
-        elif numJoints > 3:
+        """--------------------"""
+        
+    def regenArmRig(self, 
+                    _templateJoints,
+                    _doIK = True,
+                    _ikExt = "", 
+                    _doFK = True,
+                    _fkExt = "",
+                    _jntExt = "",
+                    _ctrlExt = "",
+                    _doTwist = True, 
+                    _twistStartIds = [-2],
+                    _numTwistJnts = 3,
+                    _usePlan = False,
+                    _fastBuild = False,
+                    _cache = None
+                    ):
+        
+        """
+            Method: regenArmRig
+                A method to regenerate the arm rig with new settings, only changing the parts
+                of the rig that are different. The rig is planned in memory with both the old
+                and the new settings and the plans are compared part by part, the IK chain,
+                the FK chain and the bind chain with its switch control. A part that only
+                differs by name is renamed in place, a part that is no longer wanted is
+                deleted, and only the parts that are new or made differently are built.
+                Takes the same inputs as genArmRig.
+                                        
+            On Exit:                The arm has been regenerated, a rig that hasn't been made,
+                                    or is made from different template joints, is built from
+                                    scratch with genArmRig, _usePlan and _cache are only used
+                                    then
+        """
+        
+        if not self.m_isGenerated or self.m_buildParams is None or list(_templateJoints) != self.m_templateJoints:
             
-            #if there are more than one joints
+            #the old rig is cleared in the same undo chunk as the new one is built,
+            #so a single undo puts it back
             
-            for i in range(1, numJoints-1):
+            undoState = self.startUndo("pRigging " + str(self.m_rootName), _fastBuild)
+            
+            try:
                 
-                #add the elbow as an extension and a number
+                self.clear()
                 
-                names.insert(-1, self.addExtToNames(self.addExtToNames([self.m_rootName], "Elbow"),str(i))[0])
+                return self.genArmRig(
+                                    _templateJoints,
+                                    _doIK,
+                                    _ikExt,
+                                    _doFK,
+                                    _fkExt,
+                                    _jntExt,
+                                    _ctrlExt,
+                                    _doTwist,
+                                    _twistStartIds,
+                                    _numTwistJnts,
+                                    _usePlan,
+                                    _fastBuild,
+                                    _cache
+                                    )
+                                    
+            finally:
                 
-        #set a default extension override
-        
-        extOver = ""
+                self.endUndo(undoState, _fastBuild)
+                                
+        params = self.getBuildParams(
+                                    _doIK,
+                                    _ikExt,
+                                    _doFK,
+                                    _fkExt,
+                                    _jntExt,
+                                    _ctrlExt,
+                                    _doTwist,
+                                    _twistStartIds,
+                                    _numTwistJnts
+                                    )
+                                    
+        pbs.startSession()
         
-        #set a value to it if only FK is being generated or only IK
+        undoState = self.startUndo("pRigging " + str(self.m_rootName), _fastBuild)
         
-        if (_doIK and not _doFK) or (_doFK and not _doIK):
+        try:
             
-            extOver = "Bind"
+            #work out what has changed without touching the scene
             
-        #Then if _doIk is true
-        
-        if _doIK:
+            actions = self.diffArmRig(params)
             
-            #if the extOver is not set
+            #then change it, as with a build a failure doesn't leave half a rig
             
-            if extOver != "Bind":
+            try:
                 
-                extOver = _ikExt
+                self.applyArmRigChanges(params, actions)
                 
-            #generate the IK chain
+            except:
+                
+                self.rollback()
+                
+                raise
+                
+        finally:
             
-            self.m_ikChain = pic.IKChain()
-
-            self.m_ikChain.genChain(self.m_templateJoints, names, _extOverride = extOver, _jointExt = _jntExt, _controlExt = _ctrlExt)
+            self.endUndo(undoState, _fastBuild)
             
-        if _doFK:
+            pbs.endSession()
             
-            #if the extOver is not set
+        changes = []
+        
+        for part in ARM_PARTS:
             
-            if extOver != "Bind":
+            if part in actions and actions[part][0] != "keep":
                 
-                extOver = _fkExt
+                changes.append("%s %s" % (PART_NAMES[part], ACTION_NAMES[actions[part][0]]))
                 
-            #generate the FK Chain
-            print extOver
-            self.m_fkChain = pfc.FKChain()
-
-            self.m_fkChain.genChain( self.m_templateJoints, names, _extOverride = extOver, _jointExt = _jntExt, _controlExt = _ctrlExt)
-            
-        if _doFK and _doIK:
-            
-            #generate the bind chain
-            
-            self.m_bindChain = pbc.BindChain()
-
-            if not _doTwist:
+            elif part in actions and (actions[part][1] != [] or actions[part][2] != []):
                 
-                self.m_bindChain.genChain(self.m_templateJoints, names)
+                changes.append("%s renamed" % PART_NAMES[part])
                 
-            else:
+        if changes == []:
+            
+            changes = ["nothing needed changing"]
+            
+        return ["SUCCESS","CHAIN REGENERATED","SUCCESS: The chain has been regenerated, " + ", ".join(changes)]
+        
+        """--------------------"""
+        
+    def planWithParams(self, _params, _session):
+        
+        """
+            Method: planWithParams
+                A method to plan a copy of the rig, from the same template joints, with the
+                settings passed in, without touching the scene
                 
-                 self.m_bindChain.genChain(self.m_templateJoints, names, _twistJointStartIDs = _twistStartIds, _numTwistJoints = _numTwistJnts, _jointExt = _jntExt)
-                
-            self.m_bindChain.connectJointsToChains([self.m_ikChain.getJointChain(),self.m_fkChain.getJointChain()], ["orient"])
-            
-            #now create a control to drive the FK/IK switching value
-            
-            self.m_FKIKControl = pctrl.Control()
-            self.m_FKIKControl.genCtrl(self.m_bindChain.getJoint(-1),
-                                        _name = self.addExtToNames([self.m_rootName],"FKIK")[0], 
-                                        _groupExtsOverride = ["0"],
-                                        _parent = self.m_bindChain.getJoint(-1)
-                                      )
-                                      
-            #move the switch control
-            
-            self.m_FKIKControl.offsetTopGroup (0, 3, 0, _os = True, _r = True)
-                                      
-            #add an attribute to the control    
-            
-            ikAttr = self.m_FKIKControl.addAttribute("FKIK_Switch",
-                                                        "float",
-                                                        _dv = 0,
-                                                        _max = 1,
-                                                        _min = 0,
-                                                        _setMax = True,
-                                                        _setMin = True
-                                                        ) 
-                                                        
-            multName = self.addExtToNames(self.addExtToNames([self.m_rootName],"FKIK"),"_MINUS")[0]
-                                                        
-            
-            #generate a minus node and connect it up
+            Inputs:
+                _params:                The build settings, see getBuildParams
+                _session:               The session to plan in, forked from the open one
+                                        so the names reserved don't count against it
+                                        
+            On Exit:                Returns the planned ArmRig, holding in-memory nodes
+        """
+        
+        rig = ArmRig(_params["rootName"])
+        
+        previous = pbs.swapSession(_session)
+        
+        try:
+            
+            rig.planArmRig(
+                        self.m_templateJoints,
+                        _params["doIK"],
+                        _params["ikExt"],
+                        _params["doFK"],
+                        _params["fkExt"],
+                        _params["jntExt"],
+                        _params["ctrlExt"],
+                        _params["doTwist"],
+                        _params["twistStartIds"],
+                        _params["numTwistJnts"]
+                        )
                         
-            self.m_reverseNode =  pm.shadingNode('plusMinusAverage', name = multName, au = True)
-                       
-            self.m_reverseNode.operation.set(2)
+        finally:
+            
+            pbs.swapSession(previous)
+            
+        return rig
+        
+        """--------------------"""
+        
+    def getPartNodes(self, _part):
+        
+        """
+            Method: getPartNodes
+                A method to return the nodes of one part of the rig, in the order they were
+                made, parts are "ik", "fk", "bind", the bind chain with its twist chains,
+                switch control and reverse node, and "top", the rig's group
+        """
+        
+        if _part == "ik" and self.m_ikChain != 0:
             
-            self.m_reverseNode.input1D[0].set(1)
+            return self.m_ikChain.getLedger()
             
-            self.m_FKIKControl.getCtrl().FKIK_Switch.connect(self.m_reverseNode.input1D[1])
+        if _part == "fk" and self.m_fkChain != 0:
             
-            #get a list of the constraints on the bind chain
+            return self.m_fkChain.getLedger()
             
-            constraintList = self.m_bindChain.getConstraints()
+        if _part == "bind" and self.m_bindChain != 0:
             
-            #for each constraint
+            nodes = self.m_bindChain.getLedger()
             
-            for const in constraintList:
+            if self.m_FKIKControl != 0:
                 
-                #get the weight attribute names
+                nodes.extend(self.m_FKIKControl.getLedger())
                 
-                weights =  const.getWeightAliasList()
+            nodes.extend(self.m_reverseNode)
                 
-                #then connect the appropriate values
+            return nodes
             
-                self.m_FKIKControl.getCtrl().FKIK_Switch.connect(weights[0])
-                self.m_reverseNode.output1D.connect(weights[1])
-                    
-        #make the group
-        
-        pm.select(cl = True)
-        self.m_topGroup = pm.group(n = groupName)
+        if _part == "top":
+            
+            return self.m_topGroup.getNodes()
+            
+        return []
         
-        #if the various chains exist, parent their top group to the group
+        """--------------------"""
         
-        if self.m_fkChain != 0:
-            
-            self.m_fkChain.getChainGroup().setParent(self.m_topGroup)
+    def diffArmRig(self, _params):
         
-        if self.m_ikChain != 0:
-            
-            self.m_ikChain.getChainGroup().setParent(self.m_topGroup)
+        """
+            Method: diffArmRig
+                A method to work out what has to change for the rig to match new settings, by
+                planning it with the old and the new settings and comparing the plans
+                
+            Inputs:
+                _params:                The new build settings, see getBuildParams
+                                        
+            On Exit:                Returns a dictionary of each part to a tuple of what to do
+                                    with it, "keep", "add", "remove" or "rebuild", a list of
+                                    the nodes to rename with their new names, and a list of
+                                    the constraints whose weight attributes, named after their
+                                    targets, need new aliases, with the index of the weight
+                                    and its new alias
+        """
         
-        if self.m_bindChain != 0:
-            
-            self.m_bindChain.getChainGroup().setParent(self.m_topGroup)
-            
-        #clear the selection
+        #both plans are made as if the rig wasn't in the scene
         
-        pm.select(cl = True)
+        session = pbs.getSession()
+        rigNames = [str(node) for node in self.getLedger()]
         
-        self.m_isGenerated = True
+        oldRig = self.planWithParams(self.m_buildParams, session.fork(rigNames))
+        newRig = self.planWithParams(_params, session.fork(rigNames))
         
-        #return success
+        oldNodes = dict([(node["name"], node) for node in oldRig.getPlan().getNodes()])
+        newNodes = dict([(node["name"], node) for node in newRig.getPlan().getNodes()])
         
-        return ["SUCCESS","CHAIN GENERATED","SUCCESS: The chain has been successfully generated"]
+        #pair up the planned nodes of the parts made the same number of nodes, the
+        #builds are the same so the nodes are made in the same order
         
-        """--------------------"""
+        nameMap = {}
         
-    def genFromMirror(self, _mirrorChain):
+        for part in ARM_PARTS:
+            
+            old = oldRig.getPartNodes(part)
+            new = newRig.getPartNodes(part)
+            
+            if len(old) == len(new):
+                
+                for i in range(0, len(old)):
+                    
+                    nameMap[str(old[i])] = str(new[i])
+                    
+        actions = {}
         
-        """
-            Method: genFromMirror
-                a method which generates a joint chain as a duplicate of the input jointChain
-                object, _mirror chain, and renames them correctly 
+        for part in ARM_PARTS:
             
-            Inputs:
-                self:                   A pointer to the instance of the FKChain class of which
-                                        this method is being called
-                _mirrorChain:           A jointChain object that will be mirrored to generate the
-                                        new jointChain object
-               
-            On Exit:                    The fk chain has been generated, as have the controls,
-                                        and they have both been connected together                           
-        """
+            current = self.getPartNodes(part)
+            old = oldRig.getPartNodes(part)
+            new = newRig.getPartNodes(part)
+            
+            if old == [] and new == []:
+                
+                continue
+                
+            if new == []:
+                
+                actions[part] = "remove"
+                
+            elif old == [] or current == []:
+                
+                actions[part] = "add"
+                
+            elif part == "top" or (len(current) == len(old) and self.isSamePart(old, new, oldRig, newRig, oldNodes, newNodes, nameMap)):
+                
+                actions[part] = "keep"
+                
+            else:
+                
+                actions[part] = "rebuild"
+                
+        #the bind chain is constrained to the joints of the other two chains, so it is
+        #made again if either of them is
         
-        #takes in a Twist chain object and mirrors it to generate the chain
+        if actions.get("bind") == "keep" and (actions.get("ik") != "keep" or actions.get("fk") != "keep"):
+            
+            actions["bind"] = "rebuild"
+            
+        #then the kept parts are renamed, along with the weights of their constraints
+        #whose targets are renamed
         
-        pass
+        for part in actions:
+            
+            renames = []
+            aliases = []
+            
+            if actions[part] == "keep":
+                
+                current = self.getPartNodes(part)
+                old = oldRig.getPartNodes(part)
+                new = newRig.getPartNodes(part)
+                
+                for i in range(0, len(current)):
+                    
+                    if str(current[i]).split("|")[-1] != str(new[i]):
+                        
+                        renames.append((current[i], str(new[i])))
+                        
+                    if new[i].nodeType().endswith("Constraint"):
+                        
+                        oldWeights = [weight.attrName() for weight in old[i].getWeightAliasList()]
+                        newWeights = [weight.attrName() for weight in new[i].getWeightAliasList()]
+                        
+                        for j in range(0, len(newWeights)):
+                            
+                            if oldWeights[j] != newWeights[j]:
+                                
+                                aliases.append((current[i], j, newWeights[j]))
+                                
+            actions[part] = (actions[part], renames, aliases)
+            
+        return actions
         
         """--------------------"""
         
-    def setRootName(self, _name):
-    
+    def isSamePart(self, _old, _new, _oldRig, _newRig, _oldNodes, _newNodes, _nameMap):
+        
         """
-            Method: setRootName
-                Method to set the root name for the arm rig
+            Method: isSamePart
+                A method to return whether or not a part of two planned rigs is made the same
+                way apart from the names of its nodes, i.e. the old part can just be renamed
                 
             Inputs:
-                _name:                  The text to set the name to
+                _old:                   The nodes of the part in the old plan
+                _new:                   The nodes of the part in the new plan
+                _oldRig:                The rig planned with the old settings
+                _newRig:                The rig planned with the new settings
+                _oldNodes:              A dictionary of the old plan's nodes by name
+                _newNodes:              A dictionary of the new plan's nodes by name
+                _nameMap:               A dictionary of old node names to new ones
         """
         
-        self.m_rootName = _name
+        plan = _oldRig.getPlan()
+        
+        for i in range(0, len(_old)):
+            
+            old = _oldNodes.get(str(_old[i]))
+            new = _newNodes.get(str(_new[i]))
+            
+            if old is None or new is None:
+                
+                return False
+                
+            for key in ("type", "parent", "create", "dynamic", "locked"):
+                
+                if self.mapNames(old[key], _nameMap) != new[key]:
+                    
+                    return False
+                    
+            if sorted(old["attrs"]) != sorted(new["attrs"]):
+                
+                return False
+                
+            for attr in old["attrs"]:
+                
+                if not plan.isClose(old["attrs"][attr], new["attrs"][attr]):
+                    
+                    return False
+                    
+        #and it must be connected the same way
+        
+        oldNames = set([str(node) for node in _old])
+        newNames = set([str(node) for node in _new])
         
+        oldConnections = [self.mapNames(connection, _nameMap) for connection in plan.getConnections()
+                            if connection[0].split(".")[0] in oldNames or connection[1].split(".")[0] in oldNames]
+        newConnections = [connection for connection in _newRig.getPlan().getConnections()
+                            if connection[0].split(".")[0] in newNames or connection[1].split(".")[0] in newNames]
+        
+        return sorted(oldConnections) == sorted(newConnections)
         
         """--------------------"""
         
-    def clear(self):
+    def mapNames(self, _value, _nameMap):
         
         """
-            Method: clear
-                A method to delete all of the maya objects generated by the joint chain
+            Method: mapNames
+                A method to return a planned value with the node names, and the node names
+                of plugs, in it swapped using the name map
         """
         
-        if self.m_isGenerated == True:
+        if isinstance(_value, list):
+            
+            return [self.mapNames(value, _nameMap) for value in _value]
+            
+        if isinstance(_value, dict):
+            
+            return dict([(key, self.mapNames(value, _nameMap)) for key, value in _value.items()])
+            
+        if isinstance(_value, str):
+            
+            parts = _value.split(".", 1)
+            
+            if parts[0] in _nameMap:
                 
-            #call clear on pRigging objects
-            if self.m_fkChain != 0:
+                parts[0] = _nameMap[parts[0]]
                 
-                self.m_fkChain.clear()
+            #the weights of a constraint are named after its targets, e.g. A_Elbow_IK_JNTW0
             
-            if self.m_ikChain != 0:
+            if len(parts) == 2:
                 
-                self.m_ikChain.clear()
+                index = parts[1].rfind("W")
                 
-            if self.m_bindChain != 0:
+                if index > 0 and parts[1][index+1:].isdigit() and parts[1][:index] in _nameMap:
+                    
+                    parts[1] = _nameMap[parts[1][:index]] + parts[1][index:]
+                    
+            return ".".join(parts)
+            
+        return _value
+        
+        """--------------------"""
+        
+    def applyArmRigChanges(self, _params, _actions):
+        
+        """
+            Method: applyArmRigChanges
+                A method to change the rig as worked out by diffArmRig, the parts going or
+                being made again are deleted in one go, the kept parts are renamed and then
+                the new parts are built and put in the rig's group
                 
-                self.m_bindChain.clear()
+            Inputs:
+                _params:                The new build settings, see getBuildParams
+                _actions:               The dictionary returned by diffArmRig
+        """
+        
+        session = pbs.getSession()
+        
+        #delete the parts that are going or being made again
+        
+        doomed = []
+        
+        for part in ARM_PARTS:
+            
+            if part in _actions and _actions[part][0] in ("remove", "rebuild"):
                 
-            if self.m_FKIKControl != 0:
+                doomed.extend(self.getPartNodes(part))
                 
-                self.m_FKIKControl.clear()
-            
-            #delete maya objects
-            try:
+                self.resetPart(part)
                 
-                pm.delete(self.m_topGroup)
+        doomed = [node for node in doomed if node.exists()]
+        
+        if doomed != []:
+            
+            session.releaseNames([str(node) for node in doomed])
+            
+            pm.delete(doomed)
+            
+        #rename the kept parts
+        
+        renames = []
+        
+        for part in ARM_PARTS:
+            
+            if part in _actions:
                 
-            except:
+                renames.extend(_actions[part][1])
                 
-                pass
+        self.renameNodes(renames)
+        
+        aliases = []
+        
+        for part in ARM_PARTS:
             
-            try:
+            if part in _actions:
                 
-                pm.delete(self.m_reverseNode)
+                aliases.extend(_actions[part][2])
                 
-            except:
+        self.renameWeights(aliases)
+        
+        #then build the new parts with the new settings
+        
+        self.m_buildParams = _params
+        
+        built = []
+        
+        for part in ("ik", "fk", "bind"):
+            
+            if part in _actions and _actions[part][0] in ("add", "rebuild"):
                 
-                pass
+                if part == "ik":
+                    
+                    self.buildIKPart(_params)
+                    
+                elif part == "fk":
+                    
+                    self.buildFKPart(_params)
+                    
+                else:
+                    
+                    self.buildBindPart(_params)
+                    
+                built.append(part)
                 
-            #then reset the lists
+        self.parentChainGroups(built)
+        
+        pm.select(cl = True)
+        
+        """--------------------"""
+        
+    def resetPart(self, _part):
+        
+        """
+            Method: resetPart
+                A method to forget one part of the rig once its nodes are to be deleted, see
+                getPartNodes
+        """
+        
+        if _part == "ik":
             
-            self.m_templateJoints = []
-            self.m_fkChain = 0
             self.m_ikChain = 0
+            
+        elif _part == "fk":
+            
+            self.m_fkChain = 0
+            
+        elif _part == "bind":
+            
+            #the reverse node is in the rig's own ledger
+            
+            self.m_ledger = pnl.NodeList([node for node in self.m_ledger if node not in self.m_reverseNode])
+            
             self.m_bindChain = 0
             self.m_FKIKControl = 0
-            self.m_reverseNode = ""
-            self.m_topGroup = ""
+            self.m_reverseNode = pnl.NodeList()
+            
+        """--------------------"""
+        
+    def renameNodes(self, _renames):
+        
+        """
+            Method: renameNodes
+                A method to rename nodes of the rig, names are swapped through temporary
+                names if any of the new names are still in use by the nodes being renamed
+                
+            Inputs:
+                _renames:               A list of nodes and their new names
+        """
+        
+        if _renames == []:
+            
+            return
+            
+        index = pbs.getSession().getNameIndex()
+        
+        oldNames = [str(node).split("|")[-1] for node, name in _renames]
+        
+        for name in oldNames:
+            
+            index.release(name)
+            
+        if set(oldNames) & set([name for node, name in _renames]):
+            
+            for node, name in _renames:
+                
+                pm.rename(node, index.reserve(name + "_TMP"))
+                
+        for node, name in _renames:
+            
+            tempName = str(node).split("|")[-1]
+            
+            pm.rename(node, index.reserve(name))
+            
+            if tempName not in oldNames:
+                
+                index.release(tempName)
+                
+        """--------------------"""
+        
+    def renameWeights(self, _aliases):
+        
+        """
+            Method: renameWeights
+                A method to give the weight attributes of constraints new aliases, as maya
+                leaves them named after the targets they had when the constraints were made
+                
+            Inputs:
+                _aliases:               A list of constraints, the indices of their weights and
+                                        the new aliases
+        """
+        
+        weights = {}
+        
+        for constraint, index, alias in _aliases:
+            
+            if constraint not in weights:
+                
+                weights[constraint] = constraint.getWeightAliasList()
+                
+            pm.aliasAttr(alias, weights[constraint][index])
+            
+        """--------------------"""
+        
+    def planArmRig(self, 
+                    _templateJoints,
+                    _doIK = True,
+                    _ikExt = "", 
+                    _doFK = True,
+                    _fkExt = "",
+                    _jntExt = "",
+                    _ctrlExt = "",
+                    _doTwist = True, 
+                    _twistStartIds = [-2],
+                    _numTwistJnts = 3
+                    ):
+        
+        """
+            Method: planArmRig
+                A method to plan the arm rig without changing the scene. The rig is built
+                against in-memory copies of the template joints and recorded as a BuildPlan,
+                which can be checked, compared or stored before executePlan makes it. Takes
+                the same inputs as genArmRig.
+                                        
+            On Exit:                The plan has been stored and the status of the build is
+                                    returned, until the plan is executed the rig holds the
+                                    in-memory nodes
+        """
+        
+        #the name index is made from the scene before the backend is swapped, so
+        #the planned names are free in the scene
+        
+        pbs.startSession().getNameIndex()
+        
+        recorder = pbp.PlanRecorder()
+        templateCopies = recorder.start(_templateJoints)
+        
+        try:
+            
+            status = self.buildArmRig(
+                                    templateCopies,
+                                    _doIK,
+                                    _ikExt,
+                                    _doFK,
+                                    _fkExt,
+                                    _jntExt,
+                                    _ctrlExt,
+                                    _doTwist,
+                                    _twistStartIds,
+                                    _numTwistJnts
+                                    )
+                                    
+        #the rig holds the in-memory nodes, which are thrown away with the
+        #plan, so there is nothing to delete
+        
+        except:
+            
+            self.emptyLedger()
+            
+            raise
+            
+        finally:
+            
+            self.m_plan = recorder.stop()
+            self.m_planExisting = recorder.getExisting()
+            
+            pbs.endSession()
+            
+        return status
+        
+        """--------------------"""
+        
+    def executePlan(self):
+        
+        """
+            Method: executePlan
+                A method to make the planned rig in the scene and swap the in-memory nodes
+                held by the rig for the scene nodes
+                                        
+            On Exit:                The rig has been made in the scene
+        """
+        
+        #the executor deletes what it made if it fails, leaving the rig holding
+        #the in-memory nodes, which have nothing to delete
+        
+        try:
+            
+            nodeMap = ppe.PlanExecutor().execute(self.m_plan, self.m_planExisting)
+            
+        except:
+            
+            self.emptyLedger()
+            
+            raise
+            
+        self.rebindNodes(nodeMap)
+        
+        """--------------------"""
+        
+    def buildFromCache(self, _cache, _templateJoints, _params):
+        
+        """
+            Method: buildFromCache
+                A method to build the rig from a cache of earlier builds. The key is made from
+                the template joints and the settings, if the build is cached, and its names are
+                free, the stored plan is made and the rig is given back the stored state of the
+                rig that planned it, without building any of the chains or controls. Otherwise
+                the rig is planned, stored and then made.
+                
+            Inputs:
+                _cache:                 The BuildCache to use
+                _templateJoints:        The joints to use as the template for the arm rig
+                _params:                The build settings, see getBuildParams
+                                        
+            On Exit:                The rig has been made and the status of the build is
+                                    returned
+        """
+        
+        key = _cache.getKey(self.__class__.__name__, _templateJoints, _params)
+        entry = _cache.get(key)
+        
+        index = pbs.getSession().getNameIndex()
+        
+        #a cached build is only used if the names it was planned with are free
+        
+        if entry is not None:
+            
+            plan = pbp.BuildPlan()
+            plan.fromData(entry["plan"])
+            
+            names = [node["name"] for node in plan.getNodes()]
+            
+            if [name for name in names if index.isUsed(name)] == []:
+                
+                index.reserveAll(names)
+                
+                existing = dict([(str(joint).split("|")[-1], joint) for joint in _templateJoints])
+                
+                self.m_plan = plan
+                self.m_planExisting = existing
+                
+                nodeMap = ppe.PlanExecutor().execute(plan, existing)
+                
+                self.setState(entry["state"], nodeMap)
+                
+                return list(entry["status"])
+                
+        #otherwise plan it and store it before it is made
+        
+        status = self.planArmRig(
+                                _templateJoints,
+                                _params["doIK"],
+                                _params["ikExt"],
+                                _params["doFK"],
+                                _params["fkExt"],
+                                _params["jntExt"],
+                                _params["ctrlExt"],
+                                _params["doTwist"],
+                                _params["twistStartIds"],
+                                _params["numTwistJnts"]
+                                )
+                                
+        if status[0] == "SUCCESS":
+            
+            _cache.put(key, {"status" : status,
+                             "plan" : self.m_plan.toData(),
+                             "state" : self.getState(["m_plan", "m_planExisting"])})
+                             
+            self.executePlan()
+            
+        return status
+        
+        """--------------------"""
+        
+    def getPlan(self):
+        
+        """
+            Method: getPlan
+                A method to return the BuildPlan of the rig, None if it was not planned
+        """
+        
+        return self.m_plan
+        
+        """--------------------"""
+        
+    def buildArmRig(self, 
+                    _templateJoints,
+                    _doIK,
+                    _ikExt, 
+                    _doFK,
+                    _fkExt,
+                    _jntExt,
+                    _ctrlExt,
+                    _doTwist, 
+                    _twistStartIds,
+                    _numTwistJnts
+                    ):
+        
+        """
+            Method: buildArmRig
+                A method to build the arm rig once the inputs have been checked, called by
+                genArmRig inside a build session, takes the same inputs as genArmRig
+                                        
+            On Exit:                The arm has been generated.
+        """
+        
+        #set the template joints and keep the settings the rig was built with, so
+        #it can be regenerated by only changing what is different
+        
+        self.m_templateJoints = pnl.NodeList(_templateJoints)
+        self.m_buildParams = self.getBuildParams(
+                                    _doIK,
+                                    _ikExt,
+                                    _doFK,
+                                    _fkExt,
+                                    _jntExt,
+                                    _ctrlExt,
+                                    _doTwist,
+                                    _twistStartIds,
+                                    _numTwistJnts
+                                    )
+        
+        #build each part of the rig in turn
+        
+        if _doIK:
+            
+            self.buildIKPart(self.m_buildParams)
+            
+        if _doFK:
+            
+            self.buildFKPart(self.m_buildParams)
             
-            #and set the is generated boolean
+        if _doFK and _doIK:
+            
+            self.buildBindPart(self.m_buildParams)
+            
+        #make the group
+        
+        self.m_topGroup = pnl.NodeList([self.makeNode("transform", self.reserveNames([self.addExtToNames([self.m_rootName],"GRP")[0]])[0])])
+        
+        #if the various chains exist, parent their top group to the group
+        
+        self.parentChainGroups(["ik", "fk", "bind"])
+            
+        #clear the selection
+        
+        pm.select(cl = True)
+        
+        self.m_isGenerated = True
+        
+        #return success
+        
+        return ["SUCCESS","CHAIN GENERATED","SUCCESS: The chain has been successfully generated"]
+        
+        """--------------------"""
+        
+    def getBuildParams(self, 
+                    _doIK,
+                    _ikExt, 
+                    _doFK,
+                    _fkExt,
+                    _jntExt,
+                    _ctrlExt,
+                    _doTwist, 
+                    _twistStartIds,
+                    _numTwistJnts
+                    ):
+        
+        """
+            Method: getBuildParams
+                A method to gather the settings of a build, along with the root name, into
+                a dictionary, takes the same inputs as genArmRig after the template joints
+        """
+        
+        return {"rootName" : str(self.m_rootName),
+                "doIK" : _doIK,
+                "ikExt" : _ikExt,
+                "doFK" : _doFK,
+                "fkExt" : _fkExt,
+                "jntExt" : _jntExt,
+                "ctrlExt" : _ctrlExt,
+                "doTwist" : _doTwist,
+                "twistStartIds" : list(_twistStartIds),
+                "numTwistJnts" : _numTwistJnts}
+                
+        """--------------------"""
+        
+    def getChainNames(self):
+        
+        """
+            Method: getChainNames
+                A method to return the list of names for the chains, one per template joint,
+                e.g. Shoulder, Elbow and Wrist after the root name
+        """
+        
+        #get the number of joints inputted
+        
+        numJoints = len(self.m_templateJoints)
+        
+        #make a list of names based on the number of joints
+        
+        names = []
+        
+        if numJoints >= 1:
+            
+            #if there is at least 1 joint
+            
+            names.append(self.addExtToNames([self.m_rootName], "Shoulder")[0])
             
-            self.m_isGenerated = False
+        if numJoints >= 2:
+            
+            #if there are at least 2 joints
+            
+            names.append(self.addExtToNames([self.m_rootName], "Wrist")[0])
+            
+        if numJoints == 3:
+            
+            #if there are exactly three joints
+            
+            names.insert(-1, self.addExtToNames([self.m_rootName], "Elbow")[0])
+            
+        elif numJoints > 3:
+            
+            #if there are more than one joints
+            
+            for i in range(1, numJoints-1):
+                
+                #add the elbow as an extension and a number
+                
+                names.insert(-1, self.renameFromNames([self.m_rootName], 0, ["Elbow", str(i)])[0])
+                
+        return names
+        
+        """--------------------"""
+        
+    def buildIKPart(self, _params):
+        
+        """
+            Method: buildIKPart
+                A method to generate the IK chain
+                
+            Inputs:
+                _params:                The build settings, see getBuildParams
+        """
+        
+        #if only the IK chain is made it is the bind chain
+        
+        extOver = _params["ikExt"]
+        
+        if not _params["doFK"]:
+            
+            extOver = "Bind"
+            
+        self.m_ikChain = pic.IKChain()
+
+        self.m_ikChain.genChain(self.m_templateJoints, self.getChainNames(), _extOverride = extOver, _jointExt = _params["jntExt"], _controlExt = _params["ctrlExt"])
+        
+        """--------------------"""
+        
+    def buildFKPart(self, _params):
+        
+        """
+            Method: buildFKPart
+                A method to generate the FK chain
+                
+            Inputs:
+                _params:                The build settings, see getBuildParams
+        """
+        
+        #if only the FK chain is made it is the bind chain
+        
+        extOver = _params["fkExt"]
+        
+        if not _params["doIK"]:
+            
+            extOver = "Bind"
+            
+        self.m_fkChain = pfc.FKChain()
+
+        self.m_fkChain.genChain( self.m_templateJoints, self.getChainNames(), _extOverride = extOver, _jointExt = _params["jntExt"], _controlExt = _params["ctrlExt"])
+        
+        """--------------------"""
+        
+    def buildBindPart(self, _params):
+        
+        """
+            Method: buildBindPart
+                A method to generate the bind chain, with any twist chains, constrain it to the
+                IK and FK chains and make the control that switches between them, both of
+                the other chains must already be made
+                
+            Inputs:
+                _params:                The build settings, see getBuildParams
+        """
+        
+        names = self.getChainNames()
+        
+        #generate the bind chain
+        
+        self.m_bindChain = pbc.BindChain()
+
+        if not _params["doTwist"]:
+            
+            self.m_bindChain.genChain(self.m_templateJoints, names)
+            
+        else:
+            
+             self.m_bindChain.genChain(self.m_templateJoints, names, _twistJointStartIDs = _params["twistStartIds"], _numTwistJoints = _params["numTwistJnts"], _jointExt = _params["jntExt"])
+            
+        self.m_bindChain.connectJointsToChains([self.m_ikChain.getJointChain(),self.m_fkChain.getJointChain()], ["orient"])
+        
+        #now create a control to drive the FK/IK switching value
+        
+        self.m_FKIKControl = pctrl.Control()
+        self.m_FKIKControl.genCtrl(self.m_bindChain.getJoint(-1),
+                                    _name = self.addExtToNames([self.m_rootName],"FKIK")[0], 
+                                    _groupExtsOverride = ["0"],
+                                    _parent = self.m_bindChain.getJoint(-1)
+                                  )
+                                  
+        #move the switch control
+        
+        self.m_FKIKControl.offsetTopGroup (0, 3, 0, _os = True, _r = True)
+                                  
+        #add an attribute to the control    
+        
+        ikAttr = self.m_FKIKControl.addAttribute("FKIK_Switch",
+                                                    "float",
+                                                    _dv = 0,
+                                                    _max = 1,
+                                                    _min = 0,
+                                                    _setMax = True,
+                                                    _setMin = True
+                                                    ) 
+                                                    
+        multName = self.renameFromNames([self.m_rootName], 0, ["FKIK", "_MINUS"])[0]
+                                                    
+        
+        #generate a minus node and connect it up
+                    
+        reverseNode =  self.recordNode(pm.shadingNode('plusMinusAverage', name = self.reserveNames([multName])[0], au = True))
+        
+        self.m_reverseNode = pnl.NodeList([reverseNode])
+                   
+        reverseNode.operation.set(2)
+        
+        reverseNode.input1D[0].set(1)
+        
+        self.m_FKIKControl.getCtrl().FKIK_Switch.connect(reverseNode.input1D[1])
+        
+        #get a list of the constraints on the bind chain
+        
+        constraintList = self.m_bindChain.getConstraints()
+        
+        #for each constraint
+        
+        for const in constraintList:
+            
+            #get the weight attribute names
+            
+            weights =  const.getWeightAliasList()
+            
+            #then connect the appropriate values
+        
+            self.m_FKIKControl.getCtrl().FKIK_Switch.connect(weights[0])
+            reverseNode.output1D.connect(weights[1])
+        
+        """--------------------"""
+        
+    def parentChainGroups(self, _parts):
+        
+        """
+            Method: parentChainGroups
+                A method to parent the top groups of the chains that exist to the rig's group
+                
+            Inputs:
+                _parts:                 The parts to parent, any of "ik", "fk" and "bind"
+        """
+        
+        if "fk" in _parts and self.m_fkChain != 0:
+            
+            self.reparentNode(self.m_fkChain.getChainGroup(), self.m_topGroup[0])
+        
+        if "ik" in _parts and self.m_ikChain != 0:
+            
+            self.reparentNode(self.m_ikChain.getChainGroup(), self.m_topGroup[0])
+        
+        if "bind" in _parts and self.m_bindChain != 0:
+            
+            self.reparentNode(self.m_bindChain.getChainGroup(), self.m_topGroup[0])
+            
+        """--------------------"""
+        
+    def genFromMirror(self, _mirrorChain):
+        
+        """
+            Method: genFromMirror
+                a method which generates a joint chain as a duplicate of the input jointChain
+                object, _mirror chain, and renames them correctly 
+            
+            Inputs:
+                self:                   A pointer to the instance of the FKChain class of which
+                                        this method is being called
+                _mirrorChain:           A jointChain object that will be mirrored to generate the
+                                        new jointChain object
+               
+            On Exit:                    The fk chain has been generated, as have the controls,
+                                        and they have both been connected together                           
+        """
+        
+        #takes in a Twist chain object and mirrors it to generate the chain
+        
+        pass
+        
+        """--------------------"""
+        
+    def setRootName(self, _name):
+    
+        """
+            Method: setRootName
+                Method to set the root name for the arm rig
+                
+            Inputs:
+                _name:                  The text to set the name to
+        """
+        
+        self.m_rootName = _name
+        
+        
+        """--------------------"""
+        
+    def clear(self):
+        
+        """
+            Method: clear
+                A method to delete all of the maya objects generated by the joint chain
+        """
+        
+        if self.m_isGenerated == True:
+            
+            #delete every node made, along with those of the objects held, in
+            #a single delete
+            
+            self.deleteLedger()
+            self.resetRig()
+        
+        """--------------------"""
+        
+    def rollback(self):
+        
+        """
+            Method: rollback
+                A method to undo a build that failed part way through, everything made
+                so far is deleted in a single delete and the rig is reset, ready to be
+                built again
+        """
+        
+        self.deleteLedger()
+        self.resetRig()
+        
+        """--------------------"""
+        
+    def resetRig(self):
+        
+        """
+            Method: resetRig
+                A method to reset the rig and the pRigging objects it holds once their
+                nodes have been deleted
+        """
+        
+        #clear the pRigging objects too, they have nothing left to delete
+        
+        if self.m_fkChain != 0:
+            
+            self.m_fkChain.clear()
+        
+        if self.m_ikChain != 0:
+            
+            self.m_ikChain.clear()
+            
+        if self.m_bindChain != 0:
+            
+            self.m_bindChain.clear()
+            
+        if self.m_FKIKControl != 0:
+            
+            self.m_FKIKControl.clear()
+            
+        #then reset the lists
+        
+        self.m_templateJoints = pnl.NodeList()
+        self.m_fkChain = 0
+        self.m_ikChain = 0
+        self.m_bindChain = 0
+        self.m_FKIKControl = 0
+        self.m_reverseNode = pnl.NodeList()
+        self.m_topGroup = pnl.NodeList()
+        self.m_buildParams = None
+        
+        #and set the is generated boolean
+        
+        self.m_isGenerated = False
         
         """--------------------"""
         
@@ -415,8 +1463,8 @@ class ArmRig(prb.RiggingBase):
                 _val:                   The value to set it to, boolean
         """
         
-        if self.m_topGroup != "":
+        for topGroup in self.m_topGroup:
             
-            self.m_topGroup.visibility.set(_val)
+            topGroup.visibility.set(_val)
         
 #----------END-ArmRig-Class----------#  
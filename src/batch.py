@@ -0,0 +1,631 @@
+#----------Imports----------#
+
+import os
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+import pRigging.src.scenebackend as psb
+import pRigging.src.buildsession as pbs
+import pRigging.src.buildcache as pbc
+import pRigging.src.rigspec as prs
+
+pm = psb.pm
+
+#----------BatchBuilder-Class----------#
+
+class BatchBuilder(object):
+
+    """
+        Class: BatchBuilder
+            Builds the rigs described in spec files without any UI, e.g. to rig a
+            whole cast overnight. Each job in a spec file opens its scene, builds
+            its rigs in one build session and saves the scene, and a rig that fails
+            is rolled back and reported without stopping the rest of the batch.
+
+        File: pRigging/src/batch.py
+
+        Contains:
+            self.m_backend:         "maya" to build in maya through pymel, "cmds" to
+                                    build in maya through maya.cmds and the API or
+                                    "memory" to build in the in-memory scene, e.g.
+                                    to check specs, scene files can only be used in
+                                    maya
+            self.m_usePlan:         Whether or not each rig is planned first
+            self.m_fastBuild:       Whether or not undo is recorded while building
+            self.m_cache:           The BuildCache the builds are looked up in, None
+                                    when not caching
+            self.m_results:         A list of dictionaries, one per rig built
+
+        Imports:
+            os
+            sys
+            json
+            time
+            argparse
+            multiprocessing
+            pRigging.src.scenebackend as psb
+            pRigging.src.buildsession as pbs
+            pRigging.src.buildcache as pbc
+            pRigging.src.rigspec as prs
+    """
+
+    def __init__(self, _backend = "maya", _usePlan = False, _fastBuild = True, _cache = None):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _backend:               "maya", "cmds" or "memory", defaults to maya
+                _usePlan:               Whether or not to plan each rig first
+                _fastBuild:             Whether or not to build without recording undo,
+                                        defaults to True as nothing is undone in a batch
+                _cache:                 A BuildCache to use, or None
+        """
+
+        self.m_backend = _backend
+        self.m_usePlan = _usePlan
+        self.m_fastBuild = _fastBuild
+        self.m_cache = _cache
+        self.m_results = []
+
+        """--------------------"""
+
+    def openScene(self, _path):
+
+        """
+            Method: openScene
+                opens a scene file, or starts an empty scene if the path is None
+        """
+
+        if self.m_backend == "memory":
+
+            if _path is not None:
+
+                raise RuntimeError("scene files can't be opened in the in-memory scene: " + _path)
+
+            psb.useMemoryScene()
+
+            return
+
+        if self.m_backend == "cmds":
+
+            psb.useCmds()
+
+        else:
+
+            psb.usePymel()
+
+        if _path is None:
+
+            pm.newFile(force = True)
+
+        else:
+
+            pm.openFile(_path, force = True)
+
+        """--------------------"""
+
+    def saveScene(self, _path):
+
+        """
+            Method: saveScene
+                saves the open scene as the path passed in
+        """
+
+        if self.m_backend == "memory":
+
+            raise RuntimeError("the in-memory scene can't be saved: " + _path)
+
+        pm.saveAs(_path, force = True)
+
+        """--------------------"""
+
+    def runJob(self, _job, _verbose = False):
+
+        """
+            Method: runJob
+                opens the scene of a job, builds each of its rigs and saves it
+
+            Inputs:
+                _job:                   A job dictionary, see rigspec.loadSpecFile
+                _verbose:               Whether or not to print each result
+
+            On Exit:                    Returns the list of results for the job's rigs
+        """
+
+        results = []
+
+        try:
+
+            self.openScene(_job["scene"])
+
+        except Exception as e:
+
+            result = self.newResult(_job, None, ["ERROR", "SCENE NOT OPENED", "ERROR: " + str(e)], 0.0)
+            results.append(result)
+
+            self.report(result, _verbose)
+
+            return results
+
+        #the rigs of a scene share one build session, so the scene's names are
+        #only listed once
+
+        pbs.startSession()
+
+        try:
+
+            for spec in _job["rigs"]:
+
+                start = time.time()
+
+                try:
+
+                    status = spec.build(self.m_usePlan, self.m_fastBuild, self.m_cache)
+
+                except Exception as e:
+
+                    status = ["ERROR", "BUILD FAILED", "ERROR: The build failed and was rolled back, " + str(e)]
+
+                result = self.newResult(_job, spec, status, time.time() - start)
+                results.append(result)
+
+                self.report(result, _verbose)
+
+        finally:
+
+            pbs.endSession()
+
+        #only save a scene every rig was built in
+
+        if _job["save"] is not None and [result for result in results if result["status"] != "SUCCESS"] == []:
+
+            try:
+
+                self.saveScene(_job["save"])
+
+            except Exception as e:
+
+                result = self.newResult(_job, None, ["ERROR", "SCENE NOT SAVED", "ERROR: " + str(e)], 0.0)
+                results.append(result)
+
+                self.report(result, _verbose)
+
+        return results
+
+        """--------------------"""
+
+    def newResult(self, _job, _spec, _status, _time):
+
+        """
+            Method: newResult
+                returns the result dictionary of one rig, or of a scene that failed to
+                open or save when the spec is None
+        """
+
+        rig = None
+
+        if _spec is not None:
+
+            rig = _spec.getRootName()
+
+        return {"spec" : _job["spec"],
+                "scene" : _job["scene"],
+                "rig" : rig,
+                "status" : _status[0],
+                "title" : _status[1],
+                "message" : _status[2],
+                "time" : _time}
+
+        """--------------------"""
+
+    def report(self, _result, _verbose):
+
+        """
+            Method: report
+                prints a one line summary of a result if verbose
+        """
+
+        if _verbose:
+
+            print("%-7s %-24s %8.2f ms  %s" % (_result["status"], _result["rig"] or _result["scene"] or _result["spec"],
+                                               _result["time"]*1000.0, _result["message"]))
+
+        """--------------------"""
+
+    def run(self, _paths, _verbose = False):
+
+        """
+            Method: run
+                runs every job in the spec files passed in
+
+            Inputs:
+                _paths:                 A list of spec files
+                _verbose:               Whether or not to print each result
+
+            On Exit:                    Returns the list of results
+        """
+
+        self.m_results = []
+
+        for job in self.loadJobs(_paths, _verbose):
+
+            self.m_results.extend(self.runJob(job, _verbose))
+
+        return self.m_results
+
+        """--------------------"""
+
+    def loadJobs(self, _paths, _verbose = False):
+
+        """
+            Method: loadJobs
+                reads the jobs from the spec files passed in, a file that can't be read
+                is added to the results as a failure
+
+            On Exit:                    Returns the list of jobs, see rigspec.loadSpecFile
+        """
+
+        jobs = []
+
+        for path in _paths:
+
+            try:
+
+                jobs.extend(prs.loadSpecFile(path))
+
+            except (IOError, ValueError) as e:
+
+                result = self.newResult({"spec" : path, "scene" : None}, None,
+                                        ["ERROR", "SPEC NOT LOADED", "ERROR: " + str(e)], 0.0)
+                self.m_results.append(result)
+
+                self.report(result, _verbose)
+
+        return jobs
+
+        """--------------------"""
+
+    def getFailures(self):
+
+        """
+            Method: getFailures
+                returns the results that didn't succeed
+        """
+
+        return [result for result in self.m_results if result["status"] != "SUCCESS"]
+
+        """--------------------"""
+
+    def save(self, _path):
+
+        """
+            Method: save
+                writes the results to a json file
+
+            Inputs:
+                _path:                  The file to write to
+        """
+
+        data = self.getRunInfo()
+        data["results"] = self.m_results
+
+        f = open(_path, "w")
+        json.dump(data, f, indent = 2, sort_keys = True)
+        f.close()
+
+        """--------------------"""
+
+    def getRunInfo(self):
+
+        """
+            Method: getRunInfo
+                returns a dictionary of the settings of the run, saved with the results
+        """
+
+        return {"backend" : self.m_backend,
+                "usePlan" : self.m_usePlan,
+                "fastBuild" : self.m_fastBuild,
+                "time" : time.strftime("%Y-%m-%d %H:%M:%S")}
+
+        """--------------------"""
+
+#----------END-BatchBuilder-Class----------#
+
+#----------BatchScheduler-Class----------#
+
+class BatchScheduler(BatchBuilder):
+
+    """
+        Class: BatchScheduler
+            Runs the jobs of a batch in a pool of worker processes, so a batch of
+            scene files is spread across every core. Each worker has its own
+            BatchBuilder and scene backend, e.g. its own maya session or in-memory
+            scene, and runs a whole job at a time, as the rigs of a scene have to
+            be built in the same scene. The results come back as they would from
+            the BatchBuilder, in the order of the jobs, with the worker each job
+            ran on and the time it took.
+
+        File: pRigging/src/batch.py
+
+        Contains:
+            self.m_workers:         The number of worker processes
+            self.m_cacheDir:        The directory the workers cache builds in, None
+                                    when not caching, the cache is shared through it
+            self.m_wallTime:        The time the last run took from start to end
+    """
+
+    def __init__(self, _workers = None, _backend = "maya", _usePlan = False, _fastBuild = True, _cacheDir = None):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _workers:               The number of worker processes, defaults to
+                                        None for one per core
+                _backend:               "maya", "cmds" or "memory", defaults to maya
+                _usePlan:               Whether or not to plan each rig first
+                _fastBuild:             Whether or not to build without recording undo
+                _cacheDir:              The directory to cache builds in, or None
+        """
+
+        BatchBuilder.__init__(self, _backend, _usePlan, _fastBuild)
+
+        self.m_workers = _workers or multiprocessing.cpu_count()
+        self.m_cacheDir = _cacheDir
+        self.m_wallTime = 0.0
+
+        """--------------------"""
+
+    def run(self, _paths, _verbose = False):
+
+        """
+            Method: run
+                runs every job in the spec files passed in across the worker pool
+
+            Inputs:
+                _paths:                 A list of spec files
+                _verbose:               Whether or not to print each result as its
+                                        job finishes
+
+            On Exit:                    Returns the list of results
+        """
+
+        start = time.time()
+
+        self.m_results = []
+
+        jobs = [(i, jobToData(job)) for i, job in enumerate(self.loadJobs(_paths, _verbose))]
+        finished = {}
+
+        pool = multiprocessing.Pool(self.m_workers, initWorker,
+                                    (self.m_backend, self.m_usePlan, self.m_fastBuild, self.m_cacheDir))
+
+        try:
+
+            for index, results in pool.imap_unordered(runWorkerJob, jobs):
+
+                finished[index] = results
+
+                for result in results:
+
+                    self.report(result, _verbose)
+
+        finally:
+
+            pool.close()
+            pool.join()
+
+        for index in sorted(finished):
+
+            self.m_results.extend(finished[index])
+
+        self.m_wallTime = time.time() - start
+
+        return self.m_results
+
+        """--------------------"""
+
+    def getRunInfo(self):
+
+        """
+            Method: getRunInfo
+                returns a dictionary of the settings of the run, along with the number of
+                workers and the time the run took
+        """
+
+        data = BatchBuilder.getRunInfo(self)
+        data["workers"] = self.m_workers
+        data["wallTime"] = self.m_wallTime
+
+        return data
+
+        """--------------------"""
+
+#----------END-BatchScheduler-Class----------#
+
+#the builder each worker process runs its jobs with, and the error it hit
+#starting up if it couldn't, see initWorker
+
+workerBuilder = None
+workerError = None
+
+def initWorker(_backend, _usePlan, _fastBuild, _cacheDir):
+
+    """
+        Function: initWorker
+            sets up a worker process of a BatchScheduler, starting maya in it if
+            building in maya, an error is kept to report with each job rather than
+            raised, as the pool would keep starting new workers
+    """
+
+    global workerBuilder, workerError
+
+    try:
+
+        if _backend != "memory":
+
+            initMaya()
+
+        cache = None
+
+        if _cacheDir is not None:
+
+            cache = pbc.BuildCache(_cacheDir)
+
+        workerBuilder = BatchBuilder(_backend, _usePlan, _fastBuild, cache)
+
+    except Exception as e:
+
+        workerError = "the worker could not start, " + str(e)
+
+    """--------------------"""
+
+def runWorkerJob(_job):
+
+    """
+        Function: runWorkerJob
+            runs one job in a worker process
+
+        Inputs:
+            _job:                   A tuple of the index of the job and the job as
+                                    plain data, see jobToData
+
+        On Exit:                    Returns a tuple of the index and the list of
+                                    results
+    """
+
+    index, job = _job
+    job = jobFromData(job)
+
+    start = time.time()
+
+    if workerError is not None:
+
+        results = [BatchBuilder().newResult(job, None, ["ERROR", "WORKER FAILED", "ERROR: " + workerError], 0.0)]
+
+    else:
+
+        results = workerBuilder.runJob(job)
+
+    for result in results:
+
+        result["worker"] = os.getpid()
+        result["jobTime"] = time.time() - start
+
+    return (index, results)
+
+    """--------------------"""
+
+def jobToData(_job):
+
+    """
+        Function: jobToData
+            returns a job with its RigSpecs as plain data, to send to a worker
+    """
+
+    data = dict(_job)
+    data["rigs"] = [spec.toData() for spec in _job["rigs"]]
+
+    return data
+
+    """--------------------"""
+
+def jobFromData(_data):
+
+    """
+        Function: jobFromData
+            returns a job made by jobToData with its RigSpecs made again
+    """
+
+    job = dict(_data)
+    job["rigs"] = [prs.RigSpec(rig) for rig in _data["rigs"]]
+
+    return job
+
+    """--------------------"""
+
+def initMaya():
+
+    """
+        Function: initMaya
+            starts maya without its UI, when run outside of maya, e.g. by mayapy
+    """
+
+    import maya.standalone
+
+    maya.standalone.initialize(name = "python")
+
+    """--------------------"""
+
+def main(_args = None):
+
+    """
+        Function: main
+            builds the rigs in spec files from the command line, e.g.
+                mayapy -m pRigging.src.batch hero.json villain.json -o results.json
+
+        On Exit:                    Returns 1 if any rig failed to build, otherwise 0
+    """
+
+    parser = argparse.ArgumentParser(description = "Build rigs from rig spec files")
+    parser.add_argument("specs", nargs = "+", help = "json rig spec files")
+    parser.add_argument("-o", "--output", default = "", help = "json file to write the results to")
+    parser.add_argument("--backend", default = "maya", choices = ["maya", "cmds", "memory"])
+    parser.add_argument("--plan", action = "store_true", help = "plan each rig and build it from the plan")
+    parser.add_argument("--undo", action = "store_true", help = "record undo while building")
+    parser.add_argument("--cache", default = None, help = "directory to cache builds in")
+    parser.add_argument("-j", "--jobs", type = int, default = 1, help = "worker processes to build in, 0 for one per core")
+    parser.add_argument("-q", "--quiet", action = "store_true")
+
+    args = parser.parse_args(_args)
+
+    #with more than one worker each worker starts its own maya
+
+    if args.jobs != 1:
+
+        builder = BatchScheduler(args.jobs, args.backend, args.plan, not args.undo, args.cache)
+
+    else:
+
+        if args.backend != "memory":
+
+            initMaya()
+
+        cache = None
+
+        if args.cache is not None:
+
+            cache = pbc.BuildCache(args.cache)
+
+        builder = BatchBuilder(args.backend, args.plan, not args.undo, cache)
+
+    builder.run(args.specs, _verbose = not args.quiet)
+
+    if args.output != "":
+
+        builder.save(args.output)
+
+    failures = builder.getFailures()
+
+    if not args.quiet:
+
+        print("%d rigs built, %d failed" % (len(builder.m_results) - len(failures), len(failures)))
+
+    if failures != []:
+
+        return 1
+
+    return 0
+
+    """--------------------"""
+
+if __name__ == "__main__":
+
+    sys.exit(main())
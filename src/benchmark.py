@@ -0,0 +1,473 @@
+#----------Imports----------#
+
+import sys
+import json
+import time
+import platform
+import argparse
+import pRigging.src.scenebackend as psb
+import pRigging.src.armrig as par
+import pRigging.src.profiler as pprof
+import pRigging.src.buildcache as pbc
+
+pm = psb.pm
+
+#----------ArmRigBenchmark-Class----------#
+
+class ArmRigBenchmark:
+
+    """
+        Class: ArmRigBenchmark
+            A class to time ArmRig.genArmRig over a sweep of template chain lengths,
+            twist settings and FK/IK combinations. Each configuration is built in a
+            fresh scene and the wall time, the number of scene commands and the
+            number of nodes created are recorded, the results can be saved as json
+            and compared against an earlier run to catch regressions.
+
+        File: pRigging/src/benchmark.py
+
+        Contains:
+            self.m_backend:         "memory" to build in the in-memory scene, "maya"
+                                    to build in maya through pymel or "cmds" to
+                                    build in maya through maya.cmds and the API,
+                                    running the same sweep with "maya" and "cmds"
+                                    and comparing the two compares the backends
+            self.m_repeats:         The number of times each configuration is built,
+                                    the fastest time is kept
+            self.m_usePlan:         Whether or not the rigs are planned and then made
+                                    from the plan
+            self.m_profile:         Whether or not each build is profiled, adding the
+                                    time and commands of each build stage to its
+                                    result
+            self.m_cache:           The BuildCache the builds are looked up in, None
+                                    when not caching, every repeat after the first
+                                    of a configuration is made from the cache
+            self.m_results:         A list of dictionaries, one per configuration
+
+        Imports:
+            sys
+            json
+            time
+            platform
+            argparse
+            pRigging.src.scenebackend as psb
+            pRigging.src.armrig as par
+            pRigging.src.profiler as pprof
+            pRigging.src.buildcache as pbc
+    """
+
+    #the default sweep
+
+    JOINT_COUNTS = [3, 4, 6, 8, 12]
+    TWIST_COUNTS = [3, 5, 10, 20]
+    TWIST_STARTS = [[], [-2], [0, -2]]
+    CHAIN_TYPES = [(True, True), (True, False), (False, True)]
+
+    def __init__(self, _backend = "memory", _repeats = 3, _usePlan = False, _profile = False, _cache = False):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _backend:               "memory", "maya" or "cmds", defaults to memory
+                _repeats:               The number of builds per configuration
+                _usePlan:               Whether or not to build from a plan
+                _profile:               Whether or not to profile the build stages
+                _cache:                 Whether or not to cache the builds
+        """
+
+        self.m_backend = _backend
+        self.m_repeats = _repeats
+        self.m_usePlan = _usePlan
+        self.m_profile = _profile
+        self.m_cache = None
+        self.m_results = []
+
+        if _cache:
+
+            self.m_cache = pbc.BuildCache()
+
+        """--------------------"""
+
+    def newScene(self):
+
+        """
+            Method: newScene
+                starts an empty scene on the chosen backend
+
+            On Exit:                    Returns the in-memory or cmds scene, which count
+                                        their commands, or None through pymel
+        """
+
+        if self.m_backend == "memory":
+
+            return psb.useMemoryScene()
+
+        if self.m_backend == "cmds":
+
+            scene = psb.useCmds()
+            pm.newFile(force = True)
+
+            return scene
+
+        psb.usePymel()
+        pm.newFile(force = True)
+
+        return None
+
+        """--------------------"""
+
+    def genTemplateChain(self, _numJoints, _name = "template"):
+
+        """
+            Method: genTemplateChain
+                makes a template arm chain, running out along x with a slight bend
+                back in z so that every joint has a well defined orientation
+
+            Inputs:
+                _numJoints:             The number of joints in the chain
+                _name:                  The base name of the joints
+
+            On Exit:                    Returns the list of joints, parent first
+        """
+
+        joints = []
+
+        pm.select(cl = True)
+
+        for i in range(0, _numJoints):
+
+            joints.append(pm.joint(name = "%s_%d_JNT" % (_name, i+1), position = (i*10.0, 150.0, -0.25*i*i)))
+
+        pm.select(cl = True)
+
+        return joints
+
+        """--------------------"""
+
+    def getConfigs(self, _jointCounts = None, _twistCounts = None, _twistStarts = None, _chainTypes = None):
+
+        """
+            Method: getConfigs
+                returns the list of configurations to build, configurations which
+                only differ in settings that are ignored are only listed once, twist
+                settings only matter when a bind chain is made (both FK and IK)
+        """
+
+        configs = []
+
+        for numJoints in (_jointCounts or self.JOINT_COUNTS):
+
+            for doIK, doFK in (_chainTypes or self.CHAIN_TYPES):
+
+                if not (doIK and doFK):
+
+                    configs.append({"numJoints" : numJoints, "doIK" : doIK, "doFK" : doFK,
+                                    "twistStartIds" : [], "numTwistJnts" : 0})
+
+                    continue
+
+                for twistStarts in (_twistStarts if _twistStarts is not None else self.TWIST_STARTS):
+
+                    if twistStarts == []:
+
+                        configs.append({"numJoints" : numJoints, "doIK" : doIK, "doFK" : doFK,
+                                        "twistStartIds" : [], "numTwistJnts" : 0})
+
+                        continue
+
+                    for numTwist in (_twistCounts or self.TWIST_COUNTS):
+
+                        configs.append({"numJoints" : numJoints, "doIK" : doIK, "doFK" : doFK,
+                                        "twistStartIds" : twistStarts, "numTwistJnts" : numTwist})
+
+        return configs
+
+        """--------------------"""
+
+    def runConfig(self, _config):
+
+        """
+            Method: runConfig
+                builds one configuration _repeats times and records the fastest build
+
+            Inputs:
+                _config:                A configuration dictionary from getConfigs
+
+            On Exit:                    Returns the result dictionary
+        """
+
+        best = None
+
+        for i in range(0, self.m_repeats):
+
+            scene = self.newScene()
+
+            templateJoints = self.genTemplateChain(_config["numJoints"])
+
+            nodesBefore = len(pm.ls())
+
+            if scene is not None:
+
+                scene.resetStats()
+
+            arm = par.ArmRig("Bench_L_Arm")
+
+            profiler = None
+
+            if self.m_profile:
+
+                profiler = pprof.BuildProfiler()
+                profiler.start()
+
+            start = time.time()
+
+            status = arm.genArmRig(templateJoints,
+                                   _doIK = _config["doIK"],
+                                   _ikExt = "IK",
+                                   _doFK = _config["doFK"],
+                                   _fkExt = "FK",
+                                   _doTwist = _config["twistStartIds"] != [],
+                                   _twistStartIds = _config["twistStartIds"],
+                                   _numTwistJnts = _config["numTwistJnts"],
+                                   _usePlan = self.m_usePlan,
+                                   _cache = self.m_cache
+                                   )
+
+            wallTime = time.time() - start
+
+            if profiler is not None:
+
+                profiler.stop()
+
+            result = dict(_config)
+            result["status"] = status[0]
+            result["wallTime"] = wallTime
+            result["commandCount"] = None
+            result["commandCounts"] = {}
+
+            #the command counts are only known when the scene counts them
+
+            if scene is not None:
+
+                result["commandCount"] = scene.getCommandCount()
+                result["commandCounts"] = scene.getCommandCounts()
+                result["nodesCreated"] = scene.getNodesCreated()
+
+            else:
+
+                result["nodesCreated"] = len(pm.ls()) - nodesBefore
+
+            if profiler is not None:
+
+                result["profile"] = profiler.toData()["stages"]
+
+            if best is None or wallTime < best["wallTime"]:
+
+                best = result
+
+        return best
+
+        """--------------------"""
+
+    def run(self, _configs = None, _verbose = False):
+
+        """
+            Method: run
+                builds every configuration and stores the results
+
+            Inputs:
+                _configs:               A list of configurations, defaults to the
+                                        full sweep
+                _verbose:               Whether or not to print each result
+
+            On Exit:                    Returns the list of results
+        """
+
+        self.m_results = []
+
+        for config in (_configs or self.getConfigs()):
+
+            result = self.runConfig(config)
+            self.m_results.append(result)
+
+            if _verbose:
+
+                print(self.formatResult(result))
+
+                for stage in result.get("profile", []):
+
+                    print("    %-34s %8.2f ms  %6d cmds" % (stage["stage"], stage["time"]*1000.0, stage["commands"]))
+
+        return self.m_results
+
+        """--------------------"""
+
+    def formatResult(self, _result):
+
+        """
+            Method: formatResult
+                returns a one line summary of a result
+        """
+
+        return "joints %2d  ik %-5s fk %-5s twist %-8s x%-2d  %8.2f ms  %6s cmds  %5d nodes  %s" % (
+                    _result["numJoints"], _result["doIK"], _result["doFK"],
+                    _result["twistStartIds"], _result["numTwistJnts"],
+                    _result["wallTime"]*1000.0, _result["commandCount"],
+                    _result["nodesCreated"], _result["status"])
+
+        """--------------------"""
+
+    def save(self, _path):
+
+        """
+            Method: save
+                writes the results to a json file along with the run details
+
+            Inputs:
+                _path:                  The file to write to
+        """
+
+        data = {"python" : platform.python_version(),
+                "platform" : platform.platform(),
+                "backend" : self.m_backend,
+                "repeats" : self.m_repeats,
+                "usePlan" : self.m_usePlan,
+                "profile" : self.m_profile,
+                "cache" : self.m_cache is not None,
+                "time" : time.strftime("%Y-%m-%d %H:%M:%S"),
+                "results" : self.m_results}
+
+        f = open(_path, "w")
+        json.dump(data, f, indent = 2, sort_keys = True)
+        f.close()
+
+        """--------------------"""
+
+    def compare(self, _baselinePath, _timeTolerance = 0.25):
+
+        """
+            Method: compare
+                compares the current results with a saved run, a configuration has
+                regressed if it now uses more scene commands or nodes, or is slower
+                by more than the tolerance
+
+            Inputs:
+                _baselinePath:          The json file of the earlier run
+                _timeTolerance:         The allowed proportional slow down, defaults
+                                        to 0.25 (25%)
+
+            On Exit:                    Returns a list of strings describing each
+                                        regression
+        """
+
+        f = open(_baselinePath, "r")
+        baseline = json.load(f)
+        f.close()
+
+        #key the baseline results by their configuration
+
+        old = {}
+
+        for result in baseline["results"]:
+
+            old[self.configKey(result)] = result
+
+        regressions = []
+
+        for result in self.m_results:
+
+            before = old.get(self.configKey(result))
+
+            if before is None:
+
+                continue
+
+            if before["commandCount"] is not None and result["commandCount"] is not None \
+                    and result["commandCount"] > before["commandCount"]:
+
+                regressions.append("%s: commands %d -> %d" % (self.configKey(result), before["commandCount"], result["commandCount"]))
+
+            if result["nodesCreated"] > before["nodesCreated"]:
+
+                regressions.append("%s: nodes %d -> %d" % (self.configKey(result), before["nodesCreated"], result["nodesCreated"]))
+
+            if result["wallTime"] > before["wallTime"]*(1.0 + _timeTolerance):
+
+                regressions.append("%s: time %.2fms -> %.2fms" % (self.configKey(result), before["wallTime"]*1000.0, result["wallTime"]*1000.0))
+
+        return regressions
+
+        """--------------------"""
+
+    def configKey(self, _result):
+
+        """
+            Method: configKey
+                returns a string identifying the configuration of a result
+        """
+
+        return "joints=%d ik=%s fk=%s twistStarts=%s twist=%d" % (
+                    _result["numJoints"], _result["doIK"], _result["doFK"],
+                    list(_result["twistStartIds"]), _result["numTwistJnts"])
+
+        """--------------------"""
+
+#----------END-ArmRigBenchmark-Class----------#
+
+def main(_args = None):
+
+    """
+        Function: main
+            runs the arm rig benchmark from the command line, e.g.
+                python -m pRigging.src.benchmark -o bench.json --compare last.json
+            or, in maya, to compare building through maya.cmds against pymel
+                main(["--backend", "maya", "-o", "pymel.json"])
+                main(["--backend", "cmds", "--compare", "pymel.json"])
+
+        On Exit:                    Returns 1 if any regression was found, otherwise 0
+    """
+
+    parser = argparse.ArgumentParser(description = "Benchmark ArmRig.genArmRig")
+    parser.add_argument("-o", "--output", default = "", help = "json file to write the results to")
+    parser.add_argument("-r", "--repeats", type = int, default = 3, help = "builds per configuration")
+    parser.add_argument("--backend", default = "memory", choices = ["memory", "maya", "cmds"])
+    parser.add_argument("--joints", type = int, nargs = "*", help = "template chain lengths to sweep")
+    parser.add_argument("--twist", type = int, nargs = "*", help = "twist joint counts to sweep")
+    parser.add_argument("--compare", default = "", help = "earlier json results to check for regressions")
+    parser.add_argument("--tolerance", type = float, default = 0.25, help = "allowed proportional slow down")
+    parser.add_argument("--plan", action = "store_true", help = "plan each rig and build it from the plan")
+    parser.add_argument("--profile", action = "store_true", help = "time each build stage, the stages are saved with the results")
+    parser.add_argument("--cache", action = "store_true", help = "cache each build, so repeats are made from the cache")
+    parser.add_argument("-q", "--quiet", action = "store_true")
+
+    args = parser.parse_args(_args)
+
+    bench = ArmRigBenchmark(args.backend, args.repeats, args.plan, args.profile, args.cache)
+    bench.run(bench.getConfigs(args.joints, args.twist), _verbose = not args.quiet)
+
+    if args.output != "":
+
+        bench.save(args.output)
+
+    if args.compare != "":
+
+        regressions = bench.compare(args.compare, args.tolerance)
+
+        for line in regressions:
+
+            print("REGRESSION " + line)
+
+        if regressions != []:
+
+            return 1
+
+    return 0
+
+    """--------------------"""
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -1,10 +1,10 @@
 #----------Imports----------#
 
-import pymel.core as pm
 import pRigging.src.jointchain as pjc
 import pRigging.src.twistchain as ptc
 import pRigging.src.riggingbase as prb
 import pRigging.src.jointchaincontainer as pjcc
+import pRigging.src.nodelist as pnl
 
 #----------BindChain-Class----------#
 
@@ -18,15 +18,15 @@ class BindChain(pjcc.JointChainContainer):
         File: pRigging/src/bindchain.py
         
         Contains:
-            self.m_constraints:     a List of controls that drive the joints in the joint chain                 
+            self.m_constraints:     a NodeList of the constraints that drive the joints in the joint chain
             self.m_twistChains:      a list of TwistChains, typically 1 for the for arm area
         
         Imports:
-            pymel.core as pm
             pRigging.src.jointchain as pjc
             import pRigging.src.twistchain as ptc
             pRigging.src.riggingbase as prb
             pRigging.src.jointchaincontainer as pjcc
+            pRigging.src.nodelist as pnl
     """
     
     def __init__(self):
@@ -46,7 +46,7 @@ class BindChain(pjcc.JointChainContainer):
         
         #initialise the object's attributes
         
-        self.m_constraints = []                 
+        self.m_constraints = pnl.NodeList()
         self.m_twistChains = []
         
         self.m_isGenerated = False
@@ -83,7 +83,7 @@ class BindChain(pjcc.JointChainContainer):
 
         newNames = self.addExtToNames( _names, "Bind")
 
-        groupName = self.addExtToNames( self.removeExtFromNames([_names[0]]), "Bind")[0]
+        groupName = self.renameFromNames([_names[0]], 1, ["Bind"])[0]
         
         #generate the joint chain        
 
@@ -112,7 +112,7 @@ class BindChain(pjcc.JointChainContainer):
                 
                 self.m_twistChains[i+initialTwistCount].genTwistChain(jointList[ids[i]],jointList[(ids[i])+1],
                         _numTwistJoints, 
-                        _name = self.addExtToNames(self.removeExtFromNames([jointList[ids[i]]]),"Twist")[0],
+                        _name = self.renameFromNames([jointList[ids[i]]], 1, ["Twist"])[0],
                         _jntExt = _jointExt
                         ) 
                         
@@ -140,7 +140,7 @@ class BindChain(pjcc.JointChainContainer):
         
         
         if _jointChains != 0 and _constraintList != 0:
-            print _jointChains, _constraintList
+
             #first enforce equal numbers of joints, users should access the individual method,
             #connectJointToJoints, to define behaviours of chains that are not the same length
             
@@ -151,17 +151,13 @@ class BindChain(pjcc.JointChainContainer):
             
             numCheck = True
             
-            print "number of bind joints: ", numBindJoints
-            
             for jointChain in _jointChains:
                 
-                print "number in input joint chain: ", jointChain.getNumJoints()
                 if jointChain.getNumJoints() != numBindJoints:
                     
                     numCheck = False
                     
                     break
-            print "numCheck: ", numCheck
                     
             #only if the numbers are correct
             
@@ -253,7 +249,7 @@ class BindChain(pjcc.JointChainContainer):
             
         """
         
-        return self.m_constraints                 
+        return self.m_constraints.getNodes()
         
         
         """--------------------"""
@@ -307,16 +303,12 @@ class BindChain(pjcc.JointChainContainer):
         
         if len(self.m_chainGroups) != 0:
             
-            #ensure clear selection
-            
-            pm.select(cl = True)
-            
             #greate a group over that one and insert it into the top of the list
             #after setting the parent
             
-            newGroup = pm.group(n = name)
-            self.m_chainGroups[0].setParent(newGroup)
-            self.m_chainGroups.insert(0,newgroup)
+            newGroup = self.makeNode("transform", self.reserveNames([name])[0])
+            self.reparentNode(self.m_chainGroups[0], newGroup)
+            self.m_chainGroups.insert(0,newGroup)
             
         #if there arent any groups
         
@@ -325,13 +317,11 @@ class BindChain(pjcc.JointChainContainer):
             #generate the group and set it as the parent of all of the hierarchies 
             #represented within the chain container
             
-            pm.select(cl = True)
-            
             #greate a group over that one and insert it into the top of the list
             #after setting the parent
             
-            newGroup = pm.group(n = name)
-            self.m_jointChain.getJoint(0).setParent(newGroup)
+            newGroup = self.makeNode("transform", self.reserveNames([name])[0])
+            self.reparentNode(self.m_jointChain.getJoint(0), newGroup)
             self.m_chainGroups.append(newGroup) 
             
         """--------------------"""
@@ -344,45 +334,26 @@ class BindChain(pjcc.JointChainContainer):
         """
         
         if self.m_isGenerated == True:
-                
-            #call clear on pRigging objects
             
-            self.m_jointChain.clear()
+            #delete every node made, along with those of the objects held, in
+            #a single delete
             
-            for twist in self.m_twistChains:
-                
-                twist.clear()
+            self.deleteLedger()
             
-            #delete maya objects
+            #clear the pRigging objects too, they have nothing left to delete
             
-            for const in self.m_constraints:
-                
-                try:
-                    
-                    pm.delete(const)
-                    
-                except:
-                
-                    pass
+            self.m_jointChain.clear()
             
+            for twist in self.m_twistChains:
                 
-            for grp in self.m_chainGroups:
-                
-                try:
-                    
-                    pm.delete(grp)
-                    
-                except:
-                
-                    pass
+                twist.clear()
             
-                
             #then reset the lists
             
             self.m_jointChain = 0
-            self.m_constraints = []                 
+            self.m_constraints = pnl.NodeList()
             self.m_twistChains = []
-            self.m_chainGroups = []
+            self.m_chainGroups = pnl.NodeList()
             
             #and set the is generated boolean
             
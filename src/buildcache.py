@@ -0,0 +1,278 @@
+#----------Imports----------#
+
+import os
+import errno
+import json
+import hashlib
+import pRigging.src.scenebackend as psb
+import pRigging.src.rigmath as prm
+
+pm = psb.pm
+
+#bumped whenever the builds change what they make, so entries stored by an
+#older version of the toolset are never reused
+
+CACHE_VERSION = 1
+
+#the number of decimal places the template transforms are compared to
+
+KEY_PRECISION = 5
+
+#----------BuildCache-Class----------#
+
+class BuildCache(object):
+
+    """
+        Class: BuildCache
+            A cache of finished builds keyed by what they were built from. The key
+            is a hash of the template joints, their names, hierarchy and world
+            matrices, and every setting passed to the build, so a build repeated
+            from unchanged template joints with the same settings can make the
+            stored BuildPlan straight away rather than building the rig again.
+
+            Each entry holds the plan as plain data along with the state of the rig
+            object that planned it, so the rig can be given back its chains and
+            controls once the plan is made. Entries are kept in memory and, if the
+            cache has a directory, saved there as json so they last between
+            sessions.
+
+        File: pRigging/src/buildcache.py
+
+        Contains:
+            self.m_directory:       The directory entries are saved in, None to only
+                                    keep them in memory
+            self.m_entries:         A dictionary of the entries by key
+            self.m_hits:            The number of builds found in the cache
+            self.m_misses:          The number of builds that weren't
+
+        Imports:
+            os
+            errno
+            json
+            hashlib
+            pRigging.src.scenebackend as psb
+            pRigging.src.rigmath as prm
+    """
+
+    def __init__(self, _directory = None):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _directory:             The directory to save entries in, defaults to
+                                        None to only keep them in memory
+        """
+
+        self.m_directory = _directory
+        self.m_entries = {}
+        self.m_hits = 0
+        self.m_misses = 0
+
+        """--------------------"""
+
+    def getKey(self, _rigType, _templateJoints, _params):
+
+        """
+            Method: getKey
+                returns the key for a build
+
+            Inputs:
+                _rigType:               The name of the type of rig, e.g. ArmRig
+                _templateJoints:        The joints the rig is built from
+                _params:                A dictionary of every setting the build is
+                                        made with
+
+            On Exit:                    Returns the key as a hex string
+        """
+
+        joints = []
+
+        for joint in _templateJoints:
+
+            joint = pm.PyNode(joint)
+            parent = joint.getParent()
+
+            if parent is not None:
+
+                parent = str(parent).split("|")[-1]
+
+            matrix = prm.toMatrix4(joint.getMatrix(worldSpace = True))
+
+            joints.append([str(joint).split("|")[-1],
+                           parent,
+                           [[round(value, KEY_PRECISION) + 0.0 for value in row] for row in matrix]])
+
+        data = {"version" : CACHE_VERSION,
+                "rigType" : _rigType,
+                "joints" : joints,
+                "params" : _params}
+
+        return hashlib.sha1(json.dumps(data, sort_keys = True).encode("utf-8")).hexdigest()
+
+        """--------------------"""
+
+    def getPath(self, _key):
+
+        """
+            Method: getPath
+                returns the file an entry is saved in, None if the cache has no
+                directory
+        """
+
+        if self.m_directory is None:
+
+            return None
+
+        return os.path.join(self.m_directory, _key + ".json")
+
+        """--------------------"""
+
+    def get(self, _key):
+
+        """
+            Method: get
+                returns the entry for a key, loading it from the directory if it isn't
+                in memory, or None if the build isn't cached
+        """
+
+        entry = self.m_entries.get(_key)
+
+        path = self.getPath(_key)
+
+        if entry is None and path is not None and os.path.isfile(path):
+
+            f = open(path, "r")
+            entry = toPlainData(json.load(f))
+            f.close()
+
+            self.m_entries[_key] = entry
+
+        if entry is None:
+
+            self.m_misses = self.m_misses + 1
+
+        else:
+
+            self.m_hits = self.m_hits + 1
+
+        return entry
+
+        """--------------------"""
+
+    def put(self, _key, _entry):
+
+        """
+            Method: put
+                stores an entry, saving it in the directory if the cache has one
+
+            Inputs:
+                _key:                   The key of the build
+                _entry:                 A dictionary of plain data, e.g. the plan made
+                                        by the build
+        """
+
+        self.m_entries[_key] = _entry
+
+        path = self.getPath(_key)
+
+        if path is not None:
+
+            #another process may make the directory between checking for it
+            #and making it
+
+            try:
+
+                os.makedirs(self.m_directory)
+
+            except OSError as e:
+
+                if e.errno != errno.EEXIST or not os.path.isdir(self.m_directory):
+
+                    raise
+
+            #written to a temporary file first, so another process reading the
+            #same directory never sees half an entry
+
+            tempPath = "%s.%d.tmp" % (path, os.getpid())
+
+            f = open(tempPath, "w")
+            json.dump(_entry, f, sort_keys = True)
+            f.close()
+
+            try:
+
+                os.rename(tempPath, path)
+
+            except OSError:
+
+                #another process stored it first
+
+                os.remove(tempPath)
+
+        """--------------------"""
+
+    def clear(self, _deleteFiles = False):
+
+        """
+            Method: clear
+                empties the cache
+
+            Inputs:
+                _deleteFiles:           Whether or not to delete the entries saved in
+                                        the directory too, defaults to False
+        """
+
+        if _deleteFiles and self.m_directory is not None and os.path.isdir(self.m_directory):
+
+            for fileName in os.listdir(self.m_directory):
+
+                if fileName.endswith(".json"):
+
+                    os.remove(os.path.join(self.m_directory, fileName))
+
+        self.m_entries = {}
+        self.m_hits = 0
+        self.m_misses = 0
+
+        """--------------------"""
+
+    def getStats(self):
+
+        """
+            Method: getStats
+                returns a dictionary of the number of hits, misses and entries in
+                memory
+        """
+
+        return {"hits" : self.m_hits, "misses" : self.m_misses, "entries" : len(self.m_entries)}
+
+        """--------------------"""
+
+#----------END-BuildCache-Class----------#
+
+def toPlainData(_value):
+
+    """
+        Function: toPlainData
+            returns data loaded from json with its unicode strings made plain
+            strings, as they are in python 3, so cached data matches built data
+    """
+
+    if isinstance(_value, list):
+
+        return [toPlainData(value) for value in _value]
+
+    if isinstance(_value, dict):
+
+        return dict([(toPlainData(key), toPlainData(value)) for key, value in _value.items()])
+
+    if not isinstance(_value, str) and isinstance(_value, type(u"")):
+
+        return str(_value)
+
+    return _value
+
+    """--------------------"""
@@ -0,0 +1,519 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.memoryscene as pms
+import pRigging.src.rigmath as prm
+
+pm = psb.pm
+
+#the attributes that are worked out by the scene or set by the commands that
+#make the nodes, rather than set by the build
+
+SKIP_ATTRS = ["message", "worldMatrix", "parentMatrix", "startJoint", "endEffector",
+              "ikSolver", "create", "worldSpace", "outputCurve"]
+
+#----------BuildPlan-Class----------#
+
+class BuildPlan(object):
+
+    """
+        Class: BuildPlan
+            A build described purely as data, the nodes it makes with their names,
+            parents, attribute values and the commands that make them, and the
+            connections between them. A plan can be checked, compared, stored and
+            timed without touching the scene, and is made real by the PlanExecutor.
+
+        File: pRigging/src/buildplan.py
+
+        Contains:
+            self.m_existing:        A list of the names of the nodes the build used
+                                    that were already in the scene
+            self.m_nodes:           A list of dictionaries, one per node to make, in
+                                    the order they were made, each one has:
+                                        name:       the name of the node
+                                        type:       the node type
+                                        parent:     the name of its parent or None
+                                        create:     the command that makes it if it
+                                                    isn't a plain createNode
+                                        attrs:      the attribute values to set
+                                        dynamic:    the attributes to add, with
+                                                    their addAttr flags
+                                        locked:     the attributes to lock
+            self.m_connections:     A list of source and destination plug name pairs
+
+        Imports:
+            pRigging.src.scenebackend as psb
+            pRigging.src.memoryscene as pms
+            pRigging.src.rigmath as prm
+    """
+
+    def __init__(self):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+        """
+
+        self.m_existing = []
+        self.m_nodes = []
+        self.m_connections = []
+
+        """--------------------"""
+
+    def readScene(self, _scene, _firstId):
+
+        """
+            Method: readScene
+                fills the plan from the nodes made in an in-memory scene
+
+            Inputs:
+                _scene:                 The MemoryScene the build was made in
+                _firstId:               The creation id of the first node made by the
+                                        build, the nodes before it already existed
+        """
+
+        nodes = sorted(_scene.m_nodes.values(), key = lambda node: node.m_id)
+
+        self.m_existing = [node.m_name for node in nodes if node.m_id < _firstId]
+        self.m_nodes = []
+
+        #the default values of each node type, so only changed values are kept
+
+        defaults = {}
+
+        for node in nodes:
+
+            #skip the existing nodes and the ones made along with another, e.g. the
+            #shape of a circle or the effector of an ik handle
+
+            if node.m_id < _firstId or "owner" in node.m_create:
+
+                continue
+
+            if node.m_type not in defaults:
+
+                defaults[node.m_type] = pms.MemoryNode(None, "", node.m_type).m_attrs
+
+            entry = {"name" : node.m_name,
+                     "type" : node.m_type,
+                     "parent" : None,
+                     "create" : self.toPlanValue(node.m_create),
+                     "attrs" : {},
+                     "dynamic" : self.toPlanValue(node.m_dynamic),
+                     "locked" : sorted(node.m_locked)}
+
+            if node.m_parent is not None:
+
+                entry["parent"] = node.m_parent.m_name
+
+            #constraints are made again from their command, so their values are not kept
+
+            if node.m_type not in pms.CONSTRAINT_TYPES:
+
+                for attr, value in node.m_attrs.items():
+
+                    if attr in SKIP_ATTRS or value is None or (node, attr) in _scene.m_inputs:
+
+                        continue
+
+                    if attr in node.m_dynamic or attr not in defaults[node.m_type] or defaults[node.m_type][attr] != value:
+
+                        entry["attrs"][attr] = self.toPlanValue(value)
+
+            self.m_nodes.append(entry)
+
+        #then the connections, leaving out the ones the commands make
+
+        self.m_connections = []
+
+        for dst, src in _scene.m_inputs.items():
+
+            if self.isCommandConnection(src, dst, _firstId):
+
+                continue
+
+            self.m_connections.append(["%s.%s" % (src[0].m_name, src[1]), "%s.%s" % (dst[0].m_name, dst[1])])
+
+        self.m_connections.sort()
+
+        """--------------------"""
+
+    def isCommandConnection(self, _src, _dst, _firstId):
+
+        """
+            Method: isCommandConnection
+                returns True if a connection is made by the command that makes one of
+                its nodes, or was already in the scene, and so isn't part of the plan
+        """
+
+        srcNode, srcAttr = _src
+        dstNode, dstAttr = _dst
+
+        if srcNode.m_id < _firstId and dstNode.m_id < _firstId:
+
+            return True
+
+        if "owner" in srcNode.m_create or "owner" in dstNode.m_create:
+
+            return True
+
+        if srcNode.m_type in pms.CONSTRAINT_TYPES and srcAttr.startswith("constraint"):
+
+            return True
+
+        if dstNode.m_type in pms.CONSTRAINT_TYPES and dstAttr.startswith("targetParentMatrix"):
+
+            return True
+
+        return dstNode.m_type == "ikHandle" and dstAttr in ("startJoint", "endEffector")
+
+        """--------------------"""
+
+    def toPlanValue(self, _value):
+
+        """
+            Method: toPlanValue
+                returns a value as plain data, nodes become their names and tuples
+                become lists
+        """
+
+        if isinstance(_value, pms.MemoryNode):
+
+            return _value.m_name
+
+        if isinstance(_value, (list, tuple)):
+
+            return [self.toPlanValue(value) for value in _value]
+
+        if isinstance(_value, dict):
+
+            return dict([(key, self.toPlanValue(value)) for key, value in _value.items()])
+
+        return _value
+
+        """--------------------"""
+
+    def getExisting(self):
+
+        """
+            Method: getExisting
+                returns the names of the nodes that were already in the scene
+        """
+
+        return self.m_existing
+
+        """--------------------"""
+
+    def getNodes(self):
+
+        """
+            Method: getNodes
+                returns the list of node dictionaries in the order they were made
+        """
+
+        return self.m_nodes
+
+        """--------------------"""
+
+    def getNode(self, _name):
+
+        """
+            Method: getNode
+                returns the dictionary of the node named, or None
+        """
+
+        for node in self.m_nodes:
+
+            if node["name"] == _name:
+
+                return node
+
+        return None
+
+        """--------------------"""
+
+    def getConnections(self):
+
+        """
+            Method: getConnections
+                returns the list of source and destination plug pairs
+        """
+
+        return self.m_connections
+
+        """--------------------"""
+
+    def toData(self):
+
+        """
+            Method: toData
+                returns the plan as a dictionary of plain data, e.g. to save as json
+        """
+
+        return {"existing" : self.m_existing, "nodes" : self.m_nodes, "connections" : self.m_connections}
+
+        """--------------------"""
+
+    def fromData(self, _data):
+
+        """
+            Method: fromData
+                fills the plan from a dictionary made by toData
+        """
+
+        self.m_existing = list(_data["existing"])
+        self.m_nodes = list(_data["nodes"])
+        self.m_connections = [list(connection) for connection in _data["connections"]]
+
+        """--------------------"""
+
+    def validate(self):
+
+        """
+            Method: validate
+                checks that every node and connection in the plan refers to nodes that
+                either exist or are made by the plan
+
+            On Exit:                    Returns a list of strings describing each
+                                        problem, empty if the plan is valid
+        """
+
+        errors = []
+        known = set(self.m_existing)
+
+        for node in self.m_nodes:
+
+            if node["name"] in known:
+
+                errors.append("%s is made more than once" % node["name"])
+
+            known.add(node["name"])
+
+        for node in self.m_nodes:
+
+            if node["parent"] is not None and node["parent"] not in known:
+
+                errors.append("%s has the unknown parent %s" % (node["name"], node["parent"]))
+
+            for key in ("targets", "driven", "startJoint", "endEffector"):
+
+                for name in self.toList(node["create"].get(key, [])):
+
+                    if name not in known:
+
+                        errors.append("%s uses the unknown node %s" % (node["name"], name))
+
+        for src, dst in self.m_connections:
+
+            for plug in (src, dst):
+
+                if plug.split(".", 1)[0] not in known:
+
+                    errors.append("%s -> %s uses the unknown node %s" % (src, dst, plug.split(".", 1)[0]))
+
+        return errors
+
+        """--------------------"""
+
+    def toList(self, _value):
+
+        if isinstance(_value, list):
+
+            return _value
+
+        return [_value]
+
+    def diff(self, _other):
+
+        """
+            Method: diff
+                compares the plan with another one
+
+            Inputs:
+                _other:                 The BuildPlan to compare with
+
+            On Exit:                    Returns a list of strings describing each
+                                        difference, empty if they are the same
+        """
+
+        differences = []
+
+        nodes = dict([(node["name"], node) for node in self.m_nodes])
+        otherNodes = dict([(node["name"], node) for node in _other.m_nodes])
+
+        for name in sorted(set(nodes) - set(otherNodes)):
+
+            differences.append("- node %s" % name)
+
+        for name in sorted(set(otherNodes) - set(nodes)):
+
+            differences.append("+ node %s" % name)
+
+        for name in sorted(set(nodes) & set(otherNodes)):
+
+            for key in ("type", "parent", "create", "dynamic", "locked"):
+
+                if nodes[name][key] != otherNodes[name][key]:
+
+                    differences.append("~ %s %s: %s -> %s" % (name, key, nodes[name][key], otherNodes[name][key]))
+
+            attrs = nodes[name]["attrs"]
+            otherAttrs = otherNodes[name]["attrs"]
+
+            for attr in sorted(set(attrs) | set(otherAttrs)):
+
+                if not self.isClose(attrs.get(attr), otherAttrs.get(attr)):
+
+                    differences.append("~ %s.%s: %s -> %s" % (name, attr, attrs.get(attr), otherAttrs.get(attr)))
+
+        connections = set([tuple(connection) for connection in self.m_connections])
+        otherConnections = set([tuple(connection) for connection in _other.m_connections])
+
+        for src, dst in sorted(connections - otherConnections):
+
+            differences.append("- connection %s -> %s" % (src, dst))
+
+        for src, dst in sorted(otherConnections - connections):
+
+            differences.append("+ connection %s -> %s" % (src, dst))
+
+        return differences
+
+        """--------------------"""
+
+    def isClose(self, _a, _b):
+
+        """
+            Method: isClose
+                returns True if two attribute values are the same, allowing for
+                floating point error
+        """
+
+        if isinstance(_a, float) and isinstance(_b, float):
+
+            return abs(_a - _b) < 1e-6
+
+        return _a == _b
+
+        """--------------------"""
+
+#----------END-BuildPlan-Class----------#
+
+#----------PlanRecorder-Class----------#
+
+class PlanRecorder(object):
+
+    """
+        Class: PlanRecorder
+            Records a build as a BuildPlan. The scene nodes the build starts from,
+            e.g. the template joints, are copied into an in-memory scene, the build
+            is run against the copies with the in-memory scene as the backend and
+            the nodes it made are read back out as the plan.
+
+        File: pRigging/src/buildplan.py
+
+        Contains:
+            self.m_scene:           The MemoryScene the build is made in
+            self.m_backend:         The backend in use before recording started
+            self.m_firstId:         The creation id of the first node the build made
+            self.m_existing:        A dictionary of the names of the copies to the
+                                    scene nodes they were copied from
+    """
+
+    def __init__(self):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+        """
+
+        self.m_scene = None
+        self.m_backend = None
+        self.m_firstId = 0
+        self.m_existing = {}
+
+        """--------------------"""
+
+    def start(self, _nodes):
+
+        """
+            Method: start
+                copies the nodes passed in to a new in-memory scene and makes it the
+                backend, keeping their names, hierarchy and world transforms
+
+            Inputs:
+                _nodes:                 The scene nodes the build starts from
+
+            On Exit:                    Returns the list of copies, in the same order,
+                                        to be passed to the build
+        """
+
+        self.m_backend = pm.getBackend()
+        self.m_scene = pms.MemoryScene()
+        self.m_existing = {}
+
+        #read the nodes from the scene, parents before children
+
+        nodes = [pm.PyNode(node) for node in _nodes]
+        order = sorted(range(0, len(nodes)), key = lambda i: nodes[i].longName().count("|"))
+        copies = [None]*len(nodes)
+
+        for i in order:
+
+            parent = nodes[i].getParent()
+            copyParent = None
+
+            for j in range(0, len(nodes)):
+
+                if nodes[j] == parent and copies[j] is not None:
+
+                    copyParent = copies[j]
+
+            copy = self.m_scene.newNode(nodes[i].nodeType(), str(nodes[i]).split("|")[-1], copyParent)
+            copy.setWorldMatrixValue(prm.toMatrix4(nodes[i].getMatrix(worldSpace = True)))
+
+            copies[i] = copy
+            self.m_existing[copy.m_name] = nodes[i]
+
+        self.m_firstId = self.m_scene.m_nextId
+
+        pm.setBackend(self.m_scene)
+
+        return copies
+
+        """--------------------"""
+
+    def stop(self):
+
+        """
+            Method: stop
+                restores the backend in use before recording started
+
+            On Exit:                    Returns the BuildPlan of the nodes the build
+                                        made
+        """
+
+        pm.setBackend(self.m_backend)
+
+        plan = BuildPlan()
+        plan.readScene(self.m_scene, self.m_firstId)
+
+        return plan
+
+        """--------------------"""
+
+    def getExisting(self):
+
+        """
+            Method: getExisting
+                returns the dictionary of copy names to the scene nodes they were
+                copied from
+        """
+
+        return self.m_existing
+
+        """--------------------"""
+
+#----------END-PlanRecorder-Class----------#
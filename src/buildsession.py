@@ -0,0 +1,381 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.rigmath as prm
+import pRigging.src.naming as pnm
+
+pm = psb.pm
+
+#----------BuildSession-Class----------#
+
+class BuildSession(object):
+
+    """
+        Class: BuildSession
+            Holds the state shared by everything built between the start and end of
+            a build, e.g. one arm rig, or every rig built by a batch. Sessions nest,
+            a build started inside an open session joins it rather than starting
+            its own, so several characters built in one session share its state.
+
+            The session also caches the world matrices of the template joints,
+            which are read by the IK, FK and bind chains and the controls, so each
+            is only queried once. Only the nodes the session is told to cache are
+            cached, see cacheNodes, as the nodes a build makes are each read about
+            once. Each node cached is tracked under the nodes above it when it is
+            read, so when a node is moved or reparented its entry, and those of the
+            nodes under it, are dropped straight away without looking at any other
+            entry, see nodeMoved. The whole cache is dropped when a change can move nodes
+            that aren't known, e.g. a pole vector constraint moving an IK chain,
+            see clearWorldMatrices, and the cache goes with the session. Moves
+            and reparents made through maya directly aren't seen, so anything in
+            the toolset that moves or reparents a node tells the session.
+
+        File: pRigging/src/buildsession.py
+
+        Contains:
+            self.m_depth:           The number of builds currently using the session
+            self.m_nameIndex:       The NameIndex of every name in the scene, made
+                                    the first time a name is reserved
+            self.m_cachedNodes:     The set of nodes whose world matrices are cached
+            self.m_worldMatrices:   A dictionary of each of those nodes read to its
+                                    world matrix when read
+            self.m_ancestors:       A dictionary of each node in m_worldMatrices to
+                                    the list of nodes above it when read
+            self.m_descendants:     A dictionary of each of those nodes above to the
+                                    set of nodes in m_worldMatrices under it
+            self.m_snapshots:       A dictionary of the TemplateSnapshots made in the
+                                    session by the names of their joints, see
+                                    templatesnapshot.getTemplateSnapshot
+
+        Imports:
+            pRigging.src.scenebackend as psb
+            pRigging.src.rigmath as prm
+            pRigging.src.naming as pnm
+    """
+
+    def __init__(self):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+        """
+
+        self.m_depth = 0
+        self.m_nameIndex = None
+        self.m_cachedNodes = set()
+        self.m_worldMatrices = {}
+        self.m_ancestors = {}
+        self.m_descendants = {}
+        self.m_snapshots = {}
+
+        """--------------------"""
+
+    def getNameIndex(self):
+
+        """
+            Method: getNameIndex
+                returns the name index for the session, listing the scene to make it
+                the first time it is asked for
+        """
+
+        if self.m_nameIndex is None:
+
+            self.m_nameIndex = pnm.NameIndex([str(node) for node in pm.ls()])
+
+        return self.m_nameIndex
+
+        """--------------------"""
+
+    def fork(self, _release = []):
+
+        """
+            Method: fork
+                returns a new session whose name index is a copy of this one's, so
+                names can be reserved in it without touching this session, e.g. to
+                plan a build that isn't going to be made
+
+            Inputs:
+                _release:               Names to free in the copy, e.g. the names of
+                                        the nodes the planned build would replace
+        """
+
+        names = self.getNameIndex().m_names - set([str(name).split("|")[-1] for name in _release])
+
+        session = BuildSession()
+        session.m_nameIndex = pnm.NameIndex(names)
+
+        return session
+
+        """--------------------"""
+
+    def releaseNames(self, _names):
+
+        """
+            Method: releaseNames
+                frees the names of deleted nodes so later builds in the session can
+                use them, nothing is done if no name has been reserved yet
+        """
+
+        if self.m_nameIndex is None:
+
+            return
+
+        for name in _names:
+
+            self.m_nameIndex.release(name)
+
+        """--------------------"""
+
+    def getWorldMatrix(self, _node):
+
+        """
+            Method: getWorldMatrix
+                returns the world matrix of a node as a 4x4 list, for the nodes
+                being cached only querying the scene the first time it is asked for
+                in the session
+        """
+
+        matrix = self.m_worldMatrices.get(_node)
+
+        if matrix is None:
+
+            matrix = prm.toMatrix4(_node.getMatrix(worldSpace = True))
+
+            if _node in self.m_cachedNodes:
+
+                self.m_worldMatrices[_node] = matrix
+                self.trackNode(_node)
+
+        return matrix
+
+        """--------------------"""
+
+    def cacheNodes(self, _nodes):
+
+        """
+            Method: cacheNodes
+                has the world matrices of the nodes cached from now on, e.g. the
+                template joints, which are read many times but never moved
+        """
+
+        self.m_cachedNodes.update(_nodes)
+
+        """--------------------"""
+
+    def trackNode(self, _node):
+
+        """
+            Method: trackNode
+                records the nodes above a node just read under each of them, so it
+                is dropped when any of them moves. The walk up stops at the first
+                node above that was read itself, as the nodes above that are
+                already known, so reading a chain parent first queries one parent
+                for each joint
+        """
+
+        ancestors = []
+        parent = _node.getParent()
+
+        while parent is not None:
+
+            ancestors.append(parent)
+
+            if parent in self.m_ancestors:
+
+                ancestors.extend(self.m_ancestors[parent])
+
+                break
+
+            parent = parent.getParent()
+
+        self.m_ancestors[_node] = ancestors
+
+        for ancestor in ancestors:
+
+            self.m_descendants.setdefault(ancestor, set()).add(_node)
+
+        """--------------------"""
+
+    def nodeMoved(self, _node):
+
+        """
+            Method: nodeMoved
+                drops the cached world matrices of a node that has been moved or
+                reparented and of every node read under it, which move with it,
+                along with the template snapshots read from them. Only the entries
+                tracked under the node are looked at, nothing is queried
+        """
+
+        for node in [_node] + list(self.m_descendants.pop(_node, ())):
+
+            if node in self.m_worldMatrices:
+
+                del self.m_worldMatrices[node]
+                self.m_snapshots = {}
+
+            for ancestor in self.m_ancestors.pop(node, []):
+
+                descendants = self.m_descendants.get(ancestor)
+
+                if descendants is not None:
+
+                    descendants.discard(node)
+
+        """--------------------"""
+
+    def clearWorldMatrices(self):
+
+        """
+            Method: clearWorldMatrices
+                drops every cached world matrix and the template snapshots, for
+                changes that can move nodes other than the one changed
+        """
+
+        self.m_worldMatrices = {}
+        self.m_ancestors = {}
+        self.m_descendants = {}
+        self.m_snapshots = {}
+
+        """--------------------"""
+
+#----------END-BuildSession-Class----------#
+
+#the open session, None between builds
+
+activeSession = None
+
+def startSession():
+
+    """
+        Function: startSession
+            opens a build session, or joins the one already open
+
+        On Exit:                    Returns the open session
+    """
+
+    global activeSession
+
+    if activeSession is None:
+
+        activeSession = BuildSession()
+
+    activeSession.m_depth = activeSession.m_depth + 1
+
+    return activeSession
+
+    """--------------------"""
+
+def endSession():
+
+    """
+        Function: endSession
+            leaves the open build session, closing it once every build that
+            joined it has left, which empties the naming caches too
+    """
+
+    global activeSession
+
+    if activeSession is None:
+
+        return
+
+    activeSession.m_depth = activeSession.m_depth - 1
+
+    if activeSession.m_depth <= 0:
+
+        activeSession = None
+
+        #the names cached during the build aren't needed by the next one
+
+        pnm.engine.clear()
+
+    """--------------------"""
+
+def swapSession(_session):
+
+    """
+        Function: swapSession
+            makes the session passed in the open session, e.g. a forked session for
+            the length of a plan, None closes the open session without ending it
+
+        On Exit:                    Returns the session that was open before
+    """
+
+    global activeSession
+
+    previous = activeSession
+    activeSession = _session
+
+    return previous
+
+    """--------------------"""
+
+def getSession():
+
+    """
+        Function: getSession
+            returns the open build session, or None if there isn't one
+    """
+
+    return activeSession
+
+    """--------------------"""
+
+def getWorldMatrix(_node):
+
+    """
+        Function: getWorldMatrix
+            returns the world matrix of a node as a 4x4 list, through the cache of
+            the open session if there is one, see BuildSession.getWorldMatrix
+    """
+
+    if activeSession is None:
+
+        return prm.toMatrix4(_node.getMatrix(worldSpace = True))
+
+    return activeSession.getWorldMatrix(_node)
+
+    """--------------------"""
+
+def cacheNodes(_nodes):
+
+    """
+        Function: cacheNodes
+            has the open session, if there is one, cache the world matrices of the
+            nodes, see BuildSession.cacheNodes
+    """
+
+    if activeSession is not None:
+
+        activeSession.cacheNodes(_nodes)
+
+    """--------------------"""
+
+def nodeMoved(_node):
+
+    """
+        Function: nodeMoved
+            tells the open session, if there is one, that a node has been moved or
+            reparented, see BuildSession.nodeMoved
+    """
+
+    if activeSession is not None:
+
+        activeSession.nodeMoved(_node)
+
+    """--------------------"""
+
+def clearWorldMatrices():
+
+    """
+        Function: clearWorldMatrices
+            empties the world matrix cache of the open session, if there is one,
+            see BuildSession.clearWorldMatrices
+    """
+
+    if activeSession is not None:
+
+        activeSession.clearWorldMatrices()
+
+    """--------------------"""
@@ -0,0 +1,1328 @@
+#----------Imports----------#
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import pRigging.src.rigmath as prm
+import pRigging.src.memoryscene as pms
+
+#the flags of each command that take an object, which are passed on to cmds by name
+
+OBJECT_FLAGS = ["parent", "p", "startJoint", "sj", "endEffector", "ee",
+                "worldUpObject", "wuo"]
+
+#----------CmdsSceneError-Class----------#
+
+class CmdsSceneError(RuntimeError):
+
+    """
+        Class: CmdsSceneError
+            The error raised by the cmds scene where pymel would raise its own
+            error rather than maya's, e.g. looking up an object that doesn't exist
+
+        File: pRigging/src/cmdsscene.py
+    """
+
+    pass
+
+#----------CmdsAttribute-Class----------#
+
+class CmdsAttribute(object):
+
+    """
+        Class: CmdsAttribute
+            A plug on a node in the maya scene, mirrors the parts of pymel's
+            Attribute class used by the toolset. Values and connections are read
+            through the OpenMaya API, changes are made through maya.cmds so they
+            are recorded for undo as pymel's are.
+
+        File: pRigging/src/cmdsscene.py
+
+        Contains:
+            self.m_node:            The CmdsNode the attribute belongs to
+            self.m_name:            The long name of the attribute, multi elements
+                                    are named with their index, e.g. input1D[0]
+
+        Imports:
+            maya.cmds as cmds
+            maya.api.OpenMaya as om
+            pRigging.src.rigmath as prm
+            pRigging.src.memoryscene as pms
+    """
+
+    def __init__(self, _node, _name):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _node:                  The node the plug is on
+                _name:                  The name of the attribute
+        """
+
+        self.m_node = _node
+        self.m_name = pms.ATTR_ALIASES.get(_name, _name)
+
+        """--------------------"""
+
+    def getPlug(self):
+
+        """
+            Method: getPlug
+                returns the MPlug of the attribute, multi elements and weight aliases
+                are found through a selection list
+        """
+
+        if "[" not in self.m_name:
+
+            fn = om.MFnDependencyNode(self.m_node.object())
+
+            if fn.hasAttribute(self.m_name):
+
+                return fn.findPlug(self.m_name, False)
+
+        selection = om.MSelectionList()
+
+        try:
+
+            selection.add(self.name())
+
+        except RuntimeError:
+
+            raise CmdsSceneError("%s has no attribute '%s'" % (self.m_node.name(), self.m_name))
+
+        return selection.getPlug(0)
+
+        """--------------------"""
+
+    def node(self):
+
+        return self.m_node
+
+    def plugNode(self):
+
+        return self.m_node
+
+    def attrName(self):
+
+        return self.m_name
+
+    def name(self):
+
+        return "%s.%s" % (self.m_node.name(), self.m_name)
+
+    def __getitem__(self, _index):
+
+        return CmdsAttribute(self.m_node, "%s[%d]" % (self.m_name, _index))
+
+    def get(self):
+
+        """
+            Method: get
+                returns the value of the plug in the ui units, vectors are returned
+                as Vectors
+        """
+
+        self.m_node.m_scene.record("getAttr")
+
+        return getPlugValue(self.getPlug(), self.name())
+
+        """--------------------"""
+
+    def set(self, _value):
+
+        """
+            Method: set
+                sets the value of the plug
+        """
+
+        self.m_node.m_scene.record("setAttr")
+
+        if isinstance(_value, (list, tuple)):
+
+            cmds.setAttr(self.name(), *_value)
+
+        elif isinstance(_value, str):
+
+            cmds.setAttr(self.name(), _value, type = "string")
+
+        else:
+
+            cmds.setAttr(self.name(), _value)
+
+        """--------------------"""
+
+    def connect(self, _dest, force = False, f = False):
+
+        """
+            Method: connect
+                connects this plug to the destination plug
+        """
+
+        self.m_node.m_scene.connectAttr(self, _dest, f = (force or f))
+
+        """--------------------"""
+
+    def disconnect(self, _dest = None):
+
+        """
+            Method: disconnect
+                breaks the connection to _dest or, if it is not given, every
+                connection in to or out of this plug
+        """
+
+        if _dest is None:
+
+            self.m_node.m_scene.disconnectAttr(self)
+
+        else:
+
+            self.m_node.m_scene.disconnectAttr(self, _dest)
+
+        """--------------------"""
+
+    def isConnected(self):
+
+        self.m_node.m_scene.record("isConnected")
+
+        return self.getPlug().isConnected
+
+    def isLocked(self):
+
+        return self.getPlug().isLocked
+
+    def lock(self):
+
+        cmds.setAttr(self.name(), lock = True)
+
+    def unlock(self):
+
+        cmds.setAttr(self.name(), lock = False)
+
+    def isFreeToChange(self):
+
+        """
+            Method: isFreeToChange
+                returns True if the plug is neither locked nor driven by a connection
+        """
+
+        self.m_node.m_scene.record("isFreeToChange")
+
+        return self.getPlug().isFreeToChange() == om.MPlug.kFreeToChange
+
+        """--------------------"""
+
+    def inputs(self):
+
+        scene = self.m_node.m_scene
+
+        return [scene.wrapObject(plug.node()) for plug in self.getPlug().connectedTo(True, False)]
+
+    def outputs(self):
+
+        scene = self.m_node.m_scene
+
+        return [scene.wrapObject(plug.node()) for plug in self.getPlug().connectedTo(False, True)]
+
+    def connections(self):
+
+        """
+            Method: connections
+                returns the nodes on the other end of every connection in to or
+                out of this plug
+        """
+
+        self.m_node.m_scene.record("listConnections")
+
+        return self.inputs() + self.outputs()
+
+        """--------------------"""
+
+    def __eq__(self, _other):
+
+        return isinstance(_other, CmdsAttribute) and self.m_node == _other.m_node and self.m_name == _other.m_name
+
+    def __ne__(self, _other):
+
+        return not self.__eq__(_other)
+
+    def __hash__(self):
+
+        return hash((hash(self.m_node), self.m_name))
+
+    def __str__(self):
+
+        return self.name()
+
+    def __repr__(self):
+
+        return "Attribute(%r)" % self.name()
+
+#----------END-CmdsAttribute-Class----------#
+
+#----------CmdsNode-Class----------#
+
+class CmdsNode(object):
+
+    """
+        Class: CmdsNode
+            A node in the maya scene, mirrors the parts of pymel's PyNode classes
+            used by the toolset. The node is held by an MObjectHandle so it is
+            followed through renames and reparenting without looking its name up,
+            and transforms are read straight from its dag path rather than
+            through pymel's wrapped function sets.
+
+        File: pRigging/src/cmdsscene.py
+
+        Contains:
+            self.m_scene:           The CmdsScene the node was found through
+            self.m_handle:          The MObjectHandle of the node
+
+        Imports:
+            maya.cmds as cmds
+            maya.api.OpenMaya as om
+            pRigging.src.rigmath as prm
+            pRigging.src.memoryscene as pms
+    """
+
+    def __init__(self, _scene, _handle):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _scene:                 The scene the node was found through
+                _handle:                The MObjectHandle of the node
+        """
+
+        self.m_scene = _scene
+        self.m_handle = _handle
+
+        """--------------------"""
+
+    def object(self):
+
+        """
+            Method: object
+                returns the MObject of the node, raises a CmdsSceneError if it has
+                been deleted
+        """
+
+        if not self.m_handle.isValid():
+
+            raise CmdsSceneError("Object no longer exists.")
+
+        return self.m_handle.object()
+
+        """--------------------"""
+
+    def isDag(self):
+
+        return self.object().hasFn(om.MFn.kDagNode)
+
+    def isTransform(self):
+
+        return self.object().hasFn(om.MFn.kTransform)
+
+    def dagPath(self):
+
+        return om.MDagPath.getAPathTo(self.object())
+
+    #----------identity----------#
+
+    def name(self):
+
+        """
+            Method: name
+                returns the shortest name that is unique in the scene, the partial
+                dag path for dag nodes, as pymel does
+        """
+
+        if self.isDag():
+
+            return self.dagPath().partialPathName()
+
+        return om.MFnDependencyNode(self.object()).name()
+
+        """--------------------"""
+
+    def shortName(self):
+
+        return om.MFnDependencyNode(self.object()).name()
+
+    nodeName = shortName
+
+    def longName(self):
+
+        """
+            Method: longName
+                returns the full dag path of the node, the short name for DG nodes
+        """
+
+        if self.isDag():
+
+            return self.dagPath().fullPathName()
+
+        return self.shortName()
+
+        """--------------------"""
+
+    fullPath = longName
+
+    def nodeType(self):
+
+        return om.MFnDependencyNode(self.object()).typeName
+
+    type = nodeType
+
+    def exists(self):
+
+        return self.m_handle.isValid()
+
+    def rename(self, _name):
+
+        return self.m_scene.rename(self, _name)
+
+    def __str__(self):
+
+        return self.name()
+
+    def __repr__(self):
+
+        if not self.exists():
+
+            return "nt.DeletedNode()"
+
+        nodeType = self.nodeType()
+
+        return "nt.%s%s(%r)" % (nodeType[0].upper(), nodeType[1:], self.name())
+
+    def __eq__(self, _other):
+
+        #nodes compare equal to the same maya node and to its names, like pynodes
+
+        if isinstance(_other, CmdsNode):
+
+            return self.m_handle.isValid() and _other.m_handle.isValid() and self.object() == _other.object()
+
+        try:
+
+            return self.exists() and _other in (self.name(), self.shortName(), self.longName())
+
+        except TypeError:
+
+            return False
+
+    def __ne__(self, _other):
+
+        return not self.__eq__(_other)
+
+    def __hash__(self):
+
+        return self.m_handle.hashCode()
+
+    #----------attributes----------#
+
+    def hasAttr(self, _name):
+
+        """
+            Method: hasAttr
+                returns True if the node has the attribute named, multi elements and
+                weight aliases are checked by maya
+        """
+
+        name = pms.ATTR_ALIASES.get(_name, _name)
+
+        if "[" not in name and om.MFnDependencyNode(self.object()).hasAttribute(name):
+
+            return True
+
+        return cmds.objExists("%s.%s" % (self.name(), name))
+
+        """--------------------"""
+
+    def attr(self, _name):
+
+        """
+            Method: attr
+                returns the attribute plug named, raises a CmdsSceneError if the node
+                has no such attribute
+        """
+
+        if not self.hasAttr(_name):
+
+            raise CmdsSceneError("%s has no attribute '%s'" % (self.name(), _name))
+
+        return CmdsAttribute(self, _name)
+
+        """--------------------"""
+
+    def __getattr__(self, _name):
+
+        #only called when normal lookup fails, so the attributes of the maya node
+        #can be reached the same way pymel allows, e.g. node.tx
+
+        if _name.startswith("_") or _name.startswith("m_"):
+
+            raise AttributeError(_name)
+
+        if self.exists() and self.hasAttr(_name):
+
+            return CmdsAttribute(self, _name)
+
+        raise AttributeError("%r has no attribute or method named '%s'" % (self, _name))
+
+    def addAttr(self, _name, at = "double", attributeType = "", dv = 0, defaultValue = None,
+                hxv = False, hnv = False, max = 1, min = 0, k = False, keyable = False, **kwargs):
+
+        """
+            Method: addAttr
+                adds a dynamic attribute to the node
+        """
+
+        self.m_scene.record("addAttr")
+
+        if defaultValue is not None:
+
+            dv = defaultValue
+
+        flags = {"longName" : _name, "attributeType" : attributeType or at,
+                 "defaultValue" : dv, "keyable" : k or keyable}
+
+        if hxv:
+
+            flags.update({"hasMaxValue" : True, "maxValue" : max})
+
+        if hnv:
+
+            flags.update({"hasMinValue" : True, "minValue" : min})
+
+        cmds.addAttr(self.name(), **flags)
+
+        """--------------------"""
+
+    def getWeightAliasList(self):
+
+        """
+            Method: getWeightAliasList
+                returns the target weight plugs of a constraint in target order
+        """
+
+        self.m_scene.record("getWeightAliasList")
+
+        aliases = getattr(cmds, self.nodeType())(self.name(), query = True, weightAliasList = True) or []
+
+        return [CmdsAttribute(self, alias.split(".")[-1]) for alias in aliases]
+
+        """--------------------"""
+
+    def connections(self):
+
+        """
+            Method: connections
+                returns the nodes connected to any plug on this node
+        """
+
+        self.m_scene.record("listConnections")
+
+        return self.inputs() + self.outputs()
+
+        """--------------------"""
+
+    def inputs(self):
+
+        return self.m_scene.wrapNames(cmds.listConnections(self.name(), source = True, destination = False))
+
+    def outputs(self):
+
+        return self.m_scene.wrapNames(cmds.listConnections(self.name(), source = False, destination = True))
+
+    #----------hierarchy----------#
+
+    def getParent(self):
+
+        """
+            Method: getParent
+                returns the parent of the node, None for nodes under the world
+        """
+
+        self.m_scene.record("getParent")
+
+        path = self.dagPath()
+
+        if path.length() <= 1:
+
+            return None
+
+        return self.m_scene.wrapObject(path.pop().node())
+
+        """--------------------"""
+
+    def getChildren(self, type = None):
+
+        """
+            Method: getChildren
+                returns the dag children of the node, optionally only those of a type
+        """
+
+        self.m_scene.record("getChildren")
+
+        fn = om.MFnDagNode(self.object())
+        children = [self.m_scene.wrapObject(fn.child(i)) for i in range(0, fn.childCount())]
+
+        return [c for c in children if type is None or self.m_scene.isType(c, [type])]
+
+        """--------------------"""
+
+    def getShapes(self):
+
+        fn = om.MFnDagNode(self.object())
+
+        return [self.m_scene.wrapObject(fn.child(i)) for i in range(0, fn.childCount())
+                if not fn.child(i).hasFn(om.MFn.kTransform)]
+
+    def getShape(self):
+
+        shapes = self.getShapes()
+
+        if shapes == []:
+
+            return None
+
+        return shapes[0]
+
+    def listRelatives(self, **kwargs):
+
+        return self.m_scene.listRelatives(self, **kwargs)
+
+    def setParent(self, *args, **kwargs):
+
+        """
+            Method: setParent
+                reparents the node, keeping its world space transform. With no
+                parent, or world = True, the node is parented to the world. Nothing
+                is done if the node is already under the parent.
+        """
+
+        parent = None
+
+        if len(args) != 0 and args[0] not in ("", None):
+
+            parent = self.m_scene.PyNode(args[0])
+
+        if kwargs.get("world", False) or kwargs.get("w", False):
+
+            parent = None
+
+        self.m_scene.record("setParent")
+
+        if self.getParent() == parent:
+
+            return
+
+        relative = kwargs.get("r", False) or kwargs.get("relative", False)
+
+        if parent is None:
+
+            cmds.parent(self.name(), world = True, relative = relative)
+
+        else:
+
+            cmds.parent(self.name(), parent.name(), relative = relative)
+
+        """--------------------"""
+
+    #----------transforms----------#
+
+    def getMatrix(self, worldSpace = False, ws = False):
+
+        """
+            Method: getMatrix
+                returns the local or world matrix of the node as nested lists, with
+                its translation in the ui units
+        """
+
+        self.m_scene.record("getMatrix")
+
+        path = self.dagPath()
+        matrix = path.inclusiveMatrix()
+
+        if not (worldSpace or ws):
+
+            matrix = matrix * path.exclusiveMatrixInverse()
+
+        return toMatrix4(matrix)
+
+        """--------------------"""
+
+    def getTranslation(self, space = "object"):
+
+        """
+            Method: getTranslation
+                returns the translation of the node in world or object space
+        """
+
+        self.m_scene.record("getTranslation")
+
+        if space == "world":
+
+            vector = om.MFnTransform(self.dagPath()).translation(om.MSpace.kWorld)
+
+            return pms.Vector(prm.scale((vector.x, vector.y, vector.z), distanceToUi()))
+
+        return self.getVector("translate")
+
+        """--------------------"""
+
+    def setTranslation(self, _vector, space = "object"):
+
+        """
+            Method: setTranslation
+                sets the translation of the node in world or object space
+        """
+
+        self.m_scene.record("setTranslation")
+
+        if space == "world":
+
+            cmds.xform(self.name(), translation = tuple(_vector), worldSpace = True)
+
+        else:
+
+            cmds.setAttr(self.name() + ".translate", *_vector)
+
+        """--------------------"""
+
+    def translateBy(self, _vector, space = "object"):
+
+        """
+            Method: translateBy
+                moves the node relative to its current position
+        """
+
+        self.m_scene.record("translateBy")
+
+        if space == "world":
+
+            cmds.move(_vector[0], _vector[1], _vector[2], self.name(), relative = True, worldSpace = True)
+
+        else:
+
+            cmds.setAttr(self.name() + ".translate", *prm.add(self.getVector("translate"), _vector))
+
+        """--------------------"""
+
+    def getRotation(self, space = "object"):
+
+        """
+            Method: getRotation
+                returns the XYZ euler rotation of the node, in degrees
+        """
+
+        self.m_scene.record("getRotation")
+
+        if space == "world":
+
+            return pms.Vector(prm.matrixToEuler(prm.rotationPart(toMatrix4(self.dagPath().inclusiveMatrix()))))
+
+        return self.getVector("rotate")
+
+        """--------------------"""
+
+    def setRotation(self, _rotation, space = "object"):
+
+        """
+            Method: setRotation
+                sets the rotation of the node, in world space any joint orient is
+                taken into account by maya
+        """
+
+        self.m_scene.record("setRotation")
+
+        if space == "world":
+
+            cmds.xform(self.name(), rotation = tuple(_rotation), worldSpace = True)
+
+        else:
+
+            cmds.setAttr(self.name() + ".rotate", *_rotation)
+
+        """--------------------"""
+
+    def getVector(self, _attr):
+
+        return getPlugValue(om.MFnDependencyNode(self.object()).findPlug(_attr, False), self.name() + "." + _attr)
+
+#----------END-CmdsNode-Class----------#
+
+#----------CmdsScene-Class----------#
+
+class CmdsScene(object):
+
+    """
+        Class: CmdsScene
+            The subset of pymel.core used to build rigs, implemented with maya.cmds
+            and the OpenMaya API. It can be selected as the scene backend so that
+            builds skip pymel's node wrapping, the same rig is built either way,
+            pymel is kept as the default for compatibility. Commands that change
+            the scene go through maya.cmds so they are undone as they would be with
+            pymel, queries go through the API. The commands are counted, as they
+            are in the in-memory scene, so the two backends can be compared.
+
+        File: pRigging/src/cmdsscene.py
+
+        Contains:
+            self.m_commandCounts:   A dictionary of command names to the number of
+                                    times they have been called
+            self.m_nodesBefore:     The number of nodes in the scene when the stats
+                                    were last reset
+
+        Imports:
+            maya.cmds as cmds
+            maya.api.OpenMaya as om
+            pRigging.src.rigmath as prm
+            pRigging.src.memoryscene as pms
+    """
+
+    def __init__(self):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+        """
+
+        self.resetStats()
+
+        """--------------------"""
+
+    #----------statistics----------#
+
+    def record(self, _command):
+
+        self.m_commandCounts[_command] = self.m_commandCounts.get(_command, 0) + 1
+
+    def resetStats(self):
+
+        """
+            Method: resetStats
+                resets the command and node counts
+        """
+
+        self.m_commandCounts = {}
+        self.m_nodesBefore = len(cmds.ls())
+
+        """--------------------"""
+
+    def getCommandCount(self):
+
+        return sum(self.m_commandCounts.values())
+
+    def getCommandCounts(self):
+
+        return dict(self.m_commandCounts)
+
+    def getNodesCreated(self):
+
+        return len(cmds.ls()) - self.m_nodesBefore
+
+    #----------nodes----------#
+
+    def wrapObject(self, _obj):
+
+        return CmdsNode(self, om.MObjectHandle(_obj))
+
+    def wrapNames(self, _names):
+
+        """
+            Method: wrapNames
+                returns the nodes for a list of names returned by a command, which
+                is None rather than empty when there are none
+        """
+
+        return [self.PyNode(name) for name in (_names or [])]
+
+        """--------------------"""
+
+    def PyNode(self, _obj):
+
+        """
+            Method: PyNode
+                returns the node for a name or node, raises a CmdsSceneError if it
+                does not exist
+        """
+
+        if isinstance(_obj, CmdsAttribute):
+
+            return _obj
+
+        if isinstance(_obj, CmdsNode):
+
+            if not _obj.exists():
+
+                raise CmdsSceneError("Object no longer exists.")
+
+            return _obj
+
+        name = str(_obj)
+
+        #plugs are returned as attributes
+
+        if "." in name:
+
+            nodeName, attrName = name.split(".", 1)
+
+            return self.PyNode(nodeName).attr(attrName)
+
+        selection = om.MSelectionList()
+
+        try:
+
+            selection.add(name)
+
+        except RuntimeError:
+
+            raise CmdsSceneError("No object matches name: %s" % name)
+
+        return self.wrapObject(selection.getDependNode(0))
+
+        """--------------------"""
+
+    def names(self, _args):
+
+        """
+            Method: names
+                flattens nested lists of objects into the list of names passed to
+                maya.cmds
+        """
+
+        result = []
+
+        for arg in _args:
+
+            if isinstance(arg, (list, tuple)) and not isinstance(arg, pms.Vector):
+
+                result.extend(self.names(arg))
+
+            else:
+
+                result.append(str(arg))
+
+        return result
+
+        """--------------------"""
+
+    def flags(self, _kwargs):
+
+        """
+            Method: flags
+                returns the flags of a command with any objects passed in them
+                swapped for their names
+        """
+
+        flags = dict(_kwargs)
+
+        for flag in OBJECT_FLAGS:
+
+            if isinstance(flags.get(flag), (CmdsNode, CmdsAttribute)):
+
+                flags[flag] = str(flags[flag])
+
+        return flags
+
+        """--------------------"""
+
+    def isType(self, _node, _types):
+
+        """
+            Method: isType
+                returns True if the node is, or inherits from, one of the types
+        """
+
+        for nodeType in _types:
+
+            if _node.nodeType() == nodeType or (nodeType == "transform" and _node.isTransform()):
+
+                return True
+
+        return False
+
+        """--------------------"""
+
+    def createNode(self, _type, **kwargs):
+
+        self.record("createNode")
+
+        return self.PyNode(cmds.createNode(_type, **self.flags(kwargs)))
+
+    def objExists(self, _name):
+
+        self.record("objExists")
+
+        return cmds.objExists(str(_name))
+
+    def nodeType(self, _obj):
+
+        self.record("nodeType")
+
+        return self.PyNode(_obj).nodeType()
+
+    def rename(self, _obj, _name):
+
+        """
+            Method: rename
+                renames a node, returns the node, which keeps following the maya node
+        """
+
+        self.record("rename")
+
+        node = self.PyNode(_obj)
+        cmds.rename(node.name(), str(_name).split("|")[-1])
+
+        return node
+
+        """--------------------"""
+
+    def aliasAttr(self, _alias, _plug):
+
+        """
+            Method: aliasAttr
+                gives an attribute a new alias, replacing any it already has
+        """
+
+        self.record("aliasAttr")
+
+        cmds.aliasAttr(str(_alias), str(_plug))
+
+        """--------------------"""
+
+    def ls(self, *args, **kwargs):
+
+        """
+            Method: ls
+                lists nodes, nodes can be passed in by name or by uuid, with the uuid
+                flag their uuids are returned rather than the nodes
+        """
+
+        self.record("ls")
+
+        if kwargs.get("uuid", False):
+
+            return cmds.ls(*self.names(args), **kwargs) or []
+
+        return self.wrapNames(cmds.ls(*self.names(args), long = True, **kwargs))
+
+        """--------------------"""
+
+    #----------selection----------#
+
+    def select(self, *args, **kwargs):
+
+        """
+            Method: select
+                changes the active selection, an empty list clears it as in pymel
+        """
+
+        self.record("select")
+
+        names = self.names(args)
+
+        if names == [] and len(kwargs) == 0:
+
+            kwargs = {"clear" : True}
+
+        cmds.select(*names, **kwargs)
+
+        """--------------------"""
+
+    def selected(self):
+
+        return self.wrapNames(cmds.ls(selection = True, long = True))
+
+    #----------hierarchy----------#
+
+    def listRelatives(self, _obj, **kwargs):
+
+        self.record("listRelatives")
+
+        return self.wrapNames(cmds.listRelatives(str(self.PyNode(_obj)), fullPath = True, **kwargs))
+
+    def parent(self, *args, **kwargs):
+
+        self.record("parent")
+
+        return self.wrapNames(cmds.parent(*self.names(args), **kwargs))
+
+    #----------deletion----------#
+
+    def delete(self, *args, **kwargs):
+
+        """
+            Method: delete
+                deletes the objects passed in, nothing is done if there are none as
+                maya would delete the selection
+        """
+
+        self.record("delete")
+
+        names = self.names(args)
+
+        if names != []:
+
+            cmds.delete(*names, **kwargs)
+
+        """--------------------"""
+
+    #----------attributes----------#
+
+    def connectAttr(self, _src, _dst, f = False, force = False):
+
+        self.record("connectAttr")
+
+        cmds.connectAttr(str(_src), str(_dst), force = (f or force))
+
+    def disconnectAttr(self, _src, _dst = None):
+
+        """
+            Method: disconnectAttr
+                breaks the connection between two plugs, or every connection to and
+                from a single plug
+        """
+
+        self.record("disconnectAttr")
+
+        if _dst is not None:
+
+            cmds.disconnectAttr(str(_src), str(_dst))
+
+            return
+
+        plug = self.PyNode(_src)
+
+        for other in plug.getPlug().connectedTo(True, False):
+
+            cmds.disconnectAttr(other.name(), plug.name())
+
+        for other in plug.getPlug().connectedTo(False, True):
+
+            cmds.disconnectAttr(plug.name(), other.name())
+
+        """--------------------"""
+
+    def setAttr(self, _plug, *args, **kwargs):
+
+        value = args[0]
+
+        if len(args) > 1:
+
+            value = args
+
+        self.PyNode(_plug).set(value)
+
+    def getAttr(self, _plug, **kwargs):
+
+        return self.PyNode(_plug).get()
+
+    #----------creation commands----------#
+
+    def joint(self, *args, **kwargs):
+
+        self.record("joint")
+
+        return self.PyNode(cmds.joint(*self.names(args), **self.flags(kwargs)))
+
+    def group(self, *args, **kwargs):
+
+        self.record("group")
+
+        return self.PyNode(cmds.group(*self.names(args), **self.flags(kwargs)))
+
+    def circle(self, *args, **kwargs):
+
+        self.record("circle")
+
+        return self.wrapNames(cmds.circle(*self.names(args), **self.flags(kwargs)))
+
+    def shadingNode(self, _type, **kwargs):
+
+        self.record("shadingNode")
+
+        return self.PyNode(cmds.shadingNode(_type, **kwargs))
+
+    def makeIdentity(self, *args, **kwargs):
+
+        self.record("makeIdentity")
+
+        cmds.makeIdentity(*self.names(args), **kwargs)
+
+    def ikHandle(self, *args, **kwargs):
+
+        self.record("ikHandle")
+
+        return self.wrapNames(cmds.ikHandle(*self.names(args), **self.flags(kwargs)))
+
+    #----------constraints----------#
+
+    def aimConstraint(self, *args, **kwargs):
+
+        return self.constrain("aimConstraint", args, kwargs)
+
+    def parentConstraint(self, *args, **kwargs):
+
+        return self.constrain("parentConstraint", args, kwargs)
+
+    def orientConstraint(self, *args, **kwargs):
+
+        return self.constrain("orientConstraint", args, kwargs)
+
+    def pointConstraint(self, *args, **kwargs):
+
+        return self.constrain("pointConstraint", args, kwargs)
+
+    def scaleConstraint(self, *args, **kwargs):
+
+        return self.constrain("scaleConstraint", args, kwargs)
+
+    def poleVectorConstraint(self, *args, **kwargs):
+
+        return self.constrain("poleVectorConstraint", args, kwargs)
+
+    def constrain(self, _type, _args, _kwargs):
+
+        """
+            Method: constrain
+                makes a constraint with the maya command of the type passed in
+
+            On Exit:                    Returns the constraint node, rather than the
+                                        list of names the command returns
+        """
+
+        self.record(_type)
+
+        return self.PyNode(getattr(cmds, _type)(*self.names(_args), **self.flags(_kwargs))[0])
+
+        """--------------------"""
+
+    #----------scene----------#
+
+    def undoInfo(self, *args, **kwargs):
+
+        self.record("undoInfo")
+
+        return cmds.undoInfo(*args, **kwargs)
+
+    def newFile(self, force = False, f = False):
+
+        cmds.file(new = True, force = (force or f))
+
+    def openFile(self, _path, force = False, f = False):
+
+        cmds.file(_path, open = True, force = (force or f))
+
+    def saveAs(self, _path, force = False, f = False):
+
+        """
+            Method: saveAs
+                saves the scene as the path passed in, as ascii for .ma files
+        """
+
+        fileType = "mayaBinary"
+
+        if _path.lower().endswith(".ma"):
+
+            fileType = "mayaAscii"
+
+        cmds.file(rename = _path)
+        cmds.file(save = True, type = fileType, force = (force or f))
+
+        """--------------------"""
+
+#----------END-CmdsScene-Class----------#
+
+def distanceToUi():
+
+    """
+        Function: distanceToUi
+            returns the scale from maya's internal distance unit, centimetres, to
+            the unit set in the ui
+    """
+
+    return om.MDistance(1.0, om.MDistance.internalUnit()).asUnits(om.MDistance.uiUnit())
+
+    """--------------------"""
+
+def toMatrix4(_matrix):
+
+    """
+        Function: toMatrix4
+            returns an MMatrix as nested lists, with its translation in the ui units
+    """
+
+    matrix = [[_matrix.getElement(i, j) for j in range(4)] for i in range(4)]
+    matrix[3][:3] = prm.scale(matrix[3][:3], distanceToUi())
+
+    return matrix
+
+    """--------------------"""
+
+def getPlugValue(_plug, _name):
+
+    """
+        Function: getPlugValue
+            returns the value of a plug, numbers are read straight from the plug in
+            the ui units and compounds of numbers as Vectors, anything else, e.g. a
+            matrix, is left to getAttr
+
+        Inputs:
+            _plug:                  The MPlug to read
+            _name:                  The name of the plug, for getAttr
+    """
+
+    if _plug.isCompound and not _plug.isArray:
+
+        values = [getPlugValue(_plug.child(i), _name) for i in range(0, _plug.numChildren())]
+
+        if all([isinstance(value, float) for value in values]):
+
+            return pms.Vector(values)
+
+        return cmds.getAttr(_name)
+
+    attr = _plug.attribute()
+    apiType = attr.apiType()
+
+    if apiType in (om.MFn.kDoubleLinearAttribute, om.MFn.kFloatLinearAttribute):
+
+        return _plug.asMDistance().asUnits(om.MDistance.uiUnit())
+
+    if apiType in (om.MFn.kDoubleAngleAttribute, om.MFn.kFloatAngleAttribute):
+
+        return _plug.asMAngle().asUnits(om.MAngle.uiUnit())
+
+    if apiType == om.MFn.kEnumAttribute:
+
+        return _plug.asShort()
+
+    if apiType == om.MFn.kNumericAttribute:
+
+        numericType = om.MFnNumericAttribute(attr).numericType()
+
+        if numericType == om.MFnNumericData.kBoolean:
+
+            return _plug.asBool()
+
+        if numericType in (om.MFnNumericData.kFloat, om.MFnNumericData.kDouble):
+
+            return _plug.asDouble()
+
+        if numericType in (om.MFnNumericData.kShort, om.MFnNumericData.kInt,
+                           om.MFnNumericData.kByte, om.MFnNumericData.kChar):
+
+            return _plug.asInt()
+
+    return cmds.getAttr(_name)
+
+    """--------------------"""
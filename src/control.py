@@ -1,7 +1,14 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
 import pRigging.src.riggingbase as prb
+import pRigging.src.scenemodifier as psm
+import pRigging.src.nodelist as pnl
+import pRigging.src.nodecache as pnc
+import pRigging.src.buildsession as pbs
+import pRigging.src.rigmath as prm
+
+pm = psb.pm
 
 #----------Control-Class----------#
 
@@ -15,17 +22,25 @@ class Control(prb.RiggingBase):
         File: pRigging/src/control.py
         
         Contains:
-            self.m_control:         The control object (usually the nurbs curve)
-            self.m_groups:          The groups above the control, ordered from highest
-                                    to lowest in the hierarchy, with the last one being
-                                    group immediately above the control in the hierarchy
-                                    usually an _SDK group
-            self.m_outConstraints:  The output constraints from the control, ones with
-                                    the control as the driver
+            self.m_control:         A NodeList of the control object (usually the nurbs
+                                    curve), empty until the control is made
+            self.m_groups:          A NodeList of the groups above the control, ordered
+                                    from highest to lowest in the hierarchy, with the
+                                    last one being group immediately above the control
+                                    in the hierarchy usually an _SDK group
+            self.m_outConstraints:  A NodeList of the output constraints from the control,
+                                    ones with the control as the driver
+            self.m_ledger:          A NodeList of every scene node made by the object, so
+                                    they can all be deleted at once when it is cleared
         
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
             pRigging.src.riggingbase as prb
+            pRigging.src.scenemodifier as psm
+            pRigging.src.nodelist as pnl
+            pRigging.src.nodecache as pnc
+            pRigging.src.buildsession as pbs
+            pRigging.src.rigmath as prm
             
         Inherits:
             prb.RiggingBase
@@ -44,10 +59,11 @@ class Control(prb.RiggingBase):
         """
         #initialise the object's attributes
         
-        self.m_control = None
-        self.m_groups = []
-        self.m_outConstraints = []
+        self.m_control = pnl.NodeList()
+        self.m_groups = pnl.NodeList()
+        self.m_outConstraints = pnl.NodeList()
         self.m_ext = "CTRL"
+        self.m_ledger = pnl.NodeList()
         self.m_isGenerated = False
         
         """--------------------"""
@@ -116,9 +132,9 @@ class Control(prb.RiggingBase):
         
         if _templateObj:
             
-            #ensure pynode rather than unicode
+            #ensure pynode rather than unicode, through the node cache
             
-            templateObj = pm.PyNode(_templateObj)
+            templateObj = pnc.getNode(_templateObj)
             
             #check if a control extension override is set
             
@@ -157,23 +173,34 @@ class Control(prb.RiggingBase):
 
             #make the control
 
-            self.m_control = pm.circle(name = ctrlName, nr = (1,0,0))[0] #index 0 as circle retuns the transform 
+            control = self.recordNode(pm.circle(name = self.reserveNames([ctrlName])[0], nr = (1,0,0))[0]) #index 0 as circle retuns the transform 
                                                                         #and the make nurbs circle node
+            self.m_control = pnl.NodeList([control])
+
+            #read the template object once for the move and the rotation
+            
+            doMove = _moveToTemplate == True and _move == True
+            doOrient = _orientToTemplate == True and _orient == True
+            
+            if doMove or doOrient:
+                
+                templateMatrix = self.getWorldMatrix(templateObj)
+                
             #if move is set to true or left at default
             
-            if _moveToTemplate == True and _move == True:
+            if doMove:
                 
                 #move the control to the location of the template object
                 
-                self.m_control.setTranslation(_templateObj.getTranslation(space = 'world'))
+                control.setTranslation(tuple(templateMatrix[3][:3]))
                 
             #if orient is set to true or left at default
             
-            if _orientToTemplate == True and _orient == True:
+            if doOrient:
                 
                 #rotate the control to match the orientation of the template object
                 
-                self.m_control.setRotation(templateObj.getRotation(space = 'world'))
+                control.setRotation(prm.matrixToEuler(prm.rotationPart(templateMatrix)))
                 
             #if _noGroups is false
             
@@ -212,16 +239,12 @@ class Control(prb.RiggingBase):
                 
                 for constraint in constSet:
                     
-                    self.m_outConstraints.append(self.addConstraint(constraint, templateObj,self.m_control))
+                    self.m_outConstraints.append(self.addConstraint(constraint, templateObj, control))
             
             #finally, if the _parent flag was set, parent the top of the control hierarchy under
             #the parent object specified
             
             self.setCtrlParent(_parent)
-                    
-            #clear selection   
-            
-            pm.select(cl=True)                    
                             
             self.m_isGenerated = True
                 
@@ -267,19 +290,24 @@ class Control(prb.RiggingBase):
                     
                 elif insertId == 0 and len(self.m_groups) == 0:
                     
-                    parentObj = self.m_control.getParent()
+                    parentObj = self.getCtrl().getParent()
                     
                 elif insertId != 0:
                     
                     parentObj = self.m_groups[insertId-1]
                 
+                #the groups are made straight away but the parenting is queued and
+                #done once they are all made
+                
+                modifier = psm.SceneModifier()
+                
                 #cycle through the extensions in reverse order
                 
                 for i in range((len(_grpExts)-1),-1,-1):
                     
                     #set the group name
                         
-                    groupName = self.addExtToNames( [self.m_control], _grpExts[i])[0]
+                    groupName = self.addExtToNames( [self.getCtrl()], _grpExts[i])[0]
                     
                     #if the caller has specified that thegroups should be inserted over the
                     #control object, or there are no groups and it is the first iteration
@@ -288,21 +316,18 @@ class Control(prb.RiggingBase):
                         
                         #add the new group over the control
                                
-                        self.m_groups.insert(insertId, self.addGroupOverObj (groupName, self.m_control))
+                        self.m_groups.insert(insertId, self.addGroupOverObj (groupName, self.getCtrl(), _modifier = modifier))
                         
                     else:
                         
                         #add the group over the last group
                         
-                        self.m_groups.insert(insertId, self.addGroupOverObj (groupName, self.m_groups[insertId]))
+                        self.m_groups.insert(insertId, self.addGroupOverObj (groupName, self.m_groups[insertId], _modifier = modifier))
    
                 #fix the hierarchy
                 
-                self.m_groups[insertId].setParent(parentObj)
-                
-                #unselect all
-                
-                pm.select(cl=True)
+                modifier.reparent(self.m_groups[insertId], parentObj)
+                modifier.doIt()
 
         """--------------------"""            
     
@@ -328,13 +353,13 @@ class Control(prb.RiggingBase):
                 
                 #parent the control under the specified parent
                 
-                self.m_control.setParent(world = True)    
+                self.reparentNode(self.getCtrl())    
                 
             else:
                 
                 #parent the top group under the parent
                 
-                self.m_groups[0].setParent(world = True)  
+                self.reparentNode(self.m_groups[0])  
         
         elif _parent != "":
             
@@ -344,13 +369,13 @@ class Control(prb.RiggingBase):
                 
                 #parent the control under the specified parent
                 
-                self.m_control.setParent(_parent)    
+                self.reparentNode(self.getCtrl(), _parent)    
                 
             else:
                 
                 #parent the top group under the parent
                 
-                self.m_groups[0].setParent(_parent)  
+                self.reparentNode(self.m_groups[0], _parent)  
                 
         """--------------------"""  
                 
@@ -363,7 +388,11 @@ class Control(prb.RiggingBase):
             On Exit:                    retuns the control object                      
         """                                 
         
-        return self.m_control
+        if len(self.m_control) == 0:
+            
+            return None
+            
+        return self.m_control[0]
         
         """--------------------"""
         
@@ -382,7 +411,7 @@ class Control(prb.RiggingBase):
             
         else:
             
-            return self.m_control
+            return self.getCtrl()
         
         """--------------------"""
         
@@ -417,7 +446,7 @@ class Control(prb.RiggingBase):
             
             if len(self.m_groups) == 0:
             
-                self.m_control.translateBy((_x, _y, _z), space = sp)
+                self.getCtrl().translateBy((_x, _y, _z), space = sp)
             
             else:
                 
@@ -426,11 +455,21 @@ class Control(prb.RiggingBase):
         else:
              if len(self.m_groups) == 0:
             
-                self.m_control.setTranslation((_x, _y, _z), space = sp)
+                self.getCtrl().setTranslation((_x, _y, _z), space = sp)
             
              else:
                 
                 self.m_groups[0].setTranslation((_x, _y, _z), space = sp)
+        
+        #the world matrices read from the moved node are out of date
+        
+        if len(self.m_groups) == 0:
+            
+            pbs.nodeMoved(self.getCtrl())
+            
+        else:
+            
+            pbs.nodeMoved(self.m_groups[0])
            
         """--------------------"""
         
@@ -460,7 +499,7 @@ class Control(prb.RiggingBase):
             
         """
         
-        return self.m_control.addAttr(_name, at = _type, dv = _dv, hxv = _setMax, hnv = _setMin, max = _max, min = _min, k = True)
+        return self.getCtrl().addAttr(_name, at = _type, dv = _dv, hxv = _setMax, hnv = _setMin, max = _max, min = _min, k = True)
                 
         """--------------------"""
         
@@ -472,47 +511,17 @@ class Control(prb.RiggingBase):
         """
         
         if self.m_isGenerated == True:
-                
-            #delete maya objects
             
-            try:
-                
-                pm.delete(self.m_control)
-            
-            except:
-                
-                pass
-            
-            
-            if self.m_groups != []:
-                
-                try:
-                        
-                    pm.delete(self.m_gorups[0])
-                    
-                except:
-                
-                    pass
+            #delete every node made, along with those of the objects held, in
+            #a single delete
             
-                
-            if self.m_outConstraints != []:
-                
-                for constraint in self.m_outConstraints:
-                    
-                    try:
-                        
-                        pm.delete(constraint)
-                        
-                    except:
-                
-                        pass
+            self.deleteLedger()
             
-                
             #then reset the lists
             
-            self.m_control = None
-            self.m_groups = []
-            self.m_outConstraints = []
+            self.m_control = pnl.NodeList()
+            self.m_groups = pnl.NodeList()
+            self.m_outConstraints = pnl.NodeList()
             
             #and set the is generated boolean
             
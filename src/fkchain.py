@@ -1,11 +1,10 @@
 #----------Imports----------#
 
-import pymel.core as pm
 import pRigging.src.jointchain as pjc
 import pRigging.src.riggingbase as prb
 import pRigging.src.control as pctrl
 import pRigging.src.jointchaincontainer as pjcc
-
+import pRigging.src.nodelist as pnl
 
 #----------FKChain-Class----------#
 
@@ -24,11 +23,11 @@ class FKChain(pjcc.JointChainContainer):
             self.m_controls:        a List of controls that drive the joints in the joint chain                 
         
         Imports:
-            pymel.core as pm
             pRigging.src.jointchain as pjc
             pRigging.src.riggingbase as prb
             pRigging.src.control as pctrl
             pRigging.src.jointchaincontainer as pjcc
+            pRigging.src.nodelist as pnl
 
     """
     
@@ -88,14 +87,14 @@ class FKChain(pjcc.JointChainContainer):
             
             newNames = self.addExtToNames( newNames, "FK")
             
-            groupName = self.addExtToNames(self.removeExtFromNames([groupName]),"FK")[0]
+            groupName = self.renameFromNames([groupName], 1, ["FK"])[0]
         
         else:
             
             #add the override extension to the names
             
             newNames = self.addExtToNames(newNames, _extOverride)
-            groupName = self.addExtToNames(self.removeExtFromNames([groupName]),_extOverride)[0]
+            groupName = self.renameFromNames([groupName], 1, [_extOverride])[0]
             
         #generate the joint chain based on the selected joints, and the names passed in as inputs
         
@@ -125,9 +124,7 @@ class FKChain(pjcc.JointChainContainer):
             
             self.m_controls[i].setCtrlParent(self.m_controls[i-1].getCtrl())
             
-        self.addGroupOverChain(groupName)   
-            
-        pm.select(cl = True)
+        self.addGroupOverChain(groupName)
         
         self.m_isGenerated = True
         
@@ -206,16 +203,12 @@ class FKChain(pjcc.JointChainContainer):
         
         if len(self.m_chainGroups) != 0:
             
-            #ensure clear selection
-            
-            pm.select(cl = True)
-            
             #greate a group over that one and insert it into the top of the list
             #after setting the parent
             
-            newGroup = pm.group(n = name)
-            self.m_chainGroups[0].setParent(newGroup)
-            self.m_chainGroups.insert(0,newgroup)
+            newGroup = self.makeNode("transform", self.reserveNames([name])[0])
+            self.reparentNode(self.m_chainGroups[0], newGroup)
+            self.m_chainGroups.insert(0,newGroup)
             
         #if there arent any groups
         
@@ -224,14 +217,12 @@ class FKChain(pjcc.JointChainContainer):
             #generate the group and set it as the parent of all of the hierarchies 
             #represented within the chain container
             
-            pm.select(cl = True)
-            
             #greate a group over that one and insert it into the top of the list
             #after setting the parent
             
-            newGroup = pm.group(n = name)
-            self.m_jointChain.getJoint(0).setParent(newGroup)
-            self.m_controls[0].getTopGrp().setParent(newGroup)
+            newGroup = self.makeNode("transform", self.reserveNames([name])[0])
+            self.reparentNode(self.m_jointChain.getJoint(0), newGroup)
+            self.reparentNode(self.m_controls[0].getTopGrp(), newGroup)
             self.m_chainGroups.append(newGroup)    
 
         
@@ -245,8 +236,13 @@ class FKChain(pjcc.JointChainContainer):
         """
         
         if self.m_isGenerated == True:
-                
-            #call clear on pRigging objects
+            
+            #delete every node made, along with those of the objects held, in
+            #a single delete
+            
+            self.deleteLedger()
+            
+            #clear the pRigging objects too, they have nothing left to delete
             
             self.m_jointChain.clear()
             
@@ -254,23 +250,10 @@ class FKChain(pjcc.JointChainContainer):
                 
                 ctrl.clear()
             
-            #delete maya objects
-            
-            for grp in self.m_chainGroups:
-                
-                try:
-                    
-                    pm.delete(grp)
-                    
-                except:
-                
-                    pass
-            
-                
             #then reset the lists
             
             self.m_jointChain = 0
-            self.m_chainGroups = []
+            self.m_chainGroups = pnl.NodeList()
             self.m_controls = []
             
             #and set the is generated boolean
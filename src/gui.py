@@ -1,16 +1,22 @@
 #----------Imports----------#
 
-import pymel.core as pm
 import os
+import importlib
+import pRigging.src.scenebackend as psb
 import pRigging.src.riggingbase as prb
 import pRigging.src.ui.starttabnovice as pstn
-import pRigging.src.ui.armtabnovice as patn
-import pRigging.src.ui.armtabintermediate as pati
-import pRigging.src.ui.armtabexperienced as pate
-import pRigging.src.armrig as par
 import pRigging.src.ui.tabsettings as pts
 import pRigging.src.ui.helpbox as phb
 
+pm = psb.ui
+
+#the arm tab for each skill level, as its module and class, only the module
+#for the skill level in use is imported, see getArmTabClass
+
+ARM_TABS = {"Novice" : ("pRigging.src.ui.armtabnovice", "ArmTabNovice"),
+            "Intermediate" : ("pRigging.src.ui.armtabintermediate", "ArmTabIntermediate"),
+            "Experienced" : ("pRigging.src.ui.armtabexperienced", "ArmTabExperienced")}
+
 #----------GUI-Class----------#
 
 class Gui (prb.RiggingBase):
@@ -31,18 +37,23 @@ class Gui (prb.RiggingBase):
             self.m_window:          The GUI window, contains all of the other UI
                                     elements
             self.m_windowName:      The name of the window ui object being created
+            self.m_profiler:        The BuildProfiler used when builds are profiled,
+                                    None until the first profiled build
+            self.m_buildCache:      The BuildCache used when builds are cached, None
+                                    until the first cached build
         
         Imports:
-            pymel.core as pm
             os
+            importlib
+            pRigging.src.scenebackend as psb
             pRigging.src.riggingbase as prb
             pRigging.src.ui.starttabnovice as pstn
-            pRigging.src.ui.armtabnovice as patn
-            pRigging.src.ui.armtabintermediate as pati
-            pRigging.src.ui.armtabexperienced as pate
-            pRigging.src.armrig as par
             pRigging.src.ui.tabsettings as pts
             pRigging.src.ui.helpbox as phb
+            
+            The arm tabs, the arm rig, the profiler and the build cache are only
+            imported once they are used, and pymel once the window is made, so
+            the window appears without loading the rest of the toolset
     """
     
     def __init__(self):
@@ -80,6 +91,11 @@ class Gui (prb.RiggingBase):
         #unique id
         
         self.uID = 1
+        
+        #profiler and cache for the builds, made the first time they are used
+        
+        self.m_profiler = None
+        self.m_buildCache = None
                 
         #if the prefs file isn't empty
         
@@ -151,6 +167,13 @@ class Gui (prb.RiggingBase):
         self.m_showRigButton = pm.button(l = "Show Rig", c = pm.Callback(self.setVisRig, True))        
         self.m_showChainButton = pm.button(l = "Show Current Element", c = pm.Callback(self.setVisElement, True))
         
+        #create the build option controls
+        
+        self.m_fastBuildCheck = pm.checkBox(l = "Fast Build (No Undo)", v = False)
+        self.m_cacheCheck = pm.checkBox(l = "Cache Builds", v = False)
+        self.m_profileCheck = pm.checkBox(l = "Profile Builds", v = False)
+        self.m_saveProfileButton = pm.button(l = "Save Profile", c = pm.Callback(self.saveProfile))
+        
         self.m_helpBox = phb.HelpBox(self.m_outerForm, self)
         helpBoxUI = self.m_helpBox.getTopUI()   
         
@@ -181,24 +204,36 @@ class Gui (prb.RiggingBase):
         self.m_outerForm.attachForm(self.m_hideChainButton, 'right', 20)
         self.m_outerForm.attachForm(self.m_showRigButton, 'right', 20)
         self.m_outerForm.attachForm(self.m_showChainButton, 'right', 20)
+        self.m_outerForm.attachForm(self.m_fastBuildCheck, 'right', 20)
+        self.m_outerForm.attachForm(self.m_cacheCheck, 'right', 20)
+        self.m_outerForm.attachForm(self.m_profileCheck, 'right', 20)
+        self.m_outerForm.attachForm(self.m_saveProfileButton, 'right', 20)
         
 
         self.m_outerForm.attachPosition(self.m_hideRigButton, 'left', 10, 70)
         self.m_outerForm.attachPosition(self.m_hideChainButton, 'left', 10, 70)
         self.m_outerForm.attachPosition(self.m_showRigButton, 'left', 10, 70)
         self.m_outerForm.attachPosition(self.m_showChainButton, 'left', 10, 70)
+        self.m_outerForm.attachPosition(self.m_fastBuildCheck, 'left', 10, 70)
+        self.m_outerForm.attachPosition(self.m_cacheCheck, 'left', 10, 70)
+        self.m_outerForm.attachPosition(self.m_profileCheck, 'left', 10, 70)
+        self.m_outerForm.attachPosition(self.m_saveProfileButton, 'left', 10, 70)
         
         self.m_outerForm.attachControl(self.m_hideRigButton, 'top', 10, self.m_userSkillRB)
         self.m_outerForm.attachControl(self.m_hideChainButton, 'top', 10, self.m_hideRigButton)
         self.m_outerForm.attachControl(self.m_showRigButton, 'top', 10, self.m_hideChainButton)
         self.m_outerForm.attachControl(self.m_showChainButton, 'top', 10, self.m_showRigButton)
+        self.m_outerForm.attachControl(self.m_fastBuildCheck, 'top', 10, self.m_showChainButton)
+        self.m_outerForm.attachControl(self.m_cacheCheck, 'top', 10, self.m_fastBuildCheck)
+        self.m_outerForm.attachControl(self.m_profileCheck, 'top', 10, self.m_cacheCheck)
+        self.m_outerForm.attachControl(self.m_saveProfileButton, 'top', 10, self.m_profileCheck)
         
         #attach the helpbox
         
         self.m_outerForm.attachForm(helpBoxUI, 'right', 20)
         self.m_outerForm.attachForm(helpBoxUI, 'bottom', 10)
         self.m_outerForm.attachPosition(helpBoxUI, 'left', 10, 70)
-        self.m_outerForm.attachControl(helpBoxUI, 'top', 10,self.m_showChainButton) 
+        self.m_outerForm.attachControl(helpBoxUI, 'top', 10,self.m_saveProfileButton) 
                             
         #show window 
         
@@ -251,17 +286,7 @@ class Gui (prb.RiggingBase):
                     #this will take the reference count of the tab to
                     #0 and python will remove it
                     
-                    if self.m_skillLevel == "Novice":
-                        
-                        self.m_tabList[i] = patn.ArmTabNovice(self.m_tabs,self, settings)
-                                                
-                    elif self.m_skillLevel == "Intermediate":
-                        
-                        self.m_tabList[i] = pati.ArmTabIntermediate(self.m_tabs,self, settings)
-                        
-                    elif self.m_skillLevel == "Experienced":
-                    
-                        self.m_tabList[i] = pate.ArmTabExperienced(self.m_tabs,self, settings)            
+                    self.m_tabList[i] = self.getArmTabClass()(self.m_tabs,self, settings)
                 
             #re-select the chosen tab
             
@@ -306,29 +331,39 @@ class Gui (prb.RiggingBase):
             settings.m_sideSpecifier = side
             
             
+            import pRigging.src.armrig as par
+            
+            #the rigs already added are now only kept, so their nodes are held by uuid
+            
+            for rig in self.m_rigComponents:
+                
+                rig.compactNodes()
+            
             arm = par.ArmRig(settings.m_baseName)
             self.m_rigComponents.append(arm)
             
             settings.m_rigElement = arm
             
-            #switch through the dificulty levels
+            #add the tab for the dificulty level
             
-            if self.m_skillLevel == "Novice":
-                
-                self.m_tabList.append(patn.ArmTabNovice(self.m_tabs,self, settings))
-                
-            elif self.m_skillLevel == "Intermediate":
-                
-                self.m_tabList.append(pati.ArmTabIntermediate(self.m_tabs,self, settings))
-                
-            elif self.m_skillLevel == "Experienced":
-            
-                self.m_tabList.append(pate.ArmTabExperienced(self.m_tabs,self, settings))
+            self.m_tabList.append(self.getArmTabClass()(self.m_tabs,self, settings))
             
             self.m_tabs.setSelectTabIndex(len(self.m_tabList))
             
             self.m_helpBox.update()
             
+    def getArmTabClass(self):
+        
+        """
+            Method: getArmTabClass
+                A method to return the arm tab class for the current skill level,
+                importing its module the first time it is used
+        """
+        
+        moduleName, className = ARM_TABS.get(self.m_skillLevel, ARM_TABS["Novice"])
+        
+        return getattr(importlib.import_module(moduleName), className)
+        
     def getHelp(self):
         
         """
@@ -338,6 +373,79 @@ class Gui (prb.RiggingBase):
         
         return self.m_helpBox
         
+    def getFastBuild(self):
+        
+        """
+            Method: getFastBuild
+                A method to return whether or not rigs are built without recording
+                undo, in which case they are removed with the clear buttons instead
+        """
+        
+        return self.m_fastBuildCheck.getValue()
+        
+    def getBuildCache(self):
+        
+        """
+            Method: getBuildCache
+                A method to return the build cache, or None if builds aren't being
+                cached, a cached build made again from the same joints and settings
+                is made from the plan stored the first time
+        """
+        
+        if not self.m_cacheCheck.getValue():
+            
+            return None
+            
+        if self.m_buildCache is None:
+            
+            import pRigging.src.buildcache as pbc
+            
+            self.m_buildCache = pbc.BuildCache()
+        
+        return self.m_buildCache
+        
+    def getProfiler(self):
+        
+        """
+            Method: getProfiler
+                A method to return the build profiler, cleared ready for the next
+                build, or None if builds aren't being profiled
+        """
+        
+        if not self.m_profileCheck.getValue():
+            
+            return None
+            
+        if self.m_profiler is None:
+            
+            import pRigging.src.profiler as pprof
+            
+            self.m_profiler = pprof.BuildProfiler()
+        
+        self.m_profiler.reset()
+        
+        return self.m_profiler
+        
+    def saveProfile(self):
+        
+        """
+            Method: saveProfile
+                A method to save the profile of the last profiled build to a json
+                file picked by the user
+        """
+        
+        if self.m_profiler is None:
+            
+            self.m_helpBox.update( _errorList = ["ERROR","NO PROFILE","ERROR: No build has been profiled yet, check \"Profile Builds\" and build a rig first"])
+            
+            return
+        
+        path = pm.fileDialog2(fileFilter = "JSON (*.json)", dialogStyle = 2, fileMode = 0)
+        
+        if path:
+            
+            self.m_profiler.save(path[0])
+        
     def getTabInfo(self):
         
         """
@@ -406,14 +514,6 @@ class Gui (prb.RiggingBase):
         ID = self.m_tabs.getSelectTabIndex() -1
         if ID != 0:
             
-            print ID
-            
-            print "tab:   ",   self.m_tabList[ID]
-            print "tabList:  ", self.m_tabList
-            
-            print "uiForm = ", self.m_tabs.getSelectTab()
-            print "uiFormList= ", self.m_tabs.getChildArray()
-                
             self.m_tabList[ID].closeUI()
             
             self.m_tabList.pop(ID)
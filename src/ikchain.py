@@ -1,11 +1,14 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
 import pRigging.src.jointchain as pjc
 import pRigging.src.riggingbase as prb
 import pRigging.src.control as pctrl
 import pRigging.src.jointchaincontainer as pjcc
+import pRigging.src.buildsession as pbs
+import pRigging.src.nodelist as pnl
 
+pm = psb.pm
 
 #----------IKChain-Class----------#
 
@@ -20,16 +23,18 @@ class IKChain(pjcc.JointChainContainer):
         
         Contains:
             self.m_jointChain:      A joint chain
-            self.m_ikHandle:        The Ik handle
+            self.m_ikHandle:        A NodeList of the Ik handle, empty until it is made
             self.m_ikControl:       The Ik control
             self.m_ikPVControl:     The pole vector control
         
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
             pRigging.src.jointchain as pjc
             pRigging.src.riggingbase as prb
             pRigging.src.control as pctrl
             pRigging.src.jointchaincontainer as pjcc
+            pRigging.src.buildsession as pbs
+            pRigging.src.nodelist as pnl
     """
     
     def __init__(self):
@@ -50,7 +55,7 @@ class IKChain(pjcc.JointChainContainer):
         
         #initialise the object's attributes
         
-        self.m_ikHandle = ""
+        self.m_ikHandle = pnl.NodeList()
         self.m_ikControl = pctrl.Control()
         self.m_ikPVControl = pctrl.Control()
         
@@ -88,12 +93,12 @@ class IKChain(pjcc.JointChainContainer):
         
         if _extOverride == "":
 
-            _extOverride == "IK"
+            _extOverride = "IK"
           
         #add the override extension to the names
         
         newNames = self.addExtToNames(newNames, _extOverride)
-        groupName = self.addExtToNames(self.removeExtFromNames([groupName]),_extOverride)[0]
+        groupName = self.renameFromNames([groupName], 1, [_extOverride])[0]
             
         #generate the joint chain based on the selected joints, and the names passed in as inputs
         
@@ -113,30 +118,32 @@ class IKChain(pjcc.JointChainContainer):
             
         #generate a name based on the root joint name
         
-        handleName = self.addExtToNames(self.addExtToNames(self.removeExtFromNames(self.removeExtFromNames([newNames[0]])), _extOverride), "HNDL")[0]
+        handleName = self.renameFromNames([newNames[0]], 2, [_extOverride, "HNDL"])[0]
            
         #then generate an IK handle
                 
-        self.m_ikHandle = pm.ikHandle(
-                                name = handleName,
+        ikHandle = self.recordNode(pm.ikHandle(
+                                name = self.reserveNames([handleName])[0],
                                 startJoint = self.m_jointChain.getJoint(0), 
                                 endEffector = self.m_jointChain.getJoint(-1),
-                                sol = solver)[0] #0 so that just the handle is stored
+                                sol = solver)[0]) #0 so that just the handle is stored
+        
+        self.m_ikHandle = pnl.NodeList([ikHandle])
         
         #and the control for it
 
-        self.m_ikControl.genCtrl(self.m_ikHandle, _cExt = _controlExt)
+        self.m_ikControl.genCtrl(ikHandle, _cExt = _controlExt)
         
         #and set it as the parent of the IK handle
         
-        self.m_ikHandle.setParent(self.m_ikControl.getCtrl())
+        self.reparentNode(ikHandle, self.m_ikControl.getCtrl())
         
         if solver == "ikRPsolver":
             
             #make a pole vector control
             #set the name for the control
             
-            pvName = self.addExtToNames(self.addExtToNames(self.removeExtFromNames(self.removeExtFromNames([newNames[0]])), _extOverride), "PV")[0]
+            pvName = self.renameFromNames([newNames[0]], 2, [_extOverride, "PV"])[0]
             
             #add the control
             
@@ -148,19 +155,18 @@ class IKChain(pjcc.JointChainContainer):
             
             #set the consraint
             
-            self.m_ikPVControl.addConstraint("poleVector", self.m_ikHandle, self.m_ikPVControl.getCtrl())
+            self.m_ikPVControl.addConstraint("poleVector", ikHandle, self.m_ikPVControl.getCtrl())
             
             self.m_ikPVControl.setCtrlParent(self.m_ikControl.getCtrl())
             
             self.m_ikPVControl.getTopGrp().setRotation((0,0,0), space = "world")    
+            pbs.nodeMoved(self.m_ikPVControl.getTopGrp())
             
         #add the top group to the chain and controls
         
         self.addGroupOverChain( groupName)
-            
-        pm.select(cl = True)
         
-        self.m_isGenerated = False
+        self.m_isGenerated = True
         
         
         
@@ -238,16 +244,12 @@ class IKChain(pjcc.JointChainContainer):
         
         if len(self.m_chainGroups) != 0:
             
-            #ensure clear selection
-            
-            pm.select(cl = True)
-            
             #greate a group over that one and insert it into the top of the list
             #after setting the parent
             
-            newGroup = pm.group(n = name)
-            self.m_chainGroups[0].setParent(newGroup)
-            self.m_chainGroups.insert(0,newgroup)
+            newGroup = self.makeNode("transform", self.reserveNames([name])[0])
+            self.reparentNode(self.m_chainGroups[0], newGroup)
+            self.m_chainGroups.insert(0,newGroup)
             
         #if there arent any groups
         
@@ -256,14 +258,12 @@ class IKChain(pjcc.JointChainContainer):
             #generate the group and set it as the parent of all of the hierarchies 
             #represented within the chain container
             
-            pm.select(cl = True)
-            
             #greate a group over that one and insert it into the top of the list
             #after setting the parent
             
-            newGroup = pm.group(n = name)
-            self.m_jointChain.getJoint(0).setParent(newGroup)
-            self.m_ikControl.getTopGrp().setParent(newGroup)
+            newGroup = self.makeNode("transform", self.reserveNames([name])[0])
+            self.reparentNode(self.m_jointChain.getJoint(0), newGroup)
+            self.reparentNode(self.m_ikControl.getTopGrp(), newGroup)
             self.m_chainGroups.append(newGroup)
             
     def clear(self):
@@ -274,42 +274,25 @@ class IKChain(pjcc.JointChainContainer):
         """
         
         if self.m_isGenerated == True:
-                
-            #call clear on pRigging objects
-            
-            self.m_jointChain.clear()
-            self.m_ikControl.clear()
-            self.m_ikPVControl.clear()
             
-            #delete maya objects
+            #delete every node made, along with those of the objects held, in
+            #a single delete
             
-            try:
-                
-                pm.delete(self.m_ikHandle)
-                
-            except:
-                
-                pass
+            self.deleteLedger()
             
+            #clear the pRigging objects too, they have nothing left to delete
             
-            for grp in self.m_chainGroups:
-                
-                try:
-                    
-                    pm.delete(grp)
-            
-                except:
-                
-                    pass
+            self.m_jointChain.clear()
+            self.m_ikControl.clear()
+            self.m_ikPVControl.clear()
             
-                
             #then reset the lists
             
             self.m_jointChain = 0
-            self.m_ikHandle = ""
+            self.m_ikHandle = pnl.NodeList()
             self.m_ikControl = pctrl.Control()
             self.m_ikPVControl = pctrl.Control()
-            self.m_chainGroups = []
+            self.m_chainGroups = pnl.NodeList()
             
             #and set the is generated boolean
             
@@ -1,7 +1,13 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
+import pRigging.src.rigmath as prm
 import pRigging.src.riggingbase as prb
+import pRigging.src.scenemodifier as psm
+import pRigging.src.templatesnapshot as ptsn
+import pRigging.src.nodelist as pnl
+
+pm = psb.pm
 
 #----------JointChain-Class----------#
 
@@ -16,14 +22,20 @@ class JointChain(prb.RiggingBase):
         File: pRigging/src/jointchain.py
         
         Contains:
-            self.m_joints:          A list of the joints contained int he joint chain
+            self.m_joints:          A NodeList of the joints contained int he joint chain
                                     ordered from parent to child.
             self.m_ext:             A string containing the extension to be added to the
                                     names passed in to the generation method 
+            self.m_ledger:          A NodeList of every scene node made by the object, so
+                                    they can all be deleted at once when it is cleared
         
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
+            pRigging.src.rigmath as prm
             pRigging.src.riggingbase as prb
+            pRigging.src.scenemodifier as psm
+            pRigging.src.templatesnapshot as ptsn
+            pRigging.src.nodelist as pnl
             
         Inherits:
             prb.RiggingBase
@@ -42,8 +54,9 @@ class JointChain(prb.RiggingBase):
         """
         #initialise the object's attributes
         
-        self.m_joints = []
+        self.m_joints = pnl.NodeList()
         self.m_ext = "JNT"
+        self.m_ledger = pnl.NodeList()
         self.m_isGenerated = False
         
         """--------------------"""
@@ -59,7 +72,8 @@ class JointChain(prb.RiggingBase):
                 self:                   A pointer to the instance of the JointChain class of which
                                         this method is being called
                 _templateJoints:          A list of the joints in the chain that is used to 
-                                        as the basis for the new joint chain
+                                        as the basis for the new joint chain, or a
+                                        TemplateSnapshot of them
                 _jointNames:              A list of names for the joints to be called
             
             On Exit:                    The joints have been generated and parented together
@@ -74,9 +88,14 @@ class JointChain(prb.RiggingBase):
             
             self.m_ext = _ext
         
+        #read the template joints, or take the snapshot of them shared by the other
+        #chains built from them in the session
+        
+        snapshot = ptsn.getTemplateSnapshot(_templateJoints)
+        
         #check that the number of template joints match the number of names provided
         
-        numTemplateJoints = len(_templateJoints)
+        numTemplateJoints = len(snapshot)
         numNames =  len(_jointNames)
         
         newNames = _jointNames
@@ -91,46 +110,47 @@ class JointChain(prb.RiggingBase):
         
         else:
 
-            #add the extension to the names
+            #add the extension to the names and reserve them
             
-            newNames = self.addExtToNames(newNames, self.m_ext)
+            newNames = self.reserveNames(self.addExtToNames(newNames, self.m_ext))
             
-            #make sure the selection is clear
+            #the translates and joint orients are worked out by the snapshot, so they
+            #are queued and set at once when every joint is made
+            
+            modifier = psm.SceneModifier()
             
-            pm.select(clear = True)
-        
             #cycle through the joints
             
             i = 0;
             
             while i < numTemplateJoints:
                 
-                #add a joint to the list of joints in the joint chain
-                #NOTE: if inputted name is just a number the joint creation method
-                #removes that number from the start of the name
+                #add a joint to the list of joints in the joint chain, made under the
+                #joint made for the parent of its template joint, without selecting it
                 
-                self.m_joints.append(pm.joint(name = newNames[i]))
-                
-                #set the translation and rotation of the joint
-                
-                self.transAndOrientObj (self.m_joints[i], _templateJoints[i])
-                
-                #move all rotations to the joint orient
-                
-                pm.makeIdentity(self.m_joints[i], r=True, a=True)
+                parent = None
                 
-                #if it isnt the first joint
+                if snapshot.getParent(i) != -1:
+                    
+                    parent = self.m_joints[snapshot.getParent(i)]
+                    
+                self.m_joints.append(self.makeNode("joint", newNames[i], parent))
                 
-                if i!= 0:
+                #queue the translate and joint orient that put it on its template joint
                 
-                    #make the joint created before the current one the parent of the joint
+                translate = snapshot.getLocalTranslation(i)
+                orient = snapshot.getJointOrient(i)
                 
-                    self.m_joints[i].setParent(self.m_joints[i-1])
+                for j, axis in enumerate("XYZ"):
+                    
+                    modifier.setAttr(self.m_joints[i], "translate" + axis, translate[j])
+                    modifier.setAttr(self.m_joints[i], "jointOrient" + axis, orient[j])
                 
-                #clear selection and increment i
+                #increment i
                 
-                pm.select(clear = True)
                 i = i+1
+                
+            modifier.doIt()
         
         self.m_isGenerated = True
                 
@@ -149,7 +169,8 @@ class JointChain(prb.RiggingBase):
                             _pob = False,
                             _parentToTop = True,
                             _ptt = True,
-                            _ext = ""
+                            _ext = "",
+                            _batch = False
                             ):
                             
         """
@@ -179,6 +200,10 @@ class JointChain(prb.RiggingBase):
                 _parentToTop:           Defaults to True, specifies whether or not to parent the top
                                         of the joint chain to the top joint passed in
                 _ptt:                   Sort name for _parentToTop
+                _batch:                 Defaults to False, specifies whether or not to work out
+                                        every position and joint orient up front and make each
+                                        joint in place with a single command, rather than moving,
+                                        aiming, freezing and parenting the joints one at a time
                
             On Exit:                    The joints have been generated and parented together
                                         and named correctly                          
@@ -192,12 +217,12 @@ class JointChain(prb.RiggingBase):
             
         #get the position in world space of the two joints passed in
         
-        topPos = _topJoint.getTranslation(space='world')
-        bottomPos = _bottomJoint.getTranslation(space='world')
+        topPos = self.getWorldTranslation(_topJoint)
+        bottomPos = self.getWorldTranslation(_bottomJoint)
         
         #and the vector between them
         
-        vector = bottomPos-topPos
+        vector = prm.sub(bottomPos, topPos)
         
         #set up the names
         
@@ -235,24 +260,10 @@ class JointChain(prb.RiggingBase):
                 
                 newNames.append(name)
                 
-        #add the joint extension
+        #add the joint extension and reserve the names
         
-        newNames = self.addExtToNames(newNames,self.m_ext)
+        newNames = self.reserveNames(self.addExtToNames(newNames,self.m_ext))
                 
-        #generate the joints:
-            
-        for jointName in newNames:
-            
-            #clear the selection
-            
-            pm.select( cl = True )
-            
-            #and make the joints
-            
-            self.m_joints.append(pm.joint(name = jointName))
-            
-        pm.select(cl = True)
-
         #make a list of the propotions along the vector for each joint to be positioned
         
         vecMultiplier = []
@@ -293,19 +304,37 @@ class JointChain(prb.RiggingBase):
             
             vecMultiplier.append(1)
             
+        #if batching, make the joints in place and finish
+        
+        if _batch:
+            
+            self.genJointsInPlace(_topJoint, _bottomJoint, newNames, vecMultiplier, _ptt and _parentToTop)
+            
+            self.m_isGenerated = True
+            
+            return
+            
+        #generate the joints:
+            
+        for jointName in newNames:
+            
+            #make the joints, in the world and without selecting them
+            
+            self.m_joints.append(self.makeNode("joint", jointName))
+            
         #finally loop through each joint and set the position and orientation and freeze transformations
         #and do the parenting
         
         for i in range (0,len(self.m_joints)):
             
-            self.m_joints[i].setTranslation(topPos+(vector*vecMultiplier[i]))
+            self.m_joints[i].setTranslation(prm.add(topPos, prm.scale(vector, vecMultiplier[i])))
             
             #add a clause for if it's the last joint and it is in the same position as
             #the bottom joint
             
             if i == len(self.m_joints)-1 and (_pob or _posOnBottom):
                 
-                self.m_joints[i].setParent(self.m_joints[i-1])
+                self.reparentNode(self.m_joints[i], self.m_joints[i-1])
                 self.m_joints[i].jointOrientX.set(0)
                 self.m_joints[i].jointOrientY.set(0)
                 self.m_joints[i].jointOrientZ.set(0)
@@ -319,19 +348,103 @@ class JointChain(prb.RiggingBase):
                 
                 if i != 0:
                     
-                    self.m_joints[i].setParent(self.m_joints[i-1])
+                    self.reparentNode(self.m_joints[i], self.m_joints[i-1])
                     
-        #parent the top joint to the top joint passed in if chosen and clear selection
+        #parent the top joint to the top joint passed in if chosen
         
         if _ptt and _parentToTop:
             
-            self.m_joints[0].setParent(_topJoint)
-                    
-        pm.select (cl = True)
+            self.reparentNode(self.m_joints[0], _topJoint)
         
         self.m_isGenerated = True
                         
         """--------------------"""    
+
+    def genJointsInPlace(self, _topJoint, _bottomJoint, _names, _proportions, _parentToTop):
+        
+        """
+            Method: genJointsInPlace
+                a method which works out the positions and joint orients of a chain running
+                from the top joint to the bottom joint, giving the same result as moving,
+                aiming, freezing and parenting each joint, and then makes each joint already
+                parented, without selecting it, and sets its translate and joint orient
+            
+            Inputs:
+                self:                   A pointer to the instance of the JointChain class of which
+                                        this method is being called
+                _topJoint:              The top joint used to define the joint chain
+                _bottomJoint:           The bottom joint used to define the joint chain
+                _names:                 The full names of the joints to make
+                _proportions:           The proportion of the way from the top joint to the
+                                        bottom joint of each joint
+                _parentToTop:           Whether or not the chain is parented under the top joint
+               
+            On Exit:                    The joints have been generated and added to the chain                          
+        """
+        
+        topMatrix = self.getWorldMatrix(_topJoint)
+        topPos = tuple(topMatrix[3][:3])
+        bottomPos = self.getWorldTranslation(_bottomJoint)
+        
+        vector = prm.sub(bottomPos, topPos)
+        
+        #all of the joints lie on the line from the top to the bottom joint, so they
+        #share the aim and up vectors and so the world rotation, the last joint, if
+        #it is on the bottom joint, has no orient and so picks it up from its parent
+        
+        upVec = prm.transformVector((0.0, 1.0, 0.0), prm.rotationPart(topMatrix))
+        rotation = prm.aimMatrix(vector, upVec)
+        
+        #the joint orient of the first joint takes it from its parent's rotation to the
+        #aimed rotation, the rest are parented under a joint with the same rotation
+        
+        parentRotation = prm.identity3()
+        
+        if _parentToTop:
+            
+            parentRotation = prm.rotationPart(topMatrix)
+            
+        orients = [prm.matrixToEuler(prm.mulMatrix3(rotation, prm.transpose3(parentRotation)))]
+        
+        for i in range(1, len(_names)):
+            
+            orients.append((0.0, 0.0, 0.0))
+            
+        #make the joints, each one under the one before, with the world position taken
+        #into the space of its parent, whose world matrix is worked out as it goes
+        
+        parent = None
+        parentMatrix = prm.identity4()
+        
+        if _parentToTop:
+            
+            parent = _topJoint
+            parentMatrix = topMatrix
+            
+        modifier = psm.SceneModifier()
+            
+        for i in range(0, len(_names)):
+            
+            translate = prm.transformPoint(prm.lerp(topPos, bottomPos, _proportions[i]), prm.inverse4(parentMatrix))
+            
+            parent = self.makeNode("joint", _names[i], parent)
+            self.m_joints.append(parent)
+            
+            for j, axis in enumerate("XYZ"):
+                
+                modifier.setAttr(parent, "translate" + axis, translate[j])
+                
+                #only the first joint has an orient
+                
+                if i == 0:
+                    
+                    modifier.setAttr(parent, "jointOrient" + axis, orients[i][j])
+                    
+            parentMatrix = prm.mulMatrix4(prm.composeMatrix(translate, prm.eulerToMatrix(orients[i])), parentMatrix)
+            
+        modifier.doIt()
+        
+        """--------------------"""
             
     def genFromMirror(self, _mirrorChain):
         
@@ -365,7 +478,7 @@ class JointChain(prb.RiggingBase):
             On Exit:                    returns a list of the joints in the chain
         """
         
-        return self.m_joints
+        return self.m_joints.getNodes()
         
         """--------------------"""
         
@@ -403,22 +516,15 @@ class JointChain(prb.RiggingBase):
         """
         
         if self.m_isGenerated == True:
-            #delete maya objects
             
-            for jnt in self.m_joints:
-                
-                try:
-                    
-                    pm.delete(jnt)
-                    
-                except:
-                
-                    pass
+            #delete every node made, along with those of the objects held, in
+            #a single delete
+            
+            self.deleteLedger()
             
-                
             #then reset the list
             
-            self.m_joints = []
+            self.m_joints = pnl.NodeList()
             
             #and set the is generated boolean
             
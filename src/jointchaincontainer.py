@@ -1,8 +1,8 @@
 #----------Imports----------#
 
-import pymel.core as pm
 import pRigging.src.jointchain as pjc
 import pRigging.src.riggingbase as prb
+import pRigging.src.nodelist as pnl
 
 #----------JointChainContainer-Class----------#
 
@@ -15,16 +15,18 @@ class JointChainContainer(prb.RiggingBase):
         
         Contains:
             self.m_jointChain:      A joint chain
-            self.m_chainGroups:     A group under which all of the
+            self.m_chainGroups:     A NodeList of the groups under which all of the
                                     chain is grouped, the rig is put
                                     constrained together so these groups
                                     will be parented under the rig's global
                                     move control.  
+            self.m_ledger:          A NodeList of every scene node made by the object, so
+                                    they can all be deleted at once when it is cleared
         
         Imports:
-            pymel.core as pm
             pRigging.src.jointchain as pjc
             pRigging.src.riggingbase as prb
+            pRigging.src.nodelist as pnl
     """
     
     def __init__(self):
@@ -41,7 +43,8 @@ class JointChainContainer(prb.RiggingBase):
         #initialise the object's attributes
         
         self.m_jointChain = 0
-        self.m_chainGroups = []
+        self.m_chainGroups = pnl.NodeList()
+        self.m_ledger = pnl.NodeList()
 
         """--------------------"""
 
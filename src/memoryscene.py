@@ -0,0 +1,2325 @@
+#----------Imports----------#
+
+import re
+import pRigging.src.rigmath as prm
+
+#----------Constants----------#
+
+#short attribute names that the toolset uses, mapped to their long names
+
+ATTR_ALIASES = {
+    "tx" : "translateX", "ty" : "translateY", "tz" : "translateZ",
+    "rx" : "rotateX", "ry" : "rotateY", "rz" : "rotateZ",
+    "sx" : "scaleX", "sy" : "scaleY", "sz" : "scaleZ",
+    "jox" : "jointOrientX", "joy" : "jointOrientY", "joz" : "jointOrientZ",
+    "v" : "visibility",
+    "pvx" : "poleVectorX", "pvy" : "poleVectorY", "pvz" : "poleVectorZ"
+    }
+
+CONSTRAINT_TYPES = ["aimConstraint", "parentConstraint", "orientConstraint",
+                    "pointConstraint", "scaleConstraint", "poleVectorConstraint"]
+
+TRANSFORM_TYPES = ["transform", "joint", "ikHandle", "ikEffector"] + CONSTRAINT_TYPES
+
+SHAPE_TYPES = ["nurbsCurve", "locator"]
+
+#the default name maya gives each node type when no name is passed in
+
+DEFAULT_NAMES = {
+    "transform" : "group", "nurbsCurve" : "curveShape", "ikEffector" : "effector",
+    "makeNurbCircle" : "makeNurbCircle"
+    }
+
+#the uuid of a node, made from its creation order id, which like a maya uuid
+#stays with the node when it is renamed
+
+UUID_FORMAT = "00000000-0000-0000-0000-%012X"
+
+#----------MemorySceneError-Class----------#
+
+class MemorySceneError(RuntimeError):
+
+    """
+        Class: MemorySceneError
+            The error raised by the in-memory scene wherever maya would raise a
+            runtime error, e.g. a missing object or an illegal connection
+
+        File: pRigging/src/memoryscene.py
+    """
+
+    pass
+
+#----------Vector-Class----------#
+
+class Vector(tuple):
+
+    """
+        Class: Vector
+            A minimal stand in for pymel's datatypes.Vector, returned by the
+            translation and rotation queries of the in-memory scene so that the
+            arithmetic in the build code works unchanged
+
+        File: pRigging/src/memoryscene.py
+    """
+
+    def __new__(cls, *args):
+
+        if len(args) == 1:
+
+            args = tuple(args[0])
+
+        return tuple.__new__(cls, [float(a) for a in args])
+
+    x = property(lambda self: self[0])
+    y = property(lambda self: self[1])
+    z = property(lambda self: self[2])
+
+    def __add__(self, _other):
+
+        return Vector(prm.add(self, _other))
+
+    __radd__ = __add__
+
+    def __sub__(self, _other):
+
+        return Vector(prm.sub(self, _other))
+
+    def __rsub__(self, _other):
+
+        return Vector(prm.sub(_other, self))
+
+    def __mul__(self, _scalar):
+
+        return Vector(prm.scale(self, _scalar))
+
+    __rmul__ = __mul__
+
+    def __div__(self, _scalar):
+
+        return Vector(prm.scale(self, 1.0/_scalar))
+
+    __truediv__ = __div__
+
+    def __neg__(self):
+
+        return Vector(prm.scale(self, -1.0))
+
+    def length(self):
+
+        return prm.length(self)
+
+    def normal(self):
+
+        return Vector(prm.normalize(self))
+
+#----------MemoryAttribute-Class----------#
+
+class MemoryAttribute(object):
+
+    """
+        Class: MemoryAttribute
+            A plug on a node in the in-memory scene, mirrors the parts of pymel's
+            Attribute class used by the toolset
+
+        File: pRigging/src/memoryscene.py
+
+        Contains:
+            self.m_node:            The MemoryNode the attribute belongs to
+            self.m_name:            The long name of the attribute, multi elements
+                                    are named with their index, e.g. input1D[0]
+    """
+
+    #what the attribute is stored as in the state of a rig, read from the class
+    #so the rig doesn't need to import this module, see RiggingBase.getStateValue
+
+    STATE_TYPE = "plug"
+
+    def __init__(self, _node, _name):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _node:                  The node the plug is on
+                _name:                  The long name of the attribute
+        """
+
+        self.m_node = _node
+        self.m_name = _name
+
+        """--------------------"""
+
+    def key(self):
+
+        """
+            Method: key
+                returns the tuple used to store connections to this plug
+        """
+
+        return (self.m_node, self.m_name)
+
+        """--------------------"""
+
+    def node(self):
+
+        return self.m_node
+
+    def plugNode(self):
+
+        return self.m_node
+
+    def attrName(self):
+
+        return self.m_name
+
+    def name(self):
+
+        return "%s.%s" % (self.m_node.name(), self.m_name)
+
+    def __getitem__(self, _index):
+
+        return MemoryAttribute(self.m_node, "%s[%d]" % (self.m_name, _index))
+
+    def get(self):
+
+        """
+            Method: get
+                returns the value stored on the plug
+        """
+
+        self.m_node.m_scene.record("getAttr")
+
+        return self.m_node.getAttrValue(self.m_name)
+
+        """--------------------"""
+
+    def set(self, _value):
+
+        """
+            Method: set
+                sets the value of the plug, raises a MemorySceneError if the plug
+                is locked or driven by a connection
+        """
+
+        scene = self.m_node.m_scene
+        scene.record("setAttr")
+
+        if not self.isFreeToChange():
+
+            raise MemorySceneError("The attribute '%s' is locked or connected and cannot be modified." % self.name())
+
+        self.m_node.setAttrValue(self.m_name, _value)
+
+        """--------------------"""
+
+    def connect(self, _dest, force = False, f = False):
+
+        """
+            Method: connect
+                connects this plug to the destination plug
+        """
+
+        self.m_node.m_scene.connectAttr(self, _dest, f = (force or f))
+
+        """--------------------"""
+
+    def disconnect(self, _dest = None):
+
+        """
+            Method: disconnect
+                breaks the connection to _dest or, if it is not given, every
+                connection in to or out of this plug
+        """
+
+        if _dest is None:
+
+            self.m_node.m_scene.disconnectAttr(self)
+
+        else:
+
+            self.m_node.m_scene.disconnectAttr(self, _dest)
+
+        """--------------------"""
+
+    def isConnected(self):
+
+        scene = self.m_node.m_scene
+        scene.record("isConnected")
+
+        return self.key() in scene.m_inputs or len(scene.m_outputs.get(self.key(), [])) != 0
+
+    def isLocked(self):
+
+        return self.m_name in self.m_node.m_locked
+
+    def lock(self):
+
+        self.m_node.m_locked.add(self.m_name)
+
+    def unlock(self):
+
+        self.m_node.m_locked.discard(self.m_name)
+
+    def isFreeToChange(self):
+
+        """
+            Method: isFreeToChange
+                returns True if the plug is neither locked nor driven by a connection
+        """
+
+        scene = self.m_node.m_scene
+        scene.record("isFreeToChange")
+
+        #a compound is only free to change if each of its children is too
+
+        for name in [self.m_name] + self.m_node.getChildAttrs(self.m_name):
+
+            if name in self.m_node.m_locked or (self.m_node, name) in scene.m_inputs:
+
+                return False
+
+        return True
+
+        """--------------------"""
+
+    def inputs(self):
+
+        scene = self.m_node.m_scene
+        src = scene.m_inputs.get(self.key())
+
+        if src is None:
+
+            return []
+
+        return [src[0]]
+
+    def outputs(self):
+
+        scene = self.m_node.m_scene
+
+        return [dst[0] for dst in scene.m_outputs.get(self.key(), [])]
+
+    def connections(self):
+
+        """
+            Method: connections
+                returns the nodes on the other end of every connection in to or
+                out of this plug
+        """
+
+        self.m_node.m_scene.record("listConnections")
+
+        return self.inputs() + self.outputs()
+
+        """--------------------"""
+
+    def __eq__(self, _other):
+
+        return isinstance(_other, MemoryAttribute) and self.key() == _other.key()
+
+    def __ne__(self, _other):
+
+        return not self.__eq__(_other)
+
+    def __hash__(self):
+
+        return hash((id(self.m_node), self.m_name))
+
+    def __str__(self):
+
+        return self.name()
+
+    def __repr__(self):
+
+        return "Attribute(%r)" % self.name()
+
+#----------END-MemoryAttribute-Class----------#
+
+#----------MemoryNode-Class----------#
+
+class MemoryNode(object):
+
+    """
+        Class: MemoryNode
+            A node in the in-memory scene, mirrors the parts of pymel's PyNode
+            classes used by the toolset. DAG nodes carry their local transform as
+            attributes and compute their world matrix from their parents.
+
+        File: pRigging/src/memoryscene.py
+
+        Contains:
+            self.m_scene:           The MemoryScene the node lives in
+            self.m_name:            The short name of the node, unique in the scene
+            self.m_type:            The maya node type string
+            self.m_parent:          The parent node, None for world or DG nodes
+            self.m_children:        A list of the child nodes
+            self.m_attrs:           A dictionary of attribute long names to values
+            self.m_multi:           A set of the names of multi attributes
+            self.m_locked:          A set of the names of locked attributes
+            self.m_weightAliases:   The weight attribute names of a constraint,
+                                    ordered by target index
+            self.m_isDag:           Whether or not the node is in the DAG
+            self.m_isTransform:     Whether or not the node has a transform
+            self.m_isJoint:         Whether or not the node is a joint
+            self.m_isHistory:       Whether or not the node is construction history
+                                    which is removed with the node it feeds
+            self.m_deleted:         Set when the node has been deleted
+            self.m_id:              The order the node was created in
+            self.m_uuid:            The uuid of the node, see UUID_FORMAT
+            self.m_create:          A dictionary describing the command that made the
+                                    node, for the nodes not made by a plain createNode,
+                                    an "owner" entry marks a node made along with
+                                    another one, e.g. the shape of a circle
+            self.m_dynamic:         A dictionary of the dynamic attribute names to the
+                                    flags they were added with
+
+        Imports:
+            re
+            pRigging.src.rigmath as prm
+    """
+
+    #what the node is stored as in the state of a rig, see MemoryAttribute
+
+    STATE_TYPE = "node"
+
+    def __init__(self, _scene, _name, _type):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _scene:                 The scene creating the node
+                _name:                  The unique name of the node
+                _type:                  The node type
+        """
+
+        self.m_scene = _scene
+        self.m_name = _name
+        self.m_type = _type
+        self.m_parent = None
+        self.m_children = []
+        self.m_attrs = {"message" : None}
+        self.m_multi = set()
+        self.m_locked = set()
+        self.m_weightAliases = []
+        self.m_isTransform = _type in TRANSFORM_TYPES
+        self.m_isDag = self.m_isTransform or _type in SHAPE_TYPES
+        self.m_isJoint = _type == "joint"
+        self.m_isHistory = False
+        self.m_deleted = False
+        self.m_id = 0
+        self.m_uuid = ""
+        self.m_create = {}
+        self.m_dynamic = {}
+
+        #add the attributes for the node type
+
+        if self.m_isDag:
+
+            self.m_attrs.update({"visibility" : True, "worldMatrix" : None, "parentMatrix" : None})
+
+        if self.m_isTransform:
+
+            for axis in "XYZ":
+
+                self.m_attrs["translate"+axis] = 0.0
+                self.m_attrs["rotate"+axis] = 0.0
+                self.m_attrs["scale"+axis] = 1.0
+
+        if self.m_isJoint:
+
+            for axis in "XYZ":
+
+                self.m_attrs["jointOrient"+axis] = 0.0
+
+            self.m_attrs["radius"] = 1.0
+
+        if _type == "ikHandle":
+
+            self.m_attrs.update({"poleVectorX" : 0.0, "poleVectorY" : 1.0, "poleVectorZ" : 0.0,
+                                 "twist" : 0.0, "startJoint" : None, "endEffector" : None,
+                                 "ikSolver" : ""})
+
+        elif _type in CONSTRAINT_TYPES:
+
+            for axis in "XYZ":
+
+                self.m_attrs["constraintTranslate"+axis] = 0.0
+                self.m_attrs["constraintRotate"+axis] = 0.0
+                self.m_attrs["constraintScale"+axis] = 1.0
+
+            self.m_multi.add("targetParentMatrix")
+
+        elif _type == "nurbsCurve":
+
+            self.m_attrs.update({"create" : None, "worldSpace" : None})
+
+        elif _type == "makeNurbCircle":
+
+            self.m_attrs.update({"outputCurve" : None, "radius" : 1.0,
+                                 "normalX" : 0.0, "normalY" : 0.0, "normalZ" : 1.0})
+
+        elif _type == "multiplyDivide":
+
+            self.m_attrs["operation"] = 1
+
+            for axis in "XYZ":
+
+                self.m_attrs["input1"+axis] = 0.0
+                self.m_attrs["input2"+axis] = 1.0
+                self.m_attrs["output"+axis] = 0.0
+
+        elif _type == "plusMinusAverage":
+
+            self.m_attrs.update({"operation" : 1, "output1D" : 0.0})
+            self.m_multi.add("input1D")
+
+        """--------------------"""
+
+    #----------identity----------#
+
+    def name(self):
+
+        return self.m_name
+
+    def shortName(self):
+
+        return self.m_name
+
+    def nodeName(self):
+
+        return self.m_name
+
+    def longName(self):
+
+        """
+            Method: longName
+                returns the full dag path of the node, the short name for DG nodes
+        """
+
+        if not self.m_isDag:
+
+            return self.m_name
+
+        path = ""
+        node = self
+
+        while node is not None:
+
+            path = "|" + node.m_name + path
+            node = node.m_parent
+
+        return path
+
+        """--------------------"""
+
+    fullPath = longName
+
+    def nodeType(self):
+
+        return self.m_type
+
+    def type(self):
+
+        return self.m_type
+
+    def exists(self):
+
+        return not self.m_deleted
+
+    def rename(self, _name):
+
+        """
+            Method: rename
+                renames the node, maya's numbering is used if the name is taken
+        """
+
+        return self.m_scene.rename(self, _name)
+
+        """--------------------"""
+
+    def __str__(self):
+
+        return self.m_name
+
+    def __repr__(self):
+
+        return "nt.%s%s(%r)" % (self.m_type[0].upper(), self.m_type[1:], self.m_name)
+
+    def __eq__(self, _other):
+
+        #nodes compare equal to themselves and to their names, like pynodes
+
+        if isinstance(_other, MemoryNode):
+
+            return _other is self
+
+        try:
+
+            return _other in (self.m_name, self.longName())
+
+        except TypeError:
+
+            return False
+
+    def __ne__(self, _other):
+
+        return not self.__eq__(_other)
+
+    def __hash__(self):
+
+        return id(self)
+
+    #----------attributes----------#
+
+    def canonicalAttr(self, _name):
+
+        """
+            Method: canonicalAttr
+                returns the long name of an attribute from a short or long name
+        """
+
+        return ATTR_ALIASES.get(_name, _name)
+
+        """--------------------"""
+
+    def hasAttr(self, _name):
+
+        """
+            Method: hasAttr
+                returns True if the node has the attribute named, multi elements are
+                checked against the multi attribute they belong to
+        """
+
+        name = self.canonicalAttr(_name)
+
+        if name in self.m_attrs or name in self.m_multi or self.getChildAttrs(name) != []:
+
+            return True
+
+        index = name.find("[")
+
+        return index > 0 and name[:index] in self.m_multi
+
+        """--------------------"""
+
+    def getChildAttrs(self, _name):
+
+        """
+            Method: getChildAttrs
+                returns the names of the X, Y and Z children of a compound attribute,
+                e.g. translate, or an empty list for any other attribute
+        """
+
+        children = [_name + axis for axis in "XYZ"]
+
+        if len([child for child in children if child in self.m_attrs]) == 3:
+
+            return children
+
+        return []
+
+        """--------------------"""
+
+    def attr(self, _name):
+
+        """
+            Method: attr
+                returns the attribute plug named, raises a MemorySceneError if the
+                node has no such attribute
+        """
+
+        if self.m_deleted:
+
+            raise MemorySceneError("Object '%s' no longer exists." % self.m_name)
+
+        if not self.hasAttr(_name):
+
+            raise MemorySceneError("%s has no attribute '%s'" % (self.m_name, _name))
+
+        return MemoryAttribute(self, self.canonicalAttr(_name))
+
+        """--------------------"""
+
+    def __getattr__(self, _name):
+
+        #only called when normal lookup fails, so the attributes of the maya node
+        #can be reached the same way pymel allows, e.g. node.tx
+
+        if _name.startswith("_") or _name.startswith("m_"):
+
+            raise AttributeError(_name)
+
+        if self.hasAttr(_name):
+
+            return MemoryAttribute(self, self.canonicalAttr(_name))
+
+        raise AttributeError("%r has no attribute or method named '%s'" % (self, _name))
+
+    def getAttrValue(self, _name):
+
+        """
+            Method: getAttrValue
+                returns the raw value stored on the node, without recording a command
+        """
+
+        name = self.canonicalAttr(_name)
+
+        #matrices are worked out from the hierarchy rather than stored
+
+        if name == "worldMatrix":
+
+            return self.worldMatrixValue()
+
+        if name == "parentMatrix":
+
+            return self.parentMatrixValue()
+
+        if self.getChildAttrs(name) != []:
+
+            return self.getVectorValue(name)
+
+        if name in self.m_attrs:
+
+            return self.m_attrs[name]
+
+        if self.hasAttr(name):
+
+            return 0.0
+
+        raise MemorySceneError("%s has no attribute '%s'" % (self.m_name, _name))
+
+        """--------------------"""
+
+    def setAttrValue(self, _name, _value):
+
+        """
+            Method: setAttrValue
+                stores a raw value on the node, without recording a command
+        """
+
+        name = self.canonicalAttr(_name)
+
+        if not self.hasAttr(name):
+
+            raise MemorySceneError("%s has no attribute '%s'" % (self.m_name, _name))
+
+        if self.getChildAttrs(name) != []:
+
+            self.setVectorValue(name, _value)
+
+            return
+
+        self.m_attrs[name] = _value
+
+        """--------------------"""
+
+    def addAttr(self, _name, at = "double", attributeType = "", dv = 0, defaultValue = None,
+                hxv = False, hnv = False, max = 1, min = 0, k = False, keyable = False, **kwargs):
+
+        """
+            Method: addAttr
+                adds a dynamic attribute to the node
+        """
+
+        self.m_scene.record("addAttr")
+
+        if self.hasAttr(_name):
+
+            raise MemorySceneError("Found a conflicting attribute name '%s' on %s" % (_name, self.m_name))
+
+        if defaultValue is not None:
+
+            dv = defaultValue
+
+        self.m_attrs[_name] = dv
+        self.m_dynamic[_name] = {"at" : attributeType or at, "dv" : dv, "hxv" : hxv, "hnv" : hnv,
+                                 "max" : max, "min" : min, "k" : k or keyable}
+
+        """--------------------"""
+
+    def getWeightAliasList(self):
+
+        """
+            Method: getWeightAliasList
+                returns the target weight plugs of a constraint in target order
+        """
+
+        self.m_scene.record("getWeightAliasList")
+
+        return [MemoryAttribute(self, weight) for weight in self.m_weightAliases]
+
+        """--------------------"""
+
+    def connections(self):
+
+        """
+            Method: connections
+                returns the nodes connected to any plug on this node
+        """
+
+        self.m_scene.record("listConnections")
+
+        return self.inputs() + self.outputs()
+
+        """--------------------"""
+
+    def inputs(self):
+
+        return [src[0] for dst, src in self.m_scene.m_inputs.items() if dst[0] is self]
+
+    def outputs(self):
+
+        outputs = []
+
+        for src, dsts in self.m_scene.m_outputs.items():
+
+            if src[0] is self:
+
+                outputs.extend([dst[0] for dst in dsts])
+
+        return outputs
+
+    #----------hierarchy----------#
+
+    def getParent(self):
+
+        self.m_scene.record("getParent")
+
+        return self.m_parent
+
+    def getChildren(self, type = None):
+
+        self.m_scene.record("getChildren")
+
+        return [c for c in self.m_children if type is None or c.m_type == type]
+
+    def getShapes(self):
+
+        return [c for c in self.m_children if not c.m_isTransform]
+
+    def getShape(self):
+
+        shapes = self.getShapes()
+
+        if shapes == []:
+
+            return None
+
+        return shapes[0]
+
+    def listRelatives(self, **kwargs):
+
+        """
+            Method: listRelatives
+                lists relatives of the node, supports the allDescendents, allParents,
+                parent, children and type flags. As in maya, allParents lists the
+                direct parents of the node rather than every ancestor.
+        """
+
+        return self.m_scene.listRelatives(self, **kwargs)
+
+        """--------------------"""
+
+    def setParent(self, *args, **kwargs):
+
+        """
+            Method: setParent
+                reparents the node, keeping its world space transform unless the
+                relative flag is set. With no parent, or world = True, the node is
+                parented to the world.
+        """
+
+        parent = None
+
+        if len(args) != 0 and args[0] not in ("", None):
+
+            parent = args[0]
+
+        if kwargs.get("world", False) or kwargs.get("w", False):
+
+            parent = None
+
+        self.m_scene.record("setParent")
+        self.m_scene.reparent(self, parent, kwargs.get("r", False) or kwargs.get("relative", False))
+
+        """--------------------"""
+
+    #----------transforms----------#
+
+    def localMatrix(self):
+
+        """
+            Method: localMatrix
+                returns the matrix of the node relative to its parent, for joints
+                the joint orient is applied after the rotation
+        """
+
+        if not self.m_isTransform:
+
+            return prm.identity4()
+
+        a = self.m_attrs
+
+        rot = prm.eulerToMatrix((a["rotateX"], a["rotateY"], a["rotateZ"]))
+
+        if self.m_isJoint:
+
+            rot = prm.mulMatrix3(rot, prm.eulerToMatrix((a["jointOrientX"], a["jointOrientY"], a["jointOrientZ"])))
+
+        return prm.composeMatrix((a["translateX"], a["translateY"], a["translateZ"]),
+                                 rot,
+                                 (a["scaleX"], a["scaleY"], a["scaleZ"]))
+
+        """--------------------"""
+
+    def worldMatrixValue(self):
+
+        """
+            Method: worldMatrixValue
+                returns the world matrix of the node, worked out from its parents
+        """
+
+        matrix = self.localMatrix()
+        node = self.m_parent
+
+        while node is not None:
+
+            matrix = prm.mulMatrix4(matrix, node.localMatrix())
+            node = node.m_parent
+
+        return matrix
+
+        """--------------------"""
+
+    def parentMatrixValue(self):
+
+        if self.m_parent is None:
+
+            return prm.identity4()
+
+        return self.m_parent.worldMatrixValue()
+
+    def setWorldMatrixValue(self, _matrix):
+
+        """
+            Method: setWorldMatrixValue
+                sets the local transform so the node ends up with the world matrix
+                passed in. Joints keep their rotate values and take up the
+                difference in their joint orient, as they do in maya.
+        """
+
+        local = prm.mulMatrix4(_matrix, prm.inverse4(self.parentMatrixValue()))
+        trans, rot, scl = prm.decomposeMatrix(local)
+
+        a = self.m_attrs
+
+        if self.m_isJoint:
+
+            r = prm.eulerToMatrix((a["rotateX"], a["rotateY"], a["rotateZ"]))
+            self.setVectorValue("jointOrient", prm.matrixToEuler(prm.mulMatrix3(prm.transpose3(r), rot)))
+
+        else:
+
+            self.setVectorValue("rotate", prm.matrixToEuler(rot))
+
+        self.setVectorValue("translate", trans)
+        self.setVectorValue("scale", scl)
+
+        """--------------------"""
+
+    def getVectorValue(self, _attr):
+
+        return Vector(self.m_attrs[_attr+"X"], self.m_attrs[_attr+"Y"], self.m_attrs[_attr+"Z"])
+
+    def setVectorValue(self, _attr, _value):
+
+        self.m_attrs[_attr+"X"] = float(_value[0])
+        self.m_attrs[_attr+"Y"] = float(_value[1])
+        self.m_attrs[_attr+"Z"] = float(_value[2])
+
+    def getMatrix(self, worldSpace = False, ws = False):
+
+        self.m_scene.record("getMatrix")
+
+        if worldSpace or ws:
+
+            return self.worldMatrixValue()
+
+        return self.localMatrix()
+
+    def getTranslation(self, space = "object"):
+
+        """
+            Method: getTranslation
+                returns the translation of the node in world or object space
+        """
+
+        self.m_scene.record("getTranslation")
+
+        if space == "world":
+
+            return Vector(self.worldMatrixValue()[3][:3])
+
+        return self.getVectorValue("translate")
+
+        """--------------------"""
+
+    def setTranslation(self, _vector, space = "object"):
+
+        """
+            Method: setTranslation
+                sets the translation of the node in world or object space
+        """
+
+        self.m_scene.record("setTranslation")
+
+        if space == "world":
+
+            _vector = prm.transformPoint(_vector, prm.inverse4(self.parentMatrixValue()))
+
+        self.setVectorValue("translate", _vector)
+
+        """--------------------"""
+
+    def translateBy(self, _vector, space = "object"):
+
+        """
+            Method: translateBy
+                moves the node relative to its current position
+        """
+
+        self.m_scene.record("translateBy")
+
+        if space == "world":
+
+            world = prm.add(self.worldMatrixValue()[3][:3], _vector)
+            self.setVectorValue("translate", prm.transformPoint(world, prm.inverse4(self.parentMatrixValue())))
+
+        else:
+
+            self.setVectorValue("translate", prm.add(self.getVectorValue("translate"), _vector))
+
+        """--------------------"""
+
+    def getRotation(self, space = "object"):
+
+        """
+            Method: getRotation
+                returns the XYZ euler rotation of the node, in degrees
+        """
+
+        self.m_scene.record("getRotation")
+
+        if space == "world":
+
+            return Vector(prm.matrixToEuler(prm.rotationPart(self.worldMatrixValue())))
+
+        return self.getVectorValue("rotate")
+
+        """--------------------"""
+
+    def setRotation(self, _rotation, space = "object"):
+
+        """
+            Method: setRotation
+                sets the rotation of the node. In world space the rotate values are
+                solved so that the node's full world orientation, including any
+                joint orient, matches the rotation passed in.
+        """
+
+        self.m_scene.record("setRotation")
+
+        if space == "world":
+
+            self.setWorldRotationValue(prm.eulerToMatrix(_rotation))
+
+        else:
+
+            self.setVectorValue("rotate", _rotation)
+
+        """--------------------"""
+
+    def setWorldRotationValue(self, _rotation):
+
+        """
+            Method: setWorldRotationValue
+                solves the rotate values that give the 3x3 world rotation passed in
+        """
+
+        parentRot = prm.rotationPart(self.parentMatrixValue())
+
+        if self.m_isJoint:
+
+            a = self.m_attrs
+            jo = prm.eulerToMatrix((a["jointOrientX"], a["jointOrientY"], a["jointOrientZ"]))
+            parentRot = prm.mulMatrix3(jo, parentRot)
+
+        self.setVectorValue("rotate", prm.matrixToEuler(prm.mulMatrix3(_rotation, prm.transpose3(parentRot))))
+
+        """--------------------"""
+
+#----------END-MemoryNode-Class----------#
+
+#----------MemoryScene-Class----------#
+
+class MemoryScene(object):
+
+    """
+        Class: MemoryScene
+            A pure python, in-memory stand-in for the subset of pymel.core used to
+            build rigs. It can be selected as the scene backend so that rigs can be
+            built, timed and checked without maya. Constraints are evaluated once,
+            when they are made, rather than being live.
+
+        File: pRigging/src/memoryscene.py
+
+        Contains:
+            self.m_nodes:           A dictionary of node names to live nodes
+            self.m_selection:       The active selection list
+            self.m_inputs:          A dictionary of destination plug keys to the
+                                    source plug key driving them
+            self.m_outputs:         A dictionary of source plug keys to the list of
+                                    destination plug keys they drive
+            self.m_commandCounts:   A dictionary of command names to the number of
+                                    times they have been called
+            self.m_nodesCreated:    The number of nodes created
+            self.m_nodesDeleted:    The number of nodes deleted
+            self.m_nextId:          The creation order id the next node will get
+            self.m_uuids:           A dictionary of the uuids of the live nodes to
+                                    the nodes
+            self.m_undoState:       Whether or not undo is being recorded, nothing is
+                                    actually recorded, it is only kept for the query
+            self.m_undoChunks:      The names of the undo chunks currently open
+            self.m_closedChunks:    The names of the undo chunks closed, in order
+
+        Imports:
+            re
+            pRigging.src.rigmath as prm
+    """
+
+    def __init__(self):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+        """
+
+        self.m_nodes = {}
+        self.m_selection = []
+        self.m_inputs = {}
+        self.m_outputs = {}
+        self.m_nextId = 0
+        self.m_uuids = {}
+        self.m_undoState = True
+        self.m_undoChunks = []
+        self.m_closedChunks = []
+
+        self.resetStats()
+
+        """--------------------"""
+
+    #----------statistics----------#
+
+    def record(self, _command):
+
+        """
+            Method: record
+                counts a call to a scene command
+        """
+
+        self.m_commandCounts[_command] = self.m_commandCounts.get(_command, 0) + 1
+
+        """--------------------"""
+
+    def resetStats(self):
+
+        """
+            Method: resetStats
+                resets the command and node counts
+        """
+
+        self.m_commandCounts = {}
+        self.m_nodesCreated = 0
+        self.m_nodesDeleted = 0
+
+        """--------------------"""
+
+    def getCommandCount(self):
+
+        """
+            Method: getCommandCount
+                returns the total number of scene commands called since the last reset
+        """
+
+        return sum(self.m_commandCounts.values())
+
+        """--------------------"""
+
+    def getCommandCounts(self):
+
+        return dict(self.m_commandCounts)
+
+    def getNodesCreated(self):
+
+        return self.m_nodesCreated
+
+    def getNodesDeleted(self):
+
+        return self.m_nodesDeleted
+
+    def getNodeCount(self):
+
+        return len(self.m_nodes)
+
+    #----------node management----------#
+
+    def uniqueName(self, _name, _exclude = None):
+
+        """
+            Method: uniqueName
+                returns the name passed in, or if it is already used, the name with
+                the first free number added to the end, as maya names nodes
+        """
+
+        if _name not in self.m_nodes or self.m_nodes[_name] is _exclude:
+
+            return _name
+
+        match = re.match(r"^(.*?)(\d*)$", _name)
+        base = match.group(1)
+        num = 1
+
+        if match.group(2) != "":
+
+            num = int(match.group(2)) + 1
+
+        while (base + str(num)) in self.m_nodes:
+
+            num = num + 1
+
+        return base + str(num)
+
+        """--------------------"""
+
+    def createNode(self, _type, name = "", n = "", parent = None, p = None, **kwargs):
+
+        """
+            Method: createNode
+                creates a node of the type passed in
+
+            Inputs:
+                _type:                  The maya node type
+                name:                   The requested name, made unique
+                n:                      Short name for name
+                parent:                 The parent for dag nodes
+                p:                      Short name for parent
+
+            On Exit:                    Returns the new node
+        """
+
+        self.record("createNode")
+
+        return self.newNode(_type, name or n, parent or p)
+
+        """--------------------"""
+
+    def newNode(self, _type, _name = "", _parent = None):
+
+        """
+            Method: newNode
+                makes a node without counting a command, used by the commands that
+                create nodes
+        """
+
+        name = _name
+
+        if name in ("", None):
+
+            name = DEFAULT_NAMES.get(_type, _type) + "1"
+
+        #strip any dag path from the name
+
+        name = self.uniqueName(str(name).split("|")[-1])
+
+        node = MemoryNode(self, name, _type)
+        node.m_id = self.m_nextId
+        node.m_uuid = UUID_FORMAT % node.m_id
+        self.m_uuids[node.m_uuid] = node
+        self.m_nodes[name] = node
+        self.m_nodesCreated = self.m_nodesCreated + 1
+        self.m_nextId = self.m_nextId + 1
+
+        if _parent is not None:
+
+            parent = self.PyNode(_parent)
+            node.m_parent = parent
+            parent.m_children.append(node)
+
+        return node
+
+        """--------------------"""
+
+    def PyNode(self, _obj):
+
+        """
+            Method: PyNode
+                returns the node for a name or node, raises a MemorySceneError if it
+                does not exist
+        """
+
+        if isinstance(_obj, MemoryAttribute):
+
+            return _obj
+
+        if isinstance(_obj, MemoryNode):
+
+            if _obj.m_deleted:
+
+                raise MemorySceneError("Object '%s' no longer exists." % _obj.m_name)
+
+            return _obj
+
+        name = str(_obj)
+
+        #plugs are returned as attributes
+
+        if "." in name:
+
+            nodeName, attrName = name.split(".", 1)
+
+            return self.PyNode(nodeName).attr(attrName)
+
+        node = self.m_nodes.get(name.split("|")[-1])
+
+        if node is None:
+
+            raise MemorySceneError("No object matches name: %s" % name)
+
+        return node
+
+        """--------------------"""
+
+    def flatten(self, _args):
+
+        """
+            Method: flatten
+                flattens nested lists of objects into a single list of nodes
+        """
+
+        result = []
+
+        for arg in _args:
+
+            if isinstance(arg, (list, tuple)) and not isinstance(arg, Vector):
+
+                result.extend(self.flatten(arg))
+
+            else:
+
+                result.append(self.PyNode(arg))
+
+        return result
+
+        """--------------------"""
+
+    def objExists(self, _name):
+
+        self.record("objExists")
+
+        return str(_name).split("|")[-1] in self.m_nodes
+
+    def nodeType(self, _obj):
+
+        self.record("nodeType")
+
+        return self.PyNode(_obj).m_type
+
+    def rename(self, _obj, _name):
+
+        """
+            Method: rename
+                renames a node, returns the node, as in maya the shapes of a transform
+                named after it are renamed with it
+        """
+
+        self.record("rename")
+
+        node = self.PyNode(_obj)
+        oldName = node.m_name
+        newName = self.uniqueName(str(_name).split("|")[-1], node)
+
+        del self.m_nodes[node.m_name]
+        node.m_name = newName
+        self.m_nodes[newName] = node
+
+        for child in node.m_children:
+
+            if child.m_type in SHAPE_TYPES and child.m_name == oldName + "Shape":
+
+                del self.m_nodes[child.m_name]
+                child.m_name = self.uniqueName(newName + "Shape", child)
+                self.m_nodes[child.m_name] = child
+
+        return node
+
+        """--------------------"""
+
+    def aliasAttr(self, _alias, _plug):
+
+        """
+            Method: aliasAttr
+                renames the alias of an attribute, only the weight attributes of
+                constraints have aliases in the in-memory scene, the value, lock and
+                connections of the attribute go with it
+        """
+
+        self.record("aliasAttr")
+
+        plug = self.PyNode(_plug)
+        node = plug.m_node
+        oldName = plug.m_name
+        newName = str(_alias)
+
+        if oldName not in node.m_weightAliases:
+
+            raise MemorySceneError("'%s' has no alias." % plug.name())
+
+        if newName == oldName:
+
+            return
+
+        if node.hasAttr(newName):
+
+            raise MemorySceneError("'%s' already has an attribute named '%s'." % (node.m_name, newName))
+
+        node.m_weightAliases[node.m_weightAliases.index(oldName)] = newName
+        node.m_attrs[newName] = node.m_attrs.pop(oldName)
+
+        if oldName in node.m_locked:
+
+            node.m_locked.discard(oldName)
+            node.m_locked.add(newName)
+
+        oldKey = (node, oldName)
+        newKey = (node, newName)
+
+        if oldKey in self.m_inputs:
+
+            src = self.m_inputs.pop(oldKey)
+            self.m_inputs[newKey] = src
+            self.m_outputs[src][self.m_outputs[src].index(oldKey)] = newKey
+
+        if oldKey in self.m_outputs:
+
+            self.m_outputs[newKey] = self.m_outputs.pop(oldKey)
+
+            for dst in self.m_outputs[newKey]:
+
+                self.m_inputs[dst] = newKey
+
+        """--------------------"""
+
+    def ls(self, *args, **kwargs):
+
+        """
+            Method: ls
+                lists nodes, supports the selection, type and uuid flags, nodes can
+                be passed in by name or by uuid
+        """
+
+        self.record("ls")
+
+        if kwargs.get("sl", False) or kwargs.get("selection", False):
+
+            nodes = self.m_selection[:]
+
+        elif len(args) != 0:
+
+            nodes = []
+
+            for arg in self.flattenNames(args):
+
+                #deleted nodes are dropped, as names that don't exist are
+
+                if isinstance(arg, MemoryNode):
+
+                    if not arg.m_deleted:
+
+                        nodes.append(arg)
+
+                elif str(arg).split("|")[-1] in self.m_nodes:
+
+                    nodes.append(self.PyNode(arg))
+
+                elif str(arg) in self.m_uuids:
+
+                    nodes.append(self.m_uuids[str(arg)])
+
+        else:
+
+            nodes = list(self.m_nodes.values())
+
+        nodeType = kwargs.get("type", kwargs.get("typ", None))
+
+        if nodeType is not None:
+
+            if not isinstance(nodeType, (list, tuple)):
+
+                nodeType = [nodeType]
+
+            nodes = [node for node in nodes if self.isType(node, nodeType)]
+
+        if kwargs.get("uuid", False):
+
+            return [node.m_uuid for node in nodes]
+
+        return nodes
+
+        """--------------------"""
+
+    def flattenNames(self, _args):
+
+        result = []
+
+        for arg in _args:
+
+            if isinstance(arg, (list, tuple)):
+
+                result.extend(self.flattenNames(arg))
+
+            else:
+
+                result.append(arg)
+
+        return result
+
+    def isType(self, _node, _types):
+
+        """
+            Method: isType
+                returns True if the node is, or inherits from, one of the types
+        """
+
+        for nodeType in _types:
+
+            if _node.m_type == nodeType or (nodeType == "transform" and _node.m_isTransform):
+
+                return True
+
+        return False
+
+        """--------------------"""
+
+    #----------selection----------#
+
+    def select(self, *args, **kwargs):
+
+        """
+            Method: select
+                changes the active selection, supports the clear, add and deselect flags
+        """
+
+        self.record("select")
+
+        if kwargs.get("cl", False) or kwargs.get("clear", False):
+
+            self.m_selection = []
+
+            return
+
+        nodes = self.flatten(args)
+
+        if kwargs.get("add", False) or kwargs.get("af", False):
+
+            self.m_selection.extend([node for node in nodes if node not in self.m_selection])
+
+        elif kwargs.get("d", False) or kwargs.get("deselect", False):
+
+            self.m_selection = [node for node in self.m_selection if node not in nodes]
+
+        else:
+
+            self.m_selection = nodes
+
+        """--------------------"""
+
+    def selected(self):
+
+        return self.m_selection[:]
+
+    #----------hierarchy----------#
+
+    def listRelatives(self, _obj, **kwargs):
+
+        """
+            Method: listRelatives
+                lists the relatives of a node, see MemoryNode.listRelatives
+        """
+
+        self.record("listRelatives")
+
+        node = self.PyNode(_obj)
+        result = []
+
+        if kwargs.get("ad", False) or kwargs.get("allDescendents", False):
+
+            stack = node.m_children[:]
+
+            while len(stack) != 0:
+
+                child = stack.pop()
+                result.append(child)
+                stack.extend(child.m_children)
+
+        elif kwargs.get("ap", False) or kwargs.get("allParents", False) or kwargs.get("p", False) or kwargs.get("parent", False):
+
+            if node.m_parent is not None:
+
+                result.append(node.m_parent)
+
+        else:
+
+            result = node.m_children[:]
+
+        nodeType = kwargs.get("type", None)
+
+        if nodeType is not None:
+
+            result = [n for n in result if self.isType(n, [nodeType])]
+
+        return result
+
+        """--------------------"""
+
+    def reparent(self, _node, _parent, _relative = False):
+
+        """
+            Method: reparent
+                moves the node under the parent, or to the world when the parent is
+                None, keeping its world space transform unless _relative is set, in
+                which case its local transform is kept
+        """
+
+        node = self.PyNode(_node)
+        parent = None
+
+        if _parent is not None:
+
+            parent = self.PyNode(_parent)
+
+            #make sure the node is not being put under itself
+
+            check = parent
+
+            while check is not None:
+
+                if check is node:
+
+                    raise MemorySceneError("Cannot parent '%s' under itself or its descendant." % node.m_name)
+
+                check = check.m_parent
+
+        if node.m_parent is parent:
+
+            return
+
+        world = node.worldMatrixValue()
+
+        if node.m_parent is not None:
+
+            node.m_parent.m_children.remove(node)
+
+        node.m_parent = parent
+
+        if parent is not None:
+
+            parent.m_children.append(node)
+
+        if node.m_isTransform and not _relative:
+
+            node.setWorldMatrixValue(world)
+
+        """--------------------"""
+
+    def parent(self, *args, **kwargs):
+
+        """
+            Method: parent
+                parents the objects to the last object passed in, or to the world
+                with the world flag, the relative flag keeps their local transforms
+        """
+
+        self.record("parent")
+
+        nodes = self.flatten(args)
+        relative = kwargs.get("r", False) or kwargs.get("relative", False)
+
+        if kwargs.get("w", False) or kwargs.get("world", False):
+
+            for node in nodes:
+
+                self.reparent(node, None, relative)
+
+            return nodes
+
+        for node in nodes[:-1]:
+
+            self.reparent(node, nodes[-1], relative)
+
+        return nodes[:-1]
+
+        """--------------------"""
+
+    #----------deletion----------#
+
+    def delete(self, *args, **kwargs):
+
+        """
+            Method: delete
+                deletes the objects passed in and their dag children, raises a
+                MemorySceneError if any of them do not exist
+        """
+
+        self.record("delete")
+
+        nodes = self.flatten(args)
+
+        for node in nodes:
+
+            if not node.m_deleted:
+
+                self.deleteNode(node)
+
+        """--------------------"""
+
+    def deleteNode(self, _node):
+
+        """
+            Method: deleteNode
+                removes a node, its children and its connections from the scene,
+                construction history left without outputs is removed too
+        """
+
+        for child in _node.m_children[:]:
+
+            self.deleteNode(child)
+
+        if _node.m_parent is not None:
+
+            _node.m_parent.m_children.remove(_node)
+            _node.m_parent = None
+
+        upstream = []
+
+        #remove every connection touching the node
+
+        for dst in [d for d in self.m_inputs if d[0] is _node]:
+
+            src = self.m_inputs.pop(dst)
+            self.m_outputs[src].remove(dst)
+
+            if src[0] is not _node:
+
+                upstream.append(src[0])
+
+        for src in [s for s in self.m_outputs if s[0] is _node]:
+
+            for dst in self.m_outputs.pop(src):
+
+                del self.m_inputs[dst]
+
+        if _node in self.m_selection:
+
+            self.m_selection.remove(_node)
+
+        del self.m_nodes[_node.m_name]
+        del self.m_uuids[_node.m_uuid]
+
+        _node.m_deleted = True
+        self.m_nodesDeleted = self.m_nodesDeleted + 1
+
+        for node in upstream:
+
+            if node.m_isHistory and not node.m_deleted and node.outputs() == []:
+
+                self.deleteNode(node)
+
+        """--------------------"""
+
+    #----------attributes----------#
+
+    def toAttr(self, _plug):
+
+        if isinstance(_plug, MemoryAttribute):
+
+            return _plug
+
+        return self.PyNode(_plug)
+
+    def connectAttr(self, _src, _dst, f = False, force = False):
+
+        """
+            Method: connectAttr
+                connects the source plug to the destination plug, raises a
+                MemorySceneError if the destination is already driven and force
+                is not set
+        """
+
+        self.record("connectAttr")
+
+        src = self.toAttr(_src)
+        dst = self.toAttr(_dst)
+
+        if dst.key() in self.m_inputs:
+
+            if not (f or force):
+
+                raise MemorySceneError("'%s' is already connected to '%s'." % (dst.name(), self.m_inputs[dst.key()][0].name()))
+
+            self.disconnectPlugs(self.m_inputs[dst.key()], dst.key())
+
+        if dst.isLocked():
+
+            raise MemorySceneError("The destination attribute '%s' is locked." % dst.name())
+
+        self.m_inputs[dst.key()] = src.key()
+        self.m_outputs.setdefault(src.key(), []).append(dst.key())
+
+        """--------------------"""
+
+    def disconnectPlugs(self, _srcKey, _dstKey):
+
+        del self.m_inputs[_dstKey]
+        self.m_outputs[_srcKey].remove(_dstKey)
+
+    def disconnectAttr(self, _src, _dst = None):
+
+        """
+            Method: disconnectAttr
+                breaks the connection between two plugs, or every connection to and
+                from a single plug
+        """
+
+        self.record("disconnectAttr")
+
+        src = self.toAttr(_src)
+
+        if _dst is not None:
+
+            dst = self.toAttr(_dst)
+
+            if self.m_inputs.get(dst.key()) == src.key():
+
+                self.disconnectPlugs(src.key(), dst.key())
+
+            return
+
+        if src.key() in self.m_inputs:
+
+            self.disconnectPlugs(self.m_inputs[src.key()], src.key())
+
+        for dst in self.m_outputs.get(src.key(), [])[:]:
+
+            self.disconnectPlugs(src.key(), dst)
+
+        """--------------------"""
+
+    def setAttr(self, _plug, *args, **kwargs):
+
+        value = args[0]
+
+        if len(args) > 1:
+
+            value = args
+
+        self.toAttr(_plug).set(value)
+
+    def getAttr(self, _plug, **kwargs):
+
+        return self.toAttr(_plug).get()
+
+    #----------creation commands----------#
+
+    def joint(self, *args, **kwargs):
+
+        """
+            Method: joint
+                creates a joint, like maya it is parented under the selected joint
+                if there is one, and is then selected. The position is in world space
+                and the orientation sets the joint orient
+        """
+
+        self.record("joint")
+
+        parent = None
+        joints = [node for node in self.m_selection if node.m_isJoint]
+
+        if len(joints) != 0:
+
+            parent = joints[-1]
+
+        node = self.newNode("joint", kwargs.get("name", kwargs.get("n", "")), parent)
+
+        orientation = kwargs.get("orientation", kwargs.get("o", None))
+
+        if orientation is not None:
+
+            node.setVectorValue("jointOrient", orientation)
+
+        position = kwargs.get("position", kwargs.get("p", None))
+
+        #the position is part of the joint command so isn't recorded separately
+
+        if position is not None:
+
+            node.setVectorValue("translate", prm.transformPoint(position, prm.inverse4(node.parentMatrixValue())))
+
+        self.m_selection = [node]
+
+        return node
+
+        """--------------------"""
+
+    def group(self, *args, **kwargs):
+
+        """
+            Method: group
+                creates a group, if anything is selected (or passed in) and the empty
+                flag is not set the objects are grouped under it. The group is selected.
+        """
+
+        self.record("group")
+
+        empty = kwargs.get("em", False) or kwargs.get("empty", False)
+
+        objs = []
+
+        if not empty:
+
+            objs = self.flatten(args)
+
+            if len(objs) == 0:
+
+                objs = self.m_selection[:]
+
+        parent = kwargs.get("parent", kwargs.get("p", None))
+
+        #groups are made under the parent of the first object unless told otherwise
+
+        if parent is None and len(objs) != 0 and not (kwargs.get("w", False) or kwargs.get("world", False)):
+
+            parent = objs[0].m_parent
+
+        node = self.newNode("transform", kwargs.get("name", kwargs.get("n", "")), parent)
+
+        for obj in objs:
+
+            self.reparent(obj, node)
+
+        self.m_selection = [node]
+
+        return node
+
+        """--------------------"""
+
+    def circle(self, *args, **kwargs):
+
+        """
+            Method: circle
+                creates a nurbs circle, returns the transform and the make node
+        """
+
+        self.record("circle")
+
+        transform = self.newNode("transform", kwargs.get("name", kwargs.get("n", "nurbsCircle1")))
+        shape = self.newNode("nurbsCurve", transform.m_name + "Shape", transform)
+        make = self.newNode("makeNurbCircle", "")
+        make.m_isHistory = True
+
+        normal = kwargs.get("nr", kwargs.get("normal", (0.0, 0.0, 1.0)))
+        make.setVectorValue("normal", normal)
+        make.m_attrs["radius"] = kwargs.get("r", kwargs.get("radius", 1.0))
+
+        transform.m_create = {"command" : "circle", "nr" : list(normal), "r" : make.m_attrs["radius"]}
+        shape.m_create = {"owner" : transform}
+        make.m_create = {"owner" : transform}
+
+        self.m_inputs[(shape, "create")] = (make, "outputCurve")
+        self.m_outputs.setdefault((make, "outputCurve"), []).append((shape, "create"))
+
+        self.m_selection = [transform]
+
+        return [transform, make]
+
+        """--------------------"""
+
+    def shadingNode(self, _type, **kwargs):
+
+        """
+            Method: shadingNode
+                creates a utility node
+        """
+
+        self.record("shadingNode")
+
+        node = self.newNode(_type, kwargs.get("name", kwargs.get("n", "")))
+        node.m_create = {"command" : "shadingNode"}
+
+        return node
+
+        """--------------------"""
+
+    def makeIdentity(self, *args, **kwargs):
+
+        """
+            Method: makeIdentity
+                freezes (with apply set) or resets the transforms of the objects
+                passed in. Freezing a joint's rotation moves it into the joint
+                orient, other transforms keep their children where they are.
+        """
+
+        self.record("makeIdentity")
+
+        doT = kwargs.get("t", kwargs.get("translate", False))
+        doR = kwargs.get("r", kwargs.get("rotate", False))
+        doS = kwargs.get("s", kwargs.get("scale", False))
+
+        #with no channels specified all of them are used
+
+        if not (doT or doR or doS):
+
+            doT, doR, doS = True, True, True
+
+        apply = kwargs.get("a", kwargs.get("apply", False))
+
+        nodes = self.flatten(args)
+
+        if len(nodes) == 0:
+
+            nodes = self.m_selection[:]
+
+        for node in nodes:
+
+            if not node.m_isTransform:
+
+                continue
+
+            childWorlds = [(c, c.worldMatrixValue()) for c in node.m_children if c.m_isTransform]
+
+            if doR:
+
+                if node.m_isJoint and apply:
+
+                    rot = prm.mulMatrix3(prm.eulerToMatrix(node.getVectorValue("rotate")),
+                                         prm.eulerToMatrix(node.getVectorValue("jointOrient")))
+                    node.setVectorValue("jointOrient", prm.matrixToEuler(rot))
+
+                node.setVectorValue("rotate", (0.0, 0.0, 0.0))
+
+            if doS:
+
+                node.setVectorValue("scale", (1.0, 1.0, 1.0))
+
+            if doT and not node.m_isJoint:
+
+                node.setVectorValue("translate", (0.0, 0.0, 0.0))
+
+            #applied transformations stay where they are in the world
+
+            if apply:
+
+                for child, world in childWorlds:
+
+                    child.setWorldMatrixValue(world)
+
+        """--------------------"""
+
+    def ikHandle(self, *args, **kwargs):
+
+        """
+            Method: ikHandle
+                creates an ik handle between the start and end joints, returns the
+                handle and the effector
+        """
+
+        self.record("ikHandle")
+
+        start = self.PyNode(kwargs.get("startJoint", kwargs.get("sj")))
+        end = self.PyNode(kwargs.get("endEffector", kwargs.get("ee")))
+
+        #the end joint must be below the start joint
+
+        check = end.m_parent
+
+        while check is not None and check is not start:
+
+            check = check.m_parent
+
+        if check is None:
+
+            raise MemorySceneError("Start joint '%s' is not above end joint '%s' in the same hierarchy." % (start.m_name, end.m_name))
+
+        endPos = end.getTranslation(space = "world")
+
+        effector = self.newNode("ikEffector", "", end.m_parent)
+        effector.setTranslation(endPos, space = "world")
+
+        handle = self.newNode("ikHandle", kwargs.get("name", kwargs.get("n", "")))
+        handle.setTranslation(endPos, space = "world")
+        handle.m_attrs["ikSolver"] = kwargs.get("sol", kwargs.get("solver", "ikRPsolver"))
+        handle.m_create = {"command" : "ikHandle", "startJoint" : start, "endEffector" : end,
+                           "sol" : handle.m_attrs["ikSolver"]}
+        effector.m_create = {"owner" : handle}
+
+        self.connectAttr(start.attr("message"), handle.attr("startJoint"))
+        self.connectAttr(effector.attr("message"), handle.attr("endEffector"))
+
+        self.m_selection = [handle]
+
+        return [handle, effector]
+
+        """--------------------"""
+
+    #----------constraints----------#
+
+    def aimConstraint(self, *args, **kwargs):
+
+        return self.constrain("aimConstraint", args, kwargs)
+
+    def parentConstraint(self, *args, **kwargs):
+
+        return self.constrain("parentConstraint", args, kwargs)
+
+    def orientConstraint(self, *args, **kwargs):
+
+        return self.constrain("orientConstraint", args, kwargs)
+
+    def pointConstraint(self, *args, **kwargs):
+
+        return self.constrain("pointConstraint", args, kwargs)
+
+    def scaleConstraint(self, *args, **kwargs):
+
+        return self.constrain("scaleConstraint", args, kwargs)
+
+    def poleVectorConstraint(self, *args, **kwargs):
+
+        return self.constrain("poleVectorConstraint", args, kwargs)
+
+    def skipList(self, _value):
+
+        """
+            Method: skipList
+                turns a constraint skip flag value into a list of axis letters
+        """
+
+        if _value in (None, "none", ""):
+
+            return []
+
+        if not isinstance(_value, (list, tuple)):
+
+            _value = [_value]
+
+        return [str(axis).lower() for axis in _value if axis != "none"]
+
+        """--------------------"""
+
+    def constrain(self, _type, _args, _kwargs):
+
+        """
+            Method: constrain
+                makes a constraint node of the type passed in under the driven object
+                and connects it to the driven channels that are not skipped. Without
+                maintain offset the driven object is snapped to the targets.
+
+            Inputs:
+                _type:                  The constraint node type
+                _args:                  The targets followed by the driven object
+                _kwargs:                The flags passed to the constraint command
+
+            On Exit:                    Returns the constraint node
+        """
+
+        self.record(_type)
+
+        nodes = self.flatten(_args)
+
+        if len(nodes) < 2:
+
+            raise MemorySceneError("%s needs at least one target and a driven object." % _type)
+
+        targets = nodes[:-1]
+        driven = nodes[-1]
+
+        #work out the channels to drive
+
+        if _type == "parentConstraint":
+
+            skipT = self.skipList(_kwargs.get("st", _kwargs.get("skipTranslate", None)))
+            skipR = self.skipList(_kwargs.get("sr", _kwargs.get("skipRotate", None)))
+            channels = ([("constraintTranslate"+a.upper(), "translate"+a.upper()) for a in "xyz" if a not in skipT] +
+                        [("constraintRotate"+a.upper(), "rotate"+a.upper()) for a in "xyz" if a not in skipR])
+
+        elif _type == "poleVectorConstraint":
+
+            channels = [("constraintTranslate"+a, "poleVector"+a) for a in "XYZ"]
+
+        else:
+
+            skip = self.skipList(_kwargs.get("sk", _kwargs.get("skip", None)))
+            source = {"pointConstraint" : "Translate", "scaleConstraint" : "Scale"}.get(_type, "Rotate")
+            channels = [("constraint"+source+a.upper(), source.lower()+a.upper()) for a in "xyz" if a not in skip]
+
+        for src, dst in channels:
+
+            if not driven.hasAttr(dst):
+
+                raise MemorySceneError("%s cannot be constrained, it has no attribute '%s'." % (driven.m_name, dst))
+
+            if (driven, dst) in self.m_inputs or dst in driven.m_locked:
+
+                raise MemorySceneError("Could not add constraint, %s.%s is already connected or locked." % (driven.m_name, dst))
+
+        #without maintain offset the driven object snaps to the targets
+
+        if not (_kwargs.get("mo", False) or _kwargs.get("maintainOffset", False)):
+
+            self.snapToTargets(_type, targets, driven, _kwargs)
+
+        name = _kwargs.get("name", _kwargs.get("n", "")) or "%s_%s1" % (driven.m_name, _type)
+
+        constraint = self.newNode(_type, name, driven if driven.m_isDag else None)
+
+        #keep the flags the constraint was made with so it can be made again
+
+        flags = dict([(flag, value) for flag, value in _kwargs.items() if flag not in ("name", "n")])
+        constraint.m_create = {"command" : _type, "targets" : targets, "driven" : driven, "flags" : flags}
+
+        for i in range(0, len(targets)):
+
+            weight = "%sW%d" % (targets[i].m_name, i)
+            constraint.m_attrs[weight] = 1.0
+            constraint.m_weightAliases.append(weight)
+
+            self.connectAttr(targets[i].attr("worldMatrix"), constraint.attr("targetParentMatrix[%d]" % i))
+
+        for src, dst in channels:
+
+            constraint.m_attrs[src] = driven.m_attrs[dst]
+            self.connectAttr(constraint.attr(src), driven.attr(dst))
+
+        return constraint
+
+        """--------------------"""
+
+    def snapToTargets(self, _type, _targets, _driven, _kwargs):
+
+        """
+            Method: snapToTargets
+                moves the driven object to where the constraint would put it
+        """
+
+        positions = [t.worldMatrixValue()[3][:3] for t in _targets]
+        average = prm.scale(positions[0], 0.0)
+
+        for pos in positions:
+
+            average = prm.add(average, prm.scale(pos, 1.0/len(positions)))
+
+        if _type in ("pointConstraint", "parentConstraint"):
+
+            _driven.setTranslation(average, space = "world")
+
+        if _type in ("orientConstraint", "parentConstraint"):
+
+            _driven.setWorldRotationValue(prm.rotationPart(_targets[0].worldMatrixValue()))
+
+        elif _type == "scaleConstraint":
+
+            _driven.setVectorValue("scale", _targets[0].getVectorValue("scale"))
+
+        elif _type == "aimConstraint":
+
+            _driven.setWorldRotationValue(self.aimRotation(average, _driven, _kwargs))
+
+        """--------------------"""
+
+    def aimRotation(self, _targetPos, _driven, _kwargs):
+
+        """
+            Method: aimRotation
+                works out the world rotation an aim constraint gives the driven
+                object, supporting the scene, vector, object and objectRotation
+                world up types
+        """
+
+        aimAxis = _kwargs.get("aim", _kwargs.get("aimVector", (1.0, 0.0, 0.0)))
+        upAxis = _kwargs.get("u", _kwargs.get("upVector", (0.0, 1.0, 0.0)))
+        worldUp = _kwargs.get("wu", _kwargs.get("worldUpVector", (0.0, 1.0, 0.0)))
+        upType = _kwargs.get("wut", _kwargs.get("worldUpType", "vector"))
+        upObj = _kwargs.get("wuo", _kwargs.get("worldUpObject", None))
+
+        drivenPos = _driven.worldMatrixValue()[3][:3]
+
+        up = worldUp
+
+        if upType == "scene":
+
+            up = (0.0, 1.0, 0.0)
+
+        elif upType == "object" and upObj not in (None, ""):
+
+            up = prm.sub(self.PyNode(upObj).worldMatrixValue()[3][:3], drivenPos)
+
+        elif upType == "objectRotation" and upObj not in (None, ""):
+
+            up = prm.transformVector(worldUp, prm.rotationPart(self.PyNode(upObj).worldMatrixValue()))
+
+        return prm.aimMatrix(prm.sub(_targetPos, drivenPos), up, aimAxis, upAxis)
+
+        """--------------------"""
+
+    #----------undo----------#
+
+    def undoInfo(self, *args, **kwargs):
+
+        """
+            Method: undoInfo
+                keeps track of the undo state and chunks, supports the query, state,
+                stateWithoutFlush, openChunk, closeChunk and chunkName flags
+        """
+
+        self.record("undoInfo")
+
+        if kwargs.get("q", False) or kwargs.get("query", False):
+
+            return self.m_undoState
+
+        for flag in ("state", "st", "stateWithoutFlush", "swf"):
+
+            if flag in kwargs:
+
+                self.m_undoState = bool(kwargs[flag])
+
+        if kwargs.get("openChunk", False) or kwargs.get("ock", False):
+
+            self.m_undoChunks.append(kwargs.get("chunkName", kwargs.get("cn", "")))
+
+        elif kwargs.get("closeChunk", False) or kwargs.get("cck", False):
+
+            if len(self.m_undoChunks) == 0:
+
+                raise MemorySceneError("No undo chunk is open.")
+
+            self.m_closedChunks.append(self.m_undoChunks.pop())
+
+        """--------------------"""
+
+#----------END-MemoryScene-Class----------#
@@ -0,0 +1,403 @@
+#the number of names each cache holds before it is emptied
+
+MAX_CACHED_NAMES = 10000
+
+#----------NameTemplate-Class----------#
+
+class NameTemplate(object):
+
+    """
+        Class: NameTemplate
+            A naming rule, strip a number of extensions from the end of a name,
+            everything after the last underscore each time, then add its own, e.g.
+            L_Arm_Elbow_IK_JNT stripped twice with FK and JNT added gives
+            L_Arm_Elbow_FK_JNT. The names rendered are cached, so a name rendered
+            again, e.g. by the next chain of the same rig, isn't worked out again.
+
+        File: pRigging/src/naming.py
+
+        Contains:
+            self.m_strip:           The number of extensions to remove
+            self.m_exts:            The extensions to add, in order
+            self.m_cache:           A dictionary of the names already rendered
+    """
+
+    def __init__(self, _strip = 0, _exts = ()):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _strip:                 The number of extensions to remove
+                _exts:                  A tuple of the extensions to add
+        """
+
+        self.m_strip = _strip
+        self.m_exts = tuple([ext for ext in _exts if ext != ""])
+        self.m_cache = {}
+
+        """--------------------"""
+
+    def render(self, _name):
+
+        """
+            Method: render
+                returns the name produced by the template from the name passed in,
+                which can be a string or a node
+        """
+
+        name = str(_name)
+
+        try:
+
+            return self.m_cache[name]
+
+        except KeyError:
+
+            pass
+
+        result = name
+
+        for i in range(0, self.m_strip):
+
+            result = removeExt(result)
+
+        for ext in self.m_exts:
+
+            result = addExt(result, ext)
+
+        if len(self.m_cache) >= MAX_CACHED_NAMES:
+
+            self.m_cache = {}
+
+        self.m_cache[name] = result
+
+        return result
+
+        """--------------------"""
+
+    def renderAll(self, _names):
+
+        """
+            Method: renderAll
+                returns the list of names produced by the template from a list of
+                names, e.g. a whole chain
+        """
+
+        render = self.render
+
+        return [render(name) for name in _names]
+
+        """--------------------"""
+
+#----------END-NameTemplate-Class----------#
+
+#----------NamingEngine-Class----------#
+
+class NamingEngine(object):
+
+    """
+        Class: NamingEngine
+            The naming engine used to build every node name in the toolset. Names
+            are built by stripping extensions from a name and adding new ones, e.g.
+            the IK handle name strips the joint and chain extensions from the first
+            joint and adds the chain extension and HNDL. The engine holds each rule
+            as a template, made once, so the same rule shares its cache between
+            every chain that uses it.
+
+            Names aren't split into named parts, side, limb, chain and so on, as
+            the base names the user gives can hold underscores of their own, a
+            template works on the plain string with addExt and removeExt. The
+            caches are bounded by MAX_CACHED_NAMES and the templates are dropped
+            when each build session ends, see clear and buildsession.endSession.
+
+        File: pRigging/src/naming.py
+
+        Contains:
+            self.m_templates:       A dictionary of the templates keyed by the number
+                                    of extensions stripped and the extensions added
+    """
+
+    def __init__(self):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+        """
+
+        self.m_templates = {}
+
+        """--------------------"""
+
+    def getTemplate(self, _strip = 0, _exts = ()):
+
+        """
+            Method: getTemplate
+                returns the template for the rule, making it the first time it is
+                asked for
+
+            Inputs:
+                _strip:                 The number of extensions to remove
+                _exts:                  A list of the extensions to add
+        """
+
+        key = (_strip, tuple(_exts))
+
+        try:
+
+            return self.m_templates[key]
+
+        except KeyError:
+
+            template = NameTemplate(_strip, key[1])
+            self.m_templates[key] = template
+
+            return template
+
+        """--------------------"""
+
+    def render(self, _names, _strip = 0, _exts = ()):
+
+        """
+            Method: render
+                renders a list of names with the rule in a single call
+
+            Inputs:
+                _names:                 A list of names or nodes
+                _strip:                 The number of extensions to remove
+                _exts:                  A list of the extensions to add
+
+            On Exit:                    Returns the list of new names
+        """
+
+        return self.getTemplate(_strip, _exts).renderAll(_names)
+
+        """--------------------"""
+
+    def clear(self):
+
+        """
+            Method: clear
+                empties every template and the single name caches
+        """
+
+        self.m_templates = {}
+
+        addExtCache.clear()
+        removeExtCache.clear()
+
+        """--------------------"""
+
+#----------END-NamingEngine-Class----------#
+
+#----------NameIndex-Class----------#
+
+class NameIndex(object):
+
+    """
+        Class: NameIndex
+            An in memory index of the node names in use, built once from the scene,
+            so that the name each new node will get can be reserved up front. A name
+            that is already in use gets the first free number added to the end, as
+            maya would rename it, so the name asked for is the name the node gets
+            without checking the scene again
+
+        File: pRigging/src/naming.py
+
+        Contains:
+            self.m_names:           A set of the short names in use
+    """
+
+    def __init__(self, _names = []):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _names:                 The names already in use, long names are
+                                        reduced to their short names
+        """
+
+        self.m_names = set([name.split("|")[-1] for name in _names])
+
+        """--------------------"""
+
+    def reserve(self, _name):
+
+        """
+            Method: reserve
+                reserves the name, numbering it if it is already in use
+
+            On Exit:                    Returns the name reserved
+        """
+
+        name = str(_name)
+
+        if name not in self.m_names:
+
+            self.m_names.add(name)
+
+            return name
+
+        #split off any number already on the end and count up from it
+
+        base = name.rstrip("0123456789")
+        num = 1
+
+        if base != name:
+
+            num = int(name[len(base):]) + 1
+
+        while (base + str(num)) in self.m_names:
+
+            num = num + 1
+
+        self.m_names.add(base + str(num))
+
+        return base + str(num)
+
+        """--------------------"""
+
+    def reserveAll(self, _names):
+
+        """
+            Method: reserveAll
+                reserves every name in a list in order
+
+            On Exit:                    Returns the list of names reserved
+        """
+
+        return [self.reserve(name) for name in _names]
+
+        """--------------------"""
+
+    def release(self, _name):
+
+        """
+            Method: release
+                frees a name, e.g. when its node is deleted
+        """
+
+        self.m_names.discard(str(_name).split("|")[-1])
+
+        """--------------------"""
+
+    def isUsed(self, _name):
+
+        """
+            Method: isUsed
+                returns whether or not the name is in use
+        """
+
+        return str(_name) in self.m_names
+
+        """--------------------"""
+
+#----------END-NameIndex-Class----------#
+
+#the single name operations, cached by name and extension, each cache is emptied
+#once it holds MAX_CACHED_NAMES names
+
+addExtCache = {}
+removeExtCache = {}
+
+def addExt(_name, _ext):
+
+    """
+        Function: addExt
+            adds an extension to the end of a name, separated by one underscore, and
+            removes any long name path before it
+    """
+
+    key = (_name, _ext)
+
+    try:
+
+        return addExtCache[key]
+
+    except KeyError:
+
+        pass
+
+    name = _name
+
+    if _ext != "":
+
+        #join the two with exactly one underscore
+
+        if name.endswith("_") and _ext[0] == "_":
+
+            name = name + _ext[1:]
+
+        elif name.endswith("_") or _ext[0] == "_":
+
+            name = name + _ext
+
+        else:
+
+            name = name + "_" + _ext
+
+        index = name.rfind("|")
+
+        if index >= 0:
+
+            name = name[index:]
+
+    if len(addExtCache) >= MAX_CACHED_NAMES:
+
+        addExtCache.clear()
+
+    addExtCache[key] = name
+
+    return name
+
+    """--------------------"""
+
+def removeExt(_name):
+
+    """
+        Function: removeExt
+            removes the extension from a name, everything after the last underscore,
+            and removes any long name path before it
+    """
+
+    try:
+
+        return removeExtCache[_name]
+
+    except KeyError:
+
+        pass
+
+    name = _name
+
+    index = name.rfind("_")
+
+    if index >= 0:
+
+        name = name[:index]
+
+    index = name.rfind("|")
+
+    if index >= 0:
+
+        name = name[index:]
+
+    if len(removeExtCache) >= MAX_CACHED_NAMES:
+
+        removeExtCache.clear()
+
+    removeExtCache[_name] = name
+
+    return name
+
+    """--------------------"""
+
+#the shared engine used by all of the build modules
+
+engine = NamingEngine()
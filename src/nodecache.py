@@ -0,0 +1,339 @@
+#----------Imports----------#
+
+import collections
+import pRigging.src.scenebackend as psb
+
+#the number of nodes each cache holds before the least recently used are dropped
+
+MAX_ENTRIES = 1000
+
+#----------NodeCache-Class----------#
+
+class NodeCache(object):
+
+    """
+        Class: NodeCache
+            A cache of the node objects names have been turned into, e.g. the joints
+            picked in an arm tab, so a name asked for again is given the node it
+            was given before without going back to the scene. The nodes are held
+            by uuid, which stays with a node when it is renamed, and each name
+            points at the uuid it was found to have, so a renamed node is found
+            again under its new name with the same node object, and its old name
+            is looked up again rather than returning it.
+
+            Names the cache doesn't have are found all together, with one ls for
+            their uuids, and one more for any nodes not already held. Nodes
+            sharing a uuid, as the nodes of a file referenced more than once do,
+            are never cached, as the uuid can't tell them apart. The cache
+            holds up to a set number of nodes, dropping the least recently used.
+            Use getNodeCache to share one cache for each backend.
+
+        File: pRigging/src/nodecache.py
+
+        Contains:
+            self.m_backend:         The scene backend the nodes are found through,
+                                    e.g. psb.pm
+            self.m_scene:           The backend in use when the nodes were found,
+                                    the cache is emptied if it is switched
+            self.m_maxEntries:      The number of nodes held before the least
+                                    recently used are dropped
+            self.m_nodes:           An ordered dictionary of uuids to nodes, least
+                                    recently used first
+            self.m_uuids:           A dictionary of names to the uuids of the nodes
+                                    they were found to be
+            self.m_hits:            The number of names found in the cache
+            self.m_misses:          The number of names found in the scene
+
+        Imports:
+            collections
+            pRigging.src.scenebackend as psb
+    """
+
+    def __init__(self, _backend = None, _maxEntries = MAX_ENTRIES):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _backend:               The scene backend to find nodes through,
+                                        defaults to psb.pm
+                _maxEntries:            The number of nodes to hold, defaults to
+                                        MAX_ENTRIES
+        """
+
+        if _backend is None:
+
+            _backend = psb.pm
+
+        self.m_backend = _backend
+        self.m_scene = None
+        self.m_maxEntries = _maxEntries
+        self.m_nodes = collections.OrderedDict()
+        self.m_uuids = {}
+        self.m_hits = 0
+        self.m_misses = 0
+
+        """--------------------"""
+
+    def getNode(self, _name):
+
+        return self.getNodes([_name])[0]
+
+    def getNodes(self, _names):
+
+        """
+            Method: getNodes
+                returns the node for each of the names, in order, anything that is
+                already a node is returned as it is. Raises the error the backend
+                raises for a name that doesn't exist, as PyNode does
+
+            Inputs:
+                _names:                 A list of node names
+        """
+
+        if self.m_scene is not self.m_backend.getBackend():
+
+            self.clear()
+            self.m_scene = self.m_backend.getBackend()
+
+        nodes = [None]*len(_names)
+        missing = []
+
+        for i in range(0, len(_names)):
+
+            name = _names[i]
+
+            if not isinstance(name, (str, type(u""))):
+
+                nodes[i] = name
+
+                continue
+
+            node = self.find(name)
+
+            if node is None:
+
+                if name not in missing:
+
+                    missing.append(name)
+
+            else:
+
+                nodes[i] = node
+                self.m_hits = self.m_hits + 1
+
+        if missing != []:
+
+            found = dict(zip(missing, self.resolve(missing)))
+
+            for i in range(0, len(_names)):
+
+                if nodes[i] is None:
+
+                    nodes[i] = found[_names[i]]
+
+        return nodes
+
+        """--------------------"""
+
+    def find(self, _name):
+
+        """
+            Method: find
+                returns the cached node for a name, None if it isn't held or if the
+                node has since been deleted or renamed
+        """
+
+        uuid = self.m_uuids.get(_name, None)
+
+        if uuid is None:
+
+            return None
+
+        node = self.m_nodes.get(uuid, None)
+
+        if node is None or not self.matches(node, _name):
+
+            del self.m_uuids[_name]
+
+            return None
+
+        self.touch(uuid)
+
+        return node
+
+        """--------------------"""
+
+    def resolve(self, _names):
+
+        """
+            Method: resolve
+                finds the nodes for names the cache doesn't have and adds them to it,
+                with one ls for their uuids and one for the nodes not already held
+                under those uuids. A uuid shared by more than one node isn't cached,
+                the nodes with it are found by name with PyNode
+        """
+
+        pm = self.m_backend
+
+        self.m_misses = self.m_misses + len(_names)
+
+        uuids = [str(uuid) for uuid in pm.ls(_names, uuid = True)]
+
+        #ls drops names that don't exist and matches patterns, so anything else
+        #is looked up one at a time, raising for a missing name as PyNode does
+
+        if len(uuids) != len(_names):
+
+            uuids = [str(pm.ls(pm.PyNode(name), uuid = True)[0]) for name in _names]
+
+        newUuids = []
+
+        for uuid in uuids:
+
+            if uuid not in self.m_nodes and uuid not in newUuids:
+
+                newUuids.append(uuid)
+
+        if newUuids != []:
+
+            newNodes = list(pm.ls(newUuids))
+
+            #more nodes than uuids means some of them share a uuid, e.g. the nodes
+            #of a file referenced twice, those uuids aren't cached
+
+            if len(newNodes) != len(newUuids):
+
+                newNodes = [pm.ls(uuid) for uuid in newUuids]
+                newNodes = [found[0] if len(found) == 1 else None for found in newNodes]
+
+            for uuid, node in zip(newUuids, newNodes):
+
+                if node is not None:
+
+                    self.m_nodes[uuid] = node
+
+        nodes = []
+
+        for name, uuid in zip(_names, uuids):
+
+            node = self.m_nodes.get(uuid, None)
+
+            #a name whose uuid is shared, or held by another node, is found on
+            #its own each time
+
+            if node is None or not self.matches(node, name):
+
+                nodes.append(pm.PyNode(name))
+
+                continue
+
+            self.m_uuids[name] = uuid
+            self.touch(uuid)
+
+            nodes.append(node)
+
+        self.evict()
+
+        return nodes
+
+        """--------------------"""
+
+    def matches(self, _node, _name):
+
+        #whether or not the node still exists and still has the name
+
+        return _node.exists() and _name in (str(_node), _node.longName())
+
+    def touch(self, _uuid):
+
+        #moves a node to the most recently used end
+
+        node = self.m_nodes.pop(_uuid)
+        self.m_nodes[_uuid] = node
+
+    def evict(self):
+
+        """
+            Method: evict
+                drops the least recently used nodes over the limit, along with the
+                names pointing at them
+        """
+
+        if len(self.m_nodes) <= self.m_maxEntries:
+
+            return
+
+        while len(self.m_nodes) > self.m_maxEntries:
+
+            self.m_nodes.popitem(last = False)
+
+        self.m_uuids = dict([(name, uuid) for name, uuid in self.m_uuids.items() if uuid in self.m_nodes])
+
+        """--------------------"""
+
+    def clear(self):
+
+        self.m_nodes = collections.OrderedDict()
+        self.m_uuids = {}
+        self.m_hits = 0
+        self.m_misses = 0
+
+    def getStats(self):
+
+        """
+            Method: getStats
+                returns a dictionary of the number of hits, misses and entries
+        """
+
+        return {"hits" : self.m_hits, "misses" : self.m_misses, "entries" : len(self.m_nodes)}
+
+        """--------------------"""
+
+#----------END-NodeCache-Class----------#
+
+#the shared cache for each backend, see getNodeCache
+
+caches = {}
+
+def getNodeCache(_backend = None):
+
+    """
+        Function: getNodeCache
+            returns the cache shared by everything finding nodes through a backend,
+            made the first time it is asked for
+
+        Inputs:
+            _backend:                   The scene backend, defaults to psb.pm, the UI
+                                        modules pass psb.ui
+    """
+
+    if _backend is None:
+
+        _backend = psb.pm
+
+    if id(_backend) not in caches:
+
+        caches[id(_backend)] = NodeCache(_backend)
+
+    return caches[id(_backend)]
+
+    """--------------------"""
+
+def getNodes(_names, _backend = None):
+
+    """
+        Function: getNodes
+            returns the nodes for a list of names through the shared cache of a
+            backend, see NodeCache.getNodes
+    """
+
+    return getNodeCache(_backend).getNodes(_names)
+
+    """--------------------"""
+
+def getNode(_name, _backend = None):
+
+    return getNodeCache(_backend).getNode(_name)
@@ -0,0 +1,286 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+
+pm = psb.pm
+
+#----------NodeList-Class----------#
+
+class NodeList(object):
+
+    """
+        Class: NodeList
+            A list of scene nodes held by a rig component, e.g. the joints of a
+            joint chain, used like a list. The nodes are held as the node objects
+            they were added as until the list is compacted, which swaps them for
+            their uuids, found for every list being compacted with one ls, so a
+            rig kept for the rest of a session holds plain strings rather than a
+            pymel node for each of its nodes. The nodes are found again from their
+            uuids, all at once, the first time the list is used, and as uuids stay
+            with a node when it is renamed a renamed node is still found.
+
+            The slots keep each list down to its two lists, as a component holds
+            several and a scene can hold dozens of rigs.
+
+        File: pRigging/src/nodelist.py
+
+        Contains:
+            self.m_nodes:           A list of the node objects, None for the nodes
+                                    only held by uuid
+            self.m_uuids:           A list of the uuids of the nodes, None until
+                                    the list is compacted, and for any entries
+                                    that aren't nodes, e.g. None
+
+        Imports:
+            pRigging.src.scenebackend as psb
+    """
+
+    __slots__ = ["m_nodes", "m_uuids"]
+
+    #what the list is stored as in the state of a rig, see RiggingBase.getStateValue
+
+    STATE_TYPE = "nodeList"
+
+    def __init__(self, _nodes = []):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _nodes:                 The nodes to start with, defaults to none
+        """
+
+        self.m_nodes = list(_nodes)
+        self.m_uuids = [None]*len(self.m_nodes)
+
+        """--------------------"""
+
+    #----------list methods----------#
+
+    def __len__(self):
+
+        return len(self.m_nodes)
+
+    def __iter__(self):
+
+        return iter(self.getNodes())
+
+    def __getitem__(self, _id):
+
+        if isinstance(_id, slice):
+
+            return self.getNodes()[_id]
+
+        if self.m_nodes[_id] is None:
+
+            self.materialize()
+
+        return self.m_nodes[_id]
+
+    def __setitem__(self, _id, _node):
+
+        self.m_nodes[_id] = _node
+        self.m_uuids[_id] = None
+
+    def __delitem__(self, _id):
+
+        del self.m_nodes[_id]
+        del self.m_uuids[_id]
+
+    def __contains__(self, _node):
+
+        return _node in self.getNodes()
+
+    def __eq__(self, _other):
+
+        if isinstance(_other, NodeList):
+
+            _other = _other.getNodes()
+
+        return self.getNodes() == _other
+
+    def __ne__(self, _other):
+
+        return not self.__eq__(_other)
+
+    __hash__ = None
+
+    def __repr__(self):
+
+        return "NodeList(%r)" % (self.getNodes(),)
+
+    def append(self, _node):
+
+        self.m_nodes.append(_node)
+        self.m_uuids.append(None)
+
+    def insert(self, _id, _node):
+
+        self.m_nodes.insert(_id, _node)
+        self.m_uuids.insert(_id, None)
+
+    def extend(self, _nodes):
+
+        for node in _nodes:
+
+            self.append(node)
+
+    def index(self, _node):
+
+        return self.getNodes().index(_node)
+
+    def pop(self, _id = -1):
+
+        node = self[_id]
+
+        del self[_id]
+
+        return node
+
+    def remove(self, _node):
+
+        del self[self.index(_node)]
+
+    #----------compacting----------#
+
+    def getNodes(self):
+
+        """
+            Method: getNodes
+                returns the nodes as a plain list, finding any held only by uuid
+        """
+
+        self.materialize()
+
+        return list(self.m_nodes)
+
+        """--------------------"""
+
+    def compact(self):
+
+        """
+            Method: compact
+                swaps the nodes for their uuids, see compactLists
+        """
+
+        compactLists([self])
+
+        """--------------------"""
+
+    def getExisting(self):
+
+        """
+            Method: getExisting
+                returns the nodes that still exist as a plain list, leaving out any
+                that have been deleted, e.g. by hand, rather than raising as getNodes
+                does
+        """
+
+        self.materialize(_skipMissing = True)
+
+        return [node for node in self.m_nodes if node is not None and node.exists()]
+
+        """--------------------"""
+
+    def materialize(self, _skipMissing = False):
+
+        """
+            Method: materialize
+                finds the nodes held only by uuid with a single ls, nothing is done
+                if there aren't any, raises a RuntimeError if one of them has been
+                deleted
+
+            Inputs:
+                _skipMissing:           Whether to leave the deleted nodes as None
+                                        rather than raising, defaults to False
+        """
+
+        ids = [i for i in range(0, len(self.m_nodes)) if self.m_nodes[i] is None and self.m_uuids[i] is not None]
+
+        if ids == []:
+
+            return
+
+        uuids = [self.m_uuids[i] for i in ids]
+        nodes = list(pm.ls(uuids))
+
+        #ls drops the uuids it can't find, and lists the uuids passed in more than
+        #once only once, so anything else is looked up one at a time
+
+        if len(nodes) != len(uuids):
+
+            nodes = []
+
+            for uuid in uuids:
+
+                found = pm.ls(uuid)
+
+                if len(found) == 0:
+
+                    if not _skipMissing:
+
+                        raise RuntimeError("The node with the uuid %s no longer exists" % uuid)
+
+                    found = [None]
+
+                nodes.append(found[0])
+
+        for i, node in zip(ids, nodes):
+
+            self.m_nodes[i] = node
+
+        """--------------------"""
+
+#----------END-NodeList-Class----------#
+
+def compactLists(_lists):
+
+    """
+        Function: compactLists
+            swaps the nodes held by each of the lists for their uuids, finding the
+            uuids of every list with one ls, the lists are left as they are if any
+            of their nodes no longer exist
+
+        Inputs:
+            _lists:                     The NodeLists to compact
+    """
+
+    entries = []
+
+    for nodeList in _lists:
+
+        for i in range(0, len(nodeList.m_nodes)):
+
+            node = nodeList.m_nodes[i]
+
+            if node is not None and not isinstance(node, (str, type(u""))):
+
+                entries.append((nodeList, i, node))
+
+    if entries == []:
+
+        return
+
+    #a deleted node is dropped by ls, which leaves the uuids out of step, or
+    #can't be listed at all
+
+    try:
+
+        uuids = pm.ls([entry[2] for entry in entries], uuid = True)
+
+    except Exception:
+
+        return
+
+    if len(uuids) != len(entries):
+
+        return
+
+    for (nodeList, i, node), uuid in zip(entries, uuids):
+
+        nodeList.m_nodes[i] = None
+        nodeList.m_uuids[i] = str(uuid)
+
+    """--------------------"""
@@ -0,0 +1,315 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.scenemodifier as psm
+
+pm = psb.pm
+
+#----------PlanExecutor-Class----------#
+
+class PlanExecutor(object):
+
+    """
+        Class: PlanExecutor
+            Makes a BuildPlan real in the scene. Rather than following the order the
+            build made its decisions in, the nodes are made in passes: every node is
+            made straight under its parent, then every value is set, then the ik
+            handles and constraints are made against the finished transforms and
+            finally the connections are made and attributes locked. Every change
+            after making the nodes is queued on a SceneModifier and made a pass at
+            a time.
+
+        File: pRigging/src/planexecutor.py
+
+        Contains:
+            self.m_nodes:           A dictionary of the names in the plan to the scene
+                                    nodes made for them, or that already existed
+            self.m_modifier:        The SceneModifier the changes are queued on, every
+                                    node it parents is new so none are checked
+
+        Imports:
+            pRigging.src.scenebackend as psb
+            pRigging.src.scenemodifier as psm
+    """
+
+    def __init__(self):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+        """
+
+        self.m_nodes = {}
+        self.m_modifier = psm.SceneModifier(_checkParents = False)
+
+        """--------------------"""
+
+    def execute(self, _plan, _existing = {}):
+
+        """
+            Method: execute
+                makes every node and connection in the plan
+
+            Inputs:
+                _plan:                  The BuildPlan to make
+                _existing:              A dictionary of the names of the existing nodes
+                                        in the plan to their scene nodes, any not in it
+                                        are found by name
+
+            On Exit:                    Returns the dictionary of plan names to scene
+                                        nodes
+        """
+
+        self.m_nodes = dict(_existing)
+
+        for name in _plan.getExisting():
+
+            if name not in self.m_nodes:
+
+                self.m_nodes[name] = pm.PyNode(name)
+
+        nodes = _plan.getNodes()
+
+        #ik handles and constraints are made by their own commands once the
+        #transforms they work from are set
+
+        plain = [node for node in nodes if not self.isMadeLater(node)]
+
+        try:
+
+            self.createNodes(plain)
+            self.setValues(plain)
+            self.m_modifier.doIt()
+
+            self.createIkHandles([node for node in nodes if node["type"] == "ikHandle"])
+            self.createConstraints([node for node in nodes if node["type"].endswith("Constraint")])
+
+            self.connectPlugs(_plan.getConnections())
+            self.lockAttrs(nodes)
+            self.m_modifier.doIt()
+
+        except:
+
+            self.m_modifier = psm.SceneModifier(_checkParents = False)
+            self.rollback(_plan)
+
+            raise
+
+        pm.select(cl = True)
+
+        return self.m_nodes
+
+        """--------------------"""
+
+    def rollback(self, _plan):
+
+        """
+            Method: rollback
+                deletes every node made so far from the plan in a single delete, used
+                when making the plan fails part way through
+        """
+
+        made = [self.m_nodes[node["name"]] for node in _plan.getNodes() if node["name"] in self.m_nodes]
+        made = [node for node in made if node.exists()]
+
+        if made != []:
+
+            pm.delete(made)
+
+        self.m_nodes = {}
+
+        """--------------------"""
+
+    def isMadeLater(self, _node):
+
+        """
+            Method: isMadeLater
+                returns True for the nodes made after the values are set, the ik
+                handles and constraints
+        """
+
+        return _node["type"] == "ikHandle" or _node["type"].endswith("Constraint")
+
+        """--------------------"""
+
+    def getDepth(self, _node, _byName):
+
+        """
+            Method: getDepth
+                returns how many planned parents a node has above it
+        """
+
+        depth = 0
+        parent = _node["parent"]
+
+        while parent in _byName:
+
+            depth = depth + 1
+            parent = _byName[parent]["parent"]
+
+        return depth
+
+        """--------------------"""
+
+    def createNodes(self, _nodes):
+
+        """
+            Method: createNodes
+                makes the nodes, parents before children so each one can be made
+                straight under its parent, the circles, which can't be, are queued
+                to be parented
+        """
+
+        byName = dict([(node["name"], node) for node in _nodes])
+        order = sorted(range(0, len(_nodes)), key = lambda i: self.getDepth(_nodes[i], byName))
+
+        for i in order:
+
+            node = _nodes[i]
+            command = node["create"].get("command")
+            parent = None
+
+            if node["parent"] is not None:
+
+                parent = self.m_nodes[node["parent"]]
+
+            if command == "circle":
+
+                newNode = pm.circle(name = node["name"], nr = node["create"]["nr"], r = node["create"]["r"])[0]
+
+                if parent is not None:
+
+                    self.m_modifier.reparent(newNode, parent, _relative = True)
+
+            elif command == "shadingNode":
+
+                newNode = pm.shadingNode(node["type"], asUtility = True, name = node["name"])
+
+            elif parent is not None:
+
+                newNode = pm.createNode(node["type"], name = node["name"], parent = parent)
+
+            else:
+
+                newNode = pm.createNode(node["type"], name = node["name"])
+
+            self.m_nodes[node["name"]] = newNode
+
+        """--------------------"""
+
+    def setValues(self, _nodes):
+
+        """
+            Method: setValues
+                queues adding the dynamic attributes and setting every planned value
+        """
+
+        for node in _nodes:
+
+            newNode = self.m_nodes[node["name"]]
+
+            for attr in sorted(node["dynamic"]):
+
+                flags = node["dynamic"][attr]
+
+                self.m_modifier.addAttr(newNode, attr, at = flags["at"], dv = flags["dv"], hxv = flags["hxv"], hnv = flags["hnv"],
+                                        max = flags["max"], min = flags["min"], k = flags["k"])
+
+            for attr in sorted(node["attrs"]):
+
+                self.m_modifier.setAttr(newNode, attr, node["attrs"][attr])
+
+        """--------------------"""
+
+    def createIkHandles(self, _nodes):
+
+        """
+            Method: createIkHandles
+                makes the ik handles between the placed joints, then parents them
+                and sets their values, before the constraints are made against them
+        """
+
+        for node in _nodes:
+
+            create = node["create"]
+
+            handle = pm.ikHandle(
+                                name = node["name"],
+                                startJoint = self.m_nodes[create["startJoint"]],
+                                endEffector = self.m_nodes[create["endEffector"]],
+                                sol = create["sol"])[0]
+
+            if node["parent"] is not None:
+
+                self.m_modifier.reparent(handle, self.m_nodes[node["parent"]])
+
+            self.m_nodes[node["name"]] = handle
+
+        self.setValues(_nodes)
+        self.m_modifier.doIt()
+
+        """--------------------"""
+
+    def createConstraints(self, _nodes):
+
+        """
+            Method: createConstraints
+                makes the constraints with the flags they were planned with
+        """
+
+        for node in _nodes:
+
+            create = node["create"]
+            flags = dict(create["flags"])
+
+            #the world up object is stored by name
+
+            for flag in ("wuo", "worldUpObject"):
+
+                if flags.get(flag, "") not in ("", None):
+
+                    flags[flag] = self.m_nodes[flags[flag]]
+
+            targets = [self.m_nodes[target] for target in create["targets"]]
+
+            self.m_nodes[node["name"]] = getattr(pm, create["command"])(
+                                                        targets,
+                                                        self.m_nodes[create["driven"]],
+                                                        name = node["name"],
+                                                        **flags)
+
+        """--------------------"""
+
+    def connectPlugs(self, _connections):
+
+        """
+            Method: connectPlugs
+                queues the planned connections
+        """
+
+        for src, dst in _connections:
+
+            srcNode, srcAttr = src.split(".", 1)
+            dstNode, dstAttr = dst.split(".", 1)
+
+            self.m_modifier.connect(self.m_nodes[srcNode].attr(srcAttr), self.m_nodes[dstNode].attr(dstAttr))
+
+        """--------------------"""
+
+    def lockAttrs(self, _nodes):
+
+        """
+            Method: lockAttrs
+                queues locking the planned attributes
+        """
+
+        for node in _nodes:
+
+            for attr in node["locked"]:
+
+                self.m_modifier.lock(self.m_nodes[node["name"]], attr)
+
+        """--------------------"""
+
+#----------END-PlanExecutor-Class----------#
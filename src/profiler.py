@@ -0,0 +1,355 @@
+#----------Imports----------#
+
+import json
+import time
+import importlib
+import pRigging.src.scenebackend as psb
+
+pm = psb.pm
+
+#the build stages that are timed, as the module, class and method that runs
+#each one, methods inherited by other classes are timed for them too
+
+STAGES = [("pRigging.src.armrig", "ArmRig", "buildArmRig"),
+          ("pRigging.src.armrig", "ArmRig", "planArmRig"),
+          ("pRigging.src.armrig", "ArmRig", "executePlan"),
+          ("pRigging.src.jointchain", "JointChain", "genJoints"),
+          ("pRigging.src.jointchain", "JointChain", "genFromTopAndBottom"),
+          ("pRigging.src.fkchain", "FKChain", "genChain"),
+          ("pRigging.src.fkchain", "FKChain", "addGroupOverChain"),
+          ("pRigging.src.ikchain", "IKChain", "genChain"),
+          ("pRigging.src.ikchain", "IKChain", "addGroupOverChain"),
+          ("pRigging.src.bindchain", "BindChain", "genChain"),
+          ("pRigging.src.bindchain", "BindChain", "connectJointsToChains"),
+          ("pRigging.src.bindchain", "BindChain", "addGroupOverChain"),
+          ("pRigging.src.twistchain", "TwistChain", "genTwistChain"),
+          ("pRigging.src.control", "Control", "genCtrl"),
+          ("pRigging.src.control", "Control", "addGroups"),
+          ("pRigging.src.scenemodifier", "SceneModifier", "doIt")]
+
+#----------BuildProfiler-Class----------#
+
+class BuildProfiler(object):
+
+    """
+        Class: BuildProfiler
+            An opt-in profiler for the build pipeline. While it is running every
+            method in STAGES is wrapped so that each call records its wall time and
+            the number of scene commands it used, both in total and on its own
+            without the stages it called. Nothing is wrapped until it is started
+            and the original methods are put back when it stops, so builds that
+            aren't profiled pay nothing.
+
+            Scene commands are counted by the in-memory scene when building in
+            one, otherwise the calls made through the scene backend are counted,
+            so in maya the count is of the pymel commands and not of the calls
+            made on the nodes they return.
+
+        File: pRigging/src/profiler.py
+
+        Contains:
+            self.m_stages:          A dictionary of the totals for each stage, keyed
+                                    by the stage name, e.g. FKChain.genChain
+            self.m_stack:           The list of the stages currently running,
+                                    innermost last
+            self.m_originals:       A list of the class, method name and original
+                                    method of each method wrapped
+            self.m_time:            The wall time the profiler has run for
+            self.m_start:           The time it was last started, None when stopped
+
+        Imports:
+            json
+            time
+            importlib
+            pRigging.src.scenebackend as psb
+    """
+
+    def __init__(self):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+        """
+
+        self.m_stages = {}
+        self.m_stack = []
+        self.m_originals = []
+        self.m_time = 0.0
+        self.m_start = None
+
+        """--------------------"""
+
+    def start(self):
+
+        """
+            Method: start
+                wraps every build stage and starts counting scene commands, the
+                results are added to any from earlier runs until reset is called
+        """
+
+        if self.m_start is not None:
+
+            return
+
+        for moduleName, className, methodName in STAGES:
+
+            cls = getattr(importlib.import_module(moduleName), className)
+            original = cls.__dict__[methodName]
+
+            self.m_originals.append((cls, methodName, original))
+
+            setattr(cls, methodName, self.wrap(className + "." + methodName, original))
+
+        pm.countCalls(True)
+
+        self.m_start = time.time()
+
+        """--------------------"""
+
+    def stop(self):
+
+        """
+            Method: stop
+                puts back the original methods and stops counting
+        """
+
+        if self.m_start is None:
+
+            return
+
+        for cls, methodName, original in self.m_originals:
+
+            setattr(cls, methodName, original)
+
+        pm.countCalls(False)
+
+        self.m_originals = []
+        self.m_stack = []
+        self.m_time = self.m_time + time.time() - self.m_start
+        self.m_start = None
+
+        """--------------------"""
+
+    def reset(self):
+
+        """
+            Method: reset
+                clears the results
+        """
+
+        self.m_stages = {}
+        self.m_time = 0.0
+
+        """--------------------"""
+
+    def isRunning(self):
+
+        """
+            Method: isRunning
+                returns whether or not the profiler is running
+        """
+
+        return self.m_start is not None
+
+        """--------------------"""
+
+    def wrap(self, _stage, _method):
+
+        """
+            Method: wrap
+                returns a function that runs a method as the stage named
+        """
+
+        profiler = self
+
+        def stage(*args, **kwargs):
+
+            profiler.enterStage(_stage)
+
+            try:
+
+                return _method(*args, **kwargs)
+
+            finally:
+
+                profiler.exitStage()
+
+        stage.__name__ = _method.__name__
+        stage.__doc__ = _method.__doc__
+
+        return stage
+
+        """--------------------"""
+
+    def getCommandCount(self, _backend):
+
+        """
+            Method: getCommandCount
+                returns the number of scene commands used so far on a backend
+        """
+
+        if hasattr(_backend, "getCommandCount"):
+
+            return _backend.getCommandCount()
+
+        return pm.getCallCount(_backend)
+
+        """--------------------"""
+
+    def enterStage(self, _stage):
+
+        """
+            Method: enterStage
+                starts timing a stage
+        """
+
+        backend = pm.getBackend()
+
+        self.m_stack.append({"stage" : _stage,
+                             "backend" : backend,
+                             "start" : time.time(),
+                             "commands" : self.getCommandCount(backend),
+                             "childTime" : 0.0,
+                             "childCommands" : 0,
+                             "otherCommands" : 0})
+
+        """--------------------"""
+
+    def exitStage(self):
+
+        """
+            Method: exitStage
+                finishes timing the innermost stage and adds it to the totals, and
+                to the stage that called it
+        """
+
+        frame = self.m_stack.pop()
+
+        wallTime = time.time() - frame["start"]
+
+        #the commands used on the stage's own backend, plus any its stages used on
+        #another, e.g. the in-memory scene a plan is recorded in
+
+        commands = self.getCommandCount(frame["backend"]) - frame["commands"] + frame["otherCommands"]
+
+        if frame["stage"] not in self.m_stages:
+
+            self.m_stages[frame["stage"]] = {"calls" : 0, "time" : 0.0, "selfTime" : 0.0,
+                                             "commands" : 0, "selfCommands" : 0}
+
+        totals = self.m_stages[frame["stage"]]
+
+        totals["calls"] = totals["calls"] + 1
+        totals["time"] = totals["time"] + wallTime
+        totals["selfTime"] = totals["selfTime"] + wallTime - frame["childTime"]
+        totals["commands"] = totals["commands"] + commands
+        totals["selfCommands"] = totals["selfCommands"] + commands - frame["childCommands"]
+
+        if self.m_stack != []:
+
+            parent = self.m_stack[-1]
+
+            parent["childTime"] = parent["childTime"] + wallTime
+            parent["childCommands"] = parent["childCommands"] + commands
+
+            if parent["backend"] is not frame["backend"]:
+
+                parent["otherCommands"] = parent["otherCommands"] + commands
+
+        """--------------------"""
+
+    def getStages(self):
+
+        """
+            Method: getStages
+                returns the list of stage names, slowest first
+        """
+
+        return sorted(self.m_stages, key = lambda stage: -self.m_stages[stage]["time"])
+
+        """--------------------"""
+
+    def toData(self):
+
+        """
+            Method: toData
+                returns the results as a dictionary of plain data, e.g. to save as json
+        """
+
+        stages = []
+
+        for stage in self.getStages():
+
+            entry = dict(self.m_stages[stage])
+            entry["stage"] = stage
+
+            stages.append(entry)
+
+        return {"time" : self.m_time, "stages" : stages}
+
+        """--------------------"""
+
+    def save(self, _path):
+
+        """
+            Method: save
+                writes the results to a json file
+
+            Inputs:
+                _path:                  The file to write to
+        """
+
+        f = open(_path, "w")
+        json.dump(self.toData(), f, indent = 2, sort_keys = True)
+        f.close()
+
+        """--------------------"""
+
+    def formatReport(self):
+
+        """
+            Method: formatReport
+                returns the results as a table, one line per stage, slowest first
+        """
+
+        lines = ["%-34s %5s %10s %10s %8s %8s" % ("stage", "calls", "total ms", "self ms", "cmds", "self")]
+
+        for stage in self.getStages():
+
+            totals = self.m_stages[stage]
+
+            lines.append("%-34s %5d %10.2f %10.2f %8d %8d" % (
+                                stage, totals["calls"], totals["time"]*1000.0, totals["selfTime"]*1000.0,
+                                totals["commands"], totals["selfCommands"]))
+
+        lines.append("profiled for %.2f ms" % (self.m_time*1000.0))
+
+        return "\n".join(lines)
+
+        """--------------------"""
+
+    def getHelp(self, _result = None):
+
+        """
+            Method: getHelp
+                returns the results as a list for the help box
+
+            Inputs:
+                _result:                The list the build returned, its status and
+                                        title are kept, so a failed build still shows
+                                        as an error, and the results are added below
+                                        its message
+        """
+
+        text = self.formatReport()
+
+        if _result is None or _result == []:
+
+            return ["PROFILE", "BUILD PROFILE", text]
+
+        return [_result[0], _result[1], _result[2] + "\n\n" + text]
+
+        """--------------------"""
+
+#----------END-BuildProfiler-Class----------#
@@ -1,6 +1,12 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import importlib
+import pRigging.src.scenebackend as psb
+import pRigging.src.rigmath as prm
+import pRigging.src.naming as pnm
+import pRigging.src.buildsession as pbs
+
+pm = psb.pm
 
 #----------RiggingBase-Class----------#
 
@@ -17,7 +23,16 @@ class RiggingBase:
         Contains:
         
         Imports:
-            pymel.core as pm
+            importlib
+            pRigging.src.scenebackend as psb
+            pRigging.src.rigmath as prm
+            pRigging.src.naming as pnm
+            pRigging.src.buildsession as pbs
+            
+            pRigging.src.nodelist is only imported once a rig's nodes are compacted
+            or its state is set, and in-memory nodes and NodeLists are recognised
+            by their STATE_TYPE, see getStateType, so the gui starts without the
+            in-memory scene
     """
     
     def __init__(self):
@@ -51,97 +66,175 @@ class RiggingBase:
             On Exit:                    The extensions have been added to the name strings                      
         """
         
-        returnList = _names[:]
+        #the naming engine works on the names as strings so nodes can be passed in as well
         
-        #early breakout if no extension is supplied
-
-        if _ext == "":
-            
-            return returnList
+        return pnm.engine.render(_names, 0, [_ext])
+        
+        """--------------------"""
+        
+    def removeExtFromNames(self, _names):
+        
+        """
+            Method: removeExtToNames
+                a method which removes an extension from a name by searching for the last underscore
             
-        for i in range (0, (len(_names))):
+            Inputs:
+                self:                   A pointer to the instance of the RiggingBase class of which
+                                        this method is being called
+                _names:                 A list names to remove the extension from
             
-            #if neither the end of the name nor the start of the extension is an underscore
+            On Exit:                    The extensions have been removed from the name strings                       
+        """
             
-            if returnList[i][-1] != "_" and _ext[0] != "_":
-                
-                #add an underscore to the end of the name
-                
-                returnList[i] = returnList[i] + "_"
+        return pnm.engine.render(_names, 1)
+        
+        """--------------------"""
+        
+    def renameFromNames(self, _names, _strip = 0, _exts = []):
+        
+        """
+            Method: renameFromNames
+                a method which removes a number of extensions from the names and then adds
+                new ones, in a single call, e.g. to swap the joint extension of a whole
+                chain for a control extension
             
-            #if both have one
-                
-            if returnList[i][-1] == "_" and _ext[0] == "_":
-                
-                #remove the underscore from the start of the extension
-                
-                _ext = _ext[1:]
-                
-            #add the extension to the name
+            Inputs:
+                self:                   A pointer to the instance of the RiggingBase class of which
+                                        this method is being called
+                _names:                 A list names to rename
+                _strip:                 The number of extensions to remove, defaults to 0
+                _exts:                  A list of extensions to add, in order, defaults to none
             
-            returnList[i] = returnList[i]+_ext
-                            
-            #and then remove any long,name path influence from the name
+            On Exit:                    Returns the list of new names                       
+        """
+        
+        return pnm.engine.render(_names, _strip, _exts)
+        
+        """--------------------"""
+        
+    def reserveNames(self, _names):
+        
+        """
+            Method: reserveNames
+                a method which reserves the names for nodes about to be made in the name index
+                of the open build session, so a name already in use is numbered here, the same
+                way maya would rename the node, rather than by the scene
             
-            index =  returnList[i].rfind("|")
+            Inputs:
+                self:                   A pointer to the instance of the RiggingBase class of which
+                                        this method is being called
+                _names:                 A list of the names to reserve
             
-            #check that there was an uderscore and only edit the name if there was
+            On Exit:                    Returns the list of names the nodes should be given, the
+                                        names are returned unchanged if no session is open                     
+        """
+        
+        session = pbs.getSession()
+        
+        if session is None:
             
-            if index >= 0:
+            return [str(name) for name in _names]
             
-                #set the new name to be the old name except what was after the undercore
-                
-                returnList[i] = returnList[i][index:]
-        
-        #return the list of names
-
-        return returnList       
+        return session.getNameIndex().reserveAll(_names)
         
         """--------------------"""
         
-    def removeExtFromNames(self, _names):
+    def makeNode(self, _type, _name, _parent = None):
         
         """
-            Method: removeExtToNames
-                a method which removes an extension from a name by searching for the last underscore
+            Method: makeNode
+                a method which makes a node and records it in the creation ledger without
+                selecting it, unlike the group and joint commands, so where the node goes
+                never depends on the selection and making it never changes the selection
             
             Inputs:
                 self:                   A pointer to the instance of the RiggingBase class of which
                                         this method is being called
-                _names:                 A list names to remove the extension from
+                _type:                  The node type, e.g. transform for a group
+                _name:                  The name of the node, which should already be reserved
+                _parent:                The parent of the node, defaults to None for the world
             
-            On Exit:                    The extensions have been removed from the name strings                       
+            On Exit:                    Returns the node made                     
         """
+        
+        if _parent is None:
             
-        for i in range (0, (len(_names))):
-            
-            returnList = _names [:]
+            return self.recordNode(pm.createNode(_type, name = _name, skipSelect = True))
             
-            #find the last _ in the name
+        return self.recordNode(pm.createNode(_type, name = _name, parent = _parent, skipSelect = True))
+        
+        """--------------------"""
+        
+    def reparentNode(self, _node, _parent = None):
+        
+        """
+            Method: reparentNode
+                a method which parents a node under another and tells the open build
+                session, as the world matrices it has cached for the node and the nodes
+                under it are tracked under the nodes they were under
             
-            index =  returnList[i].rfind("_")
+            Inputs:
+                self:                   A pointer to the instance of the RiggingBase class of which
+                                        this method is being called
+                _node:                  The node to parent
+                _parent:                The new parent, defaults to None for the world
             
-            #check that there was an uderscore and only edit the name if there was
+            On Exit:                    The node has been parented                     
+        """
+        
+        if _parent is None:
             
-            if index >= 0:
+            _node.setParent(world = True)
             
-                #set the new name to be the old name except what was after the undercore
-                
-                returnList[i] = returnList[i][:index]
-                
-            #and then remove any long,name path influence from the name
+        else:
             
-            index =  returnList[i].rfind("|")
+            _node.setParent(_parent)
             
-            #check that there was an uderscore and only edit the name if there was
+        pbs.nodeMoved(_node)
+        
+        """--------------------"""
+        
+    def getWorldMatrix(self, _obj):
+        
+        """
+            Method: getWorldMatrix
+                a method which returns the world matrix of an object as a 4x4 list, read
+                through the cache of the open build session so a template joint is only
+                queried once however many times the build reads it
             
-            if index >= 0:
+            Inputs:
+                self:                   A pointer to the instance of the RiggingBase class of which
+                                        this method is being called
+                _obj:                   The object
             
-                #set the new name to be the old name except what was after the undercore
-                
-                returnList[i] = returnList[i][index:]
-
-        return returnList
+            On Exit:                    Returns the world matrix                     
+        """
+        
+        return pbs.getWorldMatrix(_obj)
+        
+        """--------------------"""
+        
+    def getWorldTranslation(self, _obj):
+        
+        """
+            Method: getWorldTranslation
+                a method which returns the world position of an object as a tuple, see
+                getWorldMatrix
+        """
+        
+        return tuple(self.getWorldMatrix(_obj)[3][:3])
+        
+        """--------------------"""
+        
+    def getWorldRotation(self, _obj):
+        
+        """
+            Method: getWorldRotation
+                a method which returns the world XYZ euler rotation of an object in degrees,
+                see getWorldMatrix
+        """
+        
+        return prm.matrixToEuler(prm.rotationPart(self.getWorldMatrix(_obj)))
         
         """--------------------"""
         
@@ -162,21 +255,31 @@ class RiggingBase:
             On Exit:                    the object has been moved and/or rotated to mach the destObj                       
         """
         
+        if not (_move or _orient):
+            
+            return
+            
+        #read the destination once for both
+        
+        matrix = self.getWorldMatrix(_destObj)
+        
         if _move:
             
             #move subject to dest
             
-            _subject.setTranslation(_destObj.getTranslation(space = 'world'), space = 'world')
+            _subject.setTranslation(tuple(matrix[3][:3]), space = 'world')
         
         if _orient:
             
             #rotate to match dest
             
-            _subject.setRotation(_destObj.getRotation(space = 'world'), space = 'world')       
+            _subject.setRotation(prm.matrixToEuler(prm.rotationPart(matrix)), space = 'world')       
+        
+        pbs.nodeMoved(_subject)
         
         """--------------------"""
     
-    def addGroupOverObj (self, _groupName, _obj, _orient = True):
+    def addGroupOverObj (self, _groupName, _obj, _orient = True, _modifier = None):
         
         """
             Method: transAndOrientObj
@@ -189,24 +292,28 @@ class RiggingBase:
                 _obj:                   The object to put the group over
                 _orient:                Whether or not to move the group to the same location as
                                         the object being grouped, defaults to true
+                _modifier:              An optional SceneModifier to queue parenting the object
+                                        to the group on, rather than parenting it straight away
             
             On Exit:                    A group has been added over the object                       
         """
-        #ensure the selection is clear
-        
-        pm.select(cl=True)
-        
         #make a new group with the name passed in
         
-        newGroup = pm.group(n= _groupName)
+        newGroup = self.makeNode("transform", self.reserveNames([_groupName])[0])
         
         #move and orient the group to the object that will be grouped
         
         self.transAndOrientObj(newGroup, _obj)
         
-        #and parent the object to the group
+        #and parent the object to the group, or queue it to be
         
-        _obj.setParent(newGroup)
+        if _modifier is not None:
+            
+            _modifier.reparent(_obj, newGroup)
+            
+        else:
+            
+            self.reparentNode(_obj, newGroup)
         
         #return the group   
         
@@ -271,7 +378,9 @@ class RiggingBase:
                         
         """
             Method: orientByAim
-                a method which sets the rotaition of an object by aim constraining it to another object
+                a method which sets the rotaition of an object so that it aims at another object,
+                the rotation is worked out from the world positions unless the aim constraint is
+                to be left in place, in which case a real constraint is made
             
             Inputs:
                 self:                   A pointer to the instance of the RiggingBase class of which
@@ -290,7 +399,8 @@ class RiggingBase:
                 _leaveAim:              Defaults to False, defines whether or not the aim constraint is left
                                         in existance 
             
-            On Exit:                The object has been rotated to match the settings                       
+            On Exit:                The object has been rotated to match the settings, the constraint
+                                    is returned if it was left in place
         """
         
         #set the world up type string
@@ -305,13 +415,29 @@ class RiggingBase:
             
             upType = "objectRotation"
             
-        constraint = ""
+        #if the constraint is not being kept, work the rotation out directly
+        #rather than making and deleting a constraint
+        
+        if not _leaveAim:
+            
+            objPos = _object.getTranslation(space = 'world')
+            aimVec = prm.sub(self.getWorldTranslation(pm.PyNode(_aimTarget)), objPos)
+            upVec = self.getWorldUpVector(upType, objPos, _upObj, _upAxis)
+            
+            rotation = prm.aimMatrix(aimVec, upVec, _aimAxis, _upAxis)
+            
+            _object.setRotation(prm.matrixToEuler(rotation), space = 'world')
+            pbs.nodeMoved(_object)
+            
+            return
             
-        #make the constraint
+        #otherwise make the constraint, which turns the object
+        
+        pbs.nodeMoved(_object)
         
         if _upObj == "":
             
-            constraint= pm.aimConstraint(
+            constraint= self.recordNode(pm.aimConstraint(
                                 _aimTarget,
                                 _object, 
                                 mo = False, 
@@ -319,11 +445,11 @@ class RiggingBase:
                                 u = _upAxis, 
                                 wu = _upAxis, 
                                 wut = upType
-                                )
+                                ))
                                 
         else:
             
-            constraint= pm.aimConstraint(
+            constraint= self.recordNode(pm.aimConstraint(
                                 _aimTarget,
                                 _object, 
                                 mo = False, 
@@ -332,14 +458,48 @@ class RiggingBase:
                                 wu = _upAxis,
                                 wuo = _upObj, 
                                 wut = upType
-                                )
+                                ))
+        
+        return constraint
+                          
+        """--------------------"""
         
-        #if the constraint is meant to be deleted
+    def getWorldUpVector(self, _upType, _objPos, _upObj, _upAxis):
         
-        if not _leaveAim:
+        """
+            Method: getWorldUpVector
+                a method which returns the world up vector an aim constraint would use
             
-            pm.delete(constraint)
-                          
+            Inputs:
+                self:                   A pointer to the instance of the RiggingBase class of which
+                                        this method is being called
+                _upType:                The world up type, "scene", "object" or "objectRotation"
+                _objPos:                The world position of the object being aimed
+                _upObj:                 The world up object, ignored for the scene up type
+                _upAxis:                The up axis, used as the world up vector of the
+                                        objectRotation up type
+            
+            On Exit:                    Returns the up vector as a tuple                       
+        """
+        
+        #aim at the up object
+        
+        if _upType == "object" and _upObj != "":
+            
+            return prm.sub(self.getWorldTranslation(pm.PyNode(_upObj)), _objPos)
+            
+        #take the up axis into the space of the up object
+        
+        elif _upType == "objectRotation" and _upObj != "":
+            
+            upMatrix = self.getWorldMatrix(pm.PyNode(_upObj))
+            
+            return prm.transformVector(_upAxis, prm.rotationPart(upMatrix))
+            
+        #otherwise use the scene up
+        
+        return (0.0, 1.0, 0.0)
+        
         """--------------------"""
         
     def addConstraint(self, _constraint, _drivenObj, _driverList,
@@ -409,6 +569,19 @@ class RiggingBase:
             rotSet = _rx or _ry or _rz
             sclSet = _sx or _sy or _sz
             
+            #the constrained object can move, and a pole vector moves the chain
+            #its handle drives, so the world matrices read from them are dropped
+            
+            if _constraint == "poleVector":
+                
+                for startJoint in _drivenObj.attr("startJoint").inputs():
+                    
+                    pbs.nodeMoved(startJoint)
+                
+            else:
+                
+                pbs.nodeMoved(_drivenObj)
+            
             #switch through constraint types
             
             if (_constraint == "parent" and (doTrans or doRot)):
@@ -478,7 +651,7 @@ class RiggingBase:
     
                 #set up a parent constraint between the control and the template object
                                 
-                return pm.parentConstraint(_driverList,_drivenObj, mo = True, st = stList, sr = srList)
+                return self.recordNode(pm.parentConstraint(_driverList,_drivenObj, mo = True, st = stList, sr = srList))
             
             #if orient constraint is chosen and the constraint is meant to be made
             
@@ -508,7 +681,7 @@ class RiggingBase:
                     
                 #set up an orient constraint between the control and the template object
                 
-                return pm.orientConstraint(_driverList,_drivenObj, mo = True, sk = srList)
+                return self.recordNode(pm.orientConstraint(_driverList,_drivenObj, mo = True, sk = srList))
 
             elif (_constraint == "point" and doTrans):
                 
@@ -535,7 +708,7 @@ class RiggingBase:
                             
                 #set up a parent constraint between the control and the template object
                 
-                return pm.pointConstraint(_driverList,_drivenObj, mo = True, sk = stList)
+                return self.recordNode(pm.pointConstraint(_driverList,_drivenObj, mo = True, sk = stList))
 
             elif (_constraint == "scale" and doScale):
                 
@@ -562,7 +735,7 @@ class RiggingBase:
                                     
                 #set up a parent constraint between the control and the template object
                 
-                return pm.scaleConstraint(_driverList,_drivenObj, mo = True, sk = ssList)
+                return self.recordNode(pm.scaleConstraint(_driverList,_drivenObj, mo = True, sk = ssList))
             
             #for the polevector constraint
             
@@ -570,7 +743,7 @@ class RiggingBase:
                 
                 #set up a parent constraint between the control and the template object
                 
-                return pm.poleVectorConstraint(_driverList,_drivenObj)
+                return self.recordNode(pm.poleVectorConstraint(_driverList,_drivenObj))
                 
         """--------------------"""
         
@@ -590,92 +763,612 @@ class RiggingBase:
             
         """
         
-        #set up the return list
+        return self.sortHierarchy(_objList)[0]
+        
+        """--------------------"""
+        
+    def sortHierarchy(self, _objList):
+        
+        """
+            Method: sortHierarchy
+                A method to sort the objects in a list into hierarchy order, parent first,
+                and find the object that breaks the hierarchy if they are not an unbroken
+                chain. Each object's full path is queried once and the chain is then
+                walked from its root, rather than comparing every pair of objects
+                
+            Inputs:
+                _objList:               The list of objects to sort
+                                        
+            On Exit:                    Returns a tuple of the sorted list and None, or
+                                        an empty list and the object that breaks the
+                                        hierarchy, either one with a missing parent,
+                                        a second child of the same parent or a repeat,
+                                        None if the list was empty                 
+            
+        """
+        
+        #map each object's full path to the object, and each parent path
+        #to the path of its child in the list
         
-        returnList = _objList     
+        paths = []
+        objects = {}
+        children = {}
         
-        #cycle through for each element except for one
+        for obj in _objList:
+            
+            path = obj.longName()
+            
+            if path in objects:
                 
-        for i in range(0, len(returnList)-1):
+                return ([], obj)
+                
+            paths.append(path)
+            objects[path] = obj
+            
+        roots = []
+        
+        for path in paths:
             
-            #then cycle through each element except for one, with
-            #one less each cycle
+            parentPath = path.rsplit("|", 1)[0]
             
-            j = 0
-            while(j < len(returnList)-(i+1)): 
+            #if the parent isn't in the list this is a root
             
-                #create a list of all the children and parents of the element one above the one currently being checked
+            if parentPath not in objects:
                 
-                children = returnList[j+1].listRelatives(ad = True)
-                parents = returnList[j+1].listRelatives(ap = True)
+                roots.append(path)
                 
-                #set up a variable to store the number of parents
+            #otherwise the parent can only have one child in the list
                 
-                numparents = len(parents)
-                checkVal = numparents - 1
+            elif parentPath in children:
                 
-                #if there was a parent
+                return ([], objects[path])
                 
-                if numparents != 0:
+            else:
+                
+                children[parentPath] = path
+                
+        #there can only be one root, the others have a missing parent,
+        #report one below the top most root if there is one
+        
+        if len(roots) > 1:
+            
+            top = min(roots, key = lambda path: path.count("|"))
+            
+            for path in roots:
+                
+                if path != top and path.startswith(top + "|"):
                     
-                    #keep checking until the check value catches up, indicating the
-                    #top most parent, and adding the parents to the list
+                    return ([], objects[path])
                     
-                    while numparents > checkVal:
-                        parents = parents + parents[-1].listRelatives(ap = True)
-                        numparents = len(parents) 
-                        checkVal = checkVal+1
+            roots.remove(top)
+            
+            return ([], objects[roots[0]])
+            
+        #then walk down the chain from the root
+        
+        returnList = []
+        path = roots[0] if roots != [] else None
+        
+        while path is not None:
+            
+            returnList.append(objects[path])
+            path = children.get(path)
+            
+        return (returnList, None)
+        
+        """--------------------"""
+        
+    def rebindNodes(self, _nodeMap, _visited = None):
+        
+        """
+            Method: rebindNodes
+                A method to swap the in-memory scene nodes held by the object, and by
+                any objects it holds, for the scene nodes they were made real as, used
+                once a recorded build plan has been executed
+                
+            Inputs:
+                _nodeMap:               A dictionary of the in-memory node names to the
+                                        scene nodes
+                _visited:               The ids of the objects already rebound, used
+                                        when rebinding the objects held
+                                        
+            On Exit:                    The object holds the scene nodes
+        """
+        
+        if _visited is None:
+            
+            _visited = set()
+            
+        if id(self) in _visited:
+            
+            return
+            
+        _visited.add(id(self))
+        
+        for key in list(self.__dict__.keys()):
+            
+            self.__dict__[key] = self.rebindValue(self.__dict__[key], _nodeMap, _visited)
+            
+        """--------------------"""
+        
+    def rebindValue(self, _value, _nodeMap, _visited):
+        
+        """
+            Method: rebindValue
+                A method to return a value with any in-memory nodes or plugs in it
+                swapped for their scene counterparts, see rebindNodes
+        """
+        
+        stateType = getStateType(_value)
+        
+        if stateType == "node":
+            
+            return _nodeMap.get(_value.m_name, _value)
+            
+        if stateType == "plug":
+            
+            node = _nodeMap.get(_value.m_node.m_name)
+            
+            if node is None:
+                
+                return _value
+                
+            return node.attr(_value.m_name)
+            
+        if isinstance(_value, list):
+            
+            return [self.rebindValue(value, _nodeMap, _visited) for value in _value]
+            
+        if stateType == "nodeList":
+            
+            return type(_value)(self.rebindValue(_value.getNodes(), _nodeMap, _visited))
+            
+        if isinstance(_value, RiggingBase):
+            
+            _value.rebindNodes(_nodeMap, _visited)
+            
+        return _value
+        
+        """--------------------"""
+        
+    def getState(self, _skip = []):
+        
+        """
+            Method: getState
+                A method to return the object, and every object it holds, as plain data,
+                e.g. to store alongside a build plan. The in-memory nodes held become
+                their names, so it is only used on an object holding a planned build
+                
+            Inputs:
+                _skip:                  The names of attributes of the object to leave
+                                        out, e.g. ones that aren't plain data
+                                        
+            On Exit:                    Returns a dictionary holding a list of every
+                                        object, the object itself first
+        """
+        
+        objects = []
+        
+        self.addState(objects, {}, _skip)
+        
+        return {"objects" : objects}
+        
+        """--------------------"""
+        
+    def addState(self, _objects, _indices, _skip = []):
+        
+        """
+            Method: addState
+                A method to add the object to the list of object states, see getState
+                
+            On Exit:                    Returns the index of the object in the list
+        """
+        
+        if id(self) in _indices:
+            
+            return _indices[id(self)]
+            
+        _indices[id(self)] = len(_objects)
+        
+        state = {"class" : self.__class__.__module__ + "." + self.__class__.__name__, "attrs" : {}}
+        
+        _objects.append(state)
+        
+        for key, value in self.__dict__.items():
+            
+            if key not in _skip:
+                
+                state["attrs"][key] = self.getStateValue(value, _objects, _indices)
+                
+        return _indices[id(self)]
+        
+        """--------------------"""
+        
+    def getStateValue(self, _value, _objects, _indices):
+        
+        """
+            Method: getStateValue
+                A method to return a value as plain data, nodes, plugs, objects and
+                dictionaries are stored in a dictionary saying what they are, see
+                getState
+        """
+        
+        stateType = getStateType(_value)
+        
+        if stateType == "node":
+            
+            return {"node" : _value.m_name}
+            
+        if stateType == "plug":
+            
+            return {"plug" : "%s.%s" % (_value.m_node.m_name, _value.m_name)}
+            
+        if isinstance(_value, RiggingBase):
+            
+            return {"object" : _value.addState(_objects, _indices)}
+            
+        if isinstance(_value, (list, tuple)):
+            
+            return [self.getStateValue(value, _objects, _indices) for value in _value]
+            
+        if stateType == "nodeList":
+            
+            return {"nodeList" : self.getStateValue(_value.getNodes(), _objects, _indices)}
+            
+        if isinstance(_value, dict):
+            
+            return {"dict" : dict([(key, self.getStateValue(value, _objects, _indices)) for key, value in _value.items()])}
+            
+        return _value
+        
+        """--------------------"""
+        
+    def setState(self, _state, _nodeMap):
+        
+        """
+            Method: setState
+                A method to give the object, and the objects it holds, the state
+                returned by getState, with the nodes swapped for the scene nodes they
+                were made real as
+                
+            Inputs:
+                _state:                 The state returned by getState
+                _nodeMap:               A dictionary of the node names to the scene
+                                        nodes, any not in it are found by name
+        """
+        
+        #the object itself is first, the objects it holds are made new
+        
+        objects = [self]
+        
+        for state in _state["objects"][1:]:
+            
+            moduleName, className = state["class"].rsplit(".", 1)
+            
+            objects.append(getattr(importlib.import_module(moduleName), className)())
+            
+        for i in range(0, len(objects)):
+            
+            attrs = _state["objects"][i]["attrs"]
+            
+            for key in attrs:
+                
+                objects[i].__dict__[key] = self.setStateValue(attrs[key], objects, _nodeMap)
+                
+        """--------------------"""
+        
+    def setStateValue(self, _value, _objects, _nodeMap):
+        
+        """
+            Method: setStateValue
+                A method to return a value stored by getStateValue as it was, see
+                setState
+        """
+        
+        if isinstance(_value, list):
+            
+            return [self.setStateValue(value, _objects, _nodeMap) for value in _value]
+            
+        if not isinstance(_value, dict):
+            
+            return _value
+            
+        if "node" in _value:
+            
+            node = _nodeMap.get(_value["node"])
+            
+            if node is None:
+                
+                node = pm.PyNode(_value["node"])
+                
+            return node
+            
+        if "plug" in _value:
+            
+            nodeName, attrName = _value["plug"].split(".", 1)
+            
+            return self.setStateValue({"node" : nodeName}, _objects, _nodeMap).attr(attrName)
+            
+        if "object" in _value:
+            
+            return _objects[_value["object"]]
+            
+        if "nodeList" in _value:
+            
+            import pRigging.src.nodelist as pnl
+            
+            return pnl.NodeList(self.setStateValue(_value["nodeList"], _objects, _nodeMap))
+            
+        return dict([(key, self.setStateValue(value, _objects, _nodeMap)) for key, value in _value["dict"].items()])
+        
+        """--------------------"""
+        
+    def recordNode(self, _node):
+        
+        """
+            Method: recordNode
+                A method to add a node the object has just made to its creation ledger,
+                so that clearing the object can delete everything it made at once
+                
+            Inputs:
+                _node:                  The node made
+                                        
+            On Exit:                    Returns the node, so the call can wrap the
+                                        command that made it
+        """
+        
+        #objects that don't make nodes often, e.g. the tabs, only get a ledger
+        #the first time they do, as a NodeList so compactNodes covers it
+        
+        if "m_ledger" not in self.__dict__:
+            
+            import pRigging.src.nodelist as pnl
+            
+            self.m_ledger = pnl.NodeList()
+            
+        self.m_ledger.append(_node)
+        
+        return _node
+        
+        """--------------------"""
+        
+    def getLedger(self, _visited = None):
+        
+        """
+            Method: getLedger
+                A method to return every node in the creation ledger of the object and
+                of every object it holds, e.g. the chains and controls of a rig, that
+                still exists
+                
+            Inputs:
+                _visited:               The ids of the objects already gathered, used
+                                        when gathering from the objects held
+        """
+        
+        if _visited is None:
+            
+            _visited = set()
+            
+        if id(self) in _visited:
+            
+            return []
+            
+        _visited.add(id(self))
+        
+        #the nodes deleted since they were recorded, e.g. by hand, are left out
+        
+        nodes = []
+        
+        if "m_ledger" in self.__dict__:
+            
+            nodes = self.m_ledger.getExisting()
+        
+        for value in self.__dict__.values():
+            
+            if not isinstance(value, list):
                 
-                #if the current element is a child of the one the lists relate to
+                value = [value]
                 
-                if returnList[j] in children:
+            for item in value:
+                
+                if isinstance(item, RiggingBase):
                     
-                    #swap the elements so the one higher up in the hierarchy has a lower index 
-                    #(closer to the front)
+                    nodes.extend(item.getLedger(_visited))
                     
-                    temp = returnList[j] 
-                    returnList[j] = returnList[j+1]
-                    returnList[j+1] = temp    
+        return nodes
+        
+        """--------------------"""
+        
+    def compactNodes(self):
+        
+        """
+            Method: compactNodes
+                A method to compact the NodeLists of the object and of every object it holds,
+                e.g. once a rig is built and is only being kept, the uuids of all of their
+                nodes are found with a single ls, see NodeList
+        """
+        
+        import pRigging.src.nodelist as pnl
+        
+        pnl.compactLists(self.getNodeLists())
+        
+        """--------------------"""
+        
+    def getNodeLists(self, _visited = None):
+        
+        """
+            Method: getNodeLists
+                A method to return every NodeList held by the object and by every object
+                it holds
+                
+            Inputs:
+                _visited:               The ids of the objects already gathered, used
+                                        when gathering from the objects held
+        """
+        
+        if _visited is None:
+            
+            _visited = set()
+            
+        if id(self) in _visited:
+            
+            return []
+            
+        _visited.add(id(self))
+        
+        nodeLists = []
+        
+        for value in self.__dict__.values():
+            
+            if getStateType(value) == "nodeList":
+                
+                nodeLists.append(value)
+                
+                continue
+                
+            if not isinstance(value, list):
                 
-                #increment i
+                value = [value]
                 
-                j = j+1 
+            for item in value:
+                
+                if isinstance(item, RiggingBase):
+                    
+                    nodeLists.extend(item.getNodeLists(_visited))
+                    
+        return nodeLists
+        
+        """--------------------"""
+        
+    def deleteLedger(self):
+        
+        """
+            Method: deleteLedger
+                A method to delete every node made by the object and the objects it holds
+                in a single delete, then empty their ledgers, nodes already deleted, e.g.
+                by hand, are skipped
+        """
+        
+        nodes = self.getLedger()
+        
+        if nodes != []:
+            
+            #free their names in the open session, if there is one
+            
+            session = pbs.getSession()
+            
+            if session is not None:
                 
-        #then ensure an unbroken hierarchy
+                session.releaseNames([str(node) for node in nodes])
+            
+            pm.delete(nodes)
+            
+        self.emptyLedger()
+        
+        """--------------------"""
+        
+    def emptyLedger(self, _visited = None):
         
-        result = True
+        """
+            Method: emptyLedger
+                A method to empty the creation ledger of the object and of every object
+                it holds, without deleting anything
+        """
         
-        #for each element appart from the last
+        if _visited is None:
+            
+            _visited = set()
+            
+        if id(self) in _visited:
+            
+            return
+            
+        _visited.add(id(self))
         
-        for i in range (0,len(returnList)-1):
+        if "m_ledger" in self.__dict__:
+            
+            import pRigging.src.nodelist as pnl
             
-            #if it isnt the first one
+            self.m_ledger = pnl.NodeList()
             
-            if i != 0:
+        for value in list(self.__dict__.values()):
+            
+            if not isinstance(value, list):
                 
-                #check that  the one bfore is it's direct parent
+                value = [value]
                 
-                if returnList[i].getParent() != returnList[i-1]:
+            for item in value:
                 
-                    result = False
+                if isinstance(item, RiggingBase):
+                    
+                    item.emptyLedger(_visited)
                     
-            #for all, check that the one after is a direct child
+        """--------------------"""
+        
+    def startUndo(self, _name, _fastBuild = False):
+        
+        """
+            Method: startUndo
+                A method to start a build as a single named undo chunk, or with a fast
+                build to stop recording undo altogether, leaving the queue as it is, in
+                which case the build is undone with clear rather than undo
+                
+            Inputs:
+                _name:                  The name of the undo chunk
+                _fastBuild:             Whether or not to stop recording undo, defaults
+                                        to False
+                                        
+            On Exit:                    Returns the undo state to pass to endUndo
+        """
+        
+        if _fastBuild:
+            
+            state = pm.undoInfo(q = True, stateWithoutFlush = True)
+            pm.undoInfo(stateWithoutFlush = False)
             
-            if not returnList[i+1] in returnList[i].getChildren():
+            return state
             
-                result = False
+        pm.undoInfo(openChunk = True, chunkName = _name)
+        
+        return None
+        
+        """--------------------"""
+        
+    def endUndo(self, _state, _fastBuild = False):
+        
+        """
+            Method: endUndo
+                A method to end a build started with startUndo, closing its undo chunk
+                or putting back the undo state
                 
-        #if the result is True, return the list, otherwise return an
-        #empty list
+            Inputs:
+                _state:                 The state returned by startUndo
+                _fastBuild:             Whether or not the build was a fast build
+        """
         
-        if result:
+        if _fastBuild:
+            
+            pm.undoInfo(stateWithoutFlush = _state)
             
-            return returnList
-        
         else:
             
-            return []
-        
+            pm.undoInfo(closeChunk = True)
+            
         """--------------------"""
        
 #----------END-RiggingBase-Class----------#  
+
+def getStateType(_value):
+    
+    """
+        Function: getStateType
+            returns what a value is stored as in the state of a rig, "node" or
+            "plug" for in-memory nodes and plugs and "nodeList" for a NodeList,
+            None for anything else. It is read from the class, as reading it from
+            a pymel node would look for a maya attribute of that name
+    """
+    
+    return getattr(type(_value), "STATE_TYPE", None)
+    
+    """--------------------"""
+
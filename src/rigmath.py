@@ -0,0 +1,423 @@
+"""
+    Module: rigmath
+        Pure python vector and matrix helpers used by the toolset wherever a
+        transformation can be worked out without asking the scene. Matrices
+        follow the maya convention of row vectors, so a point is transformed
+        by p * M and a child's world matrix is local * parentWorld.
+
+    File: pRigging/src/rigmath.py
+
+    Contains:
+        Vector and 3x3/4x4 matrix helpers, XYZ euler conversion and the aim
+        matrix solver.
+
+    Imports:
+        math
+"""
+
+#----------Imports----------#
+
+import math
+
+#----------Vector-Functions----------#
+
+def add(_a, _b):
+
+    """
+        Function: add
+            returns the sum of two 3d vectors
+    """
+
+    return (_a[0]+_b[0], _a[1]+_b[1], _a[2]+_b[2])
+
+    """--------------------"""
+
+def sub(_a, _b):
+
+    """
+        Function: sub
+            returns _a minus _b for two 3d vectors
+    """
+
+    return (_a[0]-_b[0], _a[1]-_b[1], _a[2]-_b[2])
+
+    """--------------------"""
+
+def scale(_a, _s):
+
+    """
+        Function: scale
+            returns the 3d vector _a multiplied by the scalar _s
+    """
+
+    return (_a[0]*_s, _a[1]*_s, _a[2]*_s)
+
+    """--------------------"""
+
+def dot(_a, _b):
+
+    """
+        Function: dot
+            returns the dot product of two 3d vectors
+    """
+
+    return _a[0]*_b[0] + _a[1]*_b[1] + _a[2]*_b[2]
+
+    """--------------------"""
+
+def cross(_a, _b):
+
+    """
+        Function: cross
+            returns the cross product of two 3d vectors
+    """
+
+    return (_a[1]*_b[2] - _a[2]*_b[1],
+            _a[2]*_b[0] - _a[0]*_b[2],
+            _a[0]*_b[1] - _a[1]*_b[0])
+
+    """--------------------"""
+
+def length(_a):
+
+    """
+        Function: length
+            returns the length of a 3d vector
+    """
+
+    return math.sqrt(dot(_a, _a))
+
+    """--------------------"""
+
+def normalize(_a):
+
+    """
+        Function: normalize
+            returns the unit length version of a 3d vector, a zero vector
+            is returned unchanged
+    """
+
+    l = length(_a)
+
+    if l < 1e-12:
+
+        return (0.0, 0.0, 0.0)
+
+    return (_a[0]/l, _a[1]/l, _a[2]/l)
+
+    """--------------------"""
+
+def lerp(_a, _b, _t):
+
+    """
+        Function: lerp
+            returns the point the proportion _t of the way from _a to _b
+    """
+
+    return (_a[0] + (_b[0]-_a[0])*_t,
+            _a[1] + (_b[1]-_a[1])*_t,
+            _a[2] + (_b[2]-_a[2])*_t)
+
+    """--------------------"""
+
+#----------Matrix-Functions----------#
+
+def identity3():
+
+    """
+        Function: identity3
+            returns a 3x3 identity matrix
+    """
+
+    return [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
+    """--------------------"""
+
+def identity4():
+
+    """
+        Function: identity4
+            returns a 4x4 identity matrix
+    """
+
+    return [[1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0]]
+
+    """--------------------"""
+
+def mulMatrix3(_a, _b):
+
+    """
+        Function: mulMatrix3
+            returns the product of two 3x3 matrices, _a * _b
+    """
+
+    return [[_a[i][0]*_b[0][j] + _a[i][1]*_b[1][j] + _a[i][2]*_b[2][j] for j in range(3)]
+            for i in range(3)]
+
+    """--------------------"""
+
+def mulMatrix4(_a, _b):
+
+    """
+        Function: mulMatrix4
+            returns the product of two 4x4 matrices, _a * _b
+    """
+
+    return [[_a[i][0]*_b[0][j] + _a[i][1]*_b[1][j] + _a[i][2]*_b[2][j] + _a[i][3]*_b[3][j]
+             for j in range(4)] for i in range(4)]
+
+    """--------------------"""
+
+def transpose3(_m):
+
+    """
+        Function: transpose3
+            returns the transpose of a 3x3 matrix, which is also the inverse of a
+            pure rotation matrix
+    """
+
+    return [[_m[0][0], _m[1][0], _m[2][0]],
+            [_m[0][1], _m[1][1], _m[2][1]],
+            [_m[0][2], _m[1][2], _m[2][2]]]
+
+    """--------------------"""
+
+def inverse3(_m):
+
+    """
+        Function: inverse3
+            returns the inverse of a general 3x3 matrix, singular matrices return
+            the identity
+    """
+
+    a, b, c = _m[0]
+    d, e, f = _m[1]
+    g, h, i = _m[2]
+
+    det = a*(e*i - f*h) - b*(d*i - f*g) + c*(d*h - e*g)
+
+    if abs(det) < 1e-12:
+
+        return identity3()
+
+    inv = 1.0/det
+
+    return [[(e*i - f*h)*inv, (c*h - b*i)*inv, (b*f - c*e)*inv],
+            [(f*g - d*i)*inv, (a*i - c*g)*inv, (c*d - a*f)*inv],
+            [(d*h - e*g)*inv, (b*g - a*h)*inv, (a*e - b*d)*inv]]
+
+    """--------------------"""
+
+def inverse4(_m):
+
+    """
+        Function: inverse4
+            returns the inverse of an affine 4x4 matrix (one with a last column
+            of 0,0,0,1)
+    """
+
+    inv = inverse3([_m[0][:3], _m[1][:3], _m[2][:3]])
+    t = _m[3][:3]
+
+    #the inverse translation is -t * inverse(upper 3x3)
+
+    it = [-(t[0]*inv[0][j] + t[1]*inv[1][j] + t[2]*inv[2][j]) for j in range(3)]
+
+    return [inv[0] + [0.0], inv[1] + [0.0], inv[2] + [0.0], it + [1.0]]
+
+    """--------------------"""
+
+def composeMatrix(_translate, _rotation, _scale = (1.0, 1.0, 1.0)):
+
+    """
+        Function: composeMatrix
+            builds a 4x4 matrix from a translation, a 3x3 rotation matrix and a scale,
+            scale is applied first, then rotation, then translation
+    """
+
+    return [[_rotation[0][0]*_scale[0], _rotation[0][1]*_scale[0], _rotation[0][2]*_scale[0], 0.0],
+            [_rotation[1][0]*_scale[1], _rotation[1][1]*_scale[1], _rotation[1][2]*_scale[1], 0.0],
+            [_rotation[2][0]*_scale[2], _rotation[2][1]*_scale[2], _rotation[2][2]*_scale[2], 0.0],
+            [float(_translate[0]), float(_translate[1]), float(_translate[2]), 1.0]]
+
+    """--------------------"""
+
+def decomposeMatrix(_m):
+
+    """
+        Function: decomposeMatrix
+            splits a 4x4 matrix without shear into a translation, a 3x3 rotation
+            matrix and a scale, returned as a tuple in that order
+    """
+
+    scl = (length(_m[0][:3]), length(_m[1][:3]), length(_m[2][:3]))
+
+    rot = [list(normalize(_m[0][:3])), list(normalize(_m[1][:3])), list(normalize(_m[2][:3]))]
+
+    return (tuple(_m[3][:3]), rot, scl)
+
+    """--------------------"""
+
+def toMatrix4(_m):
+
+    """
+        Function: toMatrix4
+            copies any 4x4 indexable matrix, e.g. a pymel Matrix, into nested lists
+    """
+
+    return [[float(_m[i][j]) for j in range(4)] for i in range(4)]
+
+    """--------------------"""
+
+def rotationPart(_m):
+
+    """
+        Function: rotationPart
+            returns the normalised 3x3 rotation of a 4x4 matrix
+    """
+
+    return decomposeMatrix(_m)[1]
+
+    """--------------------"""
+
+def transformPoint(_p, _m):
+
+    """
+        Function: transformPoint
+            returns the point _p transformed by the 4x4 matrix _m
+    """
+
+    return tuple(_p[0]*_m[0][j] + _p[1]*_m[1][j] + _p[2]*_m[2][j] + _m[3][j] for j in range(3))
+
+    """--------------------"""
+
+def transformVector(_v, _m):
+
+    """
+        Function: transformVector
+            returns the direction _v transformed by the upper 3x3 of the matrix _m
+    """
+
+    return tuple(_v[0]*_m[0][j] + _v[1]*_m[1][j] + _v[2]*_m[2][j] for j in range(3))
+
+    """--------------------"""
+
+#----------Euler-Functions----------#
+
+def eulerToMatrix(_rotation):
+
+    """
+        Function: eulerToMatrix
+            converts an XYZ rotate order euler rotation, in degrees, into a 3x3 matrix
+    """
+
+    x, y, z = [math.radians(a) for a in _rotation]
+
+    cx, sx = math.cos(x), math.sin(x)
+    cy, sy = math.cos(y), math.sin(y)
+    cz, sz = math.cos(z), math.sin(z)
+
+    #the rows of Rx * Ry * Rz
+
+    return [[cy*cz, cy*sz, -sy],
+            [sx*sy*cz - cx*sz, sx*sy*sz + cx*cz, sx*cy],
+            [cx*sy*cz + sx*sz, cx*sy*sz - sx*cz, cx*cy]]
+
+    """--------------------"""
+
+def matrixToEuler(_m):
+
+    """
+        Function: matrixToEuler
+            converts a 3x3 rotation matrix into an XYZ rotate order euler rotation in
+            degrees, the inverse of eulerToMatrix
+    """
+
+    sy = max(-1.0, min(1.0, -_m[0][2]))
+    y = math.asin(sy)
+
+    #away from gimbal lock both x and z can be read directly
+
+    if abs(sy) < 0.9999999:
+
+        x = math.atan2(_m[1][2], _m[2][2])
+        z = math.atan2(_m[0][1], _m[0][0])
+
+    #otherwise z is folded into x
+
+    else:
+
+        x = math.atan2(-_m[2][1], _m[1][1])
+        z = 0.0
+
+    return (math.degrees(x), math.degrees(y), math.degrees(z))
+
+    """--------------------"""
+
+#----------Aim-Functions----------#
+
+def aimMatrix(_aimVector, _upVector, _aimAxis = (1.0, 0.0, 0.0), _upAxis = (0.0, 1.0, 0.0)):
+
+    """
+        Function: aimMatrix
+            solves the rotation an aim constraint would give, the local _aimAxis is
+            pointed along _aimVector and the local _upAxis is turned as close to
+            _upVector as the aim allows
+
+        Inputs:
+            _aimVector:             The world space direction to aim along
+            _upVector:              The world space up vector
+            _aimAxis:               The local axis that is aimed
+            _upAxis:                The local axis that is pointed up
+
+        On Exit:                    Returns the world space 3x3 rotation matrix
+    """
+
+    #set up the world space basis
+
+    aim = normalize(_aimVector)
+
+    if aim == (0.0, 0.0, 0.0):
+
+        return identity3()
+
+    up = sub(_upVector, scale(aim, dot(_upVector, aim)))
+
+    #if the up vector is parallel to the aim, pick any perpendicular
+
+    if length(up) < 1e-9:
+
+        up = cross(aim, (0.0, 0.0, 1.0))
+
+        if length(up) < 1e-9:
+
+            up = cross(aim, (1.0, 0.0, 0.0))
+
+    up = normalize(up)
+
+    #then the local basis, the up axis is made perpendicular to the aim axis
+
+    localAim = normalize(_aimAxis)
+    localUp = normalize(sub(_upAxis, scale(localAim, dot(_upAxis, localAim))))
+
+    if localUp == (0.0, 0.0, 0.0):
+
+        localUp = normalize(cross(localAim, (0.0, 0.0, 1.0)))
+
+        if localUp == (0.0, 0.0, 0.0):
+
+            localUp = normalize(cross(localAim, (1.0, 0.0, 0.0)))
+
+    localBasis = [list(localAim), list(localUp), list(cross(localAim, localUp))]
+    worldBasis = [list(aim), list(up), list(cross(aim, up))]
+
+    #the local basis is orthonormal so its inverse is its transpose
+
+    return mulMatrix3(transpose3(localBasis), worldBasis)
+
+    """--------------------"""
+
+#----------END-rigmath----------#
@@ -0,0 +1,467 @@
+#----------Imports----------#
+
+import os
+import json
+import pRigging.src.scenebackend as psb
+import pRigging.src.naming as pnm
+import pRigging.src.armrig as par
+import pRigging.src.nodecache as pnc
+
+pm = psb.pm
+
+#the version of the spec format written by toData
+
+SPEC_VERSION = 1
+
+#the settings a spec holds, as the key used in the json, the attribute it is
+#stored in and its default, the same settings the arm tabs hold in TabSettings
+
+SPEC_FIELDS = [("type", "m_type", "arm"),
+               ("baseName", "m_baseName", "Rig"),
+               ("limbName", "m_limbName", "Arm"),
+               ("doSideSpecify", "m_doSideSpecify", True),
+               ("sideSpecifier", "m_sideSpecifier", "L"),
+               ("joints", "m_jntList", []),
+               ("positions", "m_positions", []),
+               ("doIK", "m_doIK", True),
+               ("ikExt", "m_ikExt", "IK"),
+               ("doFK", "m_doFK", True),
+               ("fkExt", "m_fkExt", "FK"),
+               ("jntExt", "m_jntExt", "JNT"),
+               ("ctrlExt", "m_ctrlExt", "CTRL"),
+               ("doTwist", "m_doTwist", True),
+               ("twistStartIds", "m_twistStartIds", [-2]),
+               ("numTwistJnts", "m_numTwistJnts", 3)]
+
+#----------RigSpec-Class----------#
+
+class RigSpec(object):
+
+    """
+        Class: RigSpec
+            A declarative description of one rig element, so that rigs can be
+            built from files rather than through the UI. It holds the same settings
+            as the arm tabs, the names, the template joints and the IK, FK and
+            twist options, and reads and writes them as plain data, e.g.
+
+                {"baseName" : "Hero", "sideSpecifier" : "L", "limbName" : "Arm",
+                 "joints" : ["L_Shoulder_JNT", "L_Elbow_JNT", "L_Wrist_JNT"],
+                 "twistStartIds" : [-2], "numTwistJnts" : 3}
+
+            Any setting left out takes its default, see SPEC_FIELDS.
+
+        File: pRigging/src/rigspec.py
+
+        Contains:
+            self.m_type:            The type of rig element, only "arm" is built
+            self.m_baseName:        The base name of the rig, e.g. the character
+            self.m_limbName:        The name of the limb, added after the side
+            self.m_doSideSpecify:   Whether or not the side specifier is added
+            self.m_sideSpecifier:   The side specifier, e.g. L
+            self.m_jntList:         The names or paths of the template joints
+            self.m_positions:       Optional world positions of the template joints,
+                                    used to make them if none of them exist
+            self.m_doIK:            Whether or not to make the IK chain
+            self.m_ikExt:           The IK chain extension
+            self.m_doFK:            Whether or not to make the FK chain
+            self.m_fkExt:           The FK chain extension
+            self.m_jntExt:          The joint extension
+            self.m_ctrlExt:         The control extension
+            self.m_doTwist:         Whether or not to make twist chains
+            self.m_twistStartIds:   The ids of the joints the twist chains start at
+            self.m_numTwistJnts:    The number of joints in each twist chain
+            self.m_rigElement:      The ArmRig built from the spec, 0 until built
+            self.m_unknown:         The keys read by fromData that aren't settings
+
+        Imports:
+            os
+            json
+            pRigging.src.scenebackend as psb
+            pRigging.src.naming as pnm
+            pRigging.src.armrig as par
+            pRigging.src.nodecache as pnc
+    """
+
+    def __init__(self, _data = None):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _data:                  A dictionary of settings to read, see fromData,
+                                        defaults to None for the default settings
+        """
+
+        for key, attr, default in SPEC_FIELDS:
+
+            self.__dict__[attr] = self.copyValue(default)
+
+        self.m_rigElement = 0
+        self.m_unknown = []
+
+        if _data is not None:
+
+            self.fromData(_data)
+
+        """--------------------"""
+
+    def copyValue(self, _value):
+
+        """
+            Method: copyValue
+                returns a copy of a setting, so lists aren't shared between specs
+        """
+
+        if isinstance(_value, list):
+
+            return [self.copyValue(value) for value in _value]
+
+        return _value
+
+        """--------------------"""
+
+    def fromData(self, _data):
+
+        """
+            Method: fromData
+                reads the settings from a dictionary, e.g. loaded from json, keys that
+                aren't settings are left for validate to report
+        """
+
+        fields = dict([(key, attr) for key, attr, default in SPEC_FIELDS])
+
+        for key in _data:
+
+            if key == "version":
+
+                continue
+
+            if key in fields:
+
+                self.__dict__[fields[key]] = self.copyValue(_data[key])
+
+            else:
+
+                self.m_unknown.append(key)
+
+        """--------------------"""
+
+    def toData(self):
+
+        """
+            Method: toData
+                returns the settings as a dictionary of plain data, e.g. to save as json
+        """
+
+        data = {"version" : SPEC_VERSION}
+
+        for key, attr, default in SPEC_FIELDS:
+
+            data[key] = self.copyValue(self.__dict__[attr])
+
+        return data
+
+        """--------------------"""
+
+    def fromSettings(self, _settings):
+
+        """
+            Method: fromSettings
+                reads the settings from the TabSettings of an arm tab, so a rig set up
+                in the UI can be saved as a spec
+        """
+
+        self.m_baseName = _settings.m_baseName
+        self.m_limbName = _settings.m_limbName
+        self.m_doSideSpecify = _settings.m_doSideSpecify
+        self.m_sideSpecifier = _settings.m_sideSpecifier
+        self.m_jntList = [str(joint) for joint in _settings.m_jntList]
+        self.m_numTwistJnts = _settings.m_numTwistJnts
+        self.m_doIK = _settings.m_doIK
+        self.m_ikExt = _settings.m_ikExt
+        self.m_doFK = _settings.m_doFK
+        self.m_fkExt = _settings.m_fkExt
+        self.m_jntExt = _settings.m_jntExt
+        self.m_ctrlExt = _settings.m_ctrlExt
+
+        """--------------------"""
+
+    def validate(self):
+
+        """
+            Method: validate
+                checks the settings without touching the scene
+
+            On Exit:                    Returns a list of strings describing each
+                                        problem, empty if the spec is valid
+        """
+
+        errors = ["unknown setting %s" % key for key in sorted(self.m_unknown)]
+
+        if self.m_type != "arm":
+
+            errors.append("unknown rig type %s, only arm rigs can be built" % self.m_type)
+
+        #check each setting has the type of its default
+
+        for key, attr, default in SPEC_FIELDS:
+
+            value = self.__dict__[attr]
+
+            if isinstance(default, bool):
+
+                valid = isinstance(value, bool)
+
+            elif isinstance(default, int):
+
+                valid = isinstance(value, int) and not isinstance(value, bool)
+
+            elif isinstance(default, list):
+
+                valid = isinstance(value, list)
+
+            else:
+
+                valid = isinstance(value, (str, type(u"")))
+
+            if not valid:
+
+                errors.append("%s should be a %s" % (key, type(default).__name__))
+
+        if errors != []:
+
+            return errors
+
+        if len(self.m_jntList) < 2:
+
+            errors.append("at least 2 template joints are needed")
+
+        if self.m_positions != [] and len(self.m_positions) != len(self.m_jntList):
+
+            errors.append("there should be a position for each template joint")
+
+        for twistId in self.m_twistStartIds:
+
+            #negative ids count back from the last joint
+
+            if not isinstance(twistId, int) or not -len(self.m_jntList) <= twistId < len(self.m_jntList) \
+                    or twistId % len(self.m_jntList) == len(self.m_jntList) - 1:
+
+                errors.append("the twist start id %s isn't a joint with one below it" % twistId)
+
+        if self.m_doTwist and self.m_numTwistJnts < 1:
+
+            errors.append("numTwistJnts should be at least 1")
+
+        if not self.m_doIK and not self.m_doFK:
+
+            errors.append("at least one of doIK and doFK should be True")
+
+        return errors
+
+        """--------------------"""
+
+    def getRootName(self):
+
+        """
+            Method: getRootName
+                returns the root name of the rig, made the same way the arm tabs make
+                it, the base name followed by the side and the limb name
+        """
+
+        name = str(self.m_baseName)
+
+        if self.m_doSideSpecify:
+
+            name = pnm.addExt(name, str(self.m_sideSpecifier))
+
+        return pnm.addExt(name, str(self.m_limbName))
+
+        """--------------------"""
+
+    def getTemplateJoints(self):
+
+        """
+            Method: getTemplateJoints
+                returns the template joints, if none of them exist and the spec has
+                their positions they are made first
+
+            On Exit:                    Returns a tuple of the list of joints and the
+                                        list of the names of any that are missing
+        """
+
+        missing = [str(name) for name in self.m_jntList if not pm.objExists(str(name))]
+
+        if missing != [] and len(missing) == len(self.m_jntList) and self.m_positions != []:
+
+            #each made under the one before it, without touching the selection
+
+            parent = None
+
+            for i in range(0, len(self.m_jntList)):
+
+                name = str(self.m_jntList[i]).split("|")[-1]
+
+                if parent is None:
+
+                    joint = pm.createNode("joint", name = name, skipSelect = True)
+
+                else:
+
+                    joint = pm.createNode("joint", name = name, parent = parent, skipSelect = True)
+
+                joint.setTranslation(tuple(self.m_positions[i]), space = "world")
+                parent = joint
+
+            missing = []
+
+        if missing != []:
+
+            return ([], missing)
+
+        return (pnc.getNodes([str(name) for name in self.m_jntList]), [])
+
+        """--------------------"""
+
+    def build(self, _usePlan = False, _fastBuild = False, _cache = None):
+
+        """
+            Method: build
+                builds the rig described by the spec in the open scene
+
+            Inputs:
+                _usePlan:               Whether or not to plan the rig first, see
+                                        ArmRig.genArmRig
+                _fastBuild:             Whether or not to build without recording undo
+                _cache:                 A BuildCache to look the build up in, or None
+
+            On Exit:                    The rig is stored in m_rigElement and the status
+                                        of the build is returned
+        """
+
+        errors = self.validate()
+
+        if errors != []:
+
+            return ["ERROR", "INVALID SPEC", "ERROR: The rig spec is not valid, " + ", ".join(errors)]
+
+        joints, missing = self.getTemplateJoints()
+
+        if missing != []:
+
+            return ["ERROR", "MISSING JOINTS", "ERROR: The template joints " + ", ".join(missing) + " are not in the scene"]
+
+        self.m_rigElement = par.ArmRig(self.getRootName())
+
+        #enforce the hierarchy, as the tabs do
+
+        joints, breakJoint = self.m_rigElement.sortHierarchy(joints)
+
+        if joints == []:
+
+            message = "ERROR: The template joints are not a single hierarchy"
+
+            if breakJoint is not None:
+
+                message = message + ", it breaks at " + str(breakJoint)
+
+            return ["ERROR", "INCORRECT HIERARCHY", message]
+
+        return self.m_rigElement.genArmRig(joints,
+                                           _doIK = self.m_doIK,
+                                           _ikExt = str(self.m_ikExt),
+                                           _doFK = self.m_doFK,
+                                           _fkExt = str(self.m_fkExt),
+                                           _jntExt = str(self.m_jntExt),
+                                           _ctrlExt = str(self.m_ctrlExt),
+                                           _doTwist = self.m_doTwist,
+                                           _twistStartIds = list(self.m_twistStartIds),
+                                           _numTwistJnts = self.m_numTwistJnts,
+                                           _usePlan = _usePlan,
+                                           _fastBuild = _fastBuild,
+                                           _cache = _cache)
+
+        """--------------------"""
+
+#----------END-RigSpec-Class----------#
+
+def loadSpecFile(_path):
+
+    """
+        Function: loadSpecFile
+            reads a spec file, a json file holding one job or a list of them, where a
+            job lists the rigs to build in one scene file, e.g.
+
+                {"scene" : "hero.ma", "save" : "hero_rigged.ma", "rigs" : [{...}, {...}]}
+
+            the scene is opened before the rigs are built and saved as save after,
+            either can be left out to build in a new scene or not save, relative
+            paths are relative to the spec file
+
+        On Exit:                    Returns a list of job dictionaries, each with the
+                                    scene and save paths, or None, and a list of the
+                                    RigSpecs to build
+    """
+
+    f = open(_path, "r")
+    data = json.load(f)
+    f.close()
+
+    if not isinstance(data, list):
+
+        data = [data]
+
+    folder = os.path.dirname(os.path.abspath(_path))
+    jobs = []
+
+    for job in data:
+
+        paths = {}
+
+        for key in ("scene", "save"):
+
+            paths[key] = job.get(key)
+
+            if paths[key] is not None:
+
+                paths[key] = os.path.join(folder, str(paths[key]))
+
+        jobs.append({"spec" : _path,
+                     "scene" : paths["scene"],
+                     "save" : paths["save"],
+                     "rigs" : [RigSpec(rig) for rig in job.get("rigs", [])]})
+
+    return jobs
+
+    """--------------------"""
+
+def saveSpecFile(_path, _specs, _scene = None, _save = None):
+
+    """
+        Function: saveSpecFile
+            writes a list of RigSpecs to a spec file as a single job, see loadSpecFile
+
+        Inputs:
+            _path:                  The file to write to
+            _specs:                 The list of RigSpecs
+            _scene:                 The scene file to open first, or None
+            _save:                  The file to save the scene as, or None
+    """
+
+    job = {"rigs" : [spec.toData() for spec in _specs]}
+
+    if _scene is not None:
+
+        job["scene"] = _scene
+
+    if _save is not None:
+
+        job["save"] = _save
+
+    f = open(_path, "w")
+    json.dump(job, f, indent = 2, sort_keys = True)
+    f.close()
+
+    """--------------------"""
@@ -0,0 +1,189 @@
+#----------Imports----------#
+
+import importlib
+
+#----------SceneBackend-Class----------#
+
+class SceneBackend(object):
+
+    """
+        Class: SceneBackend
+            A stand in for the pymel.core module which forwards every call on to the
+            active scene backend. The build modules use the shared instance, pm,
+            exactly as they would use pymel.core, so the scene they build into can
+            be switched between maya, through pymel or through maya.cmds and the
+            OpenMaya API, and the in-memory scene.
+            pymel is only imported the first time it is actually used.
+
+        File: pRigging/src/scenebackend.py
+
+        Contains:
+            self.m_backend:         The module or object the calls are forwarded to,
+                                    None until the first call when pymel is used
+            self.m_callCounts:      A dictionary of the number of calls forwarded to
+                                    each backend, keyed by the backend's id, or None
+                                    when the calls aren't being counted
+
+        Imports:
+            importlib
+    """
+
+    def __init__(self):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+        """
+
+        self.m_backend = None
+        self.m_callCounts = None
+
+        """--------------------"""
+
+    def setBackend(self, _backend):
+
+        """
+            Method: setBackend
+                sets the object that scene calls are forwarded to
+
+            Inputs:
+                _backend:               A module or object with the pymel.core
+                                        functions the toolset uses, None resets
+                                        to pymel
+        """
+
+        self.m_backend = _backend
+
+        """--------------------"""
+
+    def getBackend(self):
+
+        """
+            Method: getBackend
+                returns the active backend, importing pymel if none has been set
+        """
+
+        if self.m_backend is None:
+
+            self.m_backend = importlib.import_module("pymel.core")
+
+        return self.m_backend
+
+        """--------------------"""
+
+    def countCalls(self, _on):
+
+        """
+            Method: countCalls
+                starts or stops counting the calls forwarded to each backend,
+                starting clears the counts
+        """
+
+        if _on:
+
+            self.m_callCounts = {}
+
+        else:
+
+            self.m_callCounts = None
+
+        """--------------------"""
+
+    def getCallCount(self, _backend = None):
+
+        """
+            Method: getCallCount
+                returns the number of calls forwarded to a backend since counting
+                started, defaults to the active backend
+
+            On Exit:                    Returns the count, or None when the calls
+                                        aren't being counted
+        """
+
+        if self.m_callCounts is None:
+
+            return None
+
+        if _backend is None:
+
+            _backend = self.getBackend()
+
+        return self.m_callCounts.get(id(_backend), 0)
+
+        """--------------------"""
+
+    def __getattr__(self, _name):
+
+        #only called for names not found on the instance, i.e. the scene commands
+
+        if _name.startswith("m_"):
+
+            raise AttributeError(_name)
+
+        backend = self.getBackend()
+
+        if self.m_callCounts is not None:
+
+            self.m_callCounts[id(backend)] = self.m_callCounts.get(id(backend), 0) + 1
+
+        return getattr(backend, _name)
+
+#----------END-SceneBackend-Class----------#
+
+#the shared backend used by all of the build modules
+
+pm = SceneBackend()
+
+#the backend used by the UI modules, which is never switched, so the UI always
+#talks to maya through pymel, imported the first time the UI is made
+
+ui = SceneBackend()
+
+def useMemoryScene():
+
+    """
+        Function: useMemoryScene
+            switches the build modules over to a new, empty in-memory scene
+
+        On Exit:                    Returns the MemoryScene now in use
+    """
+
+    import pRigging.src.memoryscene as pms
+
+    scene = pms.MemoryScene()
+    pm.setBackend(scene)
+
+    return scene
+
+    """--------------------"""
+
+def useCmds():
+
+    """
+        Function: useCmds
+            switches the build modules over to building in maya through maya.cmds
+            and the OpenMaya API rather than pymel, only in maya
+
+        On Exit:                    Returns the CmdsScene now in use
+    """
+
+    import pRigging.src.cmdsscene as pcs
+
+    scene = pcs.CmdsScene()
+    pm.setBackend(scene)
+
+    return scene
+
+    """--------------------"""
+
+def usePymel():
+
+    """
+        Function: usePymel
+            switches the build modules back to building in maya through pymel
+    """
+
+    pm.setBackend(None)
+
+    """--------------------"""
@@ -0,0 +1,367 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.buildsession as pbs
+
+pm = psb.pm
+
+#the kinds of change a modifier queues, in the order they are made
+
+PASSES = ["rename", "reparent", "addAttr", "setAttr", "connect", "lock"]
+
+#the attributes whose X, Y and Z values are set with a single set when all three
+#are queued for a node
+
+COMPOUND_ATTRS = ["translate", "rotate", "scale", "jointOrient"]
+
+#----------SceneModifier-Class----------#
+
+class SceneModifier(object):
+
+    """
+        Class: SceneModifier
+            Queues changes to the scene, renames, reparents, dynamic attributes,
+            values, connections and locks, and makes them in one go when doIt is
+            called, much like maya's MDagModifier. The changes are made in passes,
+            one kind at a time in the order of PASSES, so they can be made with
+            fewer scene commands, e.g. consecutive nodes going under the same
+            parent are parented with one command and a translate queued as its X,
+            Y and Z values is set at once. The order changes of one kind were
+            queued in is kept, the order between kinds isn't.
+
+            Nodes are still made straight away by the build, as the steps after
+            making a node usually need it, the modifier takes the changes that
+            follow. As every queued change goes through doIt, it is the one place
+            to time and count what changing the scene costs, see getCounts.
+
+        File: pRigging/src/scenemodifier.py
+
+        Contains:
+            self.m_checkParents:    Whether or not nodes are checked for already being
+                                    under the parent they are queued to go under,
+                                    which costs a query for each node
+            self.m_queue:           A dictionary of each kind of change to the list
+                                    of changes of that kind queued, in order
+            self.m_counts:          A dictionary of each kind of change to the number
+                                    made, and of "commands" to the number of scene
+                                    commands they were made with, since the
+                                    modifier was made
+
+        Imports:
+            pRigging.src.scenebackend as psb
+            pRigging.src.buildsession as pbs
+    """
+
+    def __init__(self, _checkParents = True):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _checkParents:          Whether or not to check nodes are not already
+                                        under their new parent, defaults to True, can
+                                        be turned off when only new nodes are parented
+        """
+
+        self.m_checkParents = _checkParents
+        self.m_queue = dict([(kind, []) for kind in PASSES])
+        self.m_counts = dict([(kind, 0) for kind in PASSES + ["commands"]])
+
+        """--------------------"""
+
+    #----------queueing----------#
+
+    def rename(self, _node, _name):
+
+        """
+            Method: rename
+                queues renaming a node
+        """
+
+        self.m_queue["rename"].append((_node, _name))
+
+        """--------------------"""
+
+    def reparent(self, _node, _parent = None, _relative = False):
+
+        """
+            Method: reparent
+                queues parenting a node, nothing is done when it is made if the node
+                is already under the parent
+
+            Inputs:
+                _node:                  The node to parent
+                _parent:                The new parent, None or "" for the world
+                _relative:              Whether or not the node keeps its local
+                                        transform rather than its world one
+        """
+
+        if _parent in ("", None):
+
+            _parent = None
+
+        else:
+
+            _parent = pm.PyNode(_parent)
+
+        self.m_queue["reparent"].append((_node, _parent, _relative))
+
+        """--------------------"""
+
+    def addAttr(self, _node, _name, **kwargs):
+
+        """
+            Method: addAttr
+                queues adding a dynamic attribute, the flags are those of addAttr
+        """
+
+        self.m_queue["addAttr"].append((_node, _name, kwargs))
+
+        """--------------------"""
+
+    def setAttr(self, _node, _attr, _value):
+
+        """
+            Method: setAttr
+                queues setting the value of an attribute on a node
+        """
+
+        self.m_queue["setAttr"].append((_node, _attr, _value))
+
+        """--------------------"""
+
+    def connect(self, _src, _dst):
+
+        """
+            Method: connect
+                queues connecting two plugs
+        """
+
+        self.m_queue["connect"].append((_src, _dst))
+
+        """--------------------"""
+
+    def lock(self, _node, _attr):
+
+        """
+            Method: lock
+                queues locking an attribute on a node
+        """
+
+        self.m_queue["lock"].append((_node, _attr))
+
+        """--------------------"""
+
+    def isEmpty(self):
+
+        return sum([len(changes) for changes in self.m_queue.values()]) == 0
+
+    def getCounts(self):
+
+        return dict(self.m_counts)
+
+    #----------making the changes----------#
+
+    def doIt(self):
+
+        """
+            Method: doIt
+                makes every queued change and empties the queue, the queue is emptied
+                even if a change fails so the modifier can be used again
+        """
+
+        queue = self.m_queue
+        self.m_queue = dict([(kind, []) for kind in PASSES])
+
+        self.doRenames(queue["rename"])
+        self.doReparents(queue["reparent"])
+        self.doAddAttrs(queue["addAttr"])
+        self.doSetAttrs(queue["setAttr"])
+        self.doConnects(queue["connect"])
+        self.doLocks(queue["lock"])
+
+        """--------------------"""
+
+    def count(self, _kind, _changes, _commands):
+
+        self.m_counts[_kind] = self.m_counts[_kind] + _changes
+        self.m_counts["commands"] = self.m_counts["commands"] + _commands
+
+    def doRenames(self, _changes):
+
+        for node, name in _changes:
+
+            pm.rename(node, name)
+
+        self.count("rename", len(_changes), len(_changes))
+
+    def doReparents(self, _changes):
+
+        """
+            Method: doReparents
+                parents the nodes, with one parent command for each run of nodes
+                going under the same parent. When checking, a lone node is parented
+                with setParent, which leaves it if it is already there, and a run
+                is checked against the children of the parent
+        """
+
+        commands = 0
+        i = 0
+
+        while i < len(_changes):
+
+            node, parent, relative = _changes[i]
+
+            #gather the following nodes going the same way
+
+            nodes = []
+
+            while i < len(_changes) and isSameNode(_changes[i][1], parent) and _changes[i][2] == relative:
+
+                nodes.append(_changes[i][0])
+                i = i + 1
+
+            flags = {}
+
+            if relative:
+
+                flags["relative"] = True
+
+            #nodes keeping their local transform move with the new parent, and
+            #either way the nodes above them change
+
+            for node in nodes:
+
+                pbs.nodeMoved(node)
+
+            if self.m_checkParents and (len(nodes) == 1 or parent is None):
+
+                for node in nodes:
+
+                    if parent is None:
+
+                        node.setParent(world = True, **flags)
+
+                    else:
+
+                        node.setParent(parent, **flags)
+
+                commands = commands + len(nodes)
+
+                continue
+
+            if self.m_checkParents:
+
+                children = parent.getChildren()
+                nodes = [node for node in nodes if node not in children]
+                commands = commands + 1
+
+            if nodes == []:
+
+                continue
+
+            if parent is None:
+
+                pm.parent(nodes, world = True, **flags)
+
+            else:
+
+                pm.parent(nodes, parent, **flags)
+
+            commands = commands + 1
+
+        self.count("reparent", len(_changes), commands)
+
+        """--------------------"""
+
+    def doAddAttrs(self, _changes):
+
+        for node, name, flags in _changes:
+
+            node.addAttr(name, **flags)
+
+        self.count("addAttr", len(_changes), len(_changes))
+
+    def doSetAttrs(self, _changes):
+
+        """
+            Method: doSetAttrs
+                sets the values, node by node, setting each compound attribute with
+                all of its X, Y and Z values queued with one set
+        """
+
+        nodes = []
+        values = {}
+
+        for node, attr, value in _changes:
+
+            if node not in values:
+
+                nodes.append(node)
+                values[node] = {}
+
+            values[node][attr] = value
+
+        commands = 0
+
+        for node in nodes:
+
+            nodeValues = values[node]
+
+            if [attr for attr in nodeValues if attr.startswith(tuple(COMPOUND_ATTRS))] != []:
+
+                pbs.nodeMoved(node)
+
+            for compound in COMPOUND_ATTRS:
+
+                children = [compound + axis for axis in "XYZ"]
+
+                if len([child for child in children if child in nodeValues]) == 3:
+
+                    node.attr(compound).set(tuple([nodeValues.pop(child) for child in children]))
+                    commands = commands + 1
+
+            for attr in sorted(nodeValues):
+
+                node.attr(attr).set(nodeValues[attr])
+                commands = commands + 1
+
+        self.count("setAttr", len(_changes), commands)
+
+        """--------------------"""
+
+    def doConnects(self, _changes):
+
+        for src, dst in _changes:
+
+            pm.PyNode(src).connect(pm.PyNode(dst))
+
+        self.count("connect", len(_changes), len(_changes))
+
+    def doLocks(self, _changes):
+
+        for node, attr in _changes:
+
+            node.attr(attr).lock()
+
+        self.count("lock", len(_changes), len(_changes))
+
+#----------END-SceneModifier-Class----------#
+
+def isSameNode(_a, _b):
+
+    """
+        Function: isSameNode
+            returns True if two nodes, either of which may be None for the world,
+            are the same
+    """
+
+    if _a is None or _b is None:
+
+        return _a is None and _b is None
+
+    return _a == _b
+
+    """--------------------"""
@@ -0,0 +1,285 @@
+#----------Imports----------#
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+
+#the modules the gui used to import as soon as it was loaded, imported on top of
+#the gui to time the eager start up it replaced
+
+EAGER_MODULES = ["pymel.core",
+                 "pRigging.src.ui.armtabnovice",
+                 "pRigging.src.ui.armtabintermediate",
+                 "pRigging.src.ui.armtabexperienced",
+                 "pRigging.src.armrig",
+                 "pRigging.src.profiler",
+                 "pRigging.src.buildcache"]
+
+#run in a fresh interpreter for each sample, prints the result as json
+
+IMPORT_SCRIPT = """
+import sys, time, json
+start = time.time()
+import pRigging.src.gui
+gui = time.time()
+missing = []
+for name in %s:
+    try:
+        __import__(name)
+    except ImportError:
+        missing.append(name)
+end = time.time()
+print(json.dumps({"guiTime" : gui - start,
+                  "time" : end - start,
+                  "modules" : sorted([name for name in sys.modules if name.startswith("pRigging") and sys.modules[name] is not None]),
+                  "pymel" : "pymel.core" in sys.modules,
+                  "missing" : missing}))
+"""
+
+#----------StartupBenchmark-Class----------#
+
+class StartupBenchmark(object):
+
+    """
+        Class: StartupBenchmark
+            A class to time how long the tool takes to start. Each sample imports
+            the gui in a fresh interpreter, so nothing is already loaded, and
+            records the time taken, the toolset modules loaded and whether pymel
+            was, once as the gui now loads and once with the modules it used to
+            import up front loaded too. In maya the time until the first window
+            is shown can be timed as well, which is only meaningful in a fresh
+            session.
+
+        File: pRigging/src/startupbenchmark.py
+
+        Contains:
+            self.m_samples:         The number of fresh interpreters timed for each
+                                    way of starting, the fastest is kept
+            self.m_executable:      The python interpreter to time, e.g. mayapy
+            self.m_results:         A dictionary of the results of each way of
+                                    starting, "lazy" and "eager", and "window" once
+                                    timed
+
+        Imports:
+            os
+            sys
+            json
+            time
+            platform
+            argparse
+            subprocess
+    """
+
+    def __init__(self, _samples = 5, _executable = None):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, sets up the attributes
+                for the object
+
+            Inputs:
+                _samples:               The number of samples for each way of starting
+                _executable:            The interpreter to time, defaults to None for
+                                        the one running the benchmark
+        """
+
+        self.m_samples = _samples
+        self.m_executable = _executable or sys.executable
+        self.m_results = {}
+
+        """--------------------"""
+
+    def getPackageRoot(self):
+
+        """
+            Method: getPackageRoot
+                returns the folder holding the pRigging package, so the fresh
+                interpreters can import it
+        """
+
+        return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        """--------------------"""
+
+    def timeImport(self, _eager = False):
+
+        """
+            Method: timeImport
+                imports the gui in a fresh interpreter
+
+            Inputs:
+                _eager:                 Whether or not to import the modules the gui used
+                                        to import up front as well
+
+            On Exit:                    Returns the result dictionary
+        """
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([self.getPackageRoot()] + [path for path in [env.get("PYTHONPATH")] if path])
+
+        modules = []
+
+        if _eager:
+
+            modules = EAGER_MODULES
+
+        process = subprocess.Popen([self.m_executable, "-c", IMPORT_SCRIPT % json.dumps(modules)],
+                                   stdout = subprocess.PIPE, stderr = subprocess.PIPE, env = env)
+        out, err = process.communicate()
+
+        if process.returncode != 0:
+
+            raise RuntimeError("the gui could not be imported:\n" + err.decode("utf-8", "replace"))
+
+        return json.loads(out.decode("utf-8").strip().splitlines()[-1])
+
+        """--------------------"""
+
+    def timeWindow(self):
+
+        """
+            Method: timeWindow
+                times making the tool's window in the running maya session, the gui
+                modules must not have been imported yet for the time to mean anything
+
+            On Exit:                    Returns the result dictionary
+        """
+
+        loaded = "pRigging.src.gui" in sys.modules
+
+        start = time.time()
+
+        import pRigging.src.gui as pgui
+
+        pgui.Gui()
+
+        result = {"time" : time.time() - start, "alreadyLoaded" : loaded}
+
+        self.m_results["window"] = result
+
+        return result
+
+        """--------------------"""
+
+    def run(self, _verbose = False):
+
+        """
+            Method: run
+                times the lazy and eager start ups, keeping the fastest sample of each
+
+            Inputs:
+                _verbose:               Whether or not to print the results
+
+            On Exit:                    Returns the dictionary of results
+        """
+
+        for mode in ("lazy", "eager"):
+
+            best = None
+
+            for i in range(0, self.m_samples):
+
+                result = self.timeImport(mode == "eager")
+
+                if best is None or result["time"] < best["time"]:
+
+                    best = result
+
+            self.m_results[mode] = best
+
+            if _verbose:
+
+                print(self.formatResult(mode, best))
+
+        if _verbose:
+
+            print("lazy start up takes %.0f%% of the eager time" % (100.0*self.m_results["lazy"]["time"]/max(self.m_results["eager"]["time"], 1e-9)))
+
+        return self.m_results
+
+        """--------------------"""
+
+    def formatResult(self, _mode, _result):
+
+        """
+            Method: formatResult
+                returns a one line summary of a result
+        """
+
+        missing = ""
+
+        if _result["missing"] != []:
+
+            missing = "  (not installed: " + ", ".join(_result["missing"]) + ")"
+
+        return "%-6s %8.2f ms  %3d modules  pymel %-5s%s" % (
+                    _mode, _result["time"]*1000.0, len(_result["modules"]), _result["pymel"], missing)
+
+        """--------------------"""
+
+    def save(self, _path):
+
+        """
+            Method: save
+                writes the results to a json file along with the run details
+
+            Inputs:
+                _path:                  The file to write to
+        """
+
+        data = {"python" : platform.python_version(),
+                "platform" : platform.platform(),
+                "executable" : self.m_executable,
+                "samples" : self.m_samples,
+                "time" : time.strftime("%Y-%m-%d %H:%M:%S"),
+                "results" : self.m_results}
+
+        f = open(_path, "w")
+        json.dump(data, f, indent = 2, sort_keys = True)
+        f.close()
+
+        """--------------------"""
+
+#----------END-StartupBenchmark-Class----------#
+
+def main(_args = None):
+
+    """
+        Function: main
+            runs the start up benchmark from the command line, e.g.
+                mayapy -m pRigging.src.startupbenchmark -o startup.json
+
+        On Exit:                    Returns 1 if the lazy start up is slower than the
+                                    eager one, otherwise 0
+    """
+
+    parser = argparse.ArgumentParser(description = "Benchmark the start up of the pRigging gui")
+    parser.add_argument("-o", "--output", default = "", help = "json file to write the results to")
+    parser.add_argument("-n", "--samples", type = int, default = 5, help = "fresh interpreters per start up")
+    parser.add_argument("--python", default = None, help = "interpreter to time, e.g. mayapy")
+    parser.add_argument("-q", "--quiet", action = "store_true")
+
+    args = parser.parse_args(_args)
+
+    bench = StartupBenchmark(args.samples, args.python)
+    results = bench.run(_verbose = not args.quiet)
+
+    if args.output != "":
+
+        bench.save(args.output)
+
+    if results["lazy"]["time"] > results["eager"]["time"]:
+
+        return 1
+
+    return 0
+
+    """--------------------"""
+
+if __name__ == "__main__":
+
+    sys.exit(main())
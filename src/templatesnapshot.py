@@ -0,0 +1,185 @@
+#----------Imports----------#
+
+import pRigging.src.buildsession as pbs
+import pRigging.src.rigmath as prm
+import pRigging.src.nodecache as pnc
+
+#----------TemplateSnapshot-Class----------#
+
+class TemplateSnapshot(object):
+
+    """
+        Class: TemplateSnapshot
+            The template joints of a rig read once into plain data, their names,
+            the index of each one's parent in the chain and their world matrices,
+            so every chain built from the same template joints, e.g. the IK, FK
+            and bind chains of an arm, is made from the snapshot rather than by
+            querying the template joints again. Use getTemplateSnapshot to share
+            one snapshot between the builds of a session.
+
+            The local translate and joint orient each joint of a chain needs,
+            under the joint before it, are worked out from the world matrices,
+            so a chain can be made by setting them straight away rather than by
+            moving, rotating and freezing each joint.
+
+        File: pRigging/src/templatesnapshot.py
+
+        Contains:
+            self.m_joints:          The template joints, as nodes
+            self.m_names:           The short name of each joint
+            self.m_parents:         The index of the parent of each joint in the
+                                    chain, the joint before it, -1 for the first
+            self.m_matrices:        The world matrix of each joint, as a 4x4 list
+            self.m_translates:      The translate of each joint under its parent
+            self.m_orients:         The joint orient of each joint under its parent,
+                                    with no rotate or scale the joints of a chain
+                                    take only the rotation of their template joint
+
+        Imports:
+            pRigging.src.buildsession as pbs
+            pRigging.src.rigmath as prm
+            pRigging.src.nodecache as pnc
+    """
+
+    def __init__(self, _joints):
+
+        """
+            Method: __init__
+                A method called when the class is instanciated, reads the joints
+
+            Inputs:
+                _joints:                The template joints, nodes or names, in order
+                                        from the top of the chain
+        """
+
+        self.m_joints = pnc.getNodes(list(_joints))
+        self.m_names = [str(joint).split("|")[-1] for joint in self.m_joints]
+        self.m_parents = list(range(-1, len(self.m_joints) - 1))
+
+        #the template joints are read again by the builds, e.g. by the controls,
+        #so the open session keeps their world matrices
+
+        pbs.cacheNodes(self.m_joints)
+
+        self.m_matrices = [pbs.getWorldMatrix(joint) for joint in self.m_joints]
+        self.m_translates = []
+        self.m_orients = []
+
+        self.setLocalTransforms()
+
+        """--------------------"""
+
+    def setLocalTransforms(self):
+
+        """
+            Method: setLocalTransforms
+                works out the translate and joint orient of each joint under its
+                parent, the parents being the joints of the chain, which match
+                their template joints without any scale
+        """
+
+        rotations = [prm.rotationPart(matrix) for matrix in self.m_matrices]
+
+        for i in range(0, len(self.m_joints)):
+
+            translate = self.getTranslation(i)
+            rotation = rotations[i]
+            parent = self.m_parents[i]
+
+            if parent != -1:
+
+                parentMatrix = prm.composeMatrix(self.getTranslation(parent), rotations[parent])
+
+                translate = prm.transformPoint(translate, prm.inverse4(parentMatrix))
+                rotation = prm.mulMatrix3(rotation, prm.transpose3(rotations[parent]))
+
+            self.m_translates.append(translate)
+            self.m_orients.append(prm.matrixToEuler(rotation))
+
+        """--------------------"""
+
+    def __len__(self):
+
+        return len(self.m_joints)
+
+    def getJoints(self):
+
+        return self.m_joints[:]
+
+    def getName(self, _id):
+
+        return self.m_names[_id]
+
+    def getParent(self, _id):
+
+        return self.m_parents[_id]
+
+    def getMatrix(self, _id):
+
+        return self.m_matrices[_id]
+
+    def getLocalTranslation(self, _id):
+
+        return self.m_translates[_id]
+
+    def getJointOrient(self, _id):
+
+        return self.m_orients[_id]
+
+    def getTranslation(self, _id):
+
+        """
+            Method: getTranslation
+                returns the world position of a joint as a tuple
+        """
+
+        return tuple(self.m_matrices[_id][3][:3])
+
+        """--------------------"""
+
+    def getRotation(self, _id):
+
+        """
+            Method: getRotation
+                returns the world XYZ euler rotation of a joint in degrees
+        """
+
+        return prm.matrixToEuler(prm.rotationPart(self.m_matrices[_id]))
+
+        """--------------------"""
+
+#----------END-TemplateSnapshot-Class----------#
+
+def getTemplateSnapshot(_joints):
+
+    """
+        Function: getTemplateSnapshot
+            returns the snapshot of the template joints, made the first time it is
+            asked for in the open build session and then shared by every build in
+            it, a new snapshot if no session is open. A snapshot is dropped by the
+            session when one of the nodes it has read is moved.
+
+        Inputs:
+            _joints:                    The template joints, or a snapshot, which is
+                                        returned as it is
+    """
+
+    if isinstance(_joints, TemplateSnapshot):
+
+        return _joints
+
+    session = pbs.getSession()
+
+    if session is None:
+
+        return TemplateSnapshot(_joints)
+
+    key = tuple([str(joint) for joint in _joints])
+
+    if key not in session.m_snapshots:
+
+        session.m_snapshots[key] = TemplateSnapshot(_joints)
+
+    return session.m_snapshots[key]
+
+    """--------------------"""
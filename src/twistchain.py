@@ -1,10 +1,13 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
 import pRigging.src.jointchain as pjc
 import pRigging.src.riggingbase as prb
 import pRigging.src.jointchaincontainer as pjcc
+import pRigging.src.scenemodifier as psm
+import pRigging.src.nodelist as pnl
 
+pm = psb.pm
 
 #----------TwistChain-Class----------#
 
@@ -19,13 +22,16 @@ class TwistChain(pjcc.JointChainContainer):
         
         Contains:
             self.m_jointChain:      a joint chain
-            self.m_multNode:        the multiply node which the joints are driven by
+            self.m_multNode:        a NodeList of the multiply node which the joints are
+                                    driven by
         
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
             pRigging.src.jointchain as pjc
             pRigging.src.riggingbase as prb
             pRigging.src.jointchaincontainer as pjcc
+            pRigging.src.scenemodifier as psm
+            pRigging.src.nodelist as pnl
 
 
     """
@@ -48,7 +54,7 @@ class TwistChain(pjcc.JointChainContainer):
         
         #set the variables up
         
-        self.m_multNode = ""
+        self.m_multNode = pnl.NodeList()
         
         self.m_isGenerated = False
         
@@ -96,7 +102,8 @@ class TwistChain(pjcc.JointChainContainer):
                                                 _numJoints,
                                                 _nameList = _nameList, 
                                                 _name = _name,
-                                                _ext = _jntExt
+                                                _ext = _jntExt,
+                                                _batch = True
                                                 )
                                                 
         #then if the acon bool is set
@@ -109,7 +116,7 @@ class TwistChain(pjcc.JointChainContainer):
             
             if _nameList != []: 
                
-                multName = self.addExtToNames(self.removeExtFromNames([_namelist[i]]),"MULT")[0]
+                multName = self.renameFromNames([_nameList[0]], 1, ["MULT"])[0]
                 
             elif _name != "":
                 
@@ -117,13 +124,18 @@ class TwistChain(pjcc.JointChainContainer):
                 
             else:
                 
-                multName = self.addExtToNames(self.removeExtFromNames([_topJoint]),"MULT")[0]
+                multName = self.renameFromNames([_topJoint], 1, ["MULT"])[0]
                 
             #make a multiply node to set the influence scale
             
-            self.m_multNode = pm.shadingNode('multiplyDivide', name = multName, au = True)
+            multNode = self.recordNode(pm.shadingNode('multiplyDivide', name = self.reserveNames([multName])[0], au = True))
             
-            self.m_multNode.input1X.set(1.0/(_numJoints+1))
+            self.m_multNode = pnl.NodeList([multNode])
+            
+            #the value and connections are queued and made together
+            
+            modifier = psm.SceneModifier()
+            modifier.setAttr(multNode, "input1X", 1.0/(_numJoints+1))
             
             #switch through the _attr strings
             #at the moment there is a lot of repeated code, might finde a nicer way of doing this
@@ -134,99 +146,101 @@ class TwistChain(pjcc.JointChainContainer):
                 #connect the value on the bottom joint to the mult node and the output of
                 #that to drive the twist joints
                 
-                _bottomJoint.rx.connect(self.m_multNode.input2X)
+                modifier.connect(_bottomJoint.rx, multNode.input2X)
                 
                 for joint in self.m_jointChain.getJointList():
                     
-                    self.m_multNode.outputX.connect(joint.rx)
+                    modifier.connect(multNode.outputX, joint.rx)
                     
             elif _attr == "ry":
                 
                 #connect the value on the bottom joint to the mult node and the output of
                 #that to drive the twist joints
                 
-                _bottomJoint.ry.connect(self.m_multNode.input2X)
+                modifier.connect(_bottomJoint.ry, multNode.input2X)
                 
                 for joint in self.m_jointChain.getJointList():
                     
-                    self.m_multNode.outputX.connect(joint.ry)
+                    modifier.connect(multNode.outputX, joint.ry)
                     
             elif _attr == "rz":
                 
                 #connect the value on the bottom joint to the mult node and the output of
                 #that to drive the twist joints
                 
-                _bottomJoint.rz.connect(self.m_multNode.input2X)
+                modifier.connect(_bottomJoint.rz, multNode.input2X)
                 
                 for joint in self.m_jointChain.getJointList():
                     
-                    self.m_multNode.outputX.connect(joint.rz)
+                    modifier.connect(multNode.outputX, joint.rz)
                     
             elif _attr == "tx":
                 
                 #connect the value on the bottom joint to the mult node and the output of
                 #that to drive the twist joints
                 
-                _bottomJoint.tx.connect(self.m_multNode.input2X)
+                modifier.connect(_bottomJoint.tx, multNode.input2X)
                 
                 for joint in self.m_jointChain.getJointList():
                     
-                    self.m_multNode.outputX.connect(joint.tx)
+                    modifier.connect(multNode.outputX, joint.tx)
                     
             elif _attr == "ty":
                 
                 #connect the value on the bottom joint to the mult node and the output of
                 #that to drive the twist joints
                 
-                _bottomJoint.ty.connect(self.m_multNode.input2X)
+                modifier.connect(_bottomJoint.ty, multNode.input2X)
                 
                 for joint in self.m_jointChain.getJointList():
                     
-                    self.m_multNode.outputX.connect(joint.ty)
+                    modifier.connect(multNode.outputX, joint.ty)
                     
             elif _attr == "tz":
                 
                 #connect the value on the bottom joint to the mult node and the output of
                 #that to drive the twist joints
                 
-                _bottomJoint.tz.connect(self.m_multNode.input2X)
+                modifier.connect(_bottomJoint.tz, multNode.input2X)
                 
                 for joint in self.m_jointChain.getJointList():
                     
-                    self.m_multNode.outputZ.connect(joint.tz)
+                    modifier.connect(multNode.outputZ, joint.tz)
                     
             elif _attr == "sx":
                 
                 #connect the value on the bottom joint to the mult node and the output of
                 #that to drive the twist joints
                 
-                _bottomJoint.sx.connect(self.m_multNode.input2X)
+                modifier.connect(_bottomJoint.sx, multNode.input2X)
                 
                 for joint in self.m_jointChain.getJointList():
                     
-                    self.m_multNode.outputX.connect(joint.sx)
+                    modifier.connect(multNode.outputX, joint.sx)
                     
             elif _attr == "sy":
                 
                 #connect the value on the bottom joint to the mult node and the output of
                 #that to drive the twist joints
                 
-                _bottomJoint.sy.connect(self.m_multNode.input2X)
+                modifier.connect(_bottomJoint.sy, multNode.input2X)
                 
                 for joint in self.m_jointChain.getJointList():
                     
-                    self.m_multNode.outputX.connect(joint.sy)
+                    modifier.connect(multNode.outputX, joint.sy)
                     
             elif _attr == "sz":
                 
                 #connect the value on the bottom joint to the mult node and the output of
                 #that to drive the twist joints
                 
-                _bottomJoint.sz.connect(self.m_multNode.input2X)
+                modifier.connect(_bottomJoint.sz, multNode.input2X)
                 
                 for joint in self.m_jointChain.getJointList():
                     
-                    self.m_multNode.outputZ.connect(joint.sz)
+                    modifier.connect(multNode.outputZ, joint.sz)
+                    
+            modifier.doIt()
                     
         self.m_isGenerated = True
                             
@@ -264,38 +278,21 @@ class TwistChain(pjcc.JointChainContainer):
         """
         
         if self.m_isGenerated == True:
-                
-            #call clear on pRigging objects
             
-            self.m_jointChain.clear()
+            #delete every node made, along with those of the objects held, in
+            #a single delete
             
-            #delete maya objects
+            self.deleteLedger()
             
-            try:
-                
-                pm.delete(self.m_multNode)
-                
-            except:
-                
-                pass
+            #clear the pRigging objects too, they have nothing left to delete
             
+            self.m_jointChain.clear()
             
-            for grp in self.m_chainGroups:
-                
-                try:
-                    
-                    pm.delete(grp)
-                    
-                except:
-                
-                    pass
-            
-                
             #then reset the lists
             
             self.m_jointChain = 0
-            self.m_multNode = ""
-            self.m_chainGroups = []
+            self.m_multNode = pnl.NodeList()
+            self.m_chainGroups = pnl.NodeList()
             
             #and set the is generated boolean
             
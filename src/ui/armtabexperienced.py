@@ -1,9 +1,12 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
+import pRigging.src.nodecache as pnc
 import pRigging.src.ui.tabbase as ptb
 import pRigging.src.ui.tabsettings as pts
 
+pm = psb.ui
+
 #----------ArmTabExperienced-Class----------#
 
 class ArmTabExperienced(ptb.TabBase):
@@ -19,7 +22,8 @@ class ArmTabExperienced(ptb.TabBase):
             self.m_topLayout
 
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
+            pRigging.src.nodecache as pnc
             pRigging.src.ui.tabbase as ptb
             pRigging.src.ui.tabsettings as pts    
     """
@@ -311,33 +315,33 @@ class ArmTabExperienced(ptb.TabBase):
         
         self.m_fkExt.setEnable(_val)
 
-    def genChain(self):
+    def genChain(self, _regen = False):
         
         """
             Method: genChain
                 A method to generate the joint chain
+                
+            Inputs:
+                _regen:                 Whether or not to regenerate the rig element if
+                                        it already exists, only changing what is needed
         """
         
         #if the rig element already exists
         
-        if self.m_rigElement.getIsGenerated() == True:
+        if self.m_rigElement.getIsGenerated() == True and not _regen:
             
             self.m_gui.getHelp().update( _errorList = ["ERROR","ALREADY MADE","ERROR: The currently active rig element is aready generated, if you want to relpace it, click the \"Regenerate Rig\" button"])
             
         else:
             
-            #create a list of the unicode strings representing
-            #the selected joints and an empty list for their
-            #pynode counterparts
+            #get the list of the unicode strings representing
+            #the selected joints
             
             strList = self.m_jointTable.getAllItems()
-            pyNodeList = []
             
-            #cycle through and convert to pyNode
+            #convert to pyNodes, all at once through the node cache
             
-            for jnt in strList:
-                
-                pyNodeList.append(pm.PyNode(jnt))
+            pyNodeList = pnc.getNodes(strList, psb.ui)
                 
             #check that there are some joints
             
@@ -353,7 +357,7 @@ class ArmTabExperienced(ptb.TabBase):
             
                 #enfoce the hierarchy
                 
-                pyNodeList = self.enforceHierarchy(pyNodeList)
+                pyNodeList, breakJoint = self.sortHierarchy(pyNodeList)
                 
                 #now check if there is any nodes in the joint list
                 
@@ -361,7 +365,13 @@ class ArmTabExperienced(ptb.TabBase):
                     
                     #temp print, will use the help box eventually
                     
-                    self.m_gui.getHelp().update( _errorList =["ERROR","INCORRECT HIERARCHY","ERROR: The joints selected were not in a single hierarchy, either a joint was missing or one of them had two immediate children in the selection with it"])
+                    message = "ERROR: The joints selected were not in a single hierarchy, either a joint was missing or one of them had two immediate children in the selection with it"
+                    
+                    if breakJoint is not None:
+                        
+                        message = message + ", the hierarchy breaks at " + str(breakJoint)
+                        
+                    self.m_gui.getHelp().update( _errorList = ["ERROR","INCORRECT HIERARCHY",message])
                 
                 else:
 
@@ -400,19 +410,19 @@ class ArmTabExperienced(ptb.TabBase):
                     
                     self.m_rigElement.setRootName(self.addExtToNames(self.addExtToNames([self.m_rigName],self.m_sideTextField.getText()),self.m_nameOverrideText.getText())[0])
                     
-                    result = self.m_rigElement.genArmRig(pyNodeList,
+                    #build the rig with the gui's build options
+                    
+                    self.genRig(pyNodeList,
                                 _doIK = self.m_ikCheck.getValue(),
                                 _ikExt = self.m_ikExt.getText(),
                                 _doFK = self.m_fkCheck.getValue(),
                                 _fkExt = self.m_fkExt.getText(),
                                 _jntExt = self.m_jointExt.getText(),
                                 _ctrlExt = self.m_controlExt.getText(),
-                                _doTwist = doTwist, 
+                                _doTwist = doTwist,
                                 _twistStartIds = indexList,
-                                _numTwistJnts =  self.m_numTwistJntsVal.getValue()
-                                )
-                        
-                    self.m_gui.getHelp().update( _errorList = result)
+                                _numTwistJnts =  self.m_numTwistJntsVal.getValue(),
+                                _regen = _regen)
 
     def getInfo(self):
         """
@@ -438,6 +448,5 @@ class ArmTabExperienced(ptb.TabBase):
                 A method to regenerate the chain based on a new set of parameters
         """
         
-        self.m_rigElement.clear()
-        self.genChain()
+        self.genChain(_regen = True)
 #----------END-ArmTabExperienced-Class----------#       
@@ -1,9 +1,12 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
+import pRigging.src.nodecache as pnc
 import pRigging.src.ui.tabbase as ptb
 import pRigging.src.ui.tabsettings as pts
 
+pm = psb.ui
+
 #----------ArmTabNovice-Class----------#
 
 class ArmTabNovice(ptb.TabBase):
@@ -19,7 +22,8 @@ class ArmTabNovice(ptb.TabBase):
             self.m_topLayout
 
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
+            pRigging.src.nodecache as pnc
             pRigging.src.ui.tabbase as ptb
             pRigging.src.ui.tabsettings as pts
     """
@@ -284,18 +288,14 @@ class ArmTabNovice(ptb.TabBase):
         
         if not isChainExist:        
             
-            #create a list of the unicode strings representing
-            #the selected joints and an empty list for their
-            #pynode counterparts
+            #get the list of the unicode strings representing
+            #the selected joints
             
             strList = self.m_jointTable.getAllItems()
-            pyNodeList = []
             
-            #cycle through and convert to pyNode
+            #convert to pyNodes, all at once through the node cache
             
-            for jnt in strList:
-                
-                pyNodeList.append(pm.PyNode(jnt))
+            pyNodeList = pnc.getNodes(strList, psb.ui)
                 
             #check that there are some joints
             
@@ -311,7 +311,7 @@ class ArmTabNovice(ptb.TabBase):
                 
                 #set the m_template joints equal to those passed in with hierarchy enforced
                 
-                pyNodeList = self.enforceHierarchy(pyNodeList)
+                pyNodeList, breakJoint = self.sortHierarchy(pyNodeList)
                 
                 #now check if there is any nodes in the joint list
                 
@@ -319,7 +319,13 @@ class ArmTabNovice(ptb.TabBase):
                     
                     #temp print, will use the help box eventually
                     
-                    self.m_gui.getHelp().update( _errorList = ["ERROR","INCORRECT HIERARCHY","ERROR: The joints selected were not in a single hierarchy, either a joint was missing or one of them had two immediate children in the selection with it"])
+                    message = "ERROR: The joints selected were not in a single hierarchy, either a joint was missing or one of them had two immediate children in the selection with it"
+                    
+                    if breakJoint is not None:
+                        
+                        message = message + ", the hierarchy breaks at " + str(breakJoint)
+                        
+                    self.m_gui.getHelp().update( _errorList = ["ERROR","INCORRECT HIERARCHY",message])
                 
                 else:
                             
@@ -327,19 +333,18 @@ class ArmTabNovice(ptb.TabBase):
                     
                     self.m_rigElement.setRootName(self.addExtToNames(self.addExtToNames([self.m_rigName],self.m_sideSpecifier),self.m_limbName)[0])
                     
-                    result = self.m_rigElement.genArmRig(pyNodeList,
+                    #build the rig with the gui's build options
+                    
+                    self.genRig(pyNodeList,
                                 _doIK = self.m_ikCheck.getValue(),
                                 _ikExt = self.m_ikExt,
                                 _doFK = self.m_fkCheck.getValue(),
                                 _fkExt = self.m_fkExt,
                                 _jntExt = self.m_jntExt,
                                 _ctrlExt = self.m_ctrlExt,
-                                _doTwist = self.m_twistCheck.getValue(), 
+                                _doTwist = self.m_twistCheck.getValue(),
                                 _twistStartIds = [-2],
-                                _numTwistJnts = self.m_numTwistJnts
-                                )
-                                
-                    self.m_gui.getHelp().update( _errorList = result)
+                                _numTwistJnts = self.m_numTwistJnts)
 
     def getInfo(self):
         """
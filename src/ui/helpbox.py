@@ -1,6 +1,8 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
+
+pm = psb.ui
 
 #----------HelpBox-Class----------#
 
@@ -13,7 +15,7 @@ class HelpBox():
         File: pRigging/src/ui/helpbox.py
         
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
     """
     
     def __init__(self,_parent, _guiInstance):
@@ -98,7 +100,6 @@ class HelpBox():
             #make a list of the selection
             
             sel = pm.ls(sl = True)
-            print sel
             
             #if there are elements in the selection
             
@@ -1,8 +1,10 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
 import pRigging.src.riggingbase as prb
 
+pm = psb.ui
+
 #----------StartTabNovice-Class----------#
 
 class StartTabNovice(prb.RiggingBase):
@@ -18,7 +20,7 @@ class StartTabNovice(prb.RiggingBase):
             self.m_topLayout
 
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
             pRigging.src.riggingbase as prb     
     """
     
@@ -1,8 +1,10 @@
 #----------Imports----------#
 
-import pymel.core as pm
+import pRigging.src.scenebackend as psb
 import pRigging.src.riggingbase as prb
 
+pm = psb.ui
+
 #----------TabBase-Class----------#
 
 class TabBase(prb.RiggingBase):
@@ -27,7 +29,7 @@ class TabBase(prb.RiggingBase):
             self.m_rigElement:      The rig element that the tab relates to
 
         Imports:
-            pymel.core as pm
+            pRigging.src.scenebackend as psb
             pRigging.src.riggingbase as prb     
     """
     
@@ -71,7 +73,6 @@ class TabBase(prb.RiggingBase):
         i = 1
                 
         while not result:
-            print pm.formLayout(self.m_name, q = True, ex = True)
             if pm.formLayout(self.m_name, q = True, ex = True):
             
                 self.m_name = self.addExtToNames(self.removeExtFromNames([self.m_name]), str(i))[0]
@@ -121,6 +122,58 @@ class TabBase(prb.RiggingBase):
                   
         self.m_rigElement.setVis(_val)
     
+    def genRig(self, _joints, _regen = False, **_settings):
+        
+        """
+            Method: genRig
+                A method to generate the rig, or regenerate it, from the joints with the
+                gui's build options, profiling the build if profiling is turned on, and
+                show the result in the help box
+                
+            Inputs:
+                _joints:                The template joints, in hierarchy order
+                _regen:                 Whether or not to regenerate the rig already
+                                        built rather than generate a new one
+                _settings:              The settings passed on to the build, e.g. _doIK
+                
+            On Exit:                    Returns the list the build returned
+        """
+        
+        build = self.m_rigElement.genArmRig
+        
+        if _regen:
+            
+            build = self.m_rigElement.regenArmRig
+            
+        profiler = self.m_gui.getProfiler()
+        
+        if profiler is not None:
+            
+            profiler.start()
+            
+        try:
+            
+            result = build(_joints,
+                           _fastBuild = self.m_gui.getFastBuild(),
+                           _cache = self.m_gui.getBuildCache(),
+                           **_settings)
+            
+        finally:
+            
+            if profiler is not None:
+                
+                profiler.stop()
+                
+        #add the profile results to the build's message
+        
+        if profiler is not None:
+            
+            result = profiler.getHelp(result)
+            
+        self.m_gui.getHelp().update( _errorList = result)
+        
+        return result
+        
     def closeUI(self):
         
         """
@@ -0,0 +1,31 @@
+#----------Imports----------#
+
+import os
+import sys
+import importlib.util
+import pytest
+
+#the repository is the pRigging package itself, so it is registered under that
+#name for the tests to import it as the toolset does inside maya
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if "pRigging" not in sys.modules:
+
+    spec = importlib.util.spec_from_file_location("pRigging", os.path.join(ROOT, "__init__.py"), submodule_search_locations = [ROOT])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["pRigging"] = module
+    spec.loader.exec_module(module)
+
+import pRigging.src.scenebackend as psb
+
+@pytest.fixture
+def scene():
+
+    #a new, empty in-memory scene for the test, pymel is put back afterwards
+
+    scene = psb.useMemoryScene()
+
+    yield scene
+
+    psb.usePymel()
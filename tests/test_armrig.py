@@ -0,0 +1,251 @@
+#----------Imports----------#
+
+import math
+import pytest
+import pRigging.src.scenebackend as psb
+import pRigging.src.armrig as par
+import pRigging.src.planexecutor as ppe
+
+pm = psb.pm
+
+#the template arm, bent at the elbow and rotated at each joint so that every
+#joint has its own orientation
+
+TEMPLATE_NAMES = ["Shoulder", "Elbow", "Wrist"]
+TEMPLATE_POSITIONS = [(0.0, 150.0, 0.0), (30.0, 140.0, -5.0), (55.0, 135.0, 0.0)]
+TEMPLATE_ROTATIONS = [(0.0, 10.0, -18.0), (0.0, -11.0, -11.0), (5.0, 0.0, -11.0)]
+
+BUILD_SETTINGS = {"_ikExt" : "IK", "_fkExt" : "FK", "_twistStartIds" : [0, -2], "_numTwistJnts" : 2}
+
+TOLERANCE = 1e-6
+
+#----------Helpers----------#
+
+#the scene fixture, a new in-memory scene for each test, is in conftest.py
+
+def genTemplate():
+
+    #makes the template joints in the current scene, parent first
+
+    pm.select(cl = True)
+
+    joints = [pm.joint(name = "L_%s_JNT" % name, position = position) for name, position in zip(TEMPLATE_NAMES, TEMPLATE_POSITIONS)]
+
+    pm.select(cl = True)
+
+    for joint, rotation in zip(joints, TEMPLATE_ROTATIONS):
+
+        joint.setRotation(rotation, space = "world")
+
+    return joints
+
+def genArm(_settings = None):
+
+    settings = dict(BUILD_SETTINGS)
+    settings.update(_settings or {})
+
+    template = genTemplate()
+    arm = par.ArmRig("L_Arm")
+    status = arm.genArmRig(template, **settings)
+
+    assert status[0] == "SUCCESS", status
+
+    return arm, template
+
+def getWorldMatrix(_name):
+
+    return pm.PyNode(_name).getMatrix(worldSpace = True)
+
+def assertMatricesClose(_a, _b):
+
+    for rowA, rowB in zip(_a, _b):
+
+        for a, b in zip(rowA, rowB):
+
+            assert abs(a - b) < TOLERANCE, (_a, _b)
+
+def getRigState(_scene):
+
+    #the long name and world matrix of every dag node in the scene
+
+    return dict([(node.longName(), node.getMatrix(worldSpace = True)) for node in _scene.m_nodes.values() if node.m_isDag])
+
+#----------Tests----------#
+
+def test_node_names(scene):
+
+    genArm()
+
+    expected = ["L_Arm_GRP", "L_Arm_IK_GRP", "L_Arm_FK_GRP", "L_Arm_Bind_GRP",
+                "L_Arm_IK_CTRL", "L_Arm_IK_PV_CTRL", "L_Arm_IK_HNDL", "L_Arm_FKIK_CTRL",
+                "L_Arm_FKIK_MINUS"]
+
+    for name in TEMPLATE_NAMES:
+
+        expected.extend(["L_Arm_%s_%s_JNT" % (name, ext) for ext in ("IK", "FK", "Bind")])
+        expected.append("L_Arm_%s_FK_CTRL" % name)
+
+    for name in TEMPLATE_NAMES[:2]:
+
+        expected.extend(["L_Arm_%s_Bind_Twist_%d_JNT" % (name, i) for i in (1, 2)])
+        expected.append("L_Arm_%s_Bind_Twist_MULT" % name)
+
+    names = set([str(node) for node in pm.ls()])
+
+    assert set(expected) <= names, sorted(set(expected) - names)
+
+    #each chain is grouped under its own group, all under the rig's
+
+    assert pm.PyNode("L_Arm_Shoulder_IK_JNT").longName() == "|L_Arm_GRP|L_Arm_IK_GRP|L_Arm_Shoulder_IK_JNT"
+    assert pm.PyNode("L_Arm_Shoulder_FK_JNT").longName() == "|L_Arm_GRP|L_Arm_FK_GRP|L_Arm_Shoulder_FK_JNT"
+    assert pm.PyNode("L_Arm_Shoulder_Bind_JNT").longName() == "|L_Arm_GRP|L_Arm_Bind_GRP|L_Arm_Shoulder_Bind_JNT"
+
+def test_chain_world_matrices(scene):
+
+    arm, template = genArm()
+
+    for joint, name in zip(template, TEMPLATE_NAMES):
+
+        for ext in ("IK", "FK", "Bind"):
+
+            assertMatricesClose(getWorldMatrix("L_Arm_%s_%s_JNT" % (name, ext)), joint.getMatrix(worldSpace = True))
+
+        #the fk controls sit on the fk joints they drive
+
+        assertMatricesClose(getWorldMatrix("L_Arm_%s_FK_CTRL" % name), joint.getMatrix(worldSpace = True))
+
+def test_twist_world_matrices(scene):
+
+    arm, template = genArm()
+
+    for i in range(0, 2):
+
+        start = template[i].getTranslation(space = "world")
+        end = template[i+1].getTranslation(space = "world")
+        length = math.sqrt(sum([(e - s)**2 for s, e in zip(start, end)]))
+        direction = [(e - s)/length for s, e in zip(start, end)]
+
+        for j in (1, 2):
+
+            matrix = getWorldMatrix("L_Arm_%s_Bind_Twist_%d_JNT" % (TEMPLATE_NAMES[i], j))
+
+            #spaced evenly along the bone, pointing down it
+
+            position = [s + (e - s)*j/3.0 for s, e in zip(start, end)]
+
+            assertMatricesClose([matrix[3][:3]], [position])
+            assertMatricesClose([matrix[0][:3]], [direction])
+
+def test_ik_world_matrices(scene):
+
+    arm, template = genArm()
+
+    wrist = template[-1].getTranslation(space = "world")
+
+    #the ik control is lined up with the world at the wrist, with the handle
+
+    assertMatricesClose(getWorldMatrix("L_Arm_IK_CTRL"), [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], list(wrist) + [1.0]])
+    assertMatricesClose([getWorldMatrix("L_Arm_IK_HNDL")[3][:3]], [wrist])
+
+def test_plan_matches_direct_build(scene):
+
+    genArm()
+    direct = getRigState(scene)
+
+    scene = psb.useMemoryScene()
+
+    genArm({"_usePlan" : True})
+    planned = getRigState(scene)
+
+    assert sorted(direct) == sorted(planned)
+
+    for name in direct:
+
+        assertMatricesClose(direct[name], planned[name])
+
+def test_regen_renames_to_match_fresh_build(scene):
+
+    arm, template = genArm()
+    status = arm.regenArmRig(template, **dict(BUILD_SETTINGS, _ikExt = "Ik", _jntExt = "J"))
+
+    assert status[0] == "SUCCESS", status
+    assert "renamed" in status[2]
+
+    regenerated = getRigState(scene)
+
+    scene = psb.useMemoryScene()
+
+    genArm({"_ikExt" : "Ik", "_jntExt" : "J"})
+    fresh = getRigState(scene)
+
+    assert sorted(regenerated) == sorted(fresh)
+
+    for name in fresh:
+
+        assertMatricesClose(regenerated[name], fresh[name])
+
+def test_build_ignores_selection(scene):
+
+    genArm()
+    unselected = getRigState(scene)
+
+    #the same build with a template joint and a group selected
+
+    scene = psb.useMemoryScene()
+
+    template = genTemplate()
+    pm.select([template[1], pm.createNode("transform", name = "other", skipSelect = True)])
+
+    status = par.ArmRig("L_Arm").genArmRig(template, **BUILD_SETTINGS)
+    selected = getRigState(scene)
+
+    assert status[0] == "SUCCESS", status
+
+    del selected["|other"]
+
+    assert sorted(selected) == sorted(unselected)
+
+    for name in selected:
+
+        assertMatricesClose(selected[name], unselected[name])
+
+def failBuild(*_args, **_kwargs):
+
+    raise RuntimeError("failed build")
+
+@pytest.mark.parametrize("usePlan", [False, True])
+def test_failed_build_is_rolled_back(scene, monkeypatch, usePlan):
+
+    template = genTemplate()
+    names = sorted([str(node) for node in pm.ls()])
+
+    #the direct build fails once the chains are made, the planned one once
+    #the plan's nodes are made
+
+    if usePlan:
+
+        monkeypatch.setattr(ppe.PlanExecutor, "connectPlugs", failBuild)
+
+    else:
+
+        monkeypatch.setattr(par.ArmRig, "buildBindPart", failBuild)
+
+    arm = par.ArmRig("L_Arm")
+
+    with pytest.raises(RuntimeError):
+
+        arm.genArmRig(template, **dict(BUILD_SETTINGS, _usePlan = usePlan))
+
+    assert sorted([str(node) for node in pm.ls()]) == names
+    assert not arm.getIsGenerated()
+    assert arm.getLedger() == []
+
+    #the names freed by the rollback are given to the rebuild
+
+    monkeypatch.undo()
+
+    status = arm.genArmRig(template, **dict(BUILD_SETTINGS, _usePlan = usePlan))
+
+    assert status[0] == "SUCCESS", status
+    assert pm.PyNode("L_Arm_GRP").exists()
+    assert str(arm.m_FKIKControl.getCtrl()) == "L_Arm_FKIK_CTRL"
@@ -0,0 +1,82 @@
+#----------Imports----------#
+
+import json
+import pRigging.src.batch as pbt
+
+RIG_DATA = {"joints" : ["L_Shoulder_JNT", "L_Elbow_JNT", "L_Wrist_JNT"],
+            "positions" : [[0.0, 150.0, 0.0], [30.0, 140.0, -5.0], [55.0, 135.0, 0.0]],
+            "numTwistJnts" : 2}
+
+#----------Helpers----------#
+
+def writeSpecs(_folder, _rigCounts):
+
+    #writes a spec file for each entry, a job with that many rigs, each rig named
+    #after its job and its place in it, and returns the paths and the rig names
+    #in job order
+
+    paths = []
+    names = []
+
+    for i in range(0, len(_rigCounts)):
+
+        rigs = [dict(RIG_DATA, baseName = "Job%dRig%d" % (i, j)) for j in range(0, _rigCounts[i])]
+        names.extend(["Job%dRig%d_L_Arm" % (i, j) for j in range(0, _rigCounts[i])])
+
+        path = _folder / ("job%d.json" % i)
+        path.write_text(json.dumps({"rigs" : rigs}))
+        paths.append(str(path))
+
+    return paths, names
+
+#----------BatchBuilder----------#
+
+def test_builder_builds_every_rig(scene, tmp_path):
+
+    paths, names = writeSpecs(tmp_path, [2, 1])
+
+    builder = pbt.BatchBuilder("memory")
+    results = builder.run(paths)
+
+    assert [result["rig"] for result in results] == names
+    assert builder.getFailures() == []
+
+def test_failed_rig_does_not_stop_batch(scene, tmp_path):
+
+    paths, names = writeSpecs(tmp_path, [1])
+
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps({"rigs" : [dict(RIG_DATA, baseName = "Bad", doIK = False, doFK = False), dict(RIG_DATA, baseName = "Good")]}))
+
+    builder = pbt.BatchBuilder("memory")
+    results = builder.run([str(path), str(tmp_path / "missing.json")] + paths)
+
+    #the spec files are read before any job is run
+
+    assert [(result["rig"], result["status"]) for result in results] == [(None, "ERROR"), ("Bad_L_Arm", "ERROR"),
+                                                                         ("Good_L_Arm", "SUCCESS"), (names[0], "SUCCESS")]
+    assert [result["title"] for result in builder.getFailures()] == ["SPEC NOT LOADED", "INVALID SPEC"]
+
+#----------BatchScheduler----------#
+
+def test_scheduler_keeps_job_order(tmp_path):
+
+    #the jobs take different times, so they finish out of order
+
+    paths, names = writeSpecs(tmp_path, [3, 1, 2, 1])
+
+    scheduler = pbt.BatchScheduler(2, "memory")
+    results = scheduler.run(paths)
+
+    assert [result["rig"] for result in results] == names
+    assert scheduler.getFailures() == []
+
+    for result in results:
+
+        assert result["jobTime"] >= result["time"]
+        assert "worker" in result
+
+    info = scheduler.getRunInfo()
+
+    assert info["workers"] == 2
+    assert info["wallTime"] > 0.0
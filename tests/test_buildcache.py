@@ -0,0 +1,140 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.armrig as par
+import pRigging.src.buildcache as pbc
+from pRigging.src.benchmark import ArmRigBenchmark
+
+pm = psb.pm
+
+BUILD_SETTINGS = {"_twistStartIds" : [0, -2], "_numTwistJnts" : 2}
+
+TOLERANCE = 1e-6
+
+#----------Helpers----------#
+
+def getRigState():
+
+    #the name, parent and world matrix of every node in the scene
+
+    state = {}
+
+    for node in pm.ls():
+
+        parent = None
+
+        if hasattr(node, "getParent"):
+
+            parent = str(node.getParent())
+
+        state[str(node)] = (parent, node.getMatrix(worldSpace = True) if hasattr(node, "getMatrix") else None)
+
+    return state
+
+def assertStatesMatch(_a, _b):
+
+    assert sorted(_a) == sorted(_b)
+
+    for name in _a:
+
+        assert _a[name][0] == _b[name][0], name
+
+        if _a[name][1] is not None:
+
+            for rowA, rowB in zip(_a[name][1], _b[name][1]):
+
+                for a, b in zip(rowA, rowB):
+
+                    assert abs(a - b) < TOLERANCE, name
+
+def genCachedArm(_template, _cache):
+
+    arm = par.ArmRig("L_Arm")
+    status = arm.genArmRig(_template, _cache = _cache, **BUILD_SETTINGS)
+
+    assert status[0] == "SUCCESS", status
+
+    return arm
+
+#----------Tests----------#
+
+def test_hit_builds_same_rig_as_miss(scene):
+
+    cache = pbc.BuildCache()
+    template = ArmRigBenchmark().genTemplateChain(3)
+
+    arm = genCachedArm(template, cache)
+    missed = getRigState()
+
+    #cleared so the second build finds the names free
+
+    arm.clear()
+
+    arm = genCachedArm(template, cache)
+    hit = getRigState()
+
+    assert cache.getStats() == {"hits" : 1, "misses" : 1, "entries" : 1}
+
+    assertStatesMatch(missed, hit)
+
+    #the rig is given back the state of the rig that planned it
+
+    assert arm.getIsGenerated()
+    assert str(arm.m_FKIKControl.getCtrl()) == "L_Arm_FKIK_CTRL"
+
+    #and both match a build without the cache
+
+    psb.useMemoryScene()
+
+    par.ArmRig("L_Arm").genArmRig(ArmRigBenchmark().genTemplateChain(3), **BUILD_SETTINGS)
+
+    assertStatesMatch(hit, getRigState())
+
+def test_hit_rig_clears(scene):
+
+    cache = pbc.BuildCache()
+    template = ArmRigBenchmark().genTemplateChain(3)
+
+    genCachedArm(template, cache).clear()
+    genCachedArm(template, cache).clear()
+
+    assert sorted([str(node) for node in pm.ls()]) == sorted([str(joint) for joint in template])
+
+def test_entries_are_loaded_from_directory(scene, tmp_path):
+
+    template = ArmRigBenchmark().genTemplateChain(3)
+
+    genCachedArm(template, pbc.BuildCache(str(tmp_path))).clear()
+
+    cache = pbc.BuildCache(str(tmp_path))
+    genCachedArm(template, cache)
+
+    assert cache.getStats() == {"hits" : 1, "misses" : 0, "entries" : 1}
+
+def test_key_follows_template_and_settings(scene):
+
+    cache = pbc.BuildCache()
+    template = ArmRigBenchmark().genTemplateChain(3)
+    params = {"ikExt" : "IK"}
+
+    key = cache.getKey("ArmRig", template, params)
+
+    assert cache.getKey("ArmRig", template, dict(params)) == key
+    assert cache.getKey("ArmRig", template, {"ikExt" : "Ik"}) != key
+    assert cache.getKey("LegRig", template, params) != key
+
+    template[-1].setTranslation((0.0, 1.0, 0.0), space = "world")
+
+    assert cache.getKey("ArmRig", template, params) != key
+
+def test_taken_names_are_planned_again(scene):
+
+    cache = pbc.BuildCache()
+    template = ArmRigBenchmark().genTemplateChain(3)
+
+    genCachedArm(template, cache)
+    arm = genCachedArm(template, cache)
+
+    #the stored plan's names are in use, so the rig is planned with new ones
+
+    assert str(arm.m_FKIKControl.getCtrl()) == "L_Arm_FKIK_CTRL1"
@@ -0,0 +1,125 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.buildsession as pbs
+import pRigging.src.riggingbase as prb
+import pRigging.src.templatesnapshot as ptsn
+
+pm = psb.pm
+
+#----------Helpers----------#
+
+def genChain(_scene):
+
+    #a group with a chain of three joints under it, and a group beside it
+
+    top = pm.createNode("transform", name = "top", skipSelect = True)
+    joints = [pm.createNode("joint", name = "joint1", parent = top, skipSelect = True)]
+
+    for i in range(2, 4):
+
+        joints.append(pm.createNode("joint", name = "joint%d" % i, parent = joints[-1], skipSelect = True))
+        joints[-1].setTranslation((10.0, 0.0, 0.0))
+
+    other = pm.createNode("transform", name = "other", skipSelect = True)
+
+    _scene.resetStats()
+
+    return top, joints, other
+
+def getQueries(_scene):
+
+    counts = _scene.getCommandCounts()
+
+    return counts.get("getMatrix", 0) + counts.get("getParent", 0)
+
+#----------World matrix cache----------#
+
+def test_cached_nodes_are_read_once(scene):
+
+    top, joints, other = genChain(scene)
+    session = pbs.startSession()
+
+    try:
+
+        session.cacheNodes(joints)
+
+        for i in range(0, 3):
+
+            matrices = [pbs.getWorldMatrix(joint) for joint in joints]
+            pbs.getWorldMatrix(other)
+
+        #a getMatrix for each joint, a getParent for each to track them, the
+        #first walking up to the world, and every read of the uncached group
+
+        assert scene.getCommandCounts()["getMatrix"] == 3 + 3
+        assert scene.getCommandCounts()["getParent"] == 3 + 1
+        assert matrices[2][3][:3] == [20.0, 0.0, 0.0]
+
+    finally:
+
+        pbs.endSession()
+
+def test_moves_drop_only_nodes_under_them(scene):
+
+    top, joints, other = genChain(scene)
+    session = pbs.startSession()
+
+    try:
+
+        session.cacheNodes(joints)
+        snapshot = ptsn.getTemplateSnapshot(joints)
+
+        #moving a node nothing cached is under queries nothing and keeps the cache
+
+        queries = getQueries(scene)
+
+        pbs.nodeMoved(other)
+
+        assert getQueries(scene) == queries
+        assert len(session.m_worldMatrices) == 3
+        assert ptsn.getTemplateSnapshot(joints) is snapshot
+
+        #moving the middle joint drops it and the joint under it
+
+        pbs.nodeMoved(joints[1])
+
+        assert list(session.m_worldMatrices.keys()) == [joints[0]]
+        assert ptsn.getTemplateSnapshot(joints) is not snapshot
+
+        #and moving the group drops the rest
+
+        top.setTranslation((0.0, 5.0, 0.0))
+        pbs.nodeMoved(top)
+
+        assert session.m_worldMatrices == {}
+        assert pbs.getWorldMatrix(joints[2])[3][:3] == [20.0, 5.0, 0.0]
+
+    finally:
+
+        pbs.endSession()
+
+def test_reparent_drops_nodes_under_it(scene):
+
+    top, joints, other = genChain(scene)
+    session = pbs.startSession()
+
+    try:
+
+        session.cacheNodes(joints)
+        pbs.getWorldMatrix(joints[2])
+
+        prb.RiggingBase().reparentNode(joints[1], other)
+
+        assert session.m_worldMatrices == {}
+
+        #read again it is tracked under its new parent
+
+        pbs.getWorldMatrix(joints[2])
+        pbs.nodeMoved(other)
+
+        assert session.m_worldMatrices == {}
+
+    finally:
+
+        pbs.endSession()
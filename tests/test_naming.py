@@ -0,0 +1,134 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.naming as pnm
+import pRigging.src.armrig as par
+from pRigging.src.benchmark import ArmRigBenchmark
+
+pm = psb.pm
+
+#----------NamingEngine----------#
+
+def test_add_ext_joins_with_one_underscore():
+
+    assert pnm.addExt("L_Arm", "IK") == "L_Arm_IK"
+    assert pnm.addExt("L_Arm_", "IK") == "L_Arm_IK"
+    assert pnm.addExt("L_Arm", "_IK") == "L_Arm_IK"
+    assert pnm.addExt("L_Arm_", "_IK") == "L_Arm_IK"
+    assert pnm.addExt("L_Arm", "") == "L_Arm"
+
+def test_remove_ext_strips_last_ext():
+
+    assert pnm.removeExt("L_Arm_Elbow_IK_JNT") == "L_Arm_Elbow_IK"
+    assert pnm.removeExt("Elbow") == "Elbow"
+
+def test_render_round_trips():
+
+    engine = pnm.NamingEngine()
+    names = ["L_Arm_Shoulder", "L_Arm_Elbow", "L_Arm_Wrist"]
+
+    added = engine.render(names, 0, ["IK", "JNT"])
+
+    assert added == ["L_Arm_Shoulder_IK_JNT", "L_Arm_Elbow_IK_JNT", "L_Arm_Wrist_IK_JNT"]
+    assert engine.render(added, 2) == names
+
+    #swapping one chain's extensions for another's in one go
+
+    assert engine.render(added, 2, ["FK", "JNT"]) == ["L_Arm_Shoulder_FK_JNT", "L_Arm_Elbow_FK_JNT", "L_Arm_Wrist_FK_JNT"]
+
+def test_render_matches_uncached():
+
+    engine = pnm.NamingEngine()
+
+    #rendered twice, the second time from the cache
+
+    for i in range(0, 2):
+
+        assert engine.render(["a_b_c"], 1, ["d"]) == [pnm.addExt(pnm.removeExt("a_b_c"), "d")]
+
+def test_templates_are_shared_by_rule():
+
+    engine = pnm.NamingEngine()
+
+    assert engine.getTemplate(2, ["IK", "HNDL"]) is engine.getTemplate(2, ("IK", "HNDL"))
+    assert engine.getTemplate(2, ["IK", "HNDL"]) is not engine.getTemplate(1, ["IK", "HNDL"])
+
+def test_caches_are_bounded(monkeypatch):
+
+    monkeypatch.setattr(pnm, "MAX_CACHED_NAMES", 10)
+
+    engine = pnm.NamingEngine()
+    template = engine.getTemplate(0, ["JNT"])
+
+    for i in range(0, 25):
+
+        assert template.render("joint%d" % i) == "joint%d_JNT" % i
+        assert pnm.removeExt("joint%d_JNT" % i) == "joint%d" % i
+
+        assert len(template.m_cache) <= 10
+        assert len(pnm.addExtCache) <= 10
+        assert len(pnm.removeExtCache) <= 10
+
+def test_clear_empties_caches():
+
+    engine = pnm.NamingEngine()
+    engine.render(["a_b"], 1, ["c"])
+
+    engine.clear()
+
+    assert engine.m_templates == {}
+    assert pnm.addExtCache == {}
+    assert pnm.removeExtCache == {}
+
+#----------NameIndex----------#
+
+def test_reserve_numbers_names_in_use():
+
+    index = pnm.NameIndex(["|L_Arm_GRP|L_Arm_JNT", "L_Arm_JNT1"])
+
+    #long names are held by their short names
+
+    assert index.isUsed("L_Arm_JNT")
+
+    assert index.reserve("L_Arm_JNT") == "L_Arm_JNT2"
+    assert index.reserve("L_Arm_CTRL") == "L_Arm_CTRL"
+    assert index.reserve("L_Arm_CTRL") == "L_Arm_CTRL1"
+
+    #a name already ending in a number counts up from it
+
+    assert index.reserve("L_Arm_JNT1") == "L_Arm_JNT3"
+
+def test_reserve_all_keeps_order():
+
+    index = pnm.NameIndex()
+
+    assert index.reserveAll(["a", "b", "a", "a"]) == ["a", "b", "a1", "a2"]
+
+def test_release_frees_name():
+
+    index = pnm.NameIndex(["a", "a1"])
+
+    index.release("|grp|a1")
+
+    assert not index.isUsed("a1")
+    assert index.reserve("a") == "a1"
+
+def test_reserved_names_match_scene(scene):
+
+    template = ArmRigBenchmark().genTemplateChain(3)
+
+    par.ArmRig("L_Arm").genArmRig(template)
+    arm = par.ArmRig("L_Arm")
+    status = arm.genArmRig(template)
+
+    assert status[0] == "SUCCESS", status
+
+    #the second rig's names collide with the first's and are numbered as the
+    #scene numbers them, so every name is still used only once
+
+    assert str(arm.m_FKIKControl.getCtrl()) == "L_Arm_FKIK_CTRL1"
+    assert str(arm.m_ikChain.getJointChain().getJoint(0)) == "L_Arm_Shoulder_IK_JNT1"
+
+    names = [str(node) for node in pm.ls()]
+
+    assert len(names) == len(set(names))
@@ -0,0 +1,144 @@
+#----------Imports----------#
+
+import pytest
+import pRigging.src.scenebackend as psb
+import pRigging.src.nodecache as pnc
+
+pm = psb.pm
+
+#----------Helpers----------#
+
+def genNodes(_names):
+
+    return [pm.createNode("transform", name = name, skipSelect = True) for name in _names]
+
+class SharedNode(object):
+
+    #a node of a file referenced twice, with the same uuid as its copy
+
+    def __init__(self, _name, _uuid):
+
+        self.m_name = _name
+        self.m_uuid = _uuid
+
+    def __str__(self):
+
+        return self.m_name
+
+    def exists(self):
+
+        return True
+
+    def longName(self):
+
+        return "|" + self.m_name
+
+class SharedBackend(object):
+
+    #just enough of a backend for the cache, every node made with the same uuid
+
+    def __init__(self, _names):
+
+        self.m_nodes = [SharedNode(name, "shared") for name in _names]
+        self.m_finds = 0
+
+    def getBackend(self):
+
+        return self
+
+    def ls(self, _args, uuid = False):
+
+        if not isinstance(_args, list):
+
+            _args = [_args]
+
+        nodes = [node for node in self.m_nodes if str(node) in _args or node.m_uuid in _args]
+
+        if uuid:
+
+            return [node.m_uuid for node in nodes]
+
+        return nodes
+
+    def PyNode(self, _name):
+
+        self.m_finds = self.m_finds + 1
+
+        return [node for node in self.m_nodes if str(node) == _name][0]
+
+#----------Tests----------#
+
+def test_repeated_names_are_hits(scene):
+
+    nodes = genNodes(["a", "b", "c"])
+    cache = pnc.NodeCache()
+
+    assert cache.getNodes(["a", "b", "c", "a"]) == nodes + [nodes[0]]
+    assert cache.getStats() == {"hits" : 0, "misses" : 3, "entries" : 3}
+
+    found = cache.getNodes(["c", "a"])
+
+    assert found[0] is cache.getNode("c") and found[1] is cache.getNode("a")
+    assert cache.getStats() == {"hits" : 4, "misses" : 3, "entries" : 3}
+
+def test_renamed_node_found_under_new_name(scene):
+
+    nodes = genNodes(["a"])
+    cache = pnc.NodeCache()
+
+    node = cache.getNode("a")
+    pm.rename(nodes[0], "b")
+
+    #found by its uuid, as the same node object
+
+    assert cache.getNode("b") is node
+    assert cache.getStats()["entries"] == 1
+
+    #and the old name is looked up again rather than given the renamed node
+
+    with pytest.raises(Exception):
+
+        cache.getNode("a")
+
+def test_least_recently_used_are_dropped(scene):
+
+    genNodes(["a", "b", "c"])
+    cache = pnc.NodeCache(_maxEntries = 2)
+
+    cache.getNodes(["a", "b"])
+    cache.getNode("a")
+    cache.getNode("c")
+
+    assert list(cache.m_uuids) == ["a", "c"]
+
+    #b was dropped, so it is found in the scene again
+
+    cache.getNode("b")
+
+    assert cache.getStats() == {"hits" : 1, "misses" : 4, "entries" : 2}
+
+def test_switching_backend_empties_cache(scene):
+
+    genNodes(["a"])
+    cache = pnc.NodeCache()
+    node = cache.getNode("a")
+
+    psb.useMemoryScene()
+    genNodes(["a"])
+
+    assert cache.getNode("a") is not node
+    assert cache.getStats() == {"hits" : 0, "misses" : 1, "entries" : 1}
+
+def test_shared_uuid_is_not_cached():
+
+    backend = SharedBackend(["ref1:a", "ref2:a"])
+    cache = pnc.NodeCache(backend)
+
+    for i in range(0, 2):
+
+        assert [str(node) for node in cache.getNodes(["ref1:a", "ref2:a"])] == ["ref1:a", "ref2:a"]
+
+    #each name is found on its own every time
+
+    assert cache.getStats()["entries"] == 0
+    assert backend.m_finds == 4
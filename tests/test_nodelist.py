@@ -0,0 +1,89 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.armrig as par
+import pRigging.src.nodelist as pnl
+import pRigging.src.riggingbase as prb
+from pRigging.src.benchmark import ArmRigBenchmark
+
+pm = psb.pm
+
+BUILD_SETTINGS = {"_twistStartIds" : [0, -2], "_numTwistJnts" : 2}
+
+#----------Helpers----------#
+
+def genArm():
+
+    template = ArmRigBenchmark().genTemplateChain(3)
+    arm = par.ArmRig("L_Arm")
+    status = arm.genArmRig(template, **BUILD_SETTINGS)
+
+    assert status[0] == "SUCCESS", status
+
+    return arm, template
+
+def getHeldNodes(_value, _path, _visited):
+
+    #the paths of every node or plug held by the value, walking the rig objects,
+    #lists, dictionaries and NodeLists it holds
+
+    if id(_value) in _visited:
+
+        return []
+
+    if prb.getStateType(_value) in ("node", "plug"):
+
+        return [_path]
+
+    _visited.add(id(_value))
+
+    if isinstance(_value, pnl.NodeList):
+
+        return getHeldNodes(_value.m_nodes, _path, _visited)
+
+    if isinstance(_value, (list, tuple)):
+
+        return sum([getHeldNodes(value, "%s[%d]" % (_path, i), _visited) for i, value in enumerate(_value)], [])
+
+    if isinstance(_value, dict):
+
+        return sum([getHeldNodes(value, "%s[%r]" % (_path, key), _visited) for key, value in _value.items()], [])
+
+    if isinstance(_value, prb.RiggingBase):
+
+        return sum([getHeldNodes(value, "%s.%s" % (_path, key), _visited) for key, value in _value.__dict__.items()], [])
+
+    return []
+
+#----------Tests----------#
+
+def test_compacted_rig_holds_no_nodes(scene):
+
+    arm, template = genArm()
+
+    assert getHeldNodes(arm, "arm", set()) != []
+
+    arm.compactNodes()
+
+    assert getHeldNodes(arm, "arm", set()) == []
+
+def test_compacted_nodes_found_after_rename(scene):
+
+    arm, template = genArm()
+    arm.compactNodes()
+
+    pm.rename("L_Arm_FKIK_CTRL", "L_Arm_Switch_CTRL")
+
+    assert str(arm.m_FKIKControl.getCtrl()) == "L_Arm_Switch_CTRL"
+
+def test_clear_skips_nodes_deleted_after_compacting(scene):
+
+    arm, template = genArm()
+    arm.compactNodes()
+
+    pm.delete("L_Arm_FKIK_MINUS")
+    arm.clear()
+
+    #only the template is left
+
+    assert sorted([str(node) for node in pm.ls()]) == sorted([str(joint) for joint in template])
@@ -0,0 +1,97 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.armrig as par
+import pRigging.src.control as pctrl
+import pRigging.src.profiler as ppr
+from pRigging.src.benchmark import ArmRigBenchmark
+
+#----------Helpers----------#
+
+def profileArm(_scene, **_settings):
+
+    template = ArmRigBenchmark().genTemplateChain(3)
+
+    _scene.resetStats()
+
+    profiler = ppr.BuildProfiler()
+    profiler.start()
+
+    try:
+
+        result = par.ArmRig("L_Arm").genArmRig(template, **_settings)
+
+    finally:
+
+        profiler.stop()
+
+    return profiler, result
+
+#----------BuildProfiler----------#
+
+def test_counts_calls_and_commands(scene):
+
+    profiler, result = profileArm(scene)
+
+    stages = profiler.m_stages
+
+    assert result[0] == "SUCCESS"
+    assert stages["ArmRig.buildArmRig"]["calls"] == 1
+
+    #an IK control, its pole vector, three FK controls and the FK/IK switch
+
+    assert stages["Control.genCtrl"]["calls"] == 6
+
+    #every command of the build is counted once, by the stage that made it
+
+    total = stages["ArmRig.buildArmRig"]["commands"]
+
+    assert total <= scene.getCommandCount()
+    assert sum([stage["selfCommands"] for stage in stages.values()]) == total
+
+    for stage in stages.values():
+
+        assert 0 <= stage["selfCommands"] <= stage["commands"]
+
+def test_adds_runs_until_reset(scene):
+
+    profiler, result = profileArm(scene)
+    calls = profiler.m_stages["Control.genCtrl"]["calls"]
+
+    profiler.start()
+    par.ArmRig("R_Arm").genArmRig(ArmRigBenchmark().genTemplateChain(3, "right"))
+    profiler.stop()
+
+    assert profiler.m_stages["Control.genCtrl"]["calls"] == 2*calls
+
+    profiler.reset()
+
+    assert profiler.m_stages == {} and profiler.toData()["stages"] == []
+
+def test_stop_puts_methods_back(scene):
+
+    genCtrl = pctrl.Control.__dict__["genCtrl"]
+
+    profiler = ppr.BuildProfiler()
+    profiler.start()
+
+    assert pctrl.Control.__dict__["genCtrl"] is not genCtrl
+    assert profiler.isRunning()
+
+    profiler.stop()
+
+    assert pctrl.Control.__dict__["genCtrl"] is genCtrl
+    assert not profiler.isRunning()
+
+def test_help_keeps_build_status(scene):
+
+    profiler, result = profileArm(scene)
+
+    helpList = profiler.getHelp(["ERROR", "BUILD FAILED", "ERROR: The build failed"])
+
+    assert helpList[:2] == ["ERROR", "BUILD FAILED"]
+    assert helpList[2].startswith("ERROR: The build failed\n\n")
+    assert "ArmRig.buildArmRig" in helpList[2]
+
+    assert profiler.getHelp(result)[:2] == result[:2]
+    assert profiler.getHelp()[:2] == ["PROFILE", "BUILD PROFILE"]
@@ -0,0 +1,122 @@
+#----------Imports----------#
+
+import pRigging.src.scenebackend as psb
+import pRigging.src.riggingbase as prb
+import pRigging.src.armrig as par
+import pRigging.src.control as pctrl
+from pRigging.src.benchmark import ArmRigBenchmark
+
+pm = psb.pm
+
+#----------Helpers----------#
+
+def genJoints(_parents):
+
+    #makes a joint for each entry, parented under the joint at the index given,
+    #or the world for None, and returns them in the order made
+
+    joints = []
+
+    for i in range(0, len(_parents)):
+
+        if _parents[i] is None:
+
+            joints.append(pm.createNode("joint", name = "joint%d" % i, skipSelect = True))
+
+        else:
+
+            joints.append(pm.createNode("joint", name = "joint%d" % i, parent = joints[_parents[i]], skipSelect = True))
+
+    return joints
+
+#----------sortHierarchy----------#
+
+def test_sorts_chain_parent_first(scene):
+
+    joints = genJoints([None, 0, 1, 2])
+
+    assert prb.RiggingBase().sortHierarchy([joints[2], joints[0], joints[3], joints[1]]) == (joints, None)
+
+def test_reports_joint_with_missing_parent(scene):
+
+    joints = genJoints([None, 0, 1, 2])
+
+    assert prb.RiggingBase().sortHierarchy([joints[0], joints[3], joints[1]]) == ([], joints[3])
+
+def test_reports_second_child(scene):
+
+    joints = genJoints([None, 0, 0])
+
+    assert prb.RiggingBase().sortHierarchy(joints) == ([], joints[2])
+
+def test_reports_repeat(scene):
+
+    joints = genJoints([None, 0])
+
+    assert prb.RiggingBase().sortHierarchy([joints[0], joints[1], joints[0]]) == ([], joints[0])
+
+def test_separate_hierarchies_break(scene):
+
+    joints = genJoints([None, None])
+
+    sortedList, breakJoint = prb.RiggingBase().sortHierarchy(joints)
+
+    assert sortedList == [] and breakJoint in joints
+
+def test_empty_list_has_no_break_joint(scene):
+
+    assert prb.RiggingBase().sortHierarchy([]) == ([], None)
+    assert prb.RiggingBase().enforceHierarchy([]) == []
+
+#----------Ledger----------#
+
+def test_ledger_gathers_held_objects(scene):
+
+    holder = prb.RiggingBase()
+    holder.m_held = [prb.RiggingBase()]
+
+    nodes = [holder.recordNode(pm.createNode("transform", name = "grp%d" % i, skipSelect = True)) for i in range(0, 3)]
+    nodes.append(holder.m_held[0].recordNode(pm.createNode("transform", name = "heldGrp", skipSelect = True)))
+
+    assert holder.getLedger() == nodes
+
+def test_delete_ledger_skips_deleted_nodes(scene):
+
+    holder = prb.RiggingBase()
+    holder.m_held = prb.RiggingBase()
+
+    holder.recordNode(pm.createNode("transform", name = "grp", skipSelect = True))
+    holder.m_held.recordNode(pm.createNode("transform", name = "heldGrp", skipSelect = True))
+
+    pm.delete("grp")
+
+    holder.deleteLedger()
+
+    assert pm.ls() == []
+    assert holder.getLedger() == []
+
+def test_clear_deletes_rig_in_one_delete(scene):
+
+    template = ArmRigBenchmark().genTemplateChain(3)
+    arm = par.ArmRig("L_Arm")
+    arm.genArmRig(template)
+
+    scene.resetStats()
+
+    arm.clear()
+
+    assert scene.getCommandCounts().get("delete") == 1
+    assert sorted([str(node) for node in pm.ls()]) == sorted([str(joint) for joint in template])
+    assert arm.getLedger() == []
+
+def test_control_clear_deletes_groups(scene):
+
+    joint = pm.createNode("joint", name = "L_Arm_JNT", skipSelect = True)
+    control = pctrl.Control()
+    control.genCtrl(joint)
+
+    assert len(control.m_groups) == 3
+
+    control.clear()
+
+    assert [str(node) for node in pm.ls()] == ["L_Arm_JNT"]
@@ -0,0 +1,104 @@
+#----------Imports----------#
+
+import json
+import pRigging.src.scenebackend as psb
+import pRigging.src.rigspec as prs
+
+pm = psb.pm
+
+SPEC_DATA = {"baseName" : "Hero",
+             "joints" : ["L_Shoulder_JNT", "L_Elbow_JNT", "L_Wrist_JNT"],
+             "positions" : [[0.0, 150.0, 0.0], [30.0, 140.0, -5.0], [55.0, 135.0, 0.0]],
+             "numTwistJnts" : 2}
+
+#----------validate----------#
+
+def test_valid_spec_has_no_errors():
+
+    assert prs.RigSpec(SPEC_DATA).validate() == []
+
+def test_reports_unknown_settings_and_types():
+
+    errors = prs.RigSpec(dict(SPEC_DATA, colour = "red", numTwistJnts = "2", doIK = 1)).validate()
+
+    assert errors == ["unknown setting colour", "doIK should be a bool", "numTwistJnts should be a int"]
+
+def test_reports_bad_values():
+
+    data = dict(SPEC_DATA, joints = ["L_Shoulder_JNT"], twistStartIds = [-1], doIK = False, doFK = False)
+
+    assert prs.RigSpec(data).validate() == ["at least 2 template joints are needed",
+                                            "there should be a position for each template joint",
+                                            "the twist start id -1 isn't a joint with one below it",
+                                            "at least one of doIK and doFK should be True"]
+
+def test_invalid_spec_is_not_built(scene):
+
+    status = prs.RigSpec(dict(SPEC_DATA, type = "leg")).build()
+
+    assert status[1] == "INVALID SPEC"
+    assert pm.ls() == []
+
+#----------spec files----------#
+
+def test_load_spec_file_reads_jobs(tmp_path):
+
+    path = tmp_path / "rigs.json"
+    path.write_text(json.dumps([{"scene" : "hero.ma", "save" : "out/hero_rigged.ma", "rigs" : [SPEC_DATA]},
+                                {"rigs" : [SPEC_DATA, dict(SPEC_DATA, baseName = "Villain")]}]))
+
+    jobs = prs.loadSpecFile(str(path))
+
+    #paths are relative to the spec file, and left out ones are None
+
+    assert [(job["scene"], job["save"], len(job["rigs"])) for job in jobs] == [(str(tmp_path / "hero.ma"), str(tmp_path / "out" / "hero_rigged.ma"), 1),
+                                                                               (None, None, 2)]
+    assert jobs[1]["rigs"][1].m_baseName == "Villain"
+
+def test_saved_spec_file_loads_the_same(tmp_path):
+
+    path = str(tmp_path / "rigs.json")
+    spec = prs.RigSpec(SPEC_DATA)
+
+    prs.saveSpecFile(path, [spec], _save = "hero_rigged.ma")
+
+    jobs = prs.loadSpecFile(path)
+
+    assert jobs[0]["scene"] is None
+    assert [rig.toData() for rig in jobs[0]["rigs"]] == [spec.toData()]
+
+def test_spec_builds_rig(scene):
+
+    spec = prs.RigSpec(SPEC_DATA)
+    status = spec.build()
+
+    assert status[0] == "SUCCESS", status
+    assert str(spec.m_rigElement.m_FKIKControl.getCtrl()) == "Hero_L_Arm_FKIK_CTRL"
+
+#----------getTemplateJoints----------#
+
+def test_makes_missing_template_joints(scene):
+
+    other = pm.createNode("transform", name = "other", skipSelect = True)
+    pm.select(other)
+
+    joints, missing = prs.RigSpec(SPEC_DATA).getTemplateJoints()
+
+    assert missing == []
+    assert [str(joint) for joint in joints] == SPEC_DATA["joints"]
+    assert joints[2].longName() == "|L_Shoulder_JNT|L_Elbow_JNT|L_Wrist_JNT"
+
+    for joint, position in zip(joints, SPEC_DATA["positions"]):
+
+        assert [round(value, 6) for value in joint.getTranslation(space = "world")] == position
+
+    #made without touching the selection
+
+    assert pm.ls(sl = True) == [other]
+
+def test_reports_missing_template_joints(scene):
+
+    data = dict(SPEC_DATA)
+    del data["positions"]
+
+    assert prs.RigSpec(data).getTemplateJoints() == ([], SPEC_DATA["joints"])
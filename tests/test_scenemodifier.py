@@ -0,0 +1,128 @@
+#----------Imports----------#
+
+import pytest
+import pRigging.src.scenebackend as psb
+import pRigging.src.scenemodifier as psm
+
+pm = psb.pm
+
+#----------Helpers----------#
+
+def genNodes(_count):
+
+    #makes a group and the given number of transforms in the world
+
+    group = pm.createNode("transform", name = "grp", skipSelect = True)
+    nodes = [pm.createNode("transform", name = "node%d" % i, skipSelect = True) for i in range(0, _count)]
+
+    return group, nodes
+
+#----------Tests----------#
+
+def test_changes_wait_for_do_it(scene):
+
+    group, nodes = genNodes(1)
+
+    modifier = psm.SceneModifier()
+    modifier.setAttr(nodes[0], "translateX", 1.0)
+    modifier.reparent(nodes[0], group)
+
+    assert not modifier.isEmpty()
+    assert nodes[0].getParent() is None
+    assert nodes[0].translateX.get() == 0.0
+
+    modifier.doIt()
+
+    assert modifier.isEmpty()
+    assert nodes[0].getParent() == group
+    assert nodes[0].translateX.get() == 1.0
+
+@pytest.mark.parametrize("checkParents, commands", [(False, 1), (True, 2)])
+def test_run_of_nodes_parented_at_once(scene, checkParents, commands):
+
+    group, nodes = genNodes(3)
+
+    scene.resetStats()
+
+    modifier = psm.SceneModifier(_checkParents = checkParents)
+
+    for node in nodes:
+
+        modifier.reparent(node, group)
+
+    modifier.doIt()
+
+    #checking the parents lists the group's children first
+
+    assert scene.getCommandCounts().get("parent") == 1
+    assert modifier.getCounts()["reparent"] == 3
+    assert modifier.getCounts()["commands"] == commands
+    assert group.getChildren() == nodes
+
+def test_nodes_already_parented_are_left(scene):
+
+    group, nodes = genNodes(3)
+    nodes[1].setParent(group)
+
+    modifier = psm.SceneModifier()
+
+    for node in nodes:
+
+        modifier.reparent(node, group)
+
+    modifier.doIt()
+
+    #the node already under the group keeps its place
+
+    assert group.getChildren() == [nodes[1], nodes[0], nodes[2]]
+
+def test_xyz_values_set_at_once(scene):
+
+    group, nodes = genNodes(1)
+
+    scene.resetStats()
+
+    modifier = psm.SceneModifier()
+
+    for axis, value in zip("XYZ", (1.0, 2.0, 3.0)):
+
+        modifier.setAttr(nodes[0], "translate" + axis, value)
+
+    modifier.setAttr(nodes[0], "rotateX", 45.0)
+    modifier.doIt()
+
+    assert tuple(nodes[0].getTranslation()) == (1.0, 2.0, 3.0)
+    assert nodes[0].rotateX.get() == 45.0
+    assert scene.getCommandCounts().get("setAttr") == 2
+    assert modifier.getCounts()["setAttr"] == 4
+
+def test_changes_made_in_passes(scene):
+
+    group, nodes = genNodes(2)
+
+    #queued against the order of the passes, the attribute is made before it
+    #is connected and the node is renamed before the connection names it
+
+    modifier = psm.SceneModifier()
+    modifier.lock(nodes[1], "rotateY")
+    modifier.connect("node0.switch", "renamed.scaleX")
+    modifier.addAttr(nodes[0], "switch", at = "double", k = True)
+    modifier.rename(nodes[1], "renamed")
+    modifier.doIt()
+
+    assert str(nodes[1]) == "renamed"
+    assert nodes[1].scaleX.inputs() == [nodes[0]]
+    assert nodes[1].rotateY.isLocked()
+
+def test_queue_emptied_when_a_change_fails(scene):
+
+    group, nodes = genNodes(1)
+
+    modifier = psm.SceneModifier()
+    modifier.setAttr(nodes[0], "missing", 1.0)
+
+    with pytest.raises(Exception):
+
+        modifier.doIt()
+
+    assert modifier.isEmpty()